@@ -2,37 +2,28 @@
 Platform Adapters Package
 
 This package contains platform-specific scrapers for scraping social media platforms and scraper managers.
+Exports are imported on first access so that loading one scraper does not pull in every platform.
 """
 
-from .scraper_manager import ScraperManager
-from .proxy_manager import ProxyManager
-from .linkedin_scraper import LinkedInScraper
-from .twitter_scraper import TwitterScraper
-from .base_scraper import BaseScraper
-from .linkedin_scraper import LinkedInScraper
-from .twitter_scraper import TwitterScraper
-from .youtube_scraper import YouTubeScraper
-from .tiktok_scraper import TikTokScraper
-from .instagram_scraper import InstagramScraper
-from .reddit_scraper import RedditScraper
-from .generic_scraper import GenericWebScraper
-from .rate_limiter import RateLimiter
-
-__all__ = [
-    'ScraperManager',
-    'ProxyManager',
-    'LinkedInScraper',
-    'TwitterScraper',
-    'BaseScraper',
-    'LinkedInScraper',
-    'TwitterScraper',
-    'YouTubeScraper',
-    'TikTokScraper',
-    'InstagramScraper',
-    'RedditScraper',
-    'GenericWebScraper',
-    'RateLimiter'
-] 
+import importlib
 
+_EXPORTS = {
+    'ScraperManager': '.scraper_manager',
+    'ProxyManager': '.proxy_manager',
+    'BaseScraper': '.base_scraper',
+    'LinkedInScraper': '.linkedin_scraper',
+    'TwitterScraper': '.twitter_scraper',
+    'YouTubeScraper': '.youtube_scraper',
+    'TikTokScraper': '.tiktok_scraper',
+    'InstagramScraper': '.instagram_scraper',
+    'RedditScraper': '.reddit_scraper',
+    'GenericWebScraper': '.generic_scraper',
+    'RateLimiter': '.rate_limiter'
+}
 
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+__all__ = list(_EXPORTS)
@@ -4,15 +4,16 @@ Base Scraper
 This module defines the base scraper class that all platform-specific scrapers inherit from.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple
 import logging
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 import aiohttp
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from urllib.parse import urlparse
-from discovery.models.data_object import DataObject
+from discovery.models.data_object import DataObject, PlatformType
+from .http_cache import HTTPCache, CachingSession
 from src.services.monitoring.monitoring import MonitoringService
 
 logger = logging.getLogger(__name__)
@@ -20,66 +21,110 @@ logger = logging.getLogger(__name__)
 class BaseScraper:
     """Base class for all platform-specific scrapers."""
     
+    # Platform key used for rate limits and cache freshness
+    platform = 'generic'
+    
+    # Scrapers that can serve pages over plain HTTP start the browser on demand
+    lazy_browser = False
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.monitoring = MonitoringService()
         self.session = None
         self.driver = None
+        self.resources = None
+        self.http_cache = None
         self._validate_config()
         
+    def attach_resources(self, resources: Any):
+        """Use a manager's shared session, cache and browser pool instead of private ones."""
+        self.resources = resources
+        
     def _validate_config(self):
         """Validate configuration parameters."""
         required_keys = ['timeout', 'user_agent']
         for key in required_keys:
             if key not in self.config:
                 raise ValueError(f"Missing required config key: {key}")
-
+                
     async def __aenter__(self):
         """Enter context manager, initialize resources."""
         await self.initialize()
         return self
-
+        
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager, close resources."""
         await self.close()
-
+        
     async def initialize(self):
         """Initialize the scraper with session and browser."""
         try:
-            # Initialize aiohttp session
-            self.session = aiohttp.ClientSession(
-                headers=self._get_headers(),
-                timeout=aiohttp.ClientTimeout(total=self.config.get('timeout', 30))
-            )
+            # Initialize aiohttp session, routing GETs through the response cache
+            if self.resources:
+                session = self.resources.get_session(self._get_headers())
+                self.http_cache = self.resources.http_cache
+            else:
+                session = aiohttp.ClientSession(
+                    headers=self._get_headers(),
+                    timeout=aiohttp.ClientTimeout(total=self.config.get('timeout', 30))
+                )
+                if self.config.get('http_cache_enabled', True):
+                    self.http_cache = HTTPCache(self.config)
+            if self.http_cache:
+                session = CachingSession(session, self.http_cache, self.platform)
+            self.session = session
             
             # Initialize Selenium WebDriver
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument(f'user-agent={self.config.get("user_agent")}')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            if not self.lazy_browser:
+                self.driver = self._create_driver()
             logger.info("BaseScraper initialized successfully")
             
         except Exception as e:
             self._handle_error(e, "initializing scraper")
             raise
             
+    def _create_driver(self) -> webdriver.Chrome:
+        """Create a headless Chrome WebDriver, borrowing from the shared pool if attached."""
+        if self.resources:
+            return self.resources.browser_pool.acquire()
+            
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument(f'user-agent={self.config.get("user_agent")}')
+        
+        return webdriver.Chrome(options=chrome_options)
+        
+    def _ensure_driver(self) -> webdriver.Chrome:
+        """Get the WebDriver, starting the browser on first use."""
+        if self.driver is None:
+            self.driver = self._create_driver()
+            logger.info("WebDriver started on demand")
+        return self.driver
+            
     async def close(self):
         """Close the scraper's session and browser."""
         try:
-            if self.session:
-                await self.session.close()
-                logger.info("aiohttp session closed")
-            if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+            if self.resources:
+                # Shared resources outlive the scraper; hand the browser back to the pool
+                if self.driver:
+                    self.resources.browser_pool.release(self.driver)
+                    logger.info("WebDriver returned to pool")
+            else:
+                if self.session:
+                    await self.session.close()
+                    logger.info("aiohttp session closed")
+                if self.driver:
+                    self.driver.quit()
+                    logger.info("WebDriver closed")
+            self.session = None
+            self.driver = None
         except Exception as e:
             self._handle_error(e, "closing scraper")
             
-    async def scrape_profile(self, profile_url: str) -> DataObject:
-        """Scrape a profile from the platform."""
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
+        """Scrape a profile from the platform, skipping posts at or before the watermark."""
         raise NotImplementedError
         
     async def scrape_content(self, content_url: str) -> DataObject:
@@ -90,6 +135,28 @@ class BaseScraper:
         """Scrape network connections from the platform."""
         raise NotImplementedError
         
+    async def extract_affiliate_data(
+        self,
+        affiliate: Dict[str, Any],
+        since: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Scrape a discovered affiliate, fetching only posts newer than the watermark."""
+        try:
+            profile = await self.scrape_profile(affiliate['url'], since=since)
+            if profile.error or not profile.data:
+                return {}
+                
+            return {
+                **affiliate,
+                'platform': self.platform,
+                'data': profile.data,
+                'incremental': since is not None
+            }
+            
+        except Exception as e:
+            self._handle_error(e, f"extracting affiliate data for {affiliate.get('url')}")
+            return {}
+        
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for HTTP requests."""
         return {
@@ -186,11 +253,69 @@ class BaseScraper:
             self._handle_error(e, "extracting metadata")
             return {}
             
-    def _to_data_object(self, source: str, raw_data: Dict[str, Any]) -> DataObject:
+    def _extract_node_metadata(self, element: Any) -> Dict[str, Any]:
+        """Extract metadata from an HTML node."""
+        try:
+            return {
+                'id': element.get('id') or '',
+                'class': element.get('class') or '',
+                'data_attributes': {
+                    attr: element.get(f'data-{attr}') or ''
+                    for attr in ['testid', 'type', 'role']
+                }
+            }
+        except Exception as e:
+            self._handle_error(e, "extracting node metadata")
+            return {}
+            
+    def _iter_new_posts(
+        self,
+        elements: Iterable[Any],
+        since: Optional[Dict[str, Any]],
+        read_marker: Callable[[Any], Dict[str, Any]]
+    ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Yield post elements newer than the watermark together with their id/timestamp marker."""
+        stop_after = self.config.get('watermark_stop_after', 3)
+        # Without a timestamp only the watermark post itself is recognisable, and the
+        # feed is newest first, so everything from it on has been seen
+        id_only = bool(since and since.get('post_id') and not self._parse_timestamp(since.get('timestamp')))
+        seen_in_a_row = 0
+        for element in elements:
+            marker = read_marker(element)
+            if id_only and marker.get('post_id') == since['post_id']:
+                break
+            if since and self._is_seen_post(marker, since):
+                # Pinned posts can precede newer ones, so stop only after a run of seen posts
+                seen_in_a_row += 1
+                if seen_in_a_row >= stop_after:
+                    break
+                continue
+            seen_in_a_row = 0
+            yield element, marker
+            
+    def _is_seen_post(self, marker: Dict[str, Any], since: Dict[str, Any]) -> bool:
+        """Check whether a post is at or before the watermark."""
+        if since.get('post_id') and marker.get('post_id') == since['post_id']:
+            return True
+        post_time = self._parse_timestamp(marker.get('timestamp'))
+        watermark_time = self._parse_timestamp(since.get('timestamp'))
+        return bool(post_time and watermark_time and post_time <= watermark_time)
+        
+    def _parse_timestamp(self, value: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO timestamp, returning None when it is missing or malformed."""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+            
+    def _to_data_object(self, source: str, raw_data: Dict[str, Any], url: str = '') -> DataObject:
         """Convert raw data to DataObject."""
         return DataObject(
-            source=source,
-            raw_data=raw_data,
-            processed_data={},
+            platform=PlatformType(source),
+            url=url,
+            data=raw_data,
             metadata={'timestamp': datetime.utcnow().isoformat()}
         )
\ No newline at end of file
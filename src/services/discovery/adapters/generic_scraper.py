@@ -2,12 +2,13 @@
 Generic Web Scraper
 
 This module implements generic web scraping functionality for any website.
+Pages are fetched over plain HTTP first and only rendered in the browser when
+the raw HTML does not carry the data we need.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 import asyncio
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -17,17 +18,37 @@ from src.services.monitoring.monitoring import MonitoringService
 from discovery.models.data_object import DataObject
 from .base_scraper import BaseScraper
 from .rate_limiter import RateLimiter
+from .tiered_fetcher import TieredFetcher, FetchedPage
 
 logger = logging.getLogger(__name__)
 
+# Fields the raw HTML must provide before we skip the browser
+PROFILE_FIELDS = ('title', 'text')
+CONTENT_FIELDS = ('title', 'text')
+NETWORK_FIELDS = ('links',)
+
+SOCIAL_PLATFORMS = {
+    'facebook': 'facebook.com',
+    'twitter': 'twitter.com',
+    'linkedin': 'linkedin.com',
+    'instagram': 'instagram.com',
+    'youtube': 'youtube.com',
+    'tiktok': 'tiktok.com',
+    'reddit': 'reddit.com'
+}
+
 class GenericWebScraper(BaseScraper):
     """Scrapes data from any website."""
     
+    platform = 'generic'
+    lazy_browser = True
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.rate_limiter = RateLimiter(config)
+        self.fetcher = TieredFetcher(config)
         
-    async def scrape_profile(self, profile_url: str) -> DataObject:
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
         """Scrape a website profile."""
         try:
             # Acquire rate limit permission
@@ -37,27 +58,22 @@ class GenericWebScraper(BaseScraper):
                 raise ValueError(f"Invalid profile URL: {profile_url}")
                 
             profile_url = self._normalize_url(profile_url)
-            self.driver.get(profile_url)
-            await asyncio.sleep(self.config.get('page_load_delay', 2))
-            
-            WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            page = await self._fetch_page(profile_url, PROFILE_FIELDS)
             
             profile_data = {
-                'basic_info': await self._extract_basic_info(),
-                'content': await self._extract_content(),
-                'metadata': await self._extract_metadata()
+                'basic_info': await self._extract_basic_info(page),
+                'content': await self._extract_content(page),
+                'metadata': self._extract_node_metadata(page.document)
             }
             
-            logger.info(f"Successfully scraped website profile: {profile_url}")
+            logger.info(f"Successfully scraped website profile: {profile_url} (via {page.tier})")
             return self._to_data_object("Generic", profile_data)
             
         except ClientResponseError as e:
             if e.status == 429:
                 retry_after = int(e.headers.get('Retry-After', 60))
                 await self._handle_rate_limit(retry_after)
-                return await self.scrape_profile(profile_url)
+                return await self.scrape_profile(profile_url, since)
             self._handle_error(e, f"scraping website profile {profile_url}")
             return self._to_data_object("Generic", {})
             
@@ -75,15 +91,10 @@ class GenericWebScraper(BaseScraper):
                 raise ValueError(f"Invalid content URL: {content_url}")
                 
             content_url = self._normalize_url(content_url)
-            self.driver.get(content_url)
-            await asyncio.sleep(self.config.get('page_load_delay', 2))
-            
-            WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            page = await self._fetch_page(content_url, CONTENT_FIELDS)
             
-            content_data = await self._extract_content_details()
-            logger.info(f"Successfully scraped website content: {content_url}")
+            content_data = await self._extract_content_details(page)
+            logger.info(f"Successfully scraped website content: {content_url} (via {page.tier})")
             return self._to_data_object("Generic", content_data)
             
         except ClientResponseError as e:
@@ -108,19 +119,14 @@ class GenericWebScraper(BaseScraper):
                 raise ValueError(f"Invalid profile URL: {profile_url}")
                 
             profile_url = self._normalize_url(profile_url)
-            self.driver.get(profile_url)
-            await asyncio.sleep(self.config.get('page_load_delay', 2))
-            
-            WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            page = await self._fetch_page(profile_url, NETWORK_FIELDS)
             
             network_data = {
-                'links': await self._extract_links(),
-                'social_media': await self._extract_social_media(),
-                'related_sites': await self._extract_related_sites()
+                'links': await self._extract_links(page),
+                'social_media': await self._extract_social_media(page),
+                'related_sites': await self._extract_related_sites(page)
             }
-            logger.info(f"Successfully scraped website network: {profile_url}")
+            logger.info(f"Successfully scraped website network: {profile_url} (via {page.tier})")
             return self._to_data_object("Generic", network_data)
             
         except ClientResponseError as e:
@@ -135,16 +141,39 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, f"scraping website network {profile_url}")
             return self._to_data_object("Generic", {})
             
-    async def _extract_basic_info(self) -> Dict[str, Any]:
+    async def _fetch_page(self, url: str, required_fields: tuple) -> FetchedPage:
+        """Fetch a page over HTTP, falling back to a browser render when needed."""
+        page = await self.fetcher.fetch(url, self.session, self._render_page, required_fields)
+        if page.document is None:
+            raise ValueError(f"Could not parse page: {url}")
+        return page
+        
+    async def _render_page(self, url: str) -> str:
+        """Render a page in the browser and return its HTML."""
+        driver = self._ensure_driver()
+        driver.get(url)
+        await asyncio.sleep(self.config.get('page_load_delay', 2))
+        
+        WebDriverWait(driver, self.config.get('timeout', 10)).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        return driver.page_source
+        
+    async def _extract_basic_info(self, page: FetchedPage) -> Dict[str, Any]:
         """Extract basic website information."""
         try:
             basic_info = {
-                'title': self.driver.title,
-                'description': self._get_meta_description(),
-                'keywords': self._get_meta_keywords(),
-                'author': self._get_meta_author(),
-                'language': self._get_page_language(),
-                'metadata': self._extract_metadata(self.driver)
+                'title': page.fields.get('title', ''),
+                'description': page.fields.get('description', ''),
+                'keywords': page.fields.get('keywords', []),
+                'author': page.fields.get('author', ''),
+                'language': page.fields.get('language', ''),
+                'structured_data': {
+                    'opengraph': page.fields.get('opengraph', {}),
+                    'json_ld': page.fields.get('json_ld', []),
+                    'next_data': page.fields.get('next_data', {})
+                },
+                'metadata': self._extract_node_metadata(page.document)
             }
             return basic_info
             
@@ -152,14 +181,14 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website basic info")
             return {}
             
-    async def _extract_content(self) -> Dict[str, Any]:
+    async def _extract_content(self, page: FetchedPage) -> Dict[str, Any]:
         """Extract website content."""
         try:
             content = {
-                'text': self._get_page_text(),
-                'images': await self._extract_images(),
-                'videos': await self._extract_videos(),
-                'metadata': self._extract_metadata(self.driver)
+                'text': page.fields.get('text', ''),
+                'images': await self._extract_images(page),
+                'videos': await self._extract_videos(page),
+                'metadata': self._extract_node_metadata(page.document)
             }
             return content
             
@@ -167,16 +196,16 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website content")
             return {}
             
-    async def _extract_content_details(self) -> Dict[str, Any]:
+    async def _extract_content_details(self, page: FetchedPage) -> Dict[str, Any]:
         """Extract detailed content information."""
         try:
             content = {
-                'title': self.driver.title,
-                'text': self._get_page_text(),
-                'images': await self._extract_images(),
-                'videos': await self._extract_videos(),
-                'links': await self._extract_links(),
-                'metadata': self._extract_metadata(self.driver)
+                'title': page.fields.get('title', ''),
+                'text': page.fields.get('text', ''),
+                'images': await self._extract_images(page),
+                'videos': await self._extract_videos(page),
+                'links': await self._extract_links(page),
+                'metadata': self._extract_node_metadata(page.document)
             }
             return content
             
@@ -184,18 +213,17 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website content details")
             return {}
             
-    async def _extract_links(self) -> List[Dict[str, Any]]:
+    async def _extract_links(self, page: FetchedPage) -> List[Dict[str, Any]]:
         """Extract links from the page."""
         try:
             links = []
-            link_elements = self.driver.find_elements(By.TAG_NAME, "a")
             
-            for element in link_elements:
+            for element in page.document.iter('a'):
                 link = {
-                    'text': element.text,
-                    'url': element.get_attribute('href'),
-                    'title': element.get_attribute('title'),
-                    'metadata': self._extract_metadata(element)
+                    'text': self._get_node_text(element),
+                    'url': element.get('href'),
+                    'title': element.get('title'),
+                    'metadata': self._extract_node_metadata(element)
                 }
                 links.append(link)
                 
@@ -205,20 +233,19 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website links")
             return []
             
-    async def _extract_images(self) -> List[Dict[str, Any]]:
+    async def _extract_images(self, page: FetchedPage) -> List[Dict[str, Any]]:
         """Extract images from the page."""
         try:
             images = []
-            image_elements = self.driver.find_elements(By.TAG_NAME, "img")
             
-            for element in image_elements:
+            for element in page.document.iter('img'):
                 image = {
-                    'src': element.get_attribute('src'),
-                    'alt': element.get_attribute('alt'),
-                    'title': element.get_attribute('title'),
-                    'width': element.get_attribute('width'),
-                    'height': element.get_attribute('height'),
-                    'metadata': self._extract_metadata(element)
+                    'src': element.get('src'),
+                    'alt': element.get('alt'),
+                    'title': element.get('title'),
+                    'width': element.get('width'),
+                    'height': element.get('height'),
+                    'metadata': self._extract_node_metadata(element)
                 }
                 images.append(image)
                 
@@ -228,19 +255,18 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website images")
             return []
             
-    async def _extract_videos(self) -> List[Dict[str, Any]]:
+    async def _extract_videos(self, page: FetchedPage) -> List[Dict[str, Any]]:
         """Extract videos from the page."""
         try:
             videos = []
-            video_elements = self.driver.find_elements(By.TAG_NAME, "video")
             
-            for element in video_elements:
+            for element in page.document.iter('video'):
                 video = {
-                    'src': element.get_attribute('src'),
-                    'poster': element.get_attribute('poster'),
-                    'width': element.get_attribute('width'),
-                    'height': element.get_attribute('height'),
-                    'metadata': self._extract_metadata(element)
+                    'src': element.get('src'),
+                    'poster': element.get('poster'),
+                    'width': element.get('width'),
+                    'height': element.get('height'),
+                    'metadata': self._extract_node_metadata(element)
                 }
                 videos.append(video)
                 
@@ -250,28 +276,24 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website videos")
             return []
             
-    async def _extract_social_media(self) -> List[Dict[str, Any]]:
+    async def _extract_social_media(self, page: FetchedPage) -> List[Dict[str, Any]]:
         """Extract social media links."""
         try:
             social_media = []
-            social_platforms = {
-                'facebook': 'facebook.com',
-                'twitter': 'twitter.com',
-                'linkedin': 'linkedin.com',
-                'instagram': 'instagram.com',
-                'youtube': 'youtube.com',
-                'tiktok': 'tiktok.com',
-                'reddit': 'reddit.com'
-            }
-            
-            for platform, domain in social_platforms.items():
-                elements = self.driver.find_elements(By.CSS_SELECTOR, f"a[href*='{domain}']")
-                for element in elements:
+            link_elements = [
+                element for element in page.document.iter('a')
+                if element.get('href')
+            ]
+            
+            for platform, domain in SOCIAL_PLATFORMS.items():
+                for element in link_elements:
+                    if domain not in element.get('href'):
+                        continue
                     social = {
                         'platform': platform,
-                        'url': element.get_attribute('href'),
-                        'text': element.text,
-                        'metadata': self._extract_metadata(element)
+                        'url': element.get('href'),
+                        'text': self._get_node_text(element),
+                        'metadata': self._extract_node_metadata(element)
                     }
                     social_media.append(social)
                     
@@ -281,22 +303,21 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website social media")
             return []
             
-    async def _extract_related_sites(self) -> List[Dict[str, Any]]:
+    async def _extract_related_sites(self, page: FetchedPage) -> List[Dict[str, Any]]:
         """Extract related websites."""
         try:
             related_sites = []
-            link_elements = self.driver.find_elements(By.TAG_NAME, "a")
             
-            for element in link_elements:
-                url = element.get_attribute('href')
+            for element in page.document.iter('a'):
+                url = element.get('href')
                 if url and not url.startswith(('http://', 'https://')):
                     continue
                     
                 related_site = {
                     'url': url,
-                    'text': element.text,
-                    'title': element.get_attribute('title'),
-                    'metadata': self._extract_metadata(element)
+                    'text': self._get_node_text(element),
+                    'title': element.get('title'),
+                    'metadata': self._extract_node_metadata(element)
                 }
                 related_sites.append(related_site)
                 
@@ -306,41 +327,9 @@ class GenericWebScraper(BaseScraper):
             self._handle_error(e, "extracting website related sites")
             return []
             
-    def _get_meta_description(self) -> str:
-        """Get meta description from the page."""
+    def _get_node_text(self, element: Any) -> str:
+        """Get whitespace-normalized text of an HTML node."""
         try:
-            meta = self.driver.find_element(By.CSS_SELECTOR, "meta[name='description']")
-            return meta.get_attribute('content')
-        except:
+            return ' '.join(element.text_content().split())
+        except Exception:
             return ""
-            
-    def _get_meta_keywords(self) -> List[str]:
-        """Get meta keywords from the page."""
-        try:
-            meta = self.driver.find_element(By.CSS_SELECTOR, "meta[name='keywords']")
-            keywords = meta.get_attribute('content')
-            return [k.strip() for k in keywords.split(',')]
-        except:
-            return []
-            
-    def _get_meta_author(self) -> str:
-        """Get meta author from the page."""
-        try:
-            meta = self.driver.find_element(By.CSS_SELECTOR, "meta[name='author']")
-            return meta.get_attribute('content')
-        except:
-            return ""
-            
-    def _get_page_language(self) -> str:
-        """Get page language."""
-        try:
-            return self.driver.find_element(By.TAG_NAME, "html").get_attribute('lang')
-        except:
-            return ""
-            
-    def _get_page_text(self) -> str:
-        """Get all text content from the page."""
-        try:
-            return self.driver.find_element(By.TAG_NAME, "body").text
-        except:
-            return "" 
\ No newline at end of file
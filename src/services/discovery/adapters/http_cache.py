@@ -0,0 +1,476 @@
+"""
+HTTP Cache
+
+This module implements a conditional-request HTTP cache for the platform adapters.
+Responses are stored compressed with their ETag/Last-Modified validators; fresh
+entries are replayed without a request and stale ones are revalidated so that
+unchanged pages cost a 304 instead of a full download. Requests that carry
+credentials bypass the cache, and responses are only replayed to requests that
+match the header values named in their Vary header.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import asyncio
+import logging
+import hashlib
+import json
+import os
+import time
+import zlib
+from collections import OrderedDict, defaultdict
+import aiohttp
+import redis.asyncio as aioredis
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+# Freshness window per platform, in seconds
+DEFAULT_TTLS = {
+    'linkedin': 21600,
+    'twitter': 900,
+    'youtube': 3600,
+    'tiktok': 1800,
+    'instagram': 1800,
+    'reddit': 900,
+    'generic': 86400
+}
+
+# Response headers kept with each cache entry
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Vary')
+
+# Request headers whose responses may be personalized, so are never cached
+CREDENTIAL_HEADERS = ('Authorization', 'Cookie')
+
+class CachedResponse:
+    """Fully-read HTTP response, served live or replayed from the cache."""
+    
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        from_cache: bool = False
+    ):
+        self.url = URL(url)
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.from_cache = from_cache
+        self._body = body
+        
+    async def read(self) -> bytes:
+        """Get the response body."""
+        return self._body
+        
+    async def text(self, encoding: Optional[str] = None, errors: str = 'strict') -> str:
+        """Get the response body decoded as text."""
+        return self._body.decode(encoding or self._get_charset(), errors=errors)
+        
+    async def json(self, **kwargs) -> Any:
+        """Get the response body decoded as JSON."""
+        return json.loads(await self.text(), **kwargs)
+        
+    def raise_for_status(self):
+        """Raise ClientResponseError for error statuses."""
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(self.url, 'GET', CIMultiDictProxy(CIMultiDict()), self.url),
+                (),
+                status=self.status,
+                headers=self.headers
+            )
+            
+    def _get_charset(self) -> str:
+        """Get the charset declared in the Content-Type header."""
+        content_type = self.headers.get('Content-Type', '')
+        for part in content_type.split(';')[1:]:
+            key, _, value = part.strip().partition('=')
+            if key.lower() == 'charset' and value:
+                return value.strip('"')
+        return 'utf-8'
+        
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+class MemoryCacheStorage:
+    """In-process storage for cache entries."""
+    
+    # HTTPCache enforces the size budget for stores that don't evict on their own
+    evicts = False
+    
+    def __init__(self):
+        self.entries: Dict[str, bytes] = {}
+        
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+        
+    async def set(self, key: str, blob: bytes, ttl: int):
+        self.entries[key] = blob
+        
+    async def delete(self, key: str):
+        self.entries.pop(key, None)
+
+class DiskCacheStorage:
+    """On-disk storage for cache entries, one file per entry."""
+    
+    evicts = False
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        
+    def existing_entries(self) -> Dict[str, int]:
+        """List stored entries with their sizes, oldest first."""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.tmp'):
+                    continue
+                stat = os.stat(os.path.join(root, name))
+                entries.append((stat.st_mtime, name, stat.st_size))
+        return {name: size for _, name, size in sorted(entries)}
+        
+    async def get(self, key: str) -> Optional[bytes]:
+        # File I/O runs in a thread so it doesn't block the event loop
+        return await asyncio.to_thread(self._read, key)
+        
+    async def set(self, key: str, blob: bytes, ttl: int):
+        await asyncio.to_thread(self._write, key, blob)
+        
+    async def delete(self, key: str):
+        await asyncio.to_thread(self._remove, key)
+        
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+            
+    def _write(self, key: str, blob: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+        
+    def _remove(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+            
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+class RedisCacheStorage:
+    """Redis storage for cache entries shared between workers."""
+    
+    # Entries expire through their TTL and Redis's maxmemory policy
+    evicts = True
+    
+    def __init__(self, url: str, prefix: str = 'http_cache:'):
+        self.client = aioredis.from_url(url)
+        self.prefix = prefix
+        
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+        
+    async def set(self, key: str, blob: bytes, ttl: int):
+        # Stale entries are still useful as revalidation targets, so keep them a while
+        await self.client.set(self.prefix + key, blob, ex=ttl * 4)
+        
+    async def delete(self, key: str):
+        await self.client.delete(self.prefix + key)
+
+class HTTPCache:
+    """Size-bounded LRU cache of compressed HTTP responses with conditional revalidation."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.monitoring = MonitoringService()
+        
+        self.ttls = {**DEFAULT_TTLS, **config.get('http_cache_ttls', {})}
+        self.max_size_bytes = config.get('http_cache_max_bytes', 256 * 1024 * 1024)
+        self.compression_level = config.get('http_cache_compression_level', 6)
+        self.metrics_interval = config.get('http_cache_metrics_interval', 60)
+        self._published_at = time.monotonic()
+        
+        # LRU index of stored entries: key -> compressed size
+        self._index: OrderedDict = OrderedDict()
+        self._size_bytes = 0
+        self.storage = self._create_storage()
+        
+        # Statistics per platform
+        self.stats = defaultdict(lambda: {
+            'hits': 0,
+            'revalidated': 0,
+            'misses': 0,
+            'bypassed': 0,
+            'bytes_saved': 0
+        })
+        
+    def _create_storage(self) -> Any:
+        """Create the configured storage backend."""
+        if self.config.get('http_cache_redis_url'):
+            return RedisCacheStorage(self.config['http_cache_redis_url'])
+            
+        if self.config.get('http_cache_dir'):
+            storage = DiskCacheStorage(self.config['http_cache_dir'])
+            for key, size in storage.existing_entries().items():
+                self._index[key] = size
+                self._size_bytes += size
+            return storage
+            
+        return MemoryCacheStorage()
+        
+    async def get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        platform: str = 'generic',
+        **kwargs
+    ) -> CachedResponse:
+        """GET a URL through the cache."""
+        headers = dict(kwargs.pop('headers', None) or {})
+        stats = self.stats[platform]
+        if self._has_credentials(session, headers, kwargs):
+            stats['bypassed'] += 1
+            return await self._fetch(session, url, headers, kwargs)
+            
+        key = self._key(url, kwargs.get('params'))
+        entry = await self._load(key)
+        if entry and not self._matches_vary(entry[0], headers):
+            entry = None
+        ttl = self.ttls.get(platform, self.ttls['generic'])
+        
+        if entry and time.time() - entry[0]['stored_at'] < ttl:
+            stats['hits'] += 1
+            stats['bytes_saved'] += len(entry[1])
+            self._record_hit_rate()
+            return self._replay(entry)
+            
+        request_headers = dict(headers)
+        if entry:
+            metadata = entry[0]
+            if metadata['headers'].get('ETag'):
+                request_headers['If-None-Match'] = metadata['headers']['ETag']
+            if metadata['headers'].get('Last-Modified'):
+                request_headers['If-Modified-Since'] = metadata['headers']['Last-Modified']
+                
+        async with session.get(url, headers=request_headers, **kwargs) as response:
+            if response.status == 304 and entry:
+                stats['revalidated'] += 1
+                stats['bytes_saved'] += len(entry[1])
+                entry[0]['stored_at'] = time.time()
+                await self._store(key, entry[0], entry[1], ttl)
+                self._record_hit_rate()
+                return self._replay(entry)
+                
+            body = await response.read()
+            response_headers = self._stored_headers(response)
+            
+        stats['misses'] += 1
+        self._record_hit_rate()
+        
+        if response.status == 200 and self._is_cacheable(response_headers):
+            vary = self._vary_names(response_headers)
+            metadata = {
+                'url': str(response.url),
+                'status': response.status,
+                'headers': response_headers,
+                'vary': {name: self._header(headers, name) for name in vary},
+                'stored_at': time.time()
+            }
+            await self._store(key, metadata, body, ttl)
+            
+        return CachedResponse(str(response.url), response.status, response_headers, body)
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics per platform."""
+        stats = {}
+        for platform, counts in list(self.stats.items()):
+            total = counts['hits'] + counts['revalidated'] + counts['misses']
+            stats[platform] = {
+                **counts,
+                'hit_rate': (counts['hits'] + counts['revalidated']) / total if total else 0.0
+            }
+        return {
+            'platforms': stats,
+            'entries': len(self._index),
+            'size_bytes': self._size_bytes
+        }
+        
+    def publish_metrics(self):
+        """Publish the cache hit rate of every platform."""
+        self._published_at = time.monotonic()
+        for platform, stats in self.get_stats()['platforms'].items():
+            self.monitoring.record_metric('http_cache_hit_rate', stats['hit_rate'], {'platform': platform})
+            
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any]
+    ) -> CachedResponse:
+        """GET a URL without reading or writing the cache."""
+        async with session.get(url, headers=headers, **kwargs) as response:
+            body = await response.read()
+            return CachedResponse(str(response.url), response.status, self._stored_headers(response), body)
+            
+    def _key(self, url: str, params: Any = None) -> str:
+        """Get the cache key of a URL with its query parameters."""
+        if params:
+            url = str(URL(url).update_query(params))
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+        
+    def _has_credentials(
+        self,
+        session: aiohttp.ClientSession,
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any]
+    ) -> bool:
+        """Check whether a request sends credentials configured on it or on its session."""
+        # Cookies the jar picked up from earlier responses don't count; nearly every site
+        # sets one, and personalized responses are marked private and never stored
+        if kwargs.get('auth') or kwargs.get('cookies') or getattr(session, 'auth', None):
+            return True
+        session_headers = getattr(session, 'headers', None) or {}
+        return any(
+            self._header(headers, name) is not None or self._header(session_headers, name) is not None
+            for name in CREDENTIAL_HEADERS
+        )
+        
+    def _matches_vary(self, metadata: Dict[str, Any], headers: Dict[str, str]) -> bool:
+        """Check that a request sends the header values an entry was stored under."""
+        return all(
+            self._header(headers, name) == value
+            for name, value in metadata.get('vary', {}).items()
+        )
+        
+    def _vary_names(self, headers: Dict[str, str]) -> List[str]:
+        """Get the request header names listed in a response's Vary header."""
+        return [name.strip() for name in headers.get('Vary', '').split(',') if name.strip()]
+        
+    def _header(self, headers: Any, name: str) -> Optional[str]:
+        """Get a request header case-insensitively."""
+        for key, value in headers.items():
+            if key.lower() == name.lower():
+                return value
+        return None
+        
+    def _stored_headers(self, response: Any) -> Dict[str, str]:
+        """Get the response headers kept with a cache entry."""
+        return {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        
+    async def _load(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """Load and decode a cache entry."""
+        try:
+            blob = await self.storage.get(key)
+            if blob is None:
+                self._drop_from_index(key)
+                return None
+                
+            header_length = int.from_bytes(blob[:4], 'big')
+            metadata = json.loads(blob[4:4 + header_length])
+            body = zlib.decompress(blob[4 + header_length:])
+            
+            if key in self._index:
+                self._index.move_to_end(key)
+            return metadata, body
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error loading HTTP cache entry: {str(e)}")
+            return None
+            
+    async def _store(self, key: str, metadata: Dict[str, Any], body: bytes, ttl: int):
+        """Compress and store a cache entry, evicting least recently used entries."""
+        try:
+            header = json.dumps(metadata).encode('utf-8')
+            blob = len(header).to_bytes(4, 'big') + header + zlib.compress(body, self.compression_level)
+            if len(blob) > self.max_size_bytes:
+                return
+                
+            await self.storage.set(key, blob, ttl)
+            if self.storage.evicts:
+                return
+                
+            self._drop_from_index(key)
+            self._index[key] = len(blob)
+            self._size_bytes += len(blob)
+            
+            while self._size_bytes > self.max_size_bytes:
+                evicted_key, _ = next(iter(self._index.items()))
+                self._drop_from_index(evicted_key)
+                await self.storage.delete(evicted_key)
+                
+        except Exception as e:
+            self.monitoring.log_error(f"Error storing HTTP cache entry: {str(e)}")
+            
+    def _drop_from_index(self, key: str):
+        """Remove an entry from the LRU index."""
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._size_bytes -= size
+            
+    def _replay(self, entry: Tuple[Dict[str, Any], bytes]) -> CachedResponse:
+        """Build a response from a cache entry."""
+        metadata, body = entry
+        return CachedResponse(
+            metadata['url'],
+            metadata['status'],
+            metadata['headers'],
+            body,
+            from_cache=True
+        )
+        
+    def _is_cacheable(self, headers: Dict[str, str]) -> bool:
+        """Check whether a response may be stored."""
+        cache_control = headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control or 'private' in cache_control:
+            return False
+        return '*' not in self._vary_names(headers)
+        
+    def _record_hit_rate(self):
+        """Publish hit rates once the metrics interval has passed since the last publish."""
+        if time.monotonic() - self._published_at >= self.metrics_interval:
+            self.publish_metrics()
+
+class CachingSession:
+    """aiohttp session wrapper that routes GET requests through an HTTPCache."""
+    
+    def __init__(self, session: aiohttp.ClientSession, cache: HTTPCache, platform: str):
+        self._session = session
+        self._cache = cache
+        self._platform = platform
+        
+    def get(self, url: str, **kwargs) -> '_CachedRequest':
+        """GET a URL through the cache."""
+        return _CachedRequest(self._cache.get(self._session, str(url), self._platform, **kwargs))
+        
+    def __getattr__(self, name: str) -> Any:
+        # Everything except GET goes straight to the wrapped session
+        return getattr(self._session, name)
+
+class _CachedRequest:
+    """Awaitable, async-context-manager wrapper around a cached GET."""
+    
+    def __init__(self, coro):
+        self._coro = coro
+        
+    def __await__(self):
+        return self._coro.__await__()
+        
+    async def __aenter__(self) -> CachedResponse:
+        return await self._coro
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
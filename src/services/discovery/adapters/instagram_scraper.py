@@ -4,7 +4,7 @@ Instagram Scraper
 This module implements scraping functionality for Instagram profiles and content.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 import asyncio
 from selenium.webdriver.common.by import By
@@ -22,11 +22,13 @@ logger = logging.getLogger(__name__)
 class InstagramScraper(BaseScraper):
     """Scrapes data from Instagram profiles and content."""
     
+    platform = 'instagram'
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.rate_limiter = RateLimiter(config)
         
-    async def scrape_profile(self, profile_url: str) -> DataObject:
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
         """Scrape an Instagram profile."""
         try:
             # Acquire rate limit permission
@@ -45,7 +47,7 @@ class InstagramScraper(BaseScraper):
             
             profile_data = {
                 'basic_info': await self._extract_basic_info(),
-                'posts': await self._extract_posts(),
+                'posts': await self._extract_posts(since),
                 'followers': await self._extract_followers(),
                 'following': await self._extract_following(),
                 'engagement': await self._extract_engagement()
@@ -58,7 +60,7 @@ class InstagramScraper(BaseScraper):
             if e.status == 429:
                 retry_after = int(e.headers.get('Retry-After', 60))
                 await self._handle_rate_limit(retry_after)
-                return await self.scrape_profile(profile_url)
+                return await self.scrape_profile(profile_url, since)
             self._handle_error(e, f"scraping Instagram profile {profile_url}")
             return self._to_data_object("Instagram", {})
             
@@ -155,15 +157,15 @@ class InstagramScraper(BaseScraper):
             self._handle_error(e, "extracting Instagram basic info")
             return {}
             
-    async def _extract_posts(self) -> List[Dict[str, Any]]:
-        """Extract posts from the profile."""
+    async def _extract_posts(self, since: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Extract posts from the profile, stopping at the watermark."""
         try:
             posts = []
             post_elements = self.driver.find_elements(By.CSS_SELECTOR, "article")
             
-            for element in post_elements:
+            for element, marker in self._iter_new_posts(post_elements, since, self._read_post_marker):
                 post = {
-                    'url': self._get_element_attribute(element, "a", "href"),
+                    'url': marker['post_id'],
                     'thumbnail': self._get_element_attribute(element, "img", "src"),
                     'caption': self._get_element_text(element, "div[role='button']"),
                     'likes': self._parse_count(self._get_element_text(element, "section span")),
@@ -179,6 +181,13 @@ class InstagramScraper(BaseScraper):
             self._handle_error(e, "extracting Instagram posts")
             return []
             
+    def _read_post_marker(self, element: Any) -> Dict[str, Any]:
+        """Read the fields identifying a post for watermark checks."""
+        return {
+            'post_id': self._get_element_attribute(element, "a", "href"),
+            'timestamp': self._get_element_attribute(element, "time", "datetime")
+        }
+            
     async def _extract_followers(self) -> Dict[str, Any]:
         """Extract follower information."""
         try:
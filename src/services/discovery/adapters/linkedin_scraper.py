@@ -2,6 +2,10 @@
 LinkedIn Scraper
 
 This module implements scraping functionality for LinkedIn profiles and content.
+Public posts and articles ship their text, date and interaction counts as JSON-LD,
+so content is fetched over plain HTTP and only rendered in the browser when that
+data is missing. Experience, skills and connections only render for a signed-in
+browser session, so profile pages are always rendered.
 """
 
 from typing import Dict, List, Any, Optional
@@ -21,17 +25,25 @@ from src.services.monitoring.monitoring import MonitoringService
 from discovery.models.data_object import DataObject
 from .base_scraper import BaseScraper
 from .rate_limiter import RateLimiter
+from .tiered_fetcher import TieredFetcher, FetchedPage, interaction_counts
 
 logger = logging.getLogger(__name__)
 
+# JSON-LD types a public post or article is published as
+POSTING_TYPES = {'SocialMediaPosting', 'DiscussionForumPosting', 'Article', 'NewsArticle', 'BlogPosting'}
+
 class LinkedInScraper(BaseScraper):
     """Scrapes data from LinkedIn profiles and content."""
     
+    platform = 'linkedin'
+    lazy_browser = True
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.rate_limiter = RateLimiter(config)
+        self.fetcher = TieredFetcher(config)
         
-    async def scrape_profile(self, profile_url: str) -> DataObject:
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
         """Scrape a LinkedIn profile."""
         try:
             # Acquire rate limit permission
@@ -44,7 +56,7 @@ class LinkedInScraper(BaseScraper):
             profile_url = self._normalize_url(profile_url)
             
             # Load profile page
-            self.driver.get(profile_url)
+            self._ensure_driver().get(profile_url)
             await asyncio.sleep(self.config.get('page_load_delay', 2))
             
             # Wait for profile content to load
@@ -58,7 +70,7 @@ class LinkedInScraper(BaseScraper):
                 'experience': await self._extract_experience(),
                 'education': await self._extract_education(),
                 'skills': await self._extract_skills(),
-                'content': await self._extract_content(),
+                'content': await self._extract_content(since),
                 'connections': await self._extract_connections()
             }
             
@@ -69,7 +81,7 @@ class LinkedInScraper(BaseScraper):
             if e.status == 429:
                 retry_after = int(e.headers.get('Retry-After', 60))
                 await self._handle_rate_limit(retry_after)
-                return await self.scrape_profile(profile_url)
+                return await self.scrape_profile(profile_url, since)
             self._handle_error(e, f"scraping LinkedIn profile {profile_url}")
             return self._to_data_object("LinkedIn", {})
             
@@ -87,15 +99,16 @@ class LinkedInScraper(BaseScraper):
                 raise ValueError(f"Invalid content URL: {content_url}")
                 
             content_url = self._normalize_url(content_url)
-            self.driver.get(content_url)
-            await asyncio.sleep(self.config.get('page_load_delay', 2))
-            
-            WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "feed-shared-update-v2"))
+            page = await self.fetcher.fetch(
+                content_url, self.session, self._render_post, ('json_ld',),
+                accept=lambda fetched: bool(self._find_postings(fetched))
             )
             
-            content_data = await self._extract_content()
-            logger.info(f"Successfully scraped LinkedIn content: {content_url}")
+            if page.tier == 'http':
+                content_data = self._read_postings(page)
+            else:
+                content_data = await self._extract_content()
+            logger.info(f"Successfully scraped LinkedIn content: {content_url} (via {page.tier})")
             return self._to_data_object("LinkedIn", {'content': content_data})
             
         except ClientResponseError as e:
@@ -120,7 +133,7 @@ class LinkedInScraper(BaseScraper):
                 raise ValueError(f"Invalid profile URL: {profile_url}")
                 
             profile_url = self._normalize_url(profile_url)
-            self.driver.get(profile_url)
+            self._ensure_driver().get(profile_url)
             await asyncio.sleep(self.config.get('page_load_delay', 2))
             
             WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
@@ -143,6 +156,47 @@ class LinkedInScraper(BaseScraper):
             self._handle_error(e, f"scraping LinkedIn network {profile_url}")
             return self._to_data_object("LinkedIn", {})
             
+    async def _render_post(self, url: str) -> str:
+        """Render a post in the browser and return its HTML."""
+        driver = self._ensure_driver()
+        driver.get(url)
+        await asyncio.sleep(self.config.get('page_load_delay', 2))
+        
+        WebDriverWait(driver, self.config.get('timeout', 10)).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "feed-shared-update-v2"))
+        )
+        return driver.page_source
+        
+    def _find_postings(self, page: FetchedPage) -> List[Dict[str, Any]]:
+        """JSON-LD items of a page that describe a post or article."""
+        items = []
+        pending = list(page.fields.get('json_ld', []))
+        while pending:
+            item = pending.pop(0)
+            if isinstance(item, list):
+                pending.extend(item)
+            elif isinstance(item, dict):
+                pending.extend(item.get('@graph', []))
+                types = item.get('@type')
+                if POSTING_TYPES.intersection(types if isinstance(types, list) else [types]):
+                    items.append(item)
+        return items
+        
+    def _read_postings(self, page: FetchedPage) -> List[Dict[str, Any]]:
+        """Read posts from the JSON-LD of a page fetched over HTTP."""
+        content = []
+        for item in self._find_postings(page):
+            engagement = interaction_counts(page, item)
+            if 'comments' not in engagement and str(item.get('commentCount', '')).isdigit():
+                engagement['comments'] = int(item['commentCount'])
+            content.append({
+                'text': item.get('articleBody') or item.get('text') or item.get('headline', ''),
+                'timestamp': item.get('datePublished'),
+                'engagement': engagement,
+                'metadata': self._extract_node_metadata(page.document)
+            })
+        return content
+        
     async def _extract_basic_info(self) -> Dict[str, Any]:
         """Extract basic profile information."""
         try:
@@ -240,8 +294,8 @@ class LinkedInScraper(BaseScraper):
             self._handle_error(e, "extracting LinkedIn skills")
             return []
             
-    async def _extract_content(self) -> List[Dict[str, Any]]:
-        """Extract profile content and posts."""
+    async def _extract_content(self, since: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Extract profile content and posts, stopping at the watermark."""
         try:
             content_section = self.driver.find_element(By.ID, "content-section")
             content_items = content_section.find_elements(
@@ -249,10 +303,10 @@ class LinkedInScraper(BaseScraper):
             )
             
             content = []
-            for item in content_items:
+            for item, marker in self._iter_new_posts(content_items, since, self._read_post_marker):
                 post = {
                     'text': item.text,
-                    'timestamp': self._get_element_attribute(item, "time", "datetime"),
+                    'timestamp': marker['timestamp'],
                     'engagement': self._get_engagement_metrics(item),
                     'metadata': self._extract_metadata(item)
                 }
@@ -264,6 +318,13 @@ class LinkedInScraper(BaseScraper):
             self._handle_error(e, "extracting LinkedIn content")
             return []
             
+    def _read_post_marker(self, element: Any) -> Dict[str, Any]:
+        """Read the fields identifying a post for watermark checks."""
+        return {
+            'post_id': None,
+            'timestamp': self._get_element_attribute(element, "time", "datetime")
+        }
+            
     async def _extract_connections(self) -> Dict[str, Any]:
         """Extract connection information."""
         try:
@@ -4,7 +4,7 @@ Reddit Scraper
 This module implements scraping functionality for Reddit profiles and content.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 import asyncio
 from selenium.webdriver.common.by import By
@@ -21,11 +21,13 @@ logger = logging.getLogger(__name__)
 class RedditScraper(BaseScraper):
     """Scrapes data from Reddit profiles and content."""
     
+    platform = 'reddit'
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.rate_limiter = RateLimiter(config)
         
-    async def scrape_profile(self, profile_url: str) -> DataObject:
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
         """Scrape a Reddit profile."""
         try:
             # Acquire rate limit permission
@@ -44,7 +46,7 @@ class RedditScraper(BaseScraper):
             
             profile_data = {
                 'basic_info': await self._extract_basic_info(),
-                'posts': await self._extract_posts(),
+                'posts': await self._extract_posts(since),
                 'comments': await self._extract_comments(),
                 'karma': await self._extract_karma(),
                 'engagement': await self._extract_engagement()
@@ -57,7 +59,7 @@ class RedditScraper(BaseScraper):
             if e.status == 429:
                 retry_after = int(e.headers.get('Retry-After', 60))
                 await self._handle_rate_limit(retry_after)
-                return await self.scrape_profile(profile_url)
+                return await self.scrape_profile(profile_url, since)
             self._handle_error(e, f"scraping Reddit profile {profile_url}")
             return self._to_data_object("Reddit", {})
             
@@ -152,20 +154,20 @@ class RedditScraper(BaseScraper):
             self._handle_error(e, "extracting Reddit basic info")
             return {}
             
-    async def _extract_posts(self) -> List[Dict[str, Any]]:
-        """Extract posts from the profile."""
+    async def _extract_posts(self, since: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Extract posts from the profile, stopping at the watermark."""
         try:
             posts = []
             post_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-testid='post-container']")
             
-            for element in post_elements:
+            for element, marker in self._iter_new_posts(post_elements, since, self._read_post_marker):
                 post = {
                     'title': self._get_element_text(element, "[data-testid='post-title']"),
-                    'url': self._get_element_attribute(element, "a", "href"),
+                    'url': marker['post_id'],
                     'subreddit': self._get_element_text(element, "[data-testid='subreddit-name']"),
                     'score': self._parse_count(self._get_element_text(element, "[data-testid='post-score']")),
                     'comments': self._parse_count(self._get_element_text(element, "[data-testid='post-comments']")),
-                    'timestamp': self._get_element_attribute(element, "time", "datetime"),
+                    'timestamp': marker['timestamp'],
                     'metadata': self._extract_metadata(element)
                 }
                 posts.append(post)
@@ -176,6 +178,13 @@ class RedditScraper(BaseScraper):
             self._handle_error(e, "extracting Reddit posts")
             return []
             
+    def _read_post_marker(self, element: Any) -> Dict[str, Any]:
+        """Read the fields identifying a post for watermark checks."""
+        return {
+            'post_id': self._get_element_attribute(element, "a", "href"),
+            'timestamp': self._get_element_attribute(element, "time", "datetime")
+        }
+            
     async def _extract_comments(self) -> List[Dict[str, Any]]:
         """Extract comments from the profile."""
         try:
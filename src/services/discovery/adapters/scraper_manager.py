@@ -8,16 +8,24 @@ scrapers in the Agentic Affiliate Outreach System.
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import asyncio
+import importlib
+import time
+from contextlib import asynccontextmanager
 from services.monitoring import MonitoringService
-from services.discovery.adapters.linkedin_scraper import LinkedInScraper
-from services.discovery.adapters.twitter_scraper import TwitterScraper
-from services.discovery.adapters.youtube_scraper import YouTubeScraper
-from services.discovery.adapters.tiktok_scraper import TikTokScraper
-from services.discovery.adapters.instagram_scraper import InstagramScraper
-from services.discovery.adapters.reddit_scraper import RedditScraper
-from services.discovery.adapters.generic_scraper import GenericWebScraper
+from services.discovery.adapters.scraper_resources import ScraperResources
 from services.discovery.models.data_object import DataObject, PlatformType
 
+# Scraper classes by platform, imported and constructed on first request
+SCRAPER_REGISTRY = {
+    PlatformType.LINKEDIN: ('services.discovery.adapters.linkedin_scraper', 'LinkedInScraper'),
+    PlatformType.TWITTER: ('services.discovery.adapters.twitter_scraper', 'TwitterScraper'),
+    PlatformType.YOUTUBE: ('services.discovery.adapters.youtube_scraper', 'YouTubeScraper'),
+    PlatformType.TIKTOK: ('services.discovery.adapters.tiktok_scraper', 'TikTokScraper'),
+    PlatformType.INSTAGRAM: ('services.discovery.adapters.instagram_scraper', 'InstagramScraper'),
+    PlatformType.REDDIT: ('services.discovery.adapters.reddit_scraper', 'RedditScraper'),
+    PlatformType.GENERIC: ('services.discovery.adapters.generic_scraper', 'GenericWebScraper')
+}
+
 class ScraperManager:
     """Manages platform-specific scrapers."""
     
@@ -26,41 +34,86 @@ class ScraperManager:
         self.config = config or {}
         self.monitoring = MonitoringService()
         
-        # Initialize scrapers
-        self.scrapers = {
-            PlatformType.LINKEDIN: LinkedInScraper(self.config),
-            PlatformType.TWITTER: TwitterScraper(self.config),
-            PlatformType.YOUTUBE: YouTubeScraper(self.config),
-            PlatformType.TIKTOK: TikTokScraper(self.config),
-            PlatformType.INSTAGRAM: InstagramScraper(self.config),
-            PlatformType.REDDIT: RedditScraper(self.config),
-            PlatformType.GENERIC: GenericWebScraper(self.config)
-        }
+        # Idle shutdown policy
+        self.idle_timeout = self.config.get('scraper_idle_timeout', 300)
+        self.idle_check_interval = self.config.get('scraper_idle_check_interval', 60)
+        
+        # Connection pool, cache and browsers shared by all scrapers
+        self.resources = ScraperResources(self.config)
+        
+        # Scrapers built so far, when each was last requested or released, and how
+        # many callers hold a lease on it
+        self.scrapers: Dict[PlatformType, Any] = {}
+        self.last_used: Dict[PlatformType, float] = {}
+        self.leases: Dict[PlatformType, int] = {}
+        self._lock = asyncio.Lock()
+        self._reaper_task: Optional[asyncio.Task] = None
         
         # Initialize scraper status
         self.scraper_status: Dict[str, Dict[str, Any]] = {}
         
     async def get_scraper(self, platform: str) -> Any:
-        """Get scraper for a specific platform."""
+        """Get scraper for a specific platform, building it on first request.
+        
+        Callers that keep using the scraper across awaits should hold a `lease`, so
+        idle shutdown cannot close it underneath them.
+        """
+        return await self._checkout(platform, lease=False)
+        
+    async def acquire(self, platform: str) -> Any:
+        """Get a platform's scraper and hold a lease on it until `release`."""
+        return await self._checkout(platform, lease=True)
+        
+    async def release(self, platform: str):
+        """Give back a lease; the scraper's idle time starts now."""
+        platform_type = self._get_platform_type(platform)
+        async with self._lock:
+            remaining = self.leases.get(platform_type, 0) - 1
+            if remaining > 0:
+                self.leases[platform_type] = remaining
+            else:
+                self.leases.pop(platform_type, None)
+            if platform_type in self.scrapers:
+                self.last_used[platform_type] = time.monotonic()
+                
+    @asynccontextmanager
+    async def lease(self, platform: str):
+        """Hold a platform's scraper for the duration of a block."""
+        scraper = await self.acquire(platform)
         try:
-            # Get platform type
-            platform_type = self._get_platform_type(platform)
+            yield scraper
+        finally:
+            await self.release(platform)
             
-            # Get scraper
-            scraper = self.scrapers.get(platform_type)
-            if not scraper:
-                raise ValueError(f"No scraper found for platform: {platform}")
-                
-            return scraper
+    async def shutdown_idle_scrapers(self) -> List[PlatformType]:
+        """Close scrapers that have not been requested within the idle timeout."""
+        try:
+            now = time.monotonic()
+            async with self._lock:
+                # Leased scrapers are in use however long ago they were requested
+                idle = [
+                    platform_type for platform_type, last_used in self.last_used.items()
+                    if now - last_used >= self.idle_timeout and not self.leases.get(platform_type)
+                ]
+                for platform_type in idle:
+                    scraper = self.scrapers.pop(platform_type)
+                    del self.last_used[platform_type]
+                    await scraper.close()
+                    await self.update_scraper_status(platform_type, {'status': 'idle'})
+                    
+                # Release the shared connections and browsers once no scraper is left
+                if idle and not self.scrapers:
+                    await self.resources.close()
+                    
+            return idle
             
         except Exception as e:
             self.monitoring.log_error(
-                f"Error getting scraper: {str(e)}",
-                error_type="scraper_retrieval_error",
-                component="scraper_manager",
-                context={'platform': platform}
+                f"Error shutting down idle scrapers: {str(e)}",
+                error_type="idle_shutdown_error",
+                component="scraper_manager"
             )
-            raise
+            return []
             
     async def update_scraper_status(self, platform: str, status: Dict[str, Any]):
         """Update status of a specific scraper."""
@@ -97,22 +150,91 @@ class ScraperManager:
         """Get status of all scrapers."""
         return self.scraper_status
         
+    async def _checkout(self, platform: str, lease: bool) -> Any:
+        """Get a platform's scraper, building it on first request and optionally leasing it."""
+        try:
+            # Get platform type
+            platform_type = self._get_platform_type(platform)
+            
+            async with self._lock:
+                scraper = self.scrapers.get(platform_type)
+                if not scraper:
+                    scraper = await self._build_scraper(platform_type)
+                    self.scrapers[platform_type] = scraper
+                self.last_used[platform_type] = time.monotonic()
+                if lease:
+                    self.leases[platform_type] = self.leases.get(platform_type, 0) + 1
+                self._ensure_reaper()
+                
+            return scraper
+            
+        except Exception as e:
+            self.monitoring.log_error(
+                f"Error getting scraper: {str(e)}",
+                error_type="scraper_retrieval_error",
+                component="scraper_manager",
+                context={'platform': platform}
+            )
+            raise
+            
+    async def _build_scraper(self, platform_type: PlatformType) -> Any:
+        """Import, construct and initialize the scraper for a platform."""
+        if platform_type not in SCRAPER_REGISTRY:
+            raise ValueError(f"No scraper found for platform: {platform_type}")
+            
+        start_time = time.perf_counter()
+        module_path, class_name = SCRAPER_REGISTRY[platform_type]
+        scraper_class = getattr(importlib.import_module(module_path), class_name)
+        
+        scraper = scraper_class(self.config)
+        scraper.attach_resources(self.resources)
+        await scraper.initialize()
+        
+        self.monitoring.record_metric(
+            'scraper_cold_start_seconds',
+            time.perf_counter() - start_time,
+            {'platform': platform_type.value}
+        )
+        await self.update_scraper_status(platform_type, {'status': 'active'})
+        return scraper
+        
+    def _ensure_reaper(self):
+        """Start the idle-shutdown loop if it is not running."""
+        if self.idle_timeout and (self._reaper_task is None or self._reaper_task.done()):
+            self._reaper_task = asyncio.create_task(self._reap_idle_scrapers())
+            
+    async def _reap_idle_scrapers(self):
+        """Periodically shut down idle scrapers until none are left."""
+        while self.scrapers:
+            await asyncio.sleep(self.idle_check_interval)
+            await self.shutdown_idle_scrapers()
+            
     def _get_platform_type(self, platform: str) -> PlatformType:
         """Get platform type from string."""
         try:
-            return PlatformType(platform.lower())
+            return PlatformType(platform)
         except ValueError:
-            return PlatformType.GENERIC
+            return PlatformType.__members__.get(platform.upper(), PlatformType.GENERIC)
             
     async def cleanup(self):
         """Cleanup resources."""
         try:
-            # Update all scrapers to inactive
-            for platform in self.scrapers.keys():
-                await self.update_scraper_status(
-                    platform,
-                    {'status': 'inactive'}
-                )
+            if self._reaper_task:
+                self._reaper_task.cancel()
+                self._reaper_task = None
+                
+            # Close all scrapers and update them to inactive
+            async with self._lock:
+                for platform, scraper in list(self.scrapers.items()):
+                    await scraper.close()
+                    await self.update_scraper_status(
+                        platform,
+                        {'status': 'inactive'}
+                    )
+                self.scrapers.clear()
+                self.last_used.clear()
+                self.leases.clear()
+                await self.resources.close()
                 
         except Exception as e:
             self.monitoring.log_error(
@@ -120,4 +242,4 @@ class ScraperManager:
                 error_type="cleanup_error",
                 component="scraper_manager"
             )
-            raise 
\ No newline at end of file
+            raise
\ No newline at end of file
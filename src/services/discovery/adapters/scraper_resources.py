@@ -0,0 +1,124 @@
+"""
+Scraper Resources
+
+This module implements the heavyweight resources shared by all scrapers owned by a
+ScraperManager: one aiohttp connection pool and response cache, and a pool of warm
+headless browsers. Each resource is created on first use.
+"""
+
+from typing import Dict, List, Any, Optional, FrozenSet, Tuple
+import logging
+import aiohttp
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from .http_cache import HTTPCache
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+class BrowserPool:
+    """Pool of headless Chrome instances reused across scrapers."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.monitoring = MonitoringService()
+        self.max_idle = config.get('browser_pool_max_idle', 2)
+        self.idle: List[webdriver.Chrome] = []
+        self.active = 0
+        
+    def acquire(self) -> webdriver.Chrome:
+        """Get a browser, reusing an idle one when available."""
+        if self.idle:
+            driver = self.idle.pop()
+        else:
+            driver = self._create_driver()
+            logger.info("Browser pool started a new WebDriver")
+        self.active += 1
+        self._record_usage()
+        return driver
+        
+    def release(self, driver: webdriver.Chrome):
+        """Return a browser to the pool, quitting it if the pool is full."""
+        self.active = max(self.active - 1, 0)
+        if len(self.idle) < self.max_idle:
+            try:
+                # Drop the previous scraper's state before handing the browser on
+                driver.delete_all_cookies()
+                self.idle.append(driver)
+            except Exception as e:
+                self.monitoring.log_error(f"Error recycling WebDriver: {str(e)}")
+                self._quit(driver)
+        else:
+            self._quit(driver)
+        self._record_usage()
+        
+    def close(self):
+        """Quit all idle browsers."""
+        while self.idle:
+            self._quit(self.idle.pop())
+        self._record_usage()
+        
+    def _create_driver(self) -> webdriver.Chrome:
+        """Create a headless Chrome WebDriver."""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument(f'user-agent={self.config.get("user_agent")}')
+        
+        return webdriver.Chrome(options=chrome_options)
+        
+    def _quit(self, driver: webdriver.Chrome):
+        """Quit a browser, logging failures."""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.monitoring.log_error(f"Error quitting WebDriver: {str(e)}")
+            
+    def _record_usage(self):
+        """Publish pool occupancy."""
+        self.monitoring.record_metric('browser_pool_active', self.active, {})
+        self.monitoring.record_metric('browser_pool_idle', len(self.idle), {})
+
+class ScraperResources:
+    """Lazily created resources shared by every scraper of a manager."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.browser_pool = BrowserPool(config)
+        self.http_cache = HTTPCache(config) if config.get('http_cache_enabled', True) else None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._sessions: Dict[FrozenSet[Tuple[str, str]], aiohttp.ClientSession] = {}
+        
+    def get_session(self, headers: Dict[str, str]) -> aiohttp.ClientSession:
+        """Get a session sending these default headers, over the shared connection pool."""
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.config.get('http_pool_size', 100),
+                limit_per_host=self.config.get('http_pool_size_per_host', 10)
+            )
+            self._sessions.clear()
+            
+        # Scrapers sending the same headers share a session; any others get their own
+        key = frozenset(headers.items())
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.config.get('timeout', 30)),
+                connector=self._connector,
+                connector_owner=False
+            )
+            self._sessions[key] = session
+        return session
+        
+    async def close(self):
+        """Close the sessions and connection pool and quit pooled browsers."""
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+        self.browser_pool.close()
@@ -0,0 +1,313 @@
+"""
+Tiered Fetcher
+
+This module implements HTTP-first page fetching for the platform adapters. Pages are
+requested with plain aiohttp and parsed with lxml; a headless browser render is only
+used when the raw HTML lacks the required fields or a JavaScript challenge is detected.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Iterable
+import asyncio
+import logging
+import json
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+import aiohttp
+import lxml.html
+from lxml.etree import ParserError
+
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+# Markers left by anti-bot interstitials that only resolve in a real browser
+CHALLENGE_PATTERN = re.compile(
+    r'cf-browser-verification|challenge-platform|_cf_chl_opt|'
+    r'<title>\s*just a moment|checking your browser|'
+    r'enable javascript and cookies to continue|ddos-guard|px-captcha',
+    re.IGNORECASE
+)
+CHALLENGE_STATUSES = {403, 503}
+CHALLENGE_SCAN_CHARS = 65536
+
+# schema.org interaction types and the engagement counts they are reported as
+INTERACTION_KEYS = {
+    'WatchAction': 'views',
+    'LikeAction': 'likes',
+    'CommentAction': 'comments',
+    'ShareAction': 'shares'
+}
+
+# Visible text only: skip script, style and noscript content
+TEXT_XPATH = (
+    './/text()[not(ancestor::script) and not(ancestor::style) '
+    'and not(ancestor::noscript)]'
+)
+
+@dataclass
+class FetchedPage:
+    """A fetched page together with the fields extracted from its HTML."""
+    url: str
+    html: str
+    tier: str
+    status: int = 200
+    document: Any = None
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+class TieredFetcher:
+    """Fetches pages over HTTP first and falls back to a browser render when needed."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.monitoring = MonitoringService()
+        
+        # Fallback policy
+        self.fallback_threshold = config.get('browser_fallback_threshold', 3)
+        self.browser_domain_ttl = config.get('browser_domain_ttl', 86400)
+        self.min_text_length = config.get('min_text_length', 200)
+        
+        # Per-domain tracking
+        self.domain_stats = defaultdict(lambda: {
+            'http_hits': 0,
+            'http_failures': 0,
+            'browser_renders': 0,
+            'consecutive_fallbacks': 0
+        })
+        self.browser_domains: Dict[str, float] = {}
+        
+    async def fetch(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession],
+        render: Callable[[str], Awaitable[str]],
+        required_fields: Iterable[str] = (),
+        accept: Optional[Callable[[FetchedPage], bool]] = None
+    ) -> FetchedPage:
+        """Fetch a page, rendering it in the browser only if plain HTTP is not enough.
+        
+        `accept` can reject an HTTP response whose required fields are present but
+        don't hold the data the caller needs, such as JSON-LD of the wrong type.
+        """
+        domain = self._get_domain(url)
+        http_attempted = False
+        
+        if session is not None and not self.requires_browser(domain):
+            try:
+                page = await self._fetch_http(url, session)
+                http_attempted = True
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Network failures say nothing about whether the page needs a browser,
+                # so they don't count towards marking the domain
+                self._record_http_failure(domain, url, e)
+                page = None
+            if page is not None and self._is_complete(page, required_fields) and (accept is None or accept(page)):
+                self._record_http_hit(domain)
+                return page
+                
+        html = await render(url)
+        page = self._build_page(url, html, 'browser')
+        self._record_browser_render(domain, http_attempted)
+        return page
+        
+    def requires_browser(self, domain: str) -> bool:
+        """Check whether a domain is currently known to need a browser render."""
+        marked_at = self.browser_domains.get(domain)
+        if marked_at is None:
+            return False
+        if time.monotonic() - marked_at > self.browser_domain_ttl:
+            # Re-probe plain HTTP once the entry expires
+            del self.browser_domains[domain]
+            self.domain_stats[domain]['consecutive_fallbacks'] = 0
+            return False
+        return True
+        
+    def get_domain_stats(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        """Get HTTP hit rates for one domain or for all tracked domains."""
+        domains = [domain] if domain else list(self.domain_stats.keys())
+        stats = {}
+        for name in domains:
+            counts = self.domain_stats[name]
+            total = counts['http_hits'] + counts['browser_renders']
+            stats[name] = {
+                'http_hits': counts['http_hits'],
+                'http_failures': counts['http_failures'],
+                'browser_renders': counts['browser_renders'],
+                'hit_rate': counts['http_hits'] / total if total else 0.0,
+                'requires_browser': name in self.browser_domains
+            }
+        return stats
+        
+    async def _fetch_http(self, url: str, session: aiohttp.ClientSession) -> Optional[FetchedPage]:
+        """Fetch a page with a plain GET, returning None when a browser is required."""
+        async with session.get(url, allow_redirects=True) as response:
+            if response.status == 429:
+                response.raise_for_status()
+                
+            html = await response.text(errors='replace')
+            if response.status in CHALLENGE_STATUSES or self._is_challenge(html):
+                logger.debug(f"JavaScript challenge detected for {url}")
+                return None
+                
+            if response.status >= 400:
+                response.raise_for_status()
+                
+            return self._build_page(str(response.url), html, 'http', response.status)
+            
+    def _build_page(self, url: str, html: str, tier: str, status: int = 200) -> FetchedPage:
+        """Parse HTML into a FetchedPage."""
+        document = self._parse_html(html, url)
+        return FetchedPage(
+            url=url,
+            html=html,
+            tier=tier,
+            status=status,
+            document=document,
+            fields=self._extract_fields(document) if document is not None else {}
+        )
+        
+    def _parse_html(self, html: str, url: str) -> Any:
+        """Parse HTML with lxml and resolve relative links."""
+        try:
+            document = lxml.html.document_fromstring(html)
+            document.make_links_absolute(url, resolve_base_href=True)
+            return document
+        except (ParserError, ValueError) as e:
+            logger.debug(f"Could not parse HTML from {url}: {str(e)}")
+            return None
+            
+    def _extract_fields(self, document: Any) -> Dict[str, Any]:
+        """Extract page fields and embedded structured data from a parsed document."""
+        meta = {}
+        for element in document.iter('meta'):
+            key = (element.get('name') or element.get('property') or '').lower()
+            if key and element.get('content') is not None:
+                meta.setdefault(key, element.get('content').strip())
+                
+        opengraph = {
+            key[3:]: value for key, value in meta.items() if key.startswith('og:')
+        }
+        
+        body = document.find('body')
+        text = ' '.join(
+            fragment.strip() for fragment in body.xpath(TEXT_XPATH) if fragment.strip()
+        ) if body is not None else ''
+        
+        return {
+            'title': (document.findtext('.//title') or opengraph.get('title', '')).strip(),
+            'description': meta.get('description') or opengraph.get('description', ''),
+            'keywords': [k.strip() for k in meta.get('keywords', '').split(',') if k.strip()],
+            'author': meta.get('author', ''),
+            'language': document.get('lang', ''),
+            'text': text,
+            'links': document.xpath('//a/@href'),
+            'opengraph': opengraph,
+            'microdata': self._extract_microdata(document),
+            'json_ld': self._extract_json_scripts(document, '//script[@type="application/ld+json"]'),
+            'next_data': next(iter(self._extract_json_scripts(document, '//script[@id="__NEXT_DATA__"]')), {})
+        }
+        
+    def _extract_microdata(self, document: Any) -> Dict[str, str]:
+        """Collect schema.org microdata properties given as content attributes, first value wins."""
+        microdata = {}
+        for element in document.xpath('//*[@itemprop and @content]'):
+            microdata.setdefault(element.get('itemprop'), element.get('content').strip())
+        return microdata
+        
+    def _extract_json_scripts(self, document: Any, xpath: str) -> List[Any]:
+        """Decode JSON payloads embedded in script tags."""
+        payloads = []
+        for script in document.xpath(xpath):
+            try:
+                payloads.append(json.loads(script.text or ''))
+            except ValueError:
+                continue
+        return payloads
+        
+    def _is_challenge(self, html: str) -> bool:
+        """Detect anti-bot interstitials in the head of the document."""
+        return bool(CHALLENGE_PATTERN.search(html[:CHALLENGE_SCAN_CHARS]))
+        
+    def _is_complete(self, page: FetchedPage, required_fields: Iterable[str]) -> bool:
+        """Check that the HTTP response carries every required field."""
+        if page.document is None:
+            return False
+            
+        has_embedded_data = bool(page.fields.get('json_ld') or page.fields.get('next_data'))
+        for field_name in required_fields:
+            value = page.fields.get(field_name)
+            if field_name == 'text':
+                # Client-rendered pages ship an empty shell; embedded JSON still counts
+                if len(value or '') < self.min_text_length and not has_embedded_data:
+                    return False
+            elif not value:
+                return False
+        return True
+        
+    def _record_http_hit(self, domain: str):
+        """Record a page served without the browser."""
+        stats = self.domain_stats[domain]
+        stats['http_hits'] += 1
+        stats['consecutive_fallbacks'] = 0
+        self._record_hit_rate(domain)
+        
+    def _record_http_failure(self, domain: str, url: str, error: BaseException):
+        """Record a plain GET that failed before returning a response."""
+        self.domain_stats[domain]['http_failures'] += 1
+        logger.debug(f"HTTP fetch of {url} failed, falling back to the browser: {error!r}")
+        self.monitoring.record_metric('http_fetch_failures', 1, {'domain': domain})
+        
+    def _record_browser_render(self, domain: str, http_attempted: bool):
+        """Record a browser render and remember domains that keep needing one."""
+        stats = self.domain_stats[domain]
+        stats['browser_renders'] += 1
+        if http_attempted:
+            stats['consecutive_fallbacks'] += 1
+            if stats['consecutive_fallbacks'] >= self.fallback_threshold:
+                self.browser_domains[domain] = time.monotonic()
+                logger.info(f"Marking {domain} as requiring browser rendering")
+        self._record_hit_rate(domain)
+        
+    def _record_hit_rate(self, domain: str):
+        """Publish the HTTP hit rate for a domain."""
+        self.monitoring.record_metric(
+            'http_fetch_hit_rate',
+            self.get_domain_stats(domain)[domain]['hit_rate'],
+            {'domain': domain}
+        )
+        
+    def _get_domain(self, url: str) -> str:
+        """Get the domain of a URL."""
+        return urlparse(url).netloc.lower()
+
+def interaction_counts(page: FetchedPage, item: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """Engagement counts from the schema.org InteractionCounters of a JSON-LD item, or of the page's microdata."""
+    counters = []
+    if item is not None:
+        statistics = item.get('interactionStatistic') or []
+        for statistic in statistics if isinstance(statistics, list) else [statistics]:
+            if isinstance(statistic, dict):
+                counters.append((statistic.get('interactionType'), statistic.get('userInteractionCount')))
+    elif page.document is not None:
+        for scope in page.document.xpath('//*[@itemprop="interactionStatistic"]'):
+            kind = scope.xpath('.//*[@itemprop="interactionType"]')
+            count = scope.xpath('.//*[@itemprop="userInteractionCount"]/@content')
+            if kind and count:
+                counters.append((kind[0].get('content') or kind[0].get('href'), count[0]))
+                
+    counts = {}
+    for kind, count in counters:
+        if isinstance(kind, dict):
+            kind = kind.get('@type')
+        key = INTERACTION_KEYS.get(str(kind or '').rstrip('/').rsplit('/', 1)[-1])
+        if key is None:
+            continue
+        try:
+            counts[key] = int(count)
+        except (TypeError, ValueError):
+            continue
+    return counts
@@ -27,11 +27,13 @@ logger = logging.getLogger(__name__)
 class TikTokScraper(BaseScraper):
     """Scrapes data from TikTok profiles and content."""
     
+    platform = 'tiktok'
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.rate_limiter = RateLimiter(config)
         
-    async def scrape_profile(self, profile_url: str) -> DataObject:
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
         """Scrape a TikTok profile."""
         try:
             # Acquire rate limit permission
@@ -50,7 +52,7 @@ class TikTokScraper(BaseScraper):
             
             profile_data = {
                 'basic_info': await self._extract_basic_info(),
-                'videos': await self._extract_videos(),
+                'videos': await self._extract_videos(since),
                 'followers': await self._extract_followers(),
                 'following': await self._extract_following(),
                 'engagement': await self._extract_engagement()
@@ -63,7 +65,7 @@ class TikTokScraper(BaseScraper):
             if e.status == 429:
                 retry_after = int(e.headers.get('Retry-After', 60))
                 await self._handle_rate_limit(retry_after)
-                return await self.scrape_profile(profile_url)
+                return await self.scrape_profile(profile_url, since)
             self._handle_error(e, f"scraping TikTok profile {profile_url}")
             return self._to_data_object("TikTok", {})
             
@@ -159,15 +161,15 @@ class TikTokScraper(BaseScraper):
             self._handle_error(e, "extracting TikTok basic info")
             return {}
             
-    async def _extract_videos(self) -> List[Dict[str, Any]]:
-        """Extract videos from the profile."""
+    async def _extract_videos(self, since: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Extract videos from the profile, stopping at the watermark."""
         try:
             videos = []
             video_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-e2e='user-post-item']")
             
-            for element in video_elements:
+            for element, marker in self._iter_new_posts(video_elements, since, self._read_video_marker):
                 video = {
-                    'url': self._get_element_attribute(element, "a", "href"),
+                    'url': marker['post_id'],
                     'thumbnail': self._get_element_attribute(element, "img", "src"),
                     'description': self._get_element_text(element, "[data-e2e='user-post-item-desc']"),
                     'likes': self._parse_count(self._get_element_text(element, "[data-e2e='like-count']")),
@@ -183,6 +185,13 @@ class TikTokScraper(BaseScraper):
             self._handle_error(e, "extracting TikTok videos")
             return []
             
+    def _read_video_marker(self, element: Any) -> Dict[str, Any]:
+        """Read the fields identifying a video for watermark checks."""
+        return {
+            'post_id': self._get_element_attribute(element, "a", "href"),
+            'timestamp': None
+        }
+            
     async def _extract_followers(self) -> Dict[str, Any]:
         """Extract follower information."""
         try:
@@ -27,11 +27,13 @@ logger = logging.getLogger(__name__)
 class TwitterScraper(BaseScraper):
     """Scrapes data from Twitter profiles and content."""
     
+    platform = 'twitter'
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.rate_limiter = RateLimiter(config)
         
-    async def scrape_profile(self, profile_url: str) -> DataObject:
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
         """Scrape a Twitter profile."""
         try:
             # Acquire rate limit permission
@@ -50,7 +52,7 @@ class TwitterScraper(BaseScraper):
             
             profile_data = {
                 'basic_info': await self._extract_basic_info(),
-                'tweets': await self._extract_tweets(),
+                'tweets': await self._extract_tweets(since),
                 'followers': await self._extract_followers(),
                 'following': await self._extract_following(),
                 'engagement': await self._extract_engagement()
@@ -63,7 +65,7 @@ class TwitterScraper(BaseScraper):
             if e.status == 429:
                 retry_after = int(e.headers.get('Retry-After', 60))
                 await self._handle_rate_limit(retry_after)
-                return await self.scrape_profile(profile_url)
+                return await self.scrape_profile(profile_url, since)
             self._handle_error(e, f"scraping Twitter profile {profile_url}")
             return self._to_data_object("Twitter", {})
             
@@ -164,16 +166,16 @@ class TwitterScraper(BaseScraper):
             self._handle_error(e, "extracting Twitter basic info")
             return {}
             
-    async def _extract_tweets(self) -> List[Dict[str, Any]]:
-        """Extract tweets from the profile."""
+    async def _extract_tweets(self, since: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Extract tweets from the profile, stopping at the watermark."""
         try:
             tweets = []
             tweet_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-testid='tweet']")
             
-            for element in tweet_elements:
+            for element, marker in self._iter_new_posts(tweet_elements, since, self._read_tweet_marker):
                 tweet = {
                     'text': self._get_element_text(element, "[data-testid='tweetText']"),
-                    'timestamp': self._get_element_attribute(element, "time", "datetime"),
+                    'timestamp': marker['timestamp'],
                     'engagement': await self._get_tweet_engagement(element),
                     'media': await self._get_tweet_media(element),
                     'metadata': self._extract_metadata(element)
@@ -186,6 +188,13 @@ class TwitterScraper(BaseScraper):
             self._handle_error(e, "extracting Twitter tweets")
             return []
             
+    def _read_tweet_marker(self, element: Any) -> Dict[str, Any]:
+        """Read the fields identifying a tweet for watermark checks."""
+        return {
+            'post_id': None,
+            'timestamp': self._get_element_attribute(element, "time", "datetime")
+        }
+            
     async def _extract_followers(self) -> Dict[str, Any]:
         """Extract follower information."""
         try:
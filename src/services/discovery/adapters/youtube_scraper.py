@@ -2,10 +2,15 @@
 YouTube Scraper
 
 This module implements scraping functionality for YouTube channels and videos.
+Watch pages ship the video's schema.org microdata in their HTML, so videos are
+fetched over plain HTTP and only rendered in the browser when that data is missing.
+Channel headers and video grids are built client-side from script payloads, so
+channel pages are always rendered.
 """
 
 from typing import Dict, List, Any, Optional
 import logging
+import re
 from datetime import datetime
 import asyncio
 import aiohttp
@@ -21,17 +26,28 @@ from src.services.monitoring.monitoring import MonitoringService
 from discovery.models.data_object import DataObject
 from .base_scraper import BaseScraper
 from .rate_limiter import RateLimiter
+from .tiered_fetcher import TieredFetcher, FetchedPage, interaction_counts
 
 logger = logging.getLogger(__name__)
 
+# Fields a watch page's raw HTML must provide before we skip the browser
+VIDEO_FIELDS = ('title', 'microdata')
+
+# ISO-8601 durations as used by schema.org, e.g. PT1H4M13S
+ISO_DURATION = re.compile(r'^P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?$')
+
 class YouTubeScraper(BaseScraper):
     """Scrapes data from YouTube channels and videos."""
     
+    platform = 'youtube'
+    lazy_browser = True
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.rate_limiter = RateLimiter(config)
+        self.fetcher = TieredFetcher(config)
         
-    async def scrape_profile(self, profile_url: str) -> DataObject:
+    async def scrape_profile(self, profile_url: str, since: Optional[Dict[str, Any]] = None) -> DataObject:
         """Scrape a YouTube channel."""
         try:
             # Acquire rate limit permission
@@ -41,7 +57,7 @@ class YouTubeScraper(BaseScraper):
                 raise ValueError(f"Invalid profile URL: {profile_url}")
                 
             profile_url = self._normalize_url(profile_url)
-            self.driver.get(profile_url)
+            self._ensure_driver().get(profile_url)
             await asyncio.sleep(self.config.get('page_load_delay', 2))
             
             WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
@@ -50,7 +66,7 @@ class YouTubeScraper(BaseScraper):
             
             profile_data = {
                 'basic_info': await self._extract_basic_info(),
-                'videos': await self._extract_videos(),
+                'videos': await self._extract_videos(since),
                 'subscribers': await self._extract_subscribers(),
                 'engagement': await self._extract_engagement()
             }
@@ -62,7 +78,7 @@ class YouTubeScraper(BaseScraper):
             if e.status == 429:
                 retry_after = int(e.headers.get('Retry-After', 60))
                 await self._handle_rate_limit(retry_after)
-                return await self.scrape_profile(profile_url)
+                return await self.scrape_profile(profile_url, since)
             self._handle_error(e, f"scraping YouTube channel {profile_url}")
             return self._to_data_object("YouTube", {})
             
@@ -80,15 +96,13 @@ class YouTubeScraper(BaseScraper):
                 raise ValueError(f"Invalid content URL: {content_url}")
                 
             content_url = self._normalize_url(content_url)
-            self.driver.get(content_url)
-            await asyncio.sleep(self.config.get('page_load_delay', 2))
-            
-            WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#movie_player"))
-            )
+            page = await self.fetcher.fetch(content_url, self.session, self._render_video, VIDEO_FIELDS)
             
-            content_data = await self._extract_video_details()
-            logger.info(f"Successfully scraped YouTube video: {content_url}")
+            if page.tier == 'http':
+                content_data = self._read_video_page(page)
+            else:
+                content_data = await self._extract_video_details()
+            logger.info(f"Successfully scraped YouTube video: {content_url} (via {page.tier})")
             return self._to_data_object("YouTube", content_data)
             
         except ClientResponseError as e:
@@ -113,7 +127,7 @@ class YouTubeScraper(BaseScraper):
                 raise ValueError(f"Invalid profile URL: {profile_url}")
                 
             profile_url = self._normalize_url(profile_url)
-            self.driver.get(profile_url)
+            self._ensure_driver().get(profile_url)
             await asyncio.sleep(self.config.get('page_load_delay', 2))
             
             WebDriverWait(self.driver, self.config.get('timeout', 10)).until(
@@ -139,6 +153,47 @@ class YouTubeScraper(BaseScraper):
             self._handle_error(e, f"scraping YouTube network {profile_url}")
             return self._to_data_object("YouTube", {})
             
+    async def _render_video(self, url: str) -> str:
+        """Render a watch page in the browser and return its HTML."""
+        driver = self._ensure_driver()
+        driver.get(url)
+        await asyncio.sleep(self.config.get('page_load_delay', 2))
+        
+        WebDriverWait(driver, self.config.get('timeout', 10)).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#movie_player"))
+        )
+        return driver.page_source
+        
+    def _read_video_page(self, page: FetchedPage) -> Dict[str, Any]:
+        """Read video details from the microdata of a watch page fetched over HTTP."""
+        microdata = page.fields['microdata']
+        counts = interaction_counts(page)
+        views = counts.get('views')
+        if views is None and microdata.get('interactionCount', '').isdigit():
+            views = int(microdata['interactionCount'])
+            
+        return {
+            'title': microdata.get('name') or page.fields['title'],
+            'description': microdata.get('description') or page.fields.get('description', ''),
+            'views': views or 0,
+            'likes': counts.get('likes', 0),
+            'comments': counts.get('comments', 0),
+            'upload_date': microdata.get('uploadDate') or microdata.get('datePublished', ''),
+            'duration': self._format_duration(microdata.get('duration', '')),
+            'metadata': self._extract_node_metadata(page.document)
+        }
+        
+    def _format_duration(self, duration: str) -> str:
+        """Format an ISO-8601 duration the way the player shows it, e.g. 1:04:13."""
+        match = ISO_DURATION.match(duration)
+        if not match or not any(match.groups()):
+            return duration
+        days, hours, minutes, seconds = (int(part or 0) for part in match.groups())
+        hours += days * 24
+        if hours:
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes}:{seconds:02d}"
+        
     async def _extract_basic_info(self) -> Dict[str, Any]:
         """Extract basic channel information."""
         try:
@@ -157,16 +212,16 @@ class YouTubeScraper(BaseScraper):
             self._handle_error(e, "extracting YouTube basic info")
             return {}
             
-    async def _extract_videos(self) -> List[Dict[str, Any]]:
-        """Extract videos from the channel."""
+    async def _extract_videos(self, since: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Extract videos from the channel, stopping at the watermark."""
         try:
             videos = []
             video_elements = self.driver.find_elements(By.CSS_SELECTOR, "ytd-grid-video-renderer")
             
-            for element in video_elements:
+            for element, marker in self._iter_new_posts(video_elements, since, self._read_video_marker):
                 video = {
                     'title': self._get_element_text(element, "#video-title"),
-                    'url': self._get_element_attribute(element, "#video-title", "href"),
+                    'url': marker['post_id'],
                     'thumbnail': self._get_element_attribute(element, "#thumbnail img", "src"),
                     'views': self._parse_count(self._get_element_text(element, "#metadata-line span")),
                     'upload_date': self._get_element_text(element, "#metadata-line span:nth-child(2)"),
@@ -181,6 +236,13 @@ class YouTubeScraper(BaseScraper):
             self._handle_error(e, "extracting YouTube videos")
             return []
             
+    def _read_video_marker(self, element: Any) -> Dict[str, Any]:
+        """Read the fields identifying a video for watermark checks."""
+        return {
+            'post_id': self._get_element_attribute(element, "#video-title", "href"),
+            'timestamp': None
+        }
+            
     async def _extract_subscribers(self) -> Dict[str, Any]:
         """Extract subscriber information."""
         try:
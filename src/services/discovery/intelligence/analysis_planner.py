@@ -0,0 +1,269 @@
+"""
+Analysis Planner
+
+This module implements the fan-out of a prospect analysis across the intelligence
+analyzers. Each analyzer declares the prospect data it reads and the platforms it
+supports, so the planner runs only the analyzers a prospect has data for and
+computes shared inputs only when a planned analyzer needs them. Planned analyzers
+run concurrently, on a thread pool or, for CPU-heavy ones, a pool of worker
+processes holding their own warm analyzer, and each gets a time budget: an analyzer
+that overruns it is reported as timed out while the others' results are returned.
+Every analyzer has a fixed number of slots in the pools, and its budget starts once
+it holds one, so a run still overrunning in the background neither delays other
+analyzers nor eats into the next run's budget.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Tuple, FrozenSet
+from dataclasses import dataclass, replace
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.services.monitoring.monitoring import MonitoringService
+from ..models.data_object import pack_payload, unpack_payload
+
+logger = logging.getLogger(__name__)
+
+COMPLETED = 'completed'
+TIMEOUT = 'timeout'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+@dataclass(frozen=True)
+class AnalyzerSpec:
+    """An analyzer, the prospect data it reads and where it runs."""
+    
+    name: str
+    factory: Callable[[Dict[str, Any]], Any]
+    method: str
+    inputs: Tuple[str, ...]
+    platforms: Optional[FrozenSet[str]] = None
+    default_platform: Optional[str] = None
+    executor: str = 'thread'
+    stateful: bool = False
+
+# Analyzers held by each worker process, built on first use
+_worker_config: Dict[str, Any] = {}
+_worker_specs: Dict[str, AnalyzerSpec] = {}
+_worker_analyzers: Dict[str, Any] = {}
+
+def _init_worker(config: Dict[str, Any], specs: List[AnalyzerSpec]):
+    """Remember the config and specs the worker builds analyzers from."""
+    _worker_config.update(config)
+    _worker_specs.update((spec.name, spec) for spec in specs)
+
+def _run_in_worker(name: str, payload: bytes) -> bytes:
+    """Run one analyzer inside a worker process on msgpack-encoded arguments."""
+    if name not in _worker_analyzers:
+        _worker_analyzers[name] = _worker_specs[name].factory(_worker_config)
+    result = _run_analyzer(_worker_analyzers[name], _worker_specs[name].method, tuple(unpack_payload(payload)))
+    return pack_payload(result)
+
+def _run_analyzer(analyzer: Any, method: str, args: Tuple[Any, ...]) -> Any:
+    """Run an analyzer's coroutine to completion on the calling thread."""
+    return asyncio.run(getattr(analyzer, method)(*args))
+
+class AnalysisPlanner:
+    """Runs the analyzers a prospect has data for concurrently, each within a time budget."""
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or {}
+        self.monitoring = MonitoringService()
+        self.time_budget = self.config.get('analysis_time_budget', 30.0)
+        self.time_budgets = self.config.get('analysis_time_budgets', {})
+        self.executors = self.config.get('analysis_executors', {})
+        self.slots = self.config.get('analysis_slots', 2)
+        self.specs: Dict[str, AnalyzerSpec] = {}
+        self.providers: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._analyzers: Dict[str, Any] = {}
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+    def register(self, spec: AnalyzerSpec) -> 'AnalysisPlanner':
+        """Add an analyzer; `analysis_executors` may move it to 'thread', 'process' or 'inline'."""
+        executor = self.executors.get(spec.name, spec.executor)
+        if executor not in ('thread', 'process', 'inline'):
+            raise ValueError(f"Unknown executor for analyzer {spec.name}: {executor}")
+        if executor == 'process' and spec.stateful:
+            # Each worker would build its own copy and split the state between them
+            raise ValueError(f"Analyzer {spec.name} keeps state across runs and cannot run in worker processes")
+        self.specs[spec.name] = replace(spec, executor=executor)
+        return self
+        
+    def provide(self, name: str, provider: Callable[[Dict[str, Any]], Any]) -> 'AnalysisPlanner':
+        """Compute input ``name`` from the prospect when an analyzer needs it and the prospect lacks it."""
+        self.providers[name] = provider
+        return self
+        
+    def plan(self, prospect_data: Dict[str, Any], analyzers: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+        """Map each analyzer to the platform it will run on, or None if it will be skipped."""
+        names = analyzers if analyzers is not None else list(self.specs)
+        plan = {}
+        for name in names:
+            spec = self.specs[name]
+            platform = self._platform(spec, prospect_data)
+            runnable = all(
+                prospect_data.get(key) is not None or key in self.providers
+                for key in spec.inputs
+            )
+            if spec.platforms is not None and platform not in spec.platforms:
+                runnable = False
+            plan[name] = (platform or '') if runnable else None
+        return plan
+        
+    async def run(self, prospect_data: Dict[str, Any], analyzers: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Run the planned analyzers concurrently; returns results, status and seconds per analyzer."""
+        plan = self.plan(prospect_data, analyzers)
+        planned = [name for name, platform in plan.items() if platform is not None]
+        status = {name: SKIPPED for name, platform in plan.items() if platform is None}
+        durations: Dict[str, float] = {}
+        results: Dict[str, Any] = {}
+        
+        # Resolve every input once, however many analyzers read it
+        resolved: Dict[str, Any] = {}
+        for name in planned:
+            spec = self.specs[name]
+            for key in spec.inputs:
+                if key not in resolved:
+                    resolved[key] = self._resolve(key, prospect_data)
+                    
+        outcomes = await asyncio.gather(*(
+            self._run_one(self.specs[name], resolved, plan[name]) for name in planned
+        ))
+        for name, (outcome, result, seconds) in zip(planned, outcomes):
+            status[name] = outcome
+            durations[name] = seconds
+            if outcome == COMPLETED:
+                results[name] = result
+            self.monitoring.record_metric('analyzer_duration', seconds, {'analyzer': name, 'status': outcome})
+            
+        return {'results': results, 'status': status, 'durations': durations}
+        
+    def close(self):
+        """Shut down the thread and worker pools."""
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+            
+    async def _run_one(self, spec: AnalyzerSpec, resolved: Dict[str, Any], platform: str) -> Tuple[str, Any, float]:
+        """Run one analyzer within its time budget."""
+        args = tuple(resolved[key] for key in spec.inputs)
+        if spec.platforms is not None:
+            args += (platform,)
+        budget = self.time_budgets.get(spec.name, self.time_budget)
+        
+        start_time = time.perf_counter()
+        try:
+            if spec.executor == 'inline':
+                result = await asyncio.wait_for(getattr(self._analyzer(spec), spec.method)(*args), timeout=budget)
+                return COMPLETED, result, time.perf_counter() - start_time
+                
+            # Every slot has a pool thread or worker of its own, so a run holding one
+            # starts right away and its budget starts with it
+            slot = self._slot(spec)
+            try:
+                await asyncio.wait_for(slot.acquire(), timeout=budget)
+            except asyncio.TimeoutError:
+                logger.warning(f"Analyzer {spec.name} has no free slot; earlier runs are still overrunning")
+                return TIMEOUT, None, time.perf_counter() - start_time
+                
+            start_time = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            try:
+                if spec.executor == 'thread':
+                    call = loop.run_in_executor(
+                        self._get_threads(), _run_analyzer, self._analyzer(spec), spec.method, args
+                    )
+                else:
+                    # Arguments and results cross the process boundary as msgpack envelopes
+                    call = loop.run_in_executor(self._get_processes(), _run_in_worker, spec.name, pack_payload(args))
+            except BaseException:
+                slot.release()
+                raise
+            # A pool thread or worker cannot be interrupted, so an overrunning run keeps
+            # its slot until it actually finishes
+            call.add_done_callback(lambda _: slot.release())
+            result = await asyncio.wait_for(asyncio.shield(call), timeout=budget)
+            if spec.executor == 'process':
+                result = unpack_payload(result)
+            return COMPLETED, result, time.perf_counter() - start_time
+            
+        except asyncio.TimeoutError:
+            logger.warning(f"Analyzer {spec.name} exceeded its {budget}s budget")
+            return TIMEOUT, None, time.perf_counter() - start_time
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error running analyzer {spec.name}: {str(e)}")
+            if isinstance(e, BrokenProcessPool):
+                self._reset_processes()
+            return FAILED, None, time.perf_counter() - start_time
+            
+    def _resolve(self, key: str, prospect_data: Dict[str, Any]) -> Any:
+        """The prospect's value for an input, or the provider's if the prospect has none."""
+        value = prospect_data.get(key)
+        if value is None:
+            value = self.providers[key](prospect_data)
+        return value
+        
+    def _platform(self, spec: AnalyzerSpec, prospect_data: Dict[str, Any]) -> Optional[str]:
+        """Platform an analyzer runs on: its entry in ``platforms``, else the prospect's if supported."""
+        platform = prospect_data.get('platforms', {}).get(spec.name, prospect_data.get('platform'))
+        platform = platform.lower() if platform else None
+        if spec.platforms is not None and platform not in spec.platforms:
+            return spec.default_platform
+        return platform
+        
+    def _analyzer(self, spec: AnalyzerSpec) -> Any:
+        """The in-process analyzer of a spec, built on first use."""
+        if spec.name not in self._analyzers:
+            self._analyzers[spec.name] = spec.factory(self.config)
+        return self._analyzers[spec.name]
+        
+    def _slot(self, spec: AnalyzerSpec) -> asyncio.Semaphore:
+        """The semaphore counting an analyzer's free slots on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = {}
+            self._slots_loop = loop
+        if spec.name not in self._slots:
+            self._slots[spec.name] = asyncio.Semaphore(self.slots)
+        return self._slots[spec.name]
+        
+    def _pool_size(self, executor: str) -> int:
+        """Workers needed to give every slot of the analyzers on an executor its own."""
+        return max(self.slots * sum(1 for spec in self.specs.values() if spec.executor == executor), 1)
+        
+    def _get_threads(self) -> Executor:
+        """Get the thread pool, with a thread per slot of the threaded analyzers."""
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self._pool_size('thread'),
+                thread_name_prefix='analysis'
+            )
+        return self._threads
+        
+    def _get_processes(self) -> Executor:
+        """Get the worker pool, starting it on first use."""
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(
+                max_workers=self._pool_size('process'),
+                # The parent runs an event loop and pool threads, so workers are not forked
+                mp_context=multiprocessing.get_context(self.config.get('analysis_start_method', 'spawn')),
+                initializer=_init_worker,
+                initargs=(self.config, list(self.specs.values()))
+            )
+        return self._processes
+        
+    def _reset_processes(self):
+        """Discard a broken worker pool so the next analysis starts fresh workers."""
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
@@ -11,6 +11,7 @@ import numpy as np
 import networkx as nx
 
 from src.services.monitoring.monitoring import MonitoringService
+from .competitor_landscape import CompetitorLandscape, LandscapeCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,9 @@ class CompetitiveAnalysisAI:
         self.config = config
         self.monitoring = MonitoringService()
         
+        # Competitor aggregates are built once per campaign and shared by its prospects
+        self.landscapes = LandscapeCache(config)
+        
     async def analyze_competition(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze competitive landscape."""
         try:
@@ -50,21 +54,41 @@ class CompetitiveAnalysisAI:
             self.monitoring.log_error(f"Error analyzing competition: {str(e)}")
             raise
             
+    async def analyze_prospect_gaps(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Score many prospects against one campaign's competitor landscape in a single call."""
+        try:
+            landscape = self._get_landscape(data)
+            prospects = data.get('prospects', [])
+            scores = landscape.score_prospects(prospects)
+            
+            return {
+                'landscape': landscape.summary(),
+                'prospect_gaps': scores,
+                'untapped_prospects': self._select_untapped_prospects(scores)
+            }
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error analyzing prospect gaps: {str(e)}")
+            raise
+            
     async def _analyze_competitors(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze competitors and their affiliates."""
         try:
             competitors = data.get('competitors', [])
+            landscape = self._get_landscape(data)
             
-            # Analyze competitor affiliates
-            affiliate_analysis = await self._analyze_competitor_affiliates(competitors)
+            # Competitor affiliates only change with the competitors, so analyze them once per snapshot
+            if landscape.affiliate_analysis is None:
+                landscape.affiliate_analysis = await self._analyze_competitor_affiliates(competitors)
+            affiliate_analysis = landscape.affiliate_analysis
             
             # Perform gap analysis
-            gap_analysis = await self._perform_gap_analysis(competitors)
+            gap_analysis = await self._perform_gap_analysis(landscape)
             
             # Identify untapped prospects
             untapped_prospects = await self._identify_untapped_prospects(
-                affiliate_analysis,
-                gap_analysis
+                landscape,
+                data.get('prospects', [])
             )
             
             return {
@@ -188,7 +212,7 @@ class CompetitiveAnalysisAI:
             self.monitoring.log_error(f"Error analyzing competitor affiliates: {str(e)}")
             return {}
             
-    async def _perform_gap_analysis(self, competitors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _perform_gap_analysis(self, landscape: CompetitorLandscape) -> Dict[str, Any]:
         """Perform gap analysis."""
         try:
             gap_analysis = {
@@ -199,19 +223,19 @@ class CompetitiveAnalysisAI:
             }
             
             # Analyze market coverage
-            market_coverage = await self._analyze_market_coverage(competitors)
+            market_coverage = await self._analyze_market_coverage(landscape)
             gap_analysis['market_coverage'] = market_coverage
             
             # Analyze audience gaps
-            audience_gaps = await self._analyze_audience_gaps(competitors)
+            audience_gaps = await self._analyze_audience_gaps(landscape)
             gap_analysis['audience_gaps'] = audience_gaps
             
             # Analyze content gaps
-            content_gaps = await self._analyze_content_gaps(competitors)
+            content_gaps = await self._analyze_content_gaps(landscape)
             gap_analysis['content_gaps'] = content_gaps
             
             # Analyze partnership gaps
-            partnership_gaps = await self._analyze_partnership_gaps(competitors)
+            partnership_gaps = await self._analyze_partnership_gaps(landscape)
             gap_analysis['partnership_gaps'] = partnership_gaps
             
             return gap_analysis
@@ -222,38 +246,16 @@ class CompetitiveAnalysisAI:
             
     async def _identify_untapped_prospects(
         self,
-        affiliate_analysis: Dict[str, Any],
-        gap_analysis: Dict[str, Any]
+        landscape: CompetitorLandscape,
+        prospects: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Identify untapped prospects."""
         try:
-            untapped_prospects = []
-            
-            # Identify prospects from market coverage gaps
-            market_prospects = await self._identify_market_prospects(
-                gap_analysis.get('market_coverage', {})
-            )
-            untapped_prospects.extend(market_prospects)
-            
-            # Identify prospects from audience gaps
-            audience_prospects = await self._identify_audience_prospects(
-                gap_analysis.get('audience_gaps', {})
-            )
-            untapped_prospects.extend(audience_prospects)
-            
-            # Identify prospects from content gaps
-            content_prospects = await self._identify_content_prospects(
-                gap_analysis.get('content_gaps', {})
-            )
-            untapped_prospects.extend(content_prospects)
-            
-            # Identify prospects from partnership gaps
-            partnership_prospects = await self._identify_partnership_prospects(
-                gap_analysis.get('partnership_gaps', {})
-            )
-            untapped_prospects.extend(partnership_prospects)
-            
-            return untapped_prospects
+            if not prospects:
+                return []
+                
+            # Score every prospect against the landscape at once
+            return self._select_untapped_prospects(landscape.score_prospects(prospects))
             
         except Exception as e:
             self.monitoring.log_error(f"Error identifying untapped prospects: {str(e)}")
@@ -448,143 +450,60 @@ class CompetitiveAnalysisAI:
             self.monitoring.log_error(f"Error analyzing affiliate relationships: {str(e)}")
             return {}
             
-    async def _analyze_market_coverage(self, competitors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_market_coverage(self, landscape: CompetitorLandscape) -> Dict[str, Any]:
         """Analyze market coverage."""
         try:
-            coverage_analysis = {
-                'total_market_share': 0,
-                'market_segments': {},
-                'geographic_coverage': {},
-                'channel_coverage': {}
-            }
-            
-            # Calculate total market share
-            total_market_share = sum(comp.get('market_share', 0) for comp in competitors)
-            coverage_analysis['total_market_share'] = total_market_share
-            
-            # Analyze market segments
-            for competitor in competitors:
-                segments = competitor.get('market_segments', {})
-                for segment, share in segments.items():
-                    coverage_analysis['market_segments'][segment] = coverage_analysis['market_segments'].get(segment, 0) + share
-                    
-            # Analyze geographic coverage
-            for competitor in competitors:
-                regions = competitor.get('geographic_coverage', {})
-                for region, share in regions.items():
-                    coverage_analysis['geographic_coverage'][region] = coverage_analysis['geographic_coverage'].get(region, 0) + share
-                    
-            # Analyze channel coverage
-            for competitor in competitors:
-                channels = competitor.get('channel_coverage', {})
-                for channel, share in channels.items():
-                    coverage_analysis['channel_coverage'][channel] = coverage_analysis['channel_coverage'].get(channel, 0) + share
-                    
-            return coverage_analysis
+            return landscape.section('market_coverage')
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing market coverage: {str(e)}")
             return {}
             
-    async def _analyze_audience_gaps(self, competitors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_audience_gaps(self, landscape: CompetitorLandscape) -> Dict[str, Any]:
         """Analyze audience gaps."""
         try:
-            gap_analysis = {
-                'demographic_gaps': {},
-                'interest_gaps': {},
-                'behavior_gaps': {}
-            }
-            
-            # Analyze demographic gaps
-            for competitor in competitors:
-                demographics = competitor.get('audience_demographics', {})
-                for demo, share in demographics.items():
-                    gap_analysis['demographic_gaps'][demo] = gap_analysis['demographic_gaps'].get(demo, 0) + share
-                    
-            # Analyze interest gaps
-            for competitor in competitors:
-                interests = competitor.get('audience_interests', {})
-                for interest, share in interests.items():
-                    gap_analysis['interest_gaps'][interest] = gap_analysis['interest_gaps'].get(interest, 0) + share
-                    
-            # Analyze behavior gaps
-            for competitor in competitors:
-                behaviors = competitor.get('audience_behaviors', {})
-                for behavior, share in behaviors.items():
-                    gap_analysis['behavior_gaps'][behavior] = gap_analysis['behavior_gaps'].get(behavior, 0) + share
-                    
-            return gap_analysis
+            return landscape.section('audience_gaps')
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing audience gaps: {str(e)}")
             return {}
             
-    async def _analyze_content_gaps(self, competitors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_content_gaps(self, landscape: CompetitorLandscape) -> Dict[str, Any]:
         """Analyze content gaps."""
         try:
-            gap_analysis = {
-                'topic_gaps': {},
-                'format_gaps': {},
-                'style_gaps': {}
-            }
-            
-            # Analyze topic gaps
-            for competitor in competitors:
-                topics = competitor.get('content_topics', {})
-                for topic, share in topics.items():
-                    gap_analysis['topic_gaps'][topic] = gap_analysis['topic_gaps'].get(topic, 0) + share
-                    
-            # Analyze format gaps
-            for competitor in competitors:
-                formats = competitor.get('content_formats', {})
-                for format, share in formats.items():
-                    gap_analysis['format_gaps'][format] = gap_analysis['format_gaps'].get(format, 0) + share
-                    
-            # Analyze style gaps
-            for competitor in competitors:
-                styles = competitor.get('content_styles', {})
-                for style, share in styles.items():
-                    gap_analysis['style_gaps'][style] = gap_analysis['style_gaps'].get(style, 0) + share
-                    
-            return gap_analysis
+            return landscape.section('content_gaps')
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing content gaps: {str(e)}")
             return {}
             
-    async def _analyze_partnership_gaps(self, competitors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_partnership_gaps(self, landscape: CompetitorLandscape) -> Dict[str, Any]:
         """Analyze partnership gaps."""
         try:
-            gap_analysis = {
-                'partner_type_gaps': {},
-                'partnership_model_gaps': {},
-                'collaboration_gaps': {}
-            }
-            
-            # Analyze partner type gaps
-            for competitor in competitors:
-                partner_types = competitor.get('partner_types', {})
-                for type, share in partner_types.items():
-                    gap_analysis['partner_type_gaps'][type] = gap_analysis['partner_type_gaps'].get(type, 0) + share
-                    
-            # Analyze partnership model gaps
-            for competitor in competitors:
-                models = competitor.get('partnership_models', {})
-                for model, share in models.items():
-                    gap_analysis['partnership_model_gaps'][model] = gap_analysis['partnership_model_gaps'].get(model, 0) + share
-                    
-            # Analyze collaboration gaps
-            for competitor in competitors:
-                collaborations = competitor.get('collaborations', {})
-                for collab, share in collaborations.items():
-                    gap_analysis['collaboration_gaps'][collab] = gap_analysis['collaboration_gaps'].get(collab, 0) + share
-                    
-            return gap_analysis
+            return landscape.section('partnership_gaps')
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing partnership gaps: {str(e)}")
             return {}
             
+    def _get_landscape(self, data: Dict[str, Any]) -> CompetitorLandscape:
+        """The cached landscape of the data's competitors, keyed by campaign or niche when given."""
+        competitors = data.get('competitors', [])
+        if data.get('campaign_id') is not None:
+            return self.landscapes.get(competitors, str(data['campaign_id']), 'campaign')
+        if data.get('niche') is not None:
+            return self.landscapes.get(competitors, str(data['niche']), 'niche')
+        return self.landscapes.get(competitors)
+        
+    def _select_untapped_prospects(self, scores: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Prospects no competitor works with whose coverage fills competitors' gaps."""
+        threshold = self.config.get('untapped_gap_threshold', 0.5)
+        return [
+            {'id': score['id'], 'type': 'untapped_prospect', 'potential': score['gap_score']}
+            for score in scores
+            if not score['competitor_affiliate'] and score['gap_score'] >= threshold
+        ]
+        
     def _is_emerging_trend(self, trend: Dict[str, Any]) -> bool:
         """Check if a trend is emerging."""
         try:
@@ -0,0 +1,241 @@
+"""
+Competitor Landscape
+
+This module implements the competitor-side half of competitive gap analysis. The
+coverage of a campaign's competitors is aggregated once into a `CompetitorLandscape`
+snapshot: for each gap dimension, a vocabulary of keys (segments, regions, topics,
+formats, ...) and the summed share competitors hold on each. Snapshots are cached per
+campaign or niche for a TTL, and prospects are scored against one in a single call
+by multiplying a sparse prospect-by-key share matrix with the landscape's gap
+weights, so competitor aggregates are no longer recomputed for every prospect.
+A cached snapshot is only reused while its competitors have the same ids and
+versions; edits that don't bump a version need an explicit invalidation.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import logging
+import threading
+import time
+import numpy as np
+import scipy.sparse as sp
+
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+# Gap analysis sections, each mapping a gap name to the competitor and prospect field
+# holding shares per key
+GAP_DIMENSIONS = {
+    'market_coverage': {
+        'market_segments': 'market_segments',
+        'geographic_coverage': 'geographic_coverage',
+        'channel_coverage': 'channel_coverage'
+    },
+    'audience_gaps': {
+        'demographic_gaps': 'audience_demographics',
+        'interest_gaps': 'audience_interests',
+        'behavior_gaps': 'audience_behaviors'
+    },
+    'content_gaps': {
+        'topic_gaps': 'content_topics',
+        'format_gaps': 'content_formats',
+        'style_gaps': 'content_styles'
+    },
+    'partnership_gaps': {
+        'partner_type_gaps': 'partner_types',
+        'partnership_model_gaps': 'partnership_models',
+        'collaboration_gaps': 'collaborations'
+    }
+}
+
+FIELDS = [field for section in GAP_DIMENSIONS.values() for field in section.values()]
+
+class CompetitorLandscape:
+    """Competitor coverage per gap dimension, aggregated once for many prospects."""
+    
+    def __init__(
+        self,
+        fingerprint: str,
+        competitor_count: int,
+        total_market_share: float,
+        vocabularies: Dict[str, Dict[str, int]],
+        coverage: Dict[str, np.ndarray],
+        affiliate_ids: frozenset
+    ):
+        self.fingerprint = fingerprint
+        self.competitor_count = competitor_count
+        self.total_market_share = total_market_share
+        self.vocabularies = vocabularies
+        self.coverage = coverage
+        self.affiliate_ids = affiliate_ids
+        self.built_at = time.time()
+        
+        # Competitor affiliate analysis, filled in by the first analysis that needs it
+        self.affiliate_analysis: Optional[Dict[str, Any]] = None
+        
+        # Keys competitors cover least are the widest gaps; keys no competitor covers
+        # score 1 through an extra trailing column
+        self.gap_weights = {}
+        for field, values in coverage.items():
+            peak = values.max() if len(values) else 0
+            weights = 1 - values / peak if peak > 0 else np.ones(len(values))
+            self.gap_weights[field] = np.append(np.clip(weights, 0, 1), 1.0)
+            
+    @classmethod
+    def build(cls, competitors: List[Dict[str, Any]], fingerprint: Optional[str] = None) -> 'CompetitorLandscape':
+        """Aggregate competitor shares per dimension in one pass over the competitors."""
+        totals: Dict[str, Dict[str, float]] = {field: {} for field in FIELDS}
+        affiliate_ids = set()
+        for competitor in competitors:
+            for field, shares in totals.items():
+                for key, share in (competitor.get(field) or {}).items():
+                    shares[key] = shares.get(key, 0) + share
+            affiliate_ids.update(
+                affiliate.get('id') for affiliate in competitor.get('affiliates', []) if affiliate.get('id') is not None
+            )
+            
+        vocabularies = {field: {key: index for index, key in enumerate(shares)} for field, shares in totals.items()}
+        coverage = {field: np.fromiter(shares.values(), dtype=np.float64, count=len(shares)) for field, shares in totals.items()}
+        return cls(
+            fingerprint=fingerprint or competitor_fingerprint(competitors),
+            competitor_count=len(competitors),
+            total_market_share=sum(competitor.get('market_share', 0) for competitor in competitors),
+            vocabularies=vocabularies,
+            coverage=coverage,
+            affiliate_ids=frozenset(affiliate_ids)
+        )
+        
+    def gap_analysis(self) -> Dict[str, Dict[str, Any]]:
+        """Summed competitor shares per key, by gap section."""
+        return {section: self.section(section) for section in GAP_DIMENSIONS}
+        
+    def section(self, name: str) -> Dict[str, Any]:
+        """Summed competitor shares per key for each gap of one section."""
+        section = {gap: self.totals(field) for gap, field in GAP_DIMENSIONS[name].items()}
+        if name == 'market_coverage':
+            section = {'total_market_share': self.total_market_share, **section}
+        return section
+        
+    def totals(self, field: str) -> Dict[str, float]:
+        """Summed competitor share of every key of one field."""
+        return dict(zip(self.vocabularies[field], self.coverage[field].tolist()))
+        
+    def score_prospects(self, prospects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Score how much each prospect covers what competitors don't, in input order."""
+        n = len(prospects)
+        scores = np.zeros((n, len(FIELDS)))
+        present = np.zeros((n, len(FIELDS)), dtype=bool)
+        for column, field in enumerate(FIELDS):
+            shares = self._share_matrix(prospects, field)
+            totals = np.asarray(shares.sum(axis=1)).ravel()
+            gaps = shares @ self.gap_weights[field]
+            scores[:, column] = np.divide(gaps, totals, out=np.zeros(n), where=totals > 0)
+            present[:, column] = totals > 0
+            
+        # A prospect's gap score averages the dimensions it has data for
+        counts = present.sum(axis=1)
+        overall = np.divide((scores * present).sum(axis=1), counts, out=np.zeros(n), where=counts > 0)
+        
+        results = []
+        for row, prospect in enumerate(prospects):
+            results.append({
+                'id': prospect.get('id'),
+                'gap_score': float(overall[row]),
+                'dimension_scores': {
+                    field: float(scores[row, column])
+                    for column, field in enumerate(FIELDS) if present[row, column]
+                },
+                'competitor_affiliate': prospect.get('id') in self.affiliate_ids
+            })
+        return results
+        
+    def summary(self) -> Dict[str, Any]:
+        """Size and age of the snapshot."""
+        return {
+            'fingerprint': self.fingerprint,
+            'competitors': self.competitor_count,
+            'keys': {field: len(vocabulary) for field, vocabulary in self.vocabularies.items()},
+            'age_seconds': time.time() - self.built_at
+        }
+        
+    def _share_matrix(self, prospects: List[Dict[str, Any]], field: str) -> sp.csr_matrix:
+        """Prospect-by-key shares of one field; keys unknown to the landscape share the last column."""
+        vocabulary = self.vocabularies[field]
+        uncovered = len(vocabulary)
+        rows, columns, values = [], [], []
+        for row, prospect in enumerate(prospects):
+            for key, share in (prospect.get(field) or {}).items():
+                rows.append(row)
+                columns.append(vocabulary.get(key, uncovered))
+                values.append(share)
+        return sp.csr_matrix(
+            (np.asarray(values, dtype=np.float64), (rows, columns)),
+            shape=(len(prospects), uncovered + 1)
+        )
+
+class LandscapeCache:
+    """Competitor landscapes per campaign or niche, rebuilt after a TTL."""
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or {}
+        self.monitoring = MonitoringService()
+        self.ttl = self.config.get('competitor_landscape_ttl', 3600)
+        self.max_entries = self.config.get('competitor_landscape_cache_size', 256)
+        self._entries: 'OrderedDict[Tuple[str, str], CompetitorLandscape]' = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def get(
+        self,
+        competitors: List[Dict[str, Any]],
+        key: Optional[str] = None,
+        kind: str = 'campaign'
+    ) -> CompetitorLandscape:
+        """The landscape of a campaign's competitors, built at most once per TTL.
+        
+        Entries are keyed by ``(kind, key)``, e.g. ``('campaign', id)`` or ``('niche', name)``,
+        and only served while the competitors' ids and versions still match the snapshot's
+        fingerprint; without a key, the fingerprint itself is the key.
+        """
+        fingerprint = competitor_fingerprint(competitors)
+        entry_key = (kind, key) if key is not None else ('competitors', fingerprint)
+        
+        with self._lock:
+            landscape = self._entries.get(entry_key)
+            if (
+                landscape is not None
+                and landscape.fingerprint == fingerprint
+                and time.time() - landscape.built_at < self.ttl
+            ):
+                self._entries.move_to_end(entry_key)
+                self.monitoring.record_metric('competitor_landscape_cache', 1, {'result': 'hit'})
+                return landscape
+                
+        landscape = CompetitorLandscape.build(competitors, fingerprint)
+        self.monitoring.record_metric('competitor_landscape_cache', 1, {'result': 'miss'})
+        with self._lock:
+            self._entries[entry_key] = landscape
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return landscape
+        
+    def invalidate(self, key: Optional[str] = None, kind: str = 'campaign'):
+        """Drop one campaign's or niche's landscape, or all of them."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop((kind, key), None)
+
+def competitor_fingerprint(competitors: List[Dict[str, Any]]) -> str:
+    """Hash of a competitor set's ids and versions, cheap enough to check on every lookup."""
+    # Hashing whole competitors costs more than building the landscape, so edits are
+    # detected through an `updated_at` or `version` field rather than the content
+    digest = hashlib.blake2b(digest_size=16)
+    for index, competitor in enumerate(competitors):
+        identity = competitor.get('id', index)
+        version = competitor.get('updated_at', competitor.get('version'))
+        digest.update(f"{identity}\x1f{version}\x1e".encode('utf-8'))
+    return digest.hexdigest()
@@ -11,14 +11,11 @@ from datetime import datetime
 import re
 from collections import Counter
 import numpy as np
-from textblob import TextBlob
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
 
 from src.services.monitoring.monitoring import MonitoringService
+from ..nlp.registry import get_model_registry
+from ..nlp.corpus_model import CorpusTfidfModel
+from ..nlp.text_analysis import AnnotatedDoc, get_text_analyzer
 
 logger = logging.getLogger(__name__)
 
@@ -29,17 +26,17 @@ class ContentAnalysisAI:
         self.config = config
         self.monitoring = MonitoringService()
         
-        # Download required NLTK data
-        try:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-            nltk.download('wordnet')
-        except Exception as e:
-            logger.error(f"Error downloading NLTK data: {str(e)}")
-            
-        # Initialize NLTK components
-        self.stop_words = set(stopwords.words('english'))
-        self.lemmatizer = WordNetLemmatizer()
+        # Models are shared process-wide and loaded on first use
+        self.models = get_model_registry()
+        
+        # Tokens, lemmas and sentiment come from the shared text analyzer, which
+        # annotates each text once for every intelligence component
+        self.text_analyzer = get_text_analyzer(config)
+        
+    @property
+    def corpus_model(self) -> CorpusTfidfModel:
+        """Shared corpus TF-IDF model."""
+        return self.models.vectorizer('corpus_tfidf', lambda: CorpusTfidfModel.from_config(self.config))
         
     async def analyze_content(self, content: Dict[str, Any], platform: str) -> Dict[str, Any]:
         """Analyze content from LinkedIn or Instagram."""
@@ -58,7 +55,35 @@ class ContentAnalysisAI:
             )
             raise
             
-    async def _analyze_linkedin_content(self, content: Dict[str, Any]) -> Dict[str, Any]:
+    async def analyze_content_batch(self, contents: List[Dict[str, Any]], platform: str) -> List[Dict[str, Any]]:
+        """Analyze many LinkedIn or Instagram profiles, extracting all their keywords in one transform."""
+        try:
+            extractors = {
+                'linkedin': (self._extract_linkedin_text, self._analyze_linkedin_content),
+                'instagram': (self._extract_instagram_text, self._analyze_instagram_content)
+            }
+            if platform.lower() not in extractors:
+                raise ValueError(f"Unsupported platform: {platform}")
+            extract_text, analyze = extractors[platform.lower()]
+            
+            keywords = await self._extract_keywords_batch([extract_text(content) for content in contents])
+            return [
+                await analyze(content, profile_keywords)
+                for content, profile_keywords in zip(contents, keywords)
+            ]
+            
+        except Exception as e:
+            self.monitoring.log_error(
+                f"Error analyzing content batch: {str(e)}",
+                context={"platform": platform}
+            )
+            raise
+            
+    async def _analyze_linkedin_content(
+        self,
+        content: Dict[str, Any],
+        keywords: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """Analyze LinkedIn content."""
         try:
             # Extract text from LinkedIn profile
@@ -70,8 +95,9 @@ class ContentAnalysisAI:
             # Extract topics
             topics = await self._extract_topics(text)
             
-            # Extract keywords
-            keywords = await self._extract_keywords(text)
+            # Extract keywords, unless a batch already did
+            if keywords is None:
+                keywords = await self._extract_keywords(text)
             
             # Detect affiliate indicators
             affiliate_indicators = await self._detect_affiliate_indicators(text)
@@ -95,7 +121,11 @@ class ContentAnalysisAI:
             self.monitoring.log_error(f"Error analyzing LinkedIn content: {str(e)}")
             raise
             
-    async def _analyze_instagram_content(self, content: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_instagram_content(
+        self,
+        content: Dict[str, Any],
+        keywords: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """Analyze Instagram content."""
         try:
             # Extract text from Instagram profile and posts
@@ -107,8 +137,9 @@ class ContentAnalysisAI:
             # Extract topics
             topics = await self._extract_topics(text)
             
-            # Extract keywords
-            keywords = await self._extract_keywords(text)
+            # Extract keywords, unless a batch already did
+            if keywords is None:
+                keywords = await self._extract_keywords(text)
             
             # Detect affiliate indicators
             affiliate_indicators = await self._detect_affiliate_indicators(text)
@@ -183,20 +214,7 @@ class ContentAnalysisAI:
     async def _analyze_sentiment(self, text: str) -> Dict[str, float]:
         """Analyze text sentiment."""
         try:
-            # Calculate overall sentiment
-            blob = TextBlob(text)
-            sentiment = blob.sentiment
-            
-            # Calculate sentence-level sentiment
-            sentences = blob.sentences
-            sentence_sentiments = [s.sentiment.polarity for s in sentences]
-            
-            return {
-                'polarity': sentiment.polarity,
-                'subjectivity': sentiment.subjectivity,
-                'sentence_sentiments': sentence_sentiments,
-                'average_sentiment': np.mean(sentence_sentiments) if sentence_sentiments else 0
-            }
+            return self._compute_sentiment(self._annotate(text))
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing sentiment: {str(e)}")
@@ -210,18 +228,7 @@ class ContentAnalysisAI:
     async def _extract_topics(self, text: str) -> List[str]:
         """Extract main topics from text."""
         try:
-            # Tokenize and preprocess text
-            tokens = word_tokenize(text.lower())
-            tokens = [t for t in tokens if t not in self.stop_words]
-            tokens = [self.lemmatizer.lemmatize(t) for t in tokens]
-            
-            # Calculate word frequencies
-            word_freq = Counter(tokens)
-            
-            # Extract most common topics
-            topics = [word for word, freq in word_freq.most_common(10)]
-            
-            return topics
+            return self._compute_topics(self._annotate(text))
             
         except Exception as e:
             self.monitoring.log_error(f"Error extracting topics: {str(e)}")
@@ -229,30 +236,31 @@ class ContentAnalysisAI:
             
     async def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords using TF-IDF."""
+        return (await self._extract_keywords_batch([text]))[0]
+        
+    async def _extract_keywords_batch(self, texts: List[str]) -> List[List[str]]:
+        """Extract keywords of many texts with one transform of the corpus TF-IDF model.
+        
+        A hashed transform is cheaper than a memo lookup, so keywords are not memoized;
+        duplicate texts within the batch are transformed once.
+        """
         try:
-            # Initialize TF-IDF vectorizer
-            vectorizer = TfidfVectorizer(
-                max_features=20,
-                stop_words='english'
-            )
-            
-            # Fit and transform text
-            tfidf_matrix = vectorizer.fit_transform([text])
-            
-            # Get feature names
-            feature_names = vectorizer.get_feature_names_out()
-            
-            # Get top keywords
-            keywords = []
-            for i in range(len(feature_names)):
-                if tfidf_matrix[0, i] > 0:
-                    keywords.append(feature_names[i])
-                    
-            return keywords
+            model = self.corpus_model
+            unique = list(dict.fromkeys(texts))
+            if not unique:
+                return []
+            computed = model.keywords(unique, self.config.get('keyword_count', 20))
+            
+            # New content also updates the corpus document frequencies
+            if self.config.get('corpus_model_learn', True):
+                model.learn(unique)
+                
+            by_text = dict(zip(unique, computed))
+            return [list(by_text[text]) for text in texts]
             
         except Exception as e:
             self.monitoring.log_error(f"Error extracting keywords: {str(e)}")
-            return []
+            return [[] for _ in texts]
             
     async def _detect_affiliate_indicators(self, text: str) -> Dict[str, Any]:
         """Detect affiliate marketing indicators in text."""
@@ -292,34 +300,7 @@ class ContentAnalysisAI:
     async def _assess_content_quality(self, text: str) -> Dict[str, float]:
         """Assess content quality metrics."""
         try:
-            # Calculate basic metrics
-            sentences = TextBlob(text).sentences
-            words = word_tokenize(text)
-            
-            # Calculate readability metrics
-            avg_sentence_length = len(words) / len(sentences) if sentences else 0
-            unique_words = len(set(words))
-            vocabulary_richness = unique_words / len(words) if words else 0
-            
-            # Calculate content structure
-            has_headings = bool(re.search(r'^#+\s', text, re.MULTILINE))
-            has_lists = bool(re.search(r'^[-*]\s', text, re.MULTILINE))
-            
-            # Calculate overall quality score
-            quality_score = (
-                0.3 * (1 / (1 + np.exp(-avg_sentence_length + 10))) +  # Sentence length
-                0.3 * vocabulary_richness +  # Vocabulary richness
-                0.2 * (1 if has_headings else 0) +  # Structure
-                0.2 * (1 if has_lists else 0)  # Formatting
-            )
-            
-            return {
-                'avg_sentence_length': avg_sentence_length,
-                'vocabulary_richness': vocabulary_richness,
-                'has_headings': has_headings,
-                'has_lists': has_lists,
-                'quality_score': quality_score
-            }
+            return self._compute_content_quality(self._annotate(text))
             
         except Exception as e:
             self.monitoring.log_error(f"Error assessing content quality: {str(e)}")
@@ -331,6 +312,61 @@ class ContentAnalysisAI:
                 'quality_score': 0
             }
             
+    def _annotate(self, text: str) -> AnnotatedDoc:
+        """Shared annotation of text."""
+        return self.text_analyzer.analyze([text])[0]
+        
+    def _compute_sentiment(self, doc: AnnotatedDoc) -> Dict[str, float]:
+        """Overall and sentence-level sentiment of an annotated text."""
+        return {
+            'polarity': doc.polarity,
+            'subjectivity': doc.subjectivity,
+            'sentence_sentiments': list(doc.sentence_polarities),
+            'average_sentiment': doc.average_sentiment
+        }
+        
+    def _compute_topics(self, doc: AnnotatedDoc) -> List[str]:
+        """Most frequent lemmas of an annotated text."""
+        word_freq = Counter(doc.lemmas)
+        
+        # Extract most common topics
+        return [word for word, freq in word_freq.most_common(10)]
+        
+    def _compute_keywords(self, text: str) -> List[str]:
+        """Find the TF-IDF keywords of text against the corpus model."""
+        return self.corpus_model.keywords([text], self.config.get('keyword_count', 20))[0]
+        
+    def _compute_content_quality(self, doc: AnnotatedDoc) -> Dict[str, float]:
+        """Measure readability, vocabulary and structure of an annotated text."""
+        text = doc.text
+        
+        # Calculate readability metrics
+        words = doc.tokens
+        sentences = doc.sentences
+        avg_sentence_length = len(words) / len(sentences) if sentences else 0
+        unique_words = len(set(words))
+        vocabulary_richness = unique_words / len(words) if words else 0
+        
+        # Calculate content structure
+        has_headings = bool(re.search(r'^#+\s', text, re.MULTILINE))
+        has_lists = bool(re.search(r'^[-*]\s', text, re.MULTILINE))
+        
+        # Calculate overall quality score
+        quality_score = (
+            0.3 * (1 / (1 + np.exp(-avg_sentence_length + 10))) +  # Sentence length
+            0.3 * vocabulary_richness +  # Vocabulary richness
+            0.2 * (1 if has_headings else 0) +  # Structure
+            0.2 * (1 if has_lists else 0)  # Formatting
+        )
+        
+        return {
+            'avg_sentence_length': avg_sentence_length,
+            'vocabulary_richness': vocabulary_richness,
+            'has_headings': has_headings,
+            'has_lists': has_lists,
+            'quality_score': quality_score
+        }
+        
     async def _calculate_engagement_potential(self, content: Dict[str, Any]) -> Dict[str, float]:
         """Calculate potential engagement metrics."""
         try:
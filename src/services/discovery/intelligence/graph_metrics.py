@@ -0,0 +1,504 @@
+"""
+Graph Metrics
+
+This module implements a versioned graph and a cache of whole-graph metrics keyed by
+graph version. Centralities, communities and components are computed at most once
+per version and served to every analysis that reads them; any structural mutation
+bumps the version and invalidates the cache.
+
+Metrics that cost O(V*E) exactly are size-adaptive: below ``exact_metrics_max_nodes``
+they are exact, above it they are estimated from sampled pivots or trials, and
+``error_bounds()`` reports how far each estimate may be off with probability
+``graph_metrics_confidence``. On large graphs every metric of an analysis draws on one
+shared ``graph_metrics_time_budget``: sampling stops when it runs out, power
+iterations for eigenvector centrality and PageRank stop early, and Louvain keeps the
+last level it finished.
+"""
+
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
+import functools
+import logging
+import math
+import random
+import time
+import numpy as np
+import scipy.sparse as sp
+import networkx as nx
+
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+# nx.Graph methods that change nodes, edges or their attributes
+MUTATORS = (
+    'add_node', 'add_nodes_from', 'remove_node', 'remove_nodes_from',
+    'add_edge', 'add_edges_from', 'add_weighted_edges_from',
+    'remove_edge', 'remove_edges_from', 'update', 'clear', 'clear_edges'
+)
+
+def _bumps_version(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return mutate
+
+class VersionedGraph(nx.Graph):
+    """Undirected graph whose version increases on every structural mutation.
+    
+    Attribute edits made directly through views such as ``graph.nodes[n]`` bypass the
+    mutators; call ``touch()`` after them so cached metrics are recomputed.
+    """
+    
+    def __init__(self, incoming_graph_data: Any = None, **attr):
+        self.version = 0
+        super().__init__(incoming_graph_data, **attr)
+        
+    def touch(self):
+        """Mark the graph as changed."""
+        self.version += 1
+
+for _name in MUTATORS:
+    setattr(VersionedGraph, _name, _bumps_version(getattr(nx.Graph, _name)))
+
+class _Failure:
+    """A metric computation that raised, cached so it is not retried within a version."""
+    
+    def __init__(self, error: Exception):
+        self.error = error
+
+class GraphMetricsCache:
+    """Computes whole-graph metrics at most once per graph version."""
+    
+    def __init__(self, graph: VersionedGraph, config: Optional[Dict[str, Any]] = None):
+        self.graph = graph
+        self.config = config or {}
+        self.monitoring = MonitoringService()
+        self._values: Dict[str, Any] = {}
+        self._version: Optional[int] = None
+        self._bounds: Dict[str, Dict[str, Any]] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'seconds': {}}
+        self.exact_max_nodes = self.config.get('exact_metrics_max_nodes', 2000)
+        self.time_budget = self.config.get('graph_metrics_time_budget', 5.0)
+        self.min_pivots = self.config.get('graph_metrics_min_pivots', 16)
+        self.min_iterations = self.config.get('graph_metrics_min_iterations', 20)
+        self.confidence = self.config.get('graph_metrics_confidence', 0.95)
+        self.seed = self.config.get('graph_metrics_seed', 0)
+        self._deadline: Optional[float] = None
+        self._budget_version: Optional[int] = None
+        
+    def get(self, name: str, compute: Callable[[nx.Graph], Any]) -> Any:
+        """Get a metric of the current graph version, computing it on first request."""
+        if self._version != self.graph.version:
+            self._values.clear()
+            self._bounds.clear()
+            self._version = self.graph.version
+            
+        if name in self._values:
+            self.stats['hits'] += 1
+            value = self._values[name]
+        else:
+            self.stats['misses'] += 1
+            start_time = time.perf_counter()
+            try:
+                value = compute(self.graph)
+            except Exception as e:
+                value = _Failure(e)
+            seconds = time.perf_counter() - start_time
+            self._values[name] = value
+            self.stats['seconds'][name] = seconds
+            self.monitoring.record_metric('graph_metric_seconds', seconds, {'metric': name})
+            
+        if isinstance(value, _Failure):
+            raise value.error
+        return value
+        
+    def clear(self):
+        """Drop every cached metric."""
+        self._values.clear()
+        self._bounds.clear()
+        
+    def start_budget(self):
+        """Start the time budget shared by the metrics computed from now on."""
+        self._deadline = time.perf_counter() + self.time_budget
+        self._budget_version = self.graph.version
+        
+    def remaining(self) -> float:
+        """Seconds left of the shared time budget, started by the first metric of a version that asks."""
+        if self._deadline is None or self._budget_version != self.graph.version:
+            self.start_budget()
+        return max(self._deadline - time.perf_counter(), 0.0)
+        
+    def error_bounds(self) -> Dict[str, Dict[str, Any]]:
+        """How each metric computed for the current version was obtained, and its error bound."""
+        if self._version != self.graph.version:
+            return {}
+        return {name: dict(bound) for name, bound in self._bounds.items()}
+        
+    def _is_exact(self, graph: nx.Graph) -> bool:
+        return graph.number_of_nodes() <= self.exact_max_nodes
+        
+    def _hoeffding(self, samples: int, events: int = 1) -> float:
+        """Half-width of a Hoeffding interval for a mean of ``samples`` draws in [0, 1].
+        
+        ``events`` widens it by a union bound so it holds for that many estimates at once.
+        """
+        delta = 1 - self.confidence
+        return math.sqrt(math.log(2 * events / delta) / (2 * samples))
+        
+    def degree_centrality(self) -> Dict[Any, float]:
+        """Degree centrality of every node."""
+        return self.get('degree_centrality', nx.degree_centrality)
+        
+    def betweenness_centrality(self) -> Dict[Any, float]:
+        """Betweenness centrality of every node, pivot-sampled on large graphs."""
+        def compute(graph: nx.Graph) -> Dict[Any, float]:
+            size = graph.number_of_nodes()
+            if self._is_exact(graph):
+                self._bounds['betweenness_centrality'] = {'method': 'exact', 'error_bound': 0.0}
+                return nx.betweenness_centrality(graph)
+                
+            # Time a single pivot to size the sample to what is left of the budget
+            budget = self.remaining()
+            start_time = time.perf_counter()
+            nx.betweenness_centrality(graph, k=1, seed=self.seed)
+            per_pivot = max(time.perf_counter() - start_time, 1e-6)
+            pivots = int(min(size, max(self.min_pivots, (budget - per_pivot) / per_pivot)))
+            
+            values = nx.betweenness_centrality(graph, k=pivots, seed=self.seed)
+            # Each pivot contributes a dependency in [0, n/(n-1)] to the normalized score
+            self._bounds['betweenness_centrality'] = {
+                'method': 'pivot_sample',
+                'pivots': pivots,
+                'error_bound': size / (size - 1) * self._hoeffding(pivots, size),
+                'confidence': self.confidence
+            }
+            return values
+            
+        return self.get('betweenness_centrality', compute)
+        
+    def eigenvector_centrality(self) -> Dict[Any, float]:
+        """Eigenvector centrality of every node, iterated within the budget on large graphs."""
+        max_iter = self.config.get('eigenvector_max_iter', 100)
+        
+        def compute(graph: nx.Graph) -> Dict[Any, float]:
+            if self._is_exact(graph) or graph.number_of_nodes() == 0:
+                return nx.eigenvector_centrality(graph, max_iter=max_iter)
+                
+            # Same shifted power iteration as networkx, x <- (A + I) x, on a sparse matrix
+            nodes = list(graph)
+            adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, dtype=float, format='csr')
+            
+            def step(x: np.ndarray) -> np.ndarray:
+                x = adjacency @ x + x
+                return x / (np.linalg.norm(x) or 1)
+                
+            start = np.full(len(nodes), 1 / len(nodes))
+            values, bound = self._power_iteration(step, start, len(nodes) * 1e-6, max_iter)
+            self._bounds['eigenvector_centrality'] = bound
+            return dict(zip(nodes, values.tolist()))
+            
+        return self.get('eigenvector_centrality', compute)
+        
+    def closeness_centrality(self) -> Dict[Any, float]:
+        """Closeness centrality of every node, estimated from BFS pivots on large graphs."""
+        def compute(graph: nx.Graph) -> Dict[Any, float]:
+            if self._is_exact(graph):
+                self._bounds['closeness_centrality'] = {'method': 'exact', 'error_bound': 0.0}
+                return nx.closeness_centrality(graph)
+                
+            sample = self._bfs_sample()
+            size = graph.number_of_nodes()
+            pivots = len(sample['sources'])
+            # Scale pivot distance sums and reach up to all n sources, then apply the
+            # same Wasserman-Faust correction as nx.closeness_centrality
+            totals = sample['distance_sums'] * size / pivots
+            reach = sample['reached'] * size / pivots
+            closeness = np.zeros(size)
+            mask = totals > 0
+            closeness[mask] = (reach[mask] - 1) ** 2 / (totals[mask] * (size - 1))
+            
+            # Eppstein-Wang: the average distance of every node is within
+            # diameter * epsilon of its estimate
+            self._bounds['closeness_centrality'] = {
+                'method': 'pivot_sample',
+                'pivots': pivots,
+                'average_distance_error_bound': sample['diameter_upper'] * self._hoeffding(pivots, size),
+                'confidence': self.confidence
+            }
+            return dict(zip(sample['nodes'], closeness.tolist()))
+            
+        return self.get('closeness_centrality', compute)
+        
+    def average_clustering(self) -> float:
+        """Average clustering coefficient, estimated from sampled wedges on large graphs."""
+        def compute(graph: nx.Graph) -> float:
+            if self._is_exact(graph) or graph.number_of_nodes() == 0:
+                self._bounds['average_clustering'] = {'method': 'exact', 'error_bound': 0.0}
+                return nx.average_clustering(graph)
+                
+            trials = self.config.get('clustering_trials', 20000)
+            value = nx.algorithms.approximation.average_clustering(graph, trials=trials, seed=self.seed)
+            self._bounds['average_clustering'] = {
+                'method': 'wedge_sample',
+                'trials': trials,
+                'error_bound': self._hoeffding(trials),
+                'confidence': self.confidence
+            }
+            return value
+            
+        return self.get('average_clustering', compute)
+        
+    def average_path_length(self) -> float:
+        """Average shortest-path length, or infinity when the graph is disconnected."""
+        def compute(graph: nx.Graph) -> float:
+            if len(self.connected_components()) != 1:
+                self._bounds['average_path_length'] = {'method': 'exact', 'error_bound': 0.0}
+                return float('inf')
+            if self._is_exact(graph):
+                self._bounds['average_path_length'] = {'method': 'exact', 'error_bound': 0.0}
+                return nx.average_shortest_path_length(graph)
+                
+            sample = self._bfs_sample()
+            size = graph.number_of_nodes()
+            pivots = len(sample['sources'])
+            # The mean distance from a source lies in [1, diameter]
+            spread = max(sample['diameter_upper'] - 1, 0)
+            self._bounds['average_path_length'] = {
+                'method': 'bfs_sample',
+                'pivots': pivots,
+                'error_bound': spread * self._hoeffding(pivots),
+                'confidence': self.confidence
+            }
+            return float(sample['distance_sums'].sum() / (pivots * (size - 1)))
+            
+        return self.get('average_path_length', compute)
+        
+    def diameter(self) -> float:
+        """Diameter of the graph, bracketed by BFS eccentricities on large graphs."""
+        def compute(graph: nx.Graph) -> float:
+            if len(self.connected_components()) != 1:
+                self._bounds['diameter'] = {'method': 'exact', 'lower': float('inf'), 'upper': float('inf')}
+                return float('inf')
+            if self._is_exact(graph):
+                value = nx.diameter(graph)
+                self._bounds['diameter'] = {'method': 'exact', 'lower': value, 'upper': value}
+                return value
+                
+            sample = self._bfs_sample()
+            self._bounds['diameter'] = {
+                'method': 'double_sweep',
+                'pivots': len(sample['sources']),
+                'lower': sample['diameter_lower'],
+                'upper': sample['diameter_upper']
+            }
+            return sample['diameter_lower']
+            
+        return self.get('diameter', compute)
+        
+    def _bfs_sample(self) -> Dict[str, Any]:
+        """Breadth-first searches from random pivots until the time budget runs out.
+        
+        Per node it keeps the summed distance from the pivots and how many reached it;
+        the largest eccentricity seen (after a double sweep from the farthest node found)
+        is a lower bound on the diameter and twice the smallest is an upper bound.
+        """
+        def compute(graph: nx.Graph) -> Dict[str, Any]:
+            nodes = list(graph)
+            index = {node: position for position, node in enumerate(nodes)}
+            rng = random.Random(self.seed)
+            candidates = rng.sample(nodes, len(nodes))
+            distance_sums = np.zeros(len(nodes))
+            reached = np.zeros(len(nodes))
+            sources = []
+            lower, upper = 0, float('inf')
+            deadline = time.perf_counter() + self.remaining()
+            
+            def search(source: Any, pivot: bool = True) -> Any:
+                nonlocal lower, upper
+                lengths = nx.single_source_shortest_path_length(graph, source)
+                farthest = max(lengths, key=lengths.get)
+                lower = max(lower, lengths[farthest])
+                upper = min(upper, 2 * lengths[farthest])
+                if pivot:
+                    positions = np.fromiter((index[node] for node in lengths), dtype=np.int64, count=len(lengths))
+                    distance_sums[positions] += np.fromiter(lengths.values(), dtype=np.float64, count=len(lengths))
+                    reached[positions] += 1
+                    sources.append(source)
+                return farthest
+                
+            for source in candidates:
+                if len(sources) >= self.min_pivots and time.perf_counter() > deadline:
+                    break
+                farthest = search(source)
+                # Double sweep: the farthest node from the first pivot is likely an end of
+                # a diameter; it only tightens the bounds so the pivots stay uniform
+                if len(sources) == 1:
+                    search(farthest, pivot=False)
+                    
+            return {
+                'nodes': nodes,
+                'sources': sources,
+                'distance_sums': distance_sums,
+                'reached': reached,
+                'diameter_lower': lower,
+                'diameter_upper': upper
+            }
+            
+        return self.get('bfs_sample', compute)
+        
+    def pagerank(self) -> Dict[Any, float]:
+        """PageRank of every node."""
+        return self.get('pagerank', self._pagerank)
+        
+    def communities(self) -> List[Set[Any]]:
+        """Louvain communities of the graph, stopping at the last level finished within the budget on large graphs."""
+        seed = self.config.get('community_seed', 0)
+        
+        def compute(graph: nx.Graph) -> List[Set[Any]]:
+            if self._is_exact(graph):
+                return nx.community.louvain_communities(graph, seed=seed)
+                
+            # Without any budget left, near-linear label propagation stands in for Louvain
+            budget = self.remaining()
+            if budget <= 0:
+                self._bounds['louvain_communities'] = {'method': 'label_propagation'}
+                return list(nx.community.label_propagation_communities(graph))
+                
+            deadline = time.perf_counter() + budget
+            communities = [{node} for node in graph]
+            levels, complete = 0, True
+            for partition in nx.community.louvain_partitions(graph, seed=seed):
+                communities = partition
+                levels += 1
+                if time.perf_counter() > deadline:
+                    complete = False
+                    break
+            self._bounds['louvain_communities'] = {'method': 'louvain', 'levels': levels, 'complete': complete}
+            return communities
+            
+        return self.get('louvain_communities', compute)
+        
+    def _pagerank(self, graph: nx.Graph, nstart: Optional[Dict[Any, float]] = None) -> Dict[Any, float]:
+        """PageRank from optional starting scores, iterated within the budget on large graphs."""
+        alpha = self.config.get('pagerank_alpha', 0.85)
+        tol = self.config.get('pagerank_tol', 1e-6)
+        if self._is_exact(graph) or graph.number_of_nodes() == 0:
+            return nx.pagerank(graph, alpha=alpha, tol=tol, nstart=nstart)
+            
+        # Same iteration as networkx's SciPy PageRank, with dangling nodes spread uniformly
+        nodes = list(graph)
+        size = len(nodes)
+        transition = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight='weight', dtype=float, format='csr')
+        out_weight = np.asarray(transition.sum(axis=1)).ravel()
+        dangling = out_weight == 0
+        transition = sp.diags(np.divide(1.0, out_weight, out=np.zeros(size), where=~dangling)) @ transition
+        
+        def step(x: np.ndarray) -> np.ndarray:
+            return alpha * (x @ transition + x[dangling].sum() / size) + (1 - alpha) / size
+            
+        if nstart:
+            start = np.fromiter((nstart.get(node, 0.0) for node in nodes), dtype=np.float64, count=size)
+            start = start / start.sum() if start.sum() > 0 else np.full(size, 1 / size)
+        else:
+            start = np.full(size, 1 / size)
+        values, bound = self._power_iteration(step, start, size * tol, self.config.get('pagerank_max_iter', 100))
+        self._bounds['pagerank'] = bound
+        return dict(zip(nodes, values.tolist()))
+        
+    def _power_iteration(
+        self,
+        step: Callable[[np.ndarray], np.ndarray],
+        x: np.ndarray,
+        tol: float,
+        max_iter: int
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Iterate ``x = step(x)`` until its L1 change is below ``tol``.
+        
+        Stops early once the budget runs out, after at least ``graph_metrics_min_iterations``.
+        """
+        deadline = time.perf_counter() + self.remaining()
+        change = float('inf')
+        iterations = 0
+        while iterations < max_iter and change >= tol:
+            if iterations >= self.min_iterations and time.perf_counter() > deadline:
+                break
+            previous, x = x, step(x)
+            change = float(np.abs(x - previous).sum())
+            iterations += 1
+        return x, {
+            'method': 'power_iteration',
+            'iterations': iterations,
+            'converged': change < tol,
+            'residual': change
+        }
+        
+    def community_stats(self) -> Dict[str, Any]:
+        """Per-community edge counts, density, conductance and modularity in one edge pass.
+        
+        ``edge_counts`` is a C x C sparse matrix whose entry (i, j) counts edges listed
+        from community i to community j; the diagonal holds intra-community edges.
+        Conductance and modularity use the ``weight`` edge attribute (default 1).
+        """
+        def compute(graph: nx.Graph) -> Dict[str, Any]:
+            communities = self.communities()
+            nodes = list(graph)
+            index = {node: position for position, node in enumerate(nodes)}
+            membership = np.empty(len(nodes), dtype=np.int64)
+            for label, community in enumerate(communities):
+                membership[[index[node] for node in community]] = label
+            count = len(communities)
+            
+            edges = graph.number_of_edges()
+            sources = np.empty(edges, dtype=np.int64)
+            targets = np.empty(edges, dtype=np.int64)
+            weights = np.empty(edges)
+            for position, (u, v, weight) in enumerate(graph.edges(data='weight', default=1)):
+                sources[position], targets[position], weights[position] = index[u], index[v], weight
+            source_labels, target_labels = membership[sources], membership[targets]
+            internal = source_labels == target_labels
+            
+            edge_counts = sp.csr_matrix(
+                (np.ones(edges, dtype=np.int64), (source_labels, target_labels)),
+                shape=(count, count)
+            )
+            sizes = np.bincount(membership, minlength=count)
+            intra = np.bincount(source_labels[internal], minlength=count)
+            # Self-loops add their weight twice to the degree, as in nx.degree
+            degrees = np.fromiter(
+                (degree for _, degree in graph.degree(nodes, weight='weight')),
+                dtype=np.float64, count=len(nodes)
+            )
+            volume = np.bincount(membership, weights=degrees, minlength=count)
+            intra_weight = np.bincount(source_labels[internal], weights=weights[internal], minlength=count)
+            cut = np.bincount(source_labels[~internal], weights=weights[~internal], minlength=count)
+            cut += np.bincount(target_labels[~internal], weights=weights[~internal], minlength=count)
+            total_weight = weights.sum()
+            
+            pairs = sizes * (sizes - 1)
+            density = np.divide(2 * intra, pairs, out=np.zeros(count), where=pairs > 0)
+            smaller_side = np.minimum(volume, 2 * total_weight - volume)
+            conductance = np.divide(cut, smaller_side, out=np.zeros(count), where=smaller_side > 0)
+            if total_weight > 0:
+                contributions = intra_weight / total_weight - (volume / (2 * total_weight)) ** 2
+            else:
+                contributions = np.zeros(count)
+                
+            return {
+                'membership': dict(zip(nodes, membership.tolist())),
+                'sizes': sizes.tolist(),
+                'edge_counts': edge_counts,
+                'intra_edges': intra.tolist(),
+                'inter_edges': (np.asarray(edge_counts.sum(axis=1)).ravel()
+                                + np.asarray(edge_counts.sum(axis=0)).ravel() - 2 * intra).tolist(),
+                'densities': density.tolist(),
+                'conductance': conductance.tolist(),
+                'modularity_contributions': contributions.tolist(),
+                'modularity': float(contributions.sum())
+            }
+            
+        return self.get('community_stats', compute)
+        
+    def connected_components(self) -> List[Set[Any]]:
+        """Connected components of the graph."""
+        return self.get('connected_components', lambda graph: list(nx.connected_components(graph)))
@@ -0,0 +1,224 @@
+"""
+Affiliate Graph Store
+
+This module implements a shared, versioned affiliate graph that grows by deltas.
+Each analysis reads an immutable snapshot of one version, so concurrent analyses
+never see each other's updates half-applied. Snapshots are copy-on-write: they share
+adjacency with the store, and an update copies only the adjacency of the nodes it
+touches. Degree and connected components are maintained as edges arrive, and
+PageRank is warm-started from the previous version's scores.
+"""
+
+from typing import Dict, List, Any, Callable, Optional, Iterable, Set
+import logging
+import threading
+import time
+import networkx as nx
+
+from src.services.monitoring.monitoring import MonitoringService
+from .graph_metrics import VersionedGraph, GraphMetricsCache
+
+logger = logging.getLogger(__name__)
+
+class AffiliateGraphStore:
+    """Versioned affiliate graph with copy-on-write snapshots and incremental metrics."""
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or {}
+        self.monitoring = MonitoringService()
+        self.compact_every = self.config.get('graph_compact_every', 1000)
+        self.version = 0
+        self._lock = threading.RLock()
+        self._node: Dict[Any, Dict[str, Any]] = {}
+        self._adj: Dict[Any, Dict[Any, Dict[str, Any]]] = {}
+        
+        # Snapshots share the outer dicts until the next update, and the adjacency
+        # dict of every node not in _owned
+        self._shared = False
+        self._owned: Set[Any] = set()
+        self._snapshot: Optional[VersionedGraph] = None
+        self._metrics: Optional['StoreMetricsCache'] = None
+        
+        self._degree: Dict[Any, int] = {}
+        self._components = nx.utils.UnionFind()
+        self._components_valid = True
+        self._pagerank: Dict[Any, float] = {}
+        self._pagerank_version = -1
+        self._updates_since_compaction = 0
+        
+    def update(self, channels: Iterable[Dict[str, Any]] = (), connections: Iterable[Dict[str, Any]] = ()) -> int:
+        """Merge channels and connections into the graph; returns the new version."""
+        with self._lock:
+            self._detach()
+            for channel in channels:
+                self._add_node(channel['id'], channel)
+            for connection in connections:
+                self._add_edge(connection['source'], connection['target'], connection.get('weight', 1.0))
+            return self._commit()
+            
+    def remove_edges(self, edges: Iterable[tuple]) -> int:
+        """Remove edges; components are recomputed at the next compaction."""
+        with self._lock:
+            self._detach()
+            for u, v in edges:
+                if v not in self._adj.get(u, {}):
+                    continue
+                self._own(u)
+                self._own(v)
+                del self._adj[u][v]
+                if u != v:
+                    del self._adj[v][u]
+                self._degree[u] -= 1
+                self._degree[v] -= 1
+                self._components_valid = False
+            return self._commit()
+            
+    def snapshot(self) -> VersionedGraph:
+        """Immutable graph of the current version, shared by every caller until the next update."""
+        with self._lock:
+            if self._snapshot is None:
+                graph = VersionedGraph()
+                graph._node = self._node
+                graph._adj = self._adj
+                graph.version = self.version
+                self._snapshot = nx.freeze(graph)
+                self._shared = True
+                self._owned.clear()
+            return self._snapshot
+            
+    def metrics(self, graph: Optional[VersionedGraph] = None) -> 'StoreMetricsCache':
+        """Metrics cache of a snapshot, shared by every analysis of the latest one."""
+        graph = graph if graph is not None else self.snapshot()
+        with self._lock:
+            if self._metrics is not None and self._metrics.graph is graph:
+                return self._metrics
+            metrics = StoreMetricsCache(self, graph, self.config)
+            if graph is self._snapshot:
+                self._metrics = metrics
+            return metrics
+            
+    def compact(self):
+        """Rebuild degree and components from scratch and stop sharing adjacency with old snapshots."""
+        with self._lock:
+            start_time = time.perf_counter()
+            self._detach()
+            self._adj = {node: dict(neighbors) for node, neighbors in self._adj.items()}
+            self._owned = set(self._adj)
+            self._degree = {
+                node: len(neighbors) + (node in neighbors)
+                for node, neighbors in self._adj.items()
+            }
+            self._components = nx.utils.UnionFind(self._adj)
+            for node, neighbors in self._adj.items():
+                for neighbor in neighbors:
+                    self._components.union(node, neighbor)
+            self._components_valid = True
+            self._updates_since_compaction = 0
+            self.monitoring.record_metric('graph_store_compaction_seconds', time.perf_counter() - start_time)
+            
+    def degrees(self, version: int) -> Optional[Dict[Any, int]]:
+        """Degree of every node if ``version`` is current, else None."""
+        with self._lock:
+            return dict(self._degree) if version == self.version else None
+            
+    def components(self, version: int) -> Optional[List[Set[Any]]]:
+        """Connected components if ``version`` is current and no edge was removed since compaction."""
+        with self._lock:
+            if version != self.version or not self._components_valid:
+                return None
+            return list(self._components.to_sets())
+            
+    def pagerank(
+        self,
+        graph: nx.Graph,
+        compute: Callable[[nx.Graph, Optional[Dict[Any, float]]], Dict[Any, float]]
+    ) -> Dict[Any, float]:
+        """PageRank of a snapshot, warm-started from the last scores computed."""
+        with self._lock:
+            previous = self._pagerank
+        default = 1 / max(graph.number_of_nodes(), 1)
+        values = compute(graph, {node: previous.get(node, default) for node in graph} if previous else None)
+        with self._lock:
+            if getattr(graph, 'version', -1) >= self._pagerank_version:
+                self._pagerank = values
+                self._pagerank_version = getattr(graph, 'version', -1)
+        return values
+        
+    def _detach(self):
+        """Stop sharing the outer dicts with the latest snapshot before mutating."""
+        if self._shared:
+            self._node = dict(self._node)
+            self._adj = dict(self._adj)
+            self._shared = False
+        self._snapshot = None
+        self._metrics = None
+        
+    def _own(self, node: Any):
+        """Copy a node's adjacency before mutating it if a snapshot may share it."""
+        if node not in self._owned:
+            self._adj[node] = dict(self._adj[node])
+            self._owned.add(node)
+            
+    def _add_node(self, node: Any, attrs: Dict[str, Any]):
+        if node in self._node:
+            self._node[node] = {**self._node[node], **attrs}
+            return
+        self._node[node] = dict(attrs)
+        self._adj[node] = {}
+        self._owned.add(node)
+        self._degree[node] = 0
+        self._components[node]
+        
+    def _add_edge(self, u: Any, v: Any, weight: float):
+        for node in (u, v):
+            if node not in self._node:
+                self._add_node(node, {})
+            self._own(node)
+        if v not in self._adj[u]:
+            self._degree[u] += 1
+            self._degree[v] += 1
+            self._components.union(u, v)
+        # Both directions share one data dict, as in nx.Graph; replace it rather than
+        # update it in place since snapshots may hold it
+        data = {**self._adj[u].get(v, {}), 'weight': weight}
+        self._adj[u][v] = data
+        self._adj[v][u] = data
+        
+    def _commit(self) -> int:
+        self.version += 1
+        self._updates_since_compaction += 1
+        if self._updates_since_compaction >= self.compact_every:
+            self.compact()
+        return self.version
+
+class StoreMetricsCache(GraphMetricsCache):
+    """Metrics of a store snapshot, reusing the store's incremental state when current."""
+    
+    def __init__(self, store: AffiliateGraphStore, graph: VersionedGraph, config: Optional[Dict[str, Any]] = None):
+        super().__init__(graph, config)
+        self.store = store
+        
+    def degree_centrality(self) -> Dict[Any, float]:
+        """Degree centrality of every node, from the store's running degrees when current."""
+        def compute(graph: nx.Graph) -> Dict[Any, float]:
+            degrees = self.store.degrees(graph.version)
+            if degrees is None:
+                return nx.degree_centrality(graph)
+            if len(degrees) <= 1:
+                return {node: 1.0 for node in degrees}
+            scale = 1 / (len(degrees) - 1)
+            return {node: degree * scale for node, degree in degrees.items()}
+            
+        return self.get('degree_centrality', compute)
+        
+    def connected_components(self) -> List[Set[Any]]:
+        """Connected components, from the store's union-find when current."""
+        def compute(graph: nx.Graph) -> List[Set[Any]]:
+            components = self.store.components(graph.version)
+            return components if components is not None else list(nx.connected_components(graph))
+            
+        return self.get('connected_components', compute)
+        
+    def pagerank(self) -> Dict[Any, float]:
+        """PageRank of every node, warm-started from the store's previous scores."""
+        return self.get('pagerank', lambda graph: self.store.pagerank(graph, self._pagerank))
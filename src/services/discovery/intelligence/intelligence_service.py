@@ -6,15 +6,42 @@ various intelligence components for prospect analysis and scoring.
 """
 
 from typing import Dict, List, Any, Optional
+from collections import OrderedDict
 from datetime import datetime
-import asyncio
-from services.monitoring import MonitoringService
+from src.services.monitoring.monitoring import MonitoringService
 
-from .ai_agent import AIAgent
-from .timing import TimingAnalyzer
-from .personalization import PersonalizationEngine
-from .sentiment import SentimentAnalyzer
-from .scoring import ProspectScorer
+from .analysis_planner import AnalysisPlanner, AnalyzerSpec
+from .profile_analysis import ProfileAnalysisAI
+from .content_analysis import ContentAnalysisAI
+from .network_analysis import NetworkAnalysisAI
+from .trend_analysis import TrendAnalysisAI
+from .competitive_analysis import CompetitiveAnalysisAI
+from ..pipeline.prospect_scorer import ProspectScorer
+
+# The data each analyzer reads from a prospect and the platforms it supports.
+# Network analysis grows one shared affiliate graph, so it runs on the thread pool
+# against the graph store's copy-on-write snapshots rather than in worker processes.
+ANALYZERS = [
+    AnalyzerSpec(
+        'profile_analysis', ProfileAnalysisAI, 'analyze_profile', ('profile',),
+        platforms=frozenset({'twitter', 'reddit'})
+    ),
+    AnalyzerSpec(
+        'content_analysis', ContentAnalysisAI, 'analyze_content', ('content',),
+        platforms=frozenset({'linkedin', 'instagram'})
+    ),
+    AnalyzerSpec(
+        'network_analysis', NetworkAnalysisAI, 'analyze_network', ('network',),
+        platforms=frozenset({'youtube'}), stateful=True
+    ),
+    AnalyzerSpec(
+        'trend_analysis', TrendAnalysisAI, 'analyze_trends', ('trends',),
+        platforms=frozenset({'tiktok', 'generic'}), default_platform='generic'
+    ),
+    AnalyzerSpec(
+        'competitive_analysis', CompetitiveAnalysisAI, 'analyze_competition', ('competition',)
+    )
+]
 
 class IntelligenceService:
     """Coordinates intelligence components for prospect analysis."""
@@ -24,39 +51,30 @@ class IntelligenceService:
         self.config = config or {}
         self.monitoring = MonitoringService()
         
-        # Initialize components
-        self.ai_agent = AIAgent(config)
-        self.timing_analyzer = TimingAnalyzer(config)
-        self.personalization_engine = PersonalizationEngine(config)
-        self.sentiment_analyzer = SentimentAnalyzer(config)
-        self.prospect_scorer = ProspectScorer(config)
+        # Initialize components; each is built on first use by the planner
+        self.planner = AnalysisPlanner(self.config)
+        for spec in ANALYZERS:
+            self.planner.register(spec)
+        self.prospect_scorer = ProspectScorer(self.config)
+        
+        self.summaries: 'OrderedDict[Any, Dict[str, Any]]' = OrderedDict()
+        self.summary_limit = self.config.get('analysis_summary_limit', 10000)
         
-    async def analyze_prospect(self, prospect_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze a prospect using all intelligence components."""
+    async def analyze_prospect(
+        self,
+        prospect_data: Dict[str, Any],
+        analyzers: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Analyze a prospect using every intelligence component it has data for."""
         try:
             # Start timing
             start_time = datetime.utcnow()
             
-            # Run analysis in parallel
-            analysis_tasks = [
-                self.ai_agent.analyze(prospect_data),
-                self.timing_analyzer.analyze(prospect_data),
-                self.personalization_engine.analyze(prospect_data),
-                self.sentiment_analyzer.analyze(prospect_data)
-            ]
-            
-            results = await asyncio.gather(*analysis_tasks)
-            
-            # Combine results
-            analysis = {
-                'ai_analysis': results[0],
-                'timing_analysis': results[1],
-                'personalization': results[2],
-                'sentiment_analysis': results[3]
-            }
+            # Run the planned analyzers concurrently, each within its time budget
+            outcome = await self.planner.run(prospect_data, analyzers)
             
             # Score prospect
-            score = await self.prospect_scorer.score(analysis)
+            score = await self.prospect_scorer.score_prospect(prospect_data)
             
             # Record metrics
             duration = (datetime.utcnow() - start_time).total_seconds()
@@ -66,11 +84,16 @@ class IntelligenceService:
                 {'prospect_id': prospect_data.get('id')}
             )
             
-            return {
-                'analysis': analysis,
+            analysis = {
+                'analysis': outcome['results'],
                 'score': score,
+                'status': outcome['status'],
+                'durations': outcome['durations'],
+                'complete': all(status != 'timeout' for status in outcome['status'].values()),
                 'timestamp': datetime.utcnow().isoformat()
             }
+            self._remember(prospect_data.get('id'), analysis, duration)
+            return analysis
             
         except Exception as e:
             self.monitoring.log_error(
@@ -84,19 +107,10 @@ class IntelligenceService:
     async def get_analysis_summary(self, prospect_id: str) -> Dict[str, Any]:
         """Get summary of prospect analysis."""
         try:
-            # Get analysis from components
-            ai_summary = await self.ai_agent.get_summary(prospect_id)
-            timing_summary = await self.timing_analyzer.get_summary(prospect_id)
-            personalization_summary = await self.personalization_engine.get_summary(prospect_id)
-            sentiment_summary = await self.sentiment_analyzer.get_summary(prospect_id)
-            
-            return {
-                'ai_summary': ai_summary,
-                'timing_summary': timing_summary,
-                'personalization_summary': personalization_summary,
-                'sentiment_summary': sentiment_summary,
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            summary = self.summaries.get(prospect_id)
+            if summary is None:
+                raise KeyError(f"No analysis for prospect {prospect_id}")
+            return {**summary, 'timestamp': datetime.utcnow().isoformat()}
             
         except Exception as e:
             self.monitoring.log_error(
@@ -110,12 +124,8 @@ class IntelligenceService:
     async def cleanup(self):
         """Cleanup resources."""
         try:
-            # Cleanup components
-            await self.ai_agent.cleanup()
-            await self.timing_analyzer.cleanup()
-            await self.personalization_engine.cleanup()
-            await self.sentiment_analyzer.cleanup()
-            await self.prospect_scorer.cleanup()
+            # Shut down the analyzer pools
+            self.planner.close()
             
         except Exception as e:
             self.monitoring.log_error(
@@ -123,4 +133,16 @@ class IntelligenceService:
                 error_type="cleanup_error",
                 component="intelligence_service"
             )
-            raise 
\ No newline at end of file
+            raise
+            
+    def _remember(self, prospect_id: Any, analysis: Dict[str, Any], duration: float):
+        """Keep the status of the latest analysis of a prospect, evicting the oldest prospects."""
+        self.summaries[prospect_id] = {
+            'status': analysis['status'],
+            'durations': analysis['durations'],
+            'duration': duration,
+            'analyzed_at': analysis['timestamp']
+        }
+        self.summaries.move_to_end(prospect_id)
+        while len(self.summaries) > self.summary_limit:
+            self.summaries.popitem(last=False)
@@ -6,15 +6,19 @@ to support affiliate discovery.
 """
 
 from typing import Dict, List, Any, Optional
+import copy
 import logging
 from datetime import datetime
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
 from collections import defaultdict, Counter
 from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import StandardScaler, normalize
 
 from src.services.monitoring.monitoring import MonitoringService
+from .graph_store import AffiliateGraphStore
+from .similarity import top_k_similarity
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +28,21 @@ class NetworkAnalysisAI:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.monitoring = MonitoringService()
-        self.network = nx.Graph()
+        
+        # Analyses read an immutable snapshot of the shared graph; centralities and
+        # communities are computed once per graph version and shared between them
+        self.store = AffiliateGraphStore(config)
+        self.network = self.store.snapshot()
+        self.metrics = self.store.metrics(self.network)
         
     async def analyze_network(self, network_data: Dict[str, Any], platform: str) -> Dict[str, Any]:
         """Analyze network from YouTube data."""
         try:
             if platform.lower() == 'youtube':
-                return await self._analyze_youtube_network(network_data)
+                # Bind this request's snapshot to its own view of the analyzer so
+                # concurrent analyses never swap each other's graph
+                analysis = copy.copy(self)
+                return await analysis._analyze_youtube_network(network_data)
             else:
                 raise ValueError(f"Unsupported platform: {platform}")
                 
@@ -47,6 +59,9 @@ class NetworkAnalysisAI:
             # Build network graph
             self._build_network_graph(network_data)
             
+            # Every metric this analysis computes shares one time budget
+            self.metrics.start_budget()
+            
             # Calculate network metrics
             network_metrics = await self._calculate_network_metrics()
             
@@ -79,26 +94,15 @@ class NetworkAnalysisAI:
             raise
             
     def _build_network_graph(self, network_data: Dict[str, Any]):
-        """Build network graph from data."""
+        """Add channels and connections to the shared graph and snapshot it."""
         try:
-            # Clear existing graph
-            self.network.clear()
-            
-            # Add nodes (channels)
-            for channel in network_data.get('channels', []):
-                self.network.add_node(
-                    channel['id'],
-                    **channel
-                )
-                
-            # Add edges (connections)
-            for connection in network_data.get('connections', []):
-                self.network.add_edge(
-                    connection['source'],
-                    connection['target'],
-                    weight=connection.get('weight', 1.0)
-                )
-                
+            self.store.update(
+                network_data.get('channels', []),
+                network_data.get('connections', [])
+            )
+            self.network = self.store.snapshot()
+            self.metrics = self.store.metrics(self.network)
+            
         except Exception as e:
             self.monitoring.log_error(f"Error building network graph: {str(e)}")
             raise
@@ -111,9 +115,11 @@ class NetworkAnalysisAI:
                 'density': nx.density(self.network),
                 'average_degree': sum(dict(self.network.degree()).values()) / self.network.number_of_nodes(),
                 'centrality_metrics': await self._calculate_centrality_metrics(),
-                'clustering_coefficient': nx.average_clustering(self.network),
-                'average_path_length': nx.average_shortest_path_length(self.network) if nx.is_connected(self.network) else float('inf')
+                'clustering_coefficient': self.metrics.average_clustering(),
+                'average_path_length': self.metrics.average_path_length(),
+                'diameter': self.metrics.diameter()
             }
+            metrics['error_bounds'] = self.metrics.error_bounds()
             
             return metrics
             
@@ -125,17 +131,20 @@ class NetworkAnalysisAI:
                 'average_degree': 0,
                 'centrality_metrics': {},
                 'clustering_coefficient': 0,
-                'average_path_length': float('inf')
+                'average_path_length': float('inf'),
+                'diameter': float('inf'),
+                'error_bounds': {}
             }
             
     async def _calculate_centrality_metrics(self) -> Dict[str, Dict[str, float]]:
         """Calculate centrality metrics."""
         try:
             metrics = {
-                'degree_centrality': nx.degree_centrality(self.network),
-                'betweenness_centrality': nx.betweenness_centrality(self.network),
-                'eigenvector_centrality': nx.eigenvector_centrality(self.network),
-                'closeness_centrality': nx.closeness_centrality(self.network)
+                'degree_centrality': self.metrics.degree_centrality(),
+                'betweenness_centrality': self.metrics.betweenness_centrality(),
+                'eigenvector_centrality': self.metrics.eigenvector_centrality(),
+                'closeness_centrality': self.metrics.closeness_centrality(),
+                'pagerank': self.metrics.pagerank()
             }
             
             # Get top nodes for each metric
@@ -159,34 +168,36 @@ class NetworkAnalysisAI:
         """Analyze community structure."""
         try:
             # Detect communities using Louvain method
-            communities = nx.community.louvain_communities(self.network)
+            communities = self.metrics.communities()
+            
+            stats = self.metrics.community_stats()
             
             # Calculate community metrics
             community_metrics = {
                 'number_of_communities': len(communities),
-                'community_sizes': [len(c) for c in communities],
-                'community_densities': [
-                    nx.density(self.network.subgraph(c))
-                    for c in communities
-                ]
+                'community_sizes': stats['sizes'],
+                'community_densities': stats['densities'],
+                'intra_community_edges': stats['intra_edges'],
+                'inter_community_edges': stats['inter_edges'],
+                'community_conductance': stats['conductance'],
+                'modularity_contributions': stats['modularity_contributions']
             }
             
             # Calculate inter-community connections
-            inter_community_connections = defaultdict(int)
-            for u, v in self.network.edges():
-                for i, community in enumerate(communities):
-                    if u in community:
-                        for j, other_community in enumerate(communities):
-                            if v in other_community and i != j:
-                                inter_community_connections[(i, j)] += 1
-                                
+            edge_counts = stats['edge_counts'].tocoo()
+            inter_community_connections = {
+                (int(i), int(j)): int(connections)
+                for i, j, connections in zip(edge_counts.row, edge_counts.col, edge_counts.data)
+                if i != j
+            }
+            
             # Calculate modularity
-            modularity = nx.community.modularity(self.network, communities)
+            modularity = stats['modularity']
             
             return {
                 'communities': [list(c) for c in communities],
                 'community_metrics': community_metrics,
-                'inter_community_connections': dict(inter_community_connections),
+                'inter_community_connections': inter_community_connections,
                 'modularity': modularity
             }
             
@@ -233,9 +244,9 @@ class NetworkAnalysisAI:
             
             # Consider multiple centrality metrics
             centrality_metrics = {
-                'degree': nx.degree_centrality(self.network),
-                'betweenness': nx.betweenness_centrality(self.network),
-                'eigenvector': nx.eigenvector_centrality(self.network)
+                'degree': self.metrics.degree_centrality(),
+                'betweenness': self.metrics.betweenness_centrality(),
+                'eigenvector': self.metrics.eigenvector_centrality()
             }
             
             # Calculate combined influence score
@@ -276,19 +287,13 @@ class NetworkAnalysisAI:
             for influencer in key_influencers:
                 influencer_id = influencer['id']
                 
-                # Find shortest paths to all other nodes
-                paths = nx.single_source_shortest_path(
+                # Only paths of length 3 or less are kept, so stop the search two hops out
+                influence_paths[influencer_id] = nx.single_source_shortest_path(
                     self.network,
-                    influencer_id
+                    influencer_id,
+                    cutoff=2
                 )
                 
-                # Filter and store paths
-                influence_paths[influencer_id] = {
-                    target: path
-                    for target, path in paths.items()
-                    if len(path) <= 3  # Consider paths of length 3 or less
-                }
-                
             return influence_paths
             
         except Exception as e:
@@ -364,30 +369,25 @@ class NetworkAnalysisAI:
     def _identify_potential_collaborations(self) -> List[Dict[str, Any]]:
         """Identify potential collaborations in the network."""
         try:
-            potential_collaborations = []
-            
-            # Get node features for similarity calculation
-            node_features = self._extract_node_features()
-            
-            # Calculate similarity matrix
-            similarity_matrix = self._calculate_similarity_matrix(node_features)
-            
-            # Find potential collaborations
-            for i, node1 in enumerate(self.network.nodes()):
-                for j, node2 in enumerate(self.network.nodes()):
-                    if i < j:  # Avoid duplicate pairs
-                        # Check if nodes are not already connected
-                        if not self.network.has_edge(node1, node2):
-                            similarity = similarity_matrix[i][j]
-                            if similarity > 0.5:  # Threshold for potential collaboration
-                                potential_collaborations.append({
-                                    'node1': node1,
-                                    'node2': node2,
-                                    'similarity': similarity
-                                })
-                                
+            nodes = list(self.network.nodes())
+            similarity_matrix = self.metrics.get(
+                'collaboration_similarity',
+                lambda graph: self._calculate_similarity_matrix(self._extract_node_features())
+            ).tocoo()
+            
+            # Top-K lists are not symmetric, so a pair may be found from either side
+            potential_collaborations = {}
+            for i, j, similarity in zip(similarity_matrix.row, similarity_matrix.col, similarity_matrix.data):
+                pair = (min(i, j), max(i, j))
+                if pair not in potential_collaborations:
+                    potential_collaborations[pair] = {
+                        'node1': nodes[pair[0]],
+                        'node2': nodes[pair[1]],
+                        'similarity': float(similarity)
+                    }
+                    
             return sorted(
-                potential_collaborations,
+                potential_collaborations.values(),
                 key=lambda x: x['similarity'],
                 reverse=True
             )
@@ -416,27 +416,51 @@ class NetworkAnalysisAI:
             self.monitoring.log_error(f"Error extracting node features: {str(e)}")
             return {}
             
-    def _calculate_similarity_matrix(self, features: Dict[str, List[float]]) -> np.ndarray:
-        """Calculate similarity matrix between nodes."""
+    def _calculate_similarity_matrix(self, features: Dict[str, List[float]]) -> sp.csr_matrix:
+        """Calculate the top-K most similar unconnected nodes of each node.
+        
+        Nodes are compared by the cosine of their standardized features and of their
+        neighbourhoods, weighted by ``similarity_feature_weight`` and
+        ``similarity_neighborhood_weight``.
+        """
         try:
+            nodes = list(self.network.nodes())
+            
             # Convert features to numpy array
             feature_matrix = np.array([
                 features[feature]
                 for feature in ['subscribers', 'views', 'videos', 'engagement_rate']
-            ]).T
+            ], dtype=float).T
             
             # Normalize features
             scaler = StandardScaler()
-            normalized_features = scaler.fit_transform(feature_matrix)
-            
-            # Calculate cosine similarity
-            similarity_matrix = np.dot(normalized_features, normalized_features.T)
-            
-            return similarity_matrix
+            normalized_features = normalize(scaler.fit_transform(feature_matrix))
+            
+            adjacency = nx.to_scipy_sparse_array(self.network, nodelist=nodes, weight=None, format='csr')
+            neighborhoods = normalize(adjacency)
+            
+            # Scaling each unit-length block by the square root of its share of the
+            # weight makes the dot product the weighted mean of the two cosines
+            feature_weight = self.config.get('similarity_feature_weight', 1.0)
+            neighborhood_weight = self.config.get('similarity_neighborhood_weight', 1.0)
+            total_weight = feature_weight + neighborhood_weight
+            vectors = sp.hstack([
+                sp.csr_matrix(normalized_features) * np.sqrt(feature_weight / total_weight),
+                neighborhoods * np.sqrt(neighborhood_weight / total_weight)
+            ], format='csr')
+            
+            # Calculate cosine similarity of unconnected pairs above the threshold
+            return top_k_similarity(
+                vectors,
+                k=self.config.get('similarity_top_k', 20),
+                threshold=self.config.get('similarity_threshold', 0.5),
+                exclude=adjacency,
+                block_elements=self.config.get('similarity_block_elements', 1 << 22)
+            )
             
         except Exception as e:
             self.monitoring.log_error(f"Error calculating similarity matrix: {str(e)}")
-            return np.array([])
+            return sp.csr_matrix((0, 0))
             
     def _calculate_collaboration_metrics(self, potential_collaborations: List[Dict[str, Any]]) -> Dict[str, float]:
         """Calculate collaboration metrics."""
@@ -489,7 +513,7 @@ class NetworkAnalysisAI:
         """Identify potential affiliate networks."""
         try:
             # Find connected components
-            components = list(nx.connected_components(self.network))
+            components = self.metrics.connected_components()
             
             # Analyze each component
             affiliate_networks = []
@@ -593,7 +617,7 @@ class NetworkAnalysisAI:
             opportunities = []
             
             # Find nodes with high betweenness centrality
-            betweenness = nx.betweenness_centrality(self.network)
+            betweenness = self.metrics.betweenness_centrality()
             
             for node, score in sorted(betweenness.items(), key=lambda x: x[1], reverse=True):
                 if score > 0.1:  # Threshold for high betweenness
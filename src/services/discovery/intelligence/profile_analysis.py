@@ -11,14 +11,10 @@ from datetime import datetime, timedelta
 import re
 from collections import Counter, defaultdict
 import numpy as np
-from textblob import TextBlob
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from src.services.monitoring.monitoring import MonitoringService
+from ..nlp.text_analysis import get_text_analyzer
 
 logger = logging.getLogger(__name__)
 
@@ -29,17 +25,8 @@ class ProfileAnalysisAI:
         self.config = config
         self.monitoring = MonitoringService()
         
-        # Download required NLTK data
-        try:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-            nltk.download('wordnet')
-        except Exception as e:
-            logger.error(f"Error downloading NLTK data: {str(e)}")
-            
-        # Initialize NLTK components
-        self.stop_words = set(stopwords.words('english'))
-        self.lemmatizer = WordNetLemmatizer()
+        # Texts are tokenized and lemmatized once by the shared text analyzer
+        self.text_analyzer = get_text_analyzer(config)
         
     async def analyze_profile(self, profile_data: Dict[str, Any], platform: str) -> Dict[str, Any]:
         """Analyze profile from Twitter or Reddit."""
@@ -346,10 +333,13 @@ class ProfileAnalysisAI:
                 
             # Extract text from posts
             texts = [p.get('text', '') for p in posts]
-            combined_text = ' '.join(texts)
             
             # Extract topics
-            topics = await self._extract_topics(combined_text)
+            topics = [
+                lemma
+                for doc in self.text_analyzer.analyze(texts)
+                for lemma in doc.lemmas
+            ]
             
             # Calculate diversity score
             unique_topics = len(set(topics))
@@ -0,0 +1,58 @@
+"""
+Similarity Search
+
+This module implements top-K cosine similarity search over sparse node vectors.
+Rows are multiplied against the whole matrix a block at a time and only the K most
+similar rows of each are kept, so memory is O(n*K) for the result plus one block of
+scores, never a dense n x n matrix.
+"""
+
+from typing import Optional
+import logging
+import numpy as np
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+logger = logging.getLogger(__name__)
+
+def top_k_similarity(
+    vectors: sp.csr_matrix,
+    k: int,
+    threshold: float = -np.inf,
+    exclude: Optional[sp.csr_matrix] = None,
+    block_elements: int = 1 << 22
+) -> sp.csr_matrix:
+    """Keep the ``k`` most cosine-similar rows of each row of ``vectors``.
+    
+    The result is an n x n CSR matrix holding at most ``k`` scores per row, each
+    above ``threshold``. A row is never its own neighbour, and pairs stored in the
+    ``exclude`` matrix are skipped. Scores are computed ``block_elements`` at a time.
+    """
+    vectors = normalize(sp.csr_matrix(vectors, dtype=np.float64))
+    size = vectors.shape[0]
+    k = min(k, size - 1)
+    if k <= 0:
+        return sp.csr_matrix((size, size))
+    transposed = vectors.T.tocsc()
+    block_size = max(1, block_elements // size)
+    rows, cols, scores = [], [], []
+    
+    for start in range(0, size, block_size):
+        stop = min(start + block_size, size)
+        block = (vectors[start:stop] @ transposed).toarray()
+        block[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        if exclude is not None:
+            excluded = exclude[start:stop].tocoo()
+            block[excluded.row, excluded.col] = -np.inf
+            
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        keep = top_scores > threshold
+        rows.append(np.nonzero(keep)[0] + start)
+        cols.append(top[keep])
+        scores.append(top_scores[keep])
+        
+    return sp.csr_matrix(
+        (np.concatenate(scores), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(size, size)
+    )
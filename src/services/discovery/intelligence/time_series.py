@@ -0,0 +1,204 @@
+"""
+Post Time Series
+
+This module implements the columnar time-series layer behind TrendAnalysisAI. A
+profile's posts are read once into NumPy arrays of timestamps and engagement sorted
+by time; hourly, daily and weekly buckets are built from those arrays with one
+`bincount` each and cached, and rolling statistics, growth slopes, seasonality and
+forecasts are all vectorized over the shared buckets.
+"""
+
+from typing import Dict, Any, Optional, Iterable, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+import numpy as np
+
+from ..pipeline.date_parser import DateParser
+
+logger = logging.getLogger(__name__)
+
+# Bucket widths in seconds; weeks start on Monday 00:00 UTC (the epoch was a Thursday)
+FREQUENCIES = {'hour': 3600, 'day': 86400, 'week': 7 * 86400}
+BUCKET_ORIGINS = {'hour': 0, 'day': 0, 'week': 4 * 86400}
+
+@dataclass(frozen=True)
+class Buckets:
+    """Post counts and engagement per time bucket."""
+    
+    frequency: str
+    start: float
+    posts: np.ndarray
+    engagement: np.ndarray
+    
+    def values(self, metric: str) -> np.ndarray:
+        """Series of a metric: 'posts', 'engagement' or 'engagement_per_post'."""
+        if metric == 'engagement_per_post':
+            return np.divide(self.engagement, self.posts, out=np.zeros_like(self.engagement), where=self.posts > 0)
+        return self.posts if metric == 'posts' else self.engagement
+
+class PostSeries:
+    """A profile's posts as time-sorted columnar arrays."""
+    
+    def __init__(self, timestamps: np.ndarray, engagement: np.ndarray, order: np.ndarray, undated: np.ndarray):
+        self.timestamps = timestamps
+        self.engagement = engagement
+        self.order = order
+        self.undated = undated
+        self._buckets: Dict[str, Buckets] = {}
+        
+    @classmethod
+    def from_posts(cls, posts: Iterable[Dict[str, Any]], date_parser: Optional[DateParser] = None) -> 'PostSeries':
+        """Read post dates and engagement into arrays in one pass over the posts."""
+        date_parser = date_parser or DateParser({})
+        posts = list(posts)
+        engagement = np.fromiter(
+            (_engagement(post) for post in posts), dtype=np.float64, count=len(posts)
+        )
+        timestamps = np.fromiter(
+            (_timestamp(post.get('created_at'), date_parser) for post in posts), dtype=np.float64, count=len(posts)
+        )
+        
+        dated = ~np.isnan(timestamps)
+        positions = np.flatnonzero(dated)
+        order = positions[np.argsort(timestamps[dated], kind='stable')]
+        return cls(timestamps[order], engagement[order], order, np.flatnonzero(~dated))
+        
+    def __len__(self) -> int:
+        return len(self.timestamps)
+        
+    @property
+    def dated_fraction(self) -> float:
+        """Share of posts that have a usable date."""
+        total = len(self.timestamps) + len(self.undated)
+        return len(self.timestamps) / total if total else 0.0
+        
+    def buckets(self, frequency: str) -> Buckets:
+        """Posts and engagement per hour, day or week, from the first to the last post."""
+        if frequency not in self._buckets:
+            width, origin = FREQUENCIES[frequency], BUCKET_ORIGINS[frequency]
+            if len(self.timestamps):
+                start = np.floor((self.timestamps[0] - origin) / width) * width + origin
+                index = ((self.timestamps - start) // width).astype(np.int64)
+                size = int(index[-1]) + 1
+                posts = np.bincount(index, minlength=size).astype(np.float64)
+                engagement = np.bincount(index, weights=self.engagement, minlength=size)
+            else:
+                start, posts, engagement = 0.0, np.zeros(0), np.zeros(0)
+            self._buckets[frequency] = Buckets(frequency, float(start), posts, engagement)
+        return self._buckets[frequency]
+        
+    def rolling_mean(self, frequency: str, window: int, metric: str = 'engagement') -> np.ndarray:
+        """Mean of a metric over the trailing ``window`` buckets, for every bucket."""
+        values = self.buckets(frequency).values(metric)
+        if not len(values):
+            return values
+        sums = np.cumsum(np.concatenate(([0.0], values)))
+        ends = np.arange(1, len(values) + 1)
+        starts = np.maximum(ends - window, 0)
+        return (sums[ends] - sums[starts]) / (ends - starts)
+        
+    def trend(self, frequency: str, metric: str = 'engagement', window: Optional[int] = None) -> Dict[str, float]:
+        """Least-squares trend of a metric over complete buckets, optionally only the last ``window``."""
+        values = self._complete(frequency, metric, window)
+        slope, intercept, r2 = _linear_fit(values)
+        mean = float(values.mean()) if len(values) else 0.0
+        return {
+            'slope': slope,
+            'intercept': intercept,
+            'r2': r2,
+            'mean': mean,
+            'growth_rate': slope / mean if mean else 0.0,
+            'buckets': len(values)
+        }
+        
+    def forecast(
+        self,
+        frequency: str,
+        horizon: int,
+        metric: str = 'engagement',
+        window: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Extrapolate a metric's trend over the next ``horizon`` buckets."""
+        values = self._complete(frequency, metric, window)
+        slope, intercept, r2 = _linear_fit(values)
+        steps = np.arange(len(values), len(values) + horizon)
+        predicted = np.maximum(intercept + slope * steps, 0.0)
+        return {
+            'frequency': frequency,
+            'horizon': horizon,
+            'predicted': predicted.tolist(),
+            'total': float(predicted.sum()),
+            'change': float(predicted.mean() / values.mean() - 1) if len(values) and values.mean() else 0.0,
+            'r2': r2
+        }
+        
+    def seasonality(self) -> Dict[str, Any]:
+        """Share of posts and mean engagement by hour of day and day of week (UTC)."""
+        hours = ((self.timestamps // 3600) % 24).astype(np.int64)
+        days = ((self.timestamps // 86400 + 3) % 7).astype(np.int64)
+        profile = {}
+        for name, index, size in (('hour_of_day', hours, 24), ('day_of_week', days, 7)):
+            posts = np.bincount(index, minlength=size).astype(np.float64)
+            engagement = np.bincount(index, weights=self.engagement, minlength=size)
+            mean_engagement = np.divide(engagement, posts, out=np.zeros(size), where=posts > 0)
+            share = posts / posts.sum() if posts.sum() else posts
+            profile[name] = {
+                'post_share': share.tolist(),
+                'mean_engagement': mean_engagement.tolist(),
+                'peak': int(np.argmax(mean_engagement)) if posts.sum() else None,
+                # Coefficient of variation of the share; 0 when posting is uniform
+                'concentration': float(share.std() / share.mean()) if share.mean() else 0.0
+            }
+        return profile
+        
+    def split(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions in the original posts of the older and the recent half; undated posts count as oldest."""
+        ranked = np.concatenate((self.undated, self.order))
+        middle = len(ranked) - len(ranked) // 2
+        return ranked[:middle], ranked[middle:]
+        
+    def _complete(self, frequency: str, metric: str, window: Optional[int]) -> np.ndarray:
+        """A metric's buckets without the last, partial one, optionally only the last ``window``."""
+        values = self.buckets(frequency).values(metric)
+        if len(values) > 2:
+            values = values[:-1]
+        return values[-window:] if window else values
+
+def _linear_fit(values: np.ndarray) -> Tuple[float, float, float]:
+    """Slope, intercept and R^2 of values against their index."""
+    n = len(values)
+    if n < 2:
+        return 0.0, float(values[0]) if n else 0.0, 0.0
+    x = np.arange(n, dtype=np.float64)
+    x_mean, y_mean = x.mean(), values.mean()
+    slope = float(((x - x_mean) * (values - y_mean)).sum() / ((x - x_mean) ** 2).sum())
+    intercept = float(y_mean - slope * x_mean)
+    total = ((values - y_mean) ** 2).sum()
+    residual = ((values - (intercept + slope * x)) ** 2).sum()
+    return slope, intercept, float(1 - residual / total) if total else 0.0
+
+def _engagement(post: Dict[str, Any]) -> float:
+    """A post's engagement: its own total if given, else likes, comments and shares."""
+    engagement = post.get('engagement')
+    if isinstance(engagement, (int, float)):
+        return engagement
+    return (post.get('likes') or 0) + (post.get('comments') or 0) + (post.get('shares') or 0)
+
+def _timestamp(value: Any, date_parser: DateParser) -> float:
+    """POSIX seconds of a post date, reading naive dates as UTC; NaN if missing or unparseable."""
+    if isinstance(value, str):
+        # Most scraped dates are ISO-8601; only others go through the format-sniffing parser
+        try:
+            date = datetime.fromisoformat(value)
+        except ValueError:
+            date = date_parser.parse(value, 'trend_analysis')
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    else:
+        date = date_parser.parse(value, 'trend_analysis')
+    if date is None:
+        return np.nan
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
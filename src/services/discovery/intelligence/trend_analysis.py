@@ -9,12 +9,11 @@ from typing import Dict, List, Any
 import logging
 import numpy as np
 from collections import Counter
-from textblob import TextBlob
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
 
 from src.services.monitoring.monitoring import MonitoringService
+from ..nlp.text_analysis import get_text_analyzer
+from ..pipeline.date_parser import DateParser
+from .time_series import PostSeries
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +24,11 @@ class TrendAnalysisAI:
         self.config = config
         self.monitoring = MonitoringService()
         
-        # Download required NLTK data
-        try:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-        except Exception as e:
-            logger.error(f"Error downloading NLTK data: {str(e)}")
-            
-        self.stop_words = set(stopwords.words('english'))
+        # Texts are tokenized and scored once by the shared text analyzer
+        self.text_analyzer = get_text_analyzer(config)
+        
+        # Post dates are parsed once per profile into a shared time series
+        self.date_parser = DateParser(config)
         
     async def analyze_trends(self, data: Dict[str, Any], platform: str) -> Dict[str, Any]:
         """Analyze trends from TikTok or generic web data."""
@@ -57,12 +53,13 @@ class TrendAnalysisAI:
             # Extract trend data
             trends = data.get('trends', [])
             content = data.get('content', [])
+            series = PostSeries.from_posts(content, self.date_parser)
             
             # Analyze content trends
-            content_analysis = await self._analyze_content_trends(content)
+            content_analysis = await self._analyze_content_trends(content, series)
             
             # Analyze audience trends
-            audience_analysis = await self._analyze_audience_trends(data)
+            audience_analysis = await self._analyze_audience_trends(data, series)
             
             # Analyze engagement trends
             engagement_analysis = await self._analyze_engagement_trends(data)
@@ -71,7 +68,7 @@ class TrendAnalysisAI:
             opportunities = await self._identify_opportunities(content_analysis, audience_analysis)
             
             # Generate predictions
-            predictions = await self._generate_predictions(content_analysis, audience_analysis)
+            predictions = await self._generate_predictions(content_analysis, audience_analysis, series)
             
             return {
                 'content_analysis': content_analysis,
@@ -91,21 +88,22 @@ class TrendAnalysisAI:
             # Extract trend data
             trends = data.get('trends', [])
             content = data.get('content', [])
+            series = PostSeries.from_posts(content, self.date_parser)
             
             # Analyze market trends
             market_analysis = await self._analyze_market_trends(data)
             
             # Analyze content trends
-            content_analysis = await self._analyze_content_trends(content)
+            content_analysis = await self._analyze_content_trends(content, series)
             
             # Analyze audience trends
-            audience_analysis = await self._analyze_audience_trends(data)
+            audience_analysis = await self._analyze_audience_trends(data, series)
             
             # Identify opportunities
             opportunities = await self._identify_opportunities(content_analysis, audience_analysis)
             
             # Generate predictions
-            predictions = await self._generate_predictions(content_analysis, audience_analysis)
+            predictions = await self._generate_predictions(content_analysis, audience_analysis, series)
             
             return {
                 'market_analysis': market_analysis,
@@ -119,14 +117,14 @@ class TrendAnalysisAI:
             self.monitoring.log_error(f"Error analyzing generic trends: {str(e)}")
             raise
             
-    async def _analyze_content_trends(self, content: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_content_trends(self, content: List[Dict[str, Any]], series: PostSeries) -> Dict[str, Any]:
         """Analyze content trends."""
         try:
             # Extract text content
             texts = [item.get('text', '') for item in content]
             
             # Analyze topics
-            topics = await self._extract_topics(texts)
+            topics = self._extract_topics(texts)
             
             # Analyze content types
             content_types = self._analyze_content_types(content)
@@ -135,32 +133,33 @@ class TrendAnalysisAI:
             sentiment_trends = await self._analyze_sentiment_trends(texts)
             
             # Analyze content evolution
-            content_evolution = self._analyze_content_evolution(content)
+            content_evolution = self._analyze_content_evolution(texts, series)
             
             return {
                 'topics': topics,
                 'content_types': content_types,
                 'sentiment_trends': sentiment_trends,
-                'content_evolution': content_evolution
+                'content_evolution': content_evolution,
+                'posting_trends': self._analyze_posting_trends(series)
             }
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing content trends: {str(e)}")
             return {}
             
-    async def _analyze_audience_trends(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_audience_trends(self, data: Dict[str, Any], series: PostSeries) -> Dict[str, Any]:
         """Analyze audience trends."""
         try:
             audience = data.get('audience', {})
             
             # Analyze growth trends
-            growth_trends = self._analyze_growth_trends(audience)
+            growth_trends = self._analyze_growth_trends(audience, series)
             
             # Analyze demographic shifts
             demographic_shifts = self._analyze_demographic_shifts(audience)
             
             # Analyze engagement patterns
-            engagement_patterns = self._analyze_engagement_patterns(audience)
+            engagement_patterns = self._analyze_engagement_patterns(audience, series)
             
             # Analyze audience behavior
             behavior_analysis = self._analyze_audience_behavior(audience)
@@ -259,15 +258,16 @@ class TrendAnalysisAI:
     async def _generate_predictions(
         self,
         content_analysis: Dict[str, Any],
-        audience_analysis: Dict[str, Any]
+        audience_analysis: Dict[str, Any],
+        series: PostSeries
     ) -> Dict[str, Any]:
         """Generate trend predictions."""
         try:
             predictions = {
-                'short_term': self._predict_short_term_trends(content_analysis),
-                'medium_term': self._predict_medium_term_trends(content_analysis),
-                'long_term': self._predict_long_term_trends(content_analysis),
-                'confidence_metrics': self._calculate_prediction_confidence(content_analysis)
+                'short_term': self._predict_short_term_trends(content_analysis, series),
+                'medium_term': self._predict_medium_term_trends(content_analysis, series),
+                'long_term': self._predict_long_term_trends(content_analysis, series),
+                'confidence_metrics': self._calculate_prediction_confidence(content_analysis, series)
             }
             
             return predictions
@@ -279,15 +279,14 @@ class TrendAnalysisAI:
     def _extract_topics(self, texts: List[str]) -> List[str]:
         """Extract topics from texts."""
         try:
-            # Combine texts
-            combined_text = ' '.join(texts)
-            
-            # Tokenize and preprocess
-            tokens = word_tokenize(combined_text.lower())
-            tokens = [t for t in tokens if t not in self.stop_words]
+            # Count lemmas across all texts
+            topic_counts = Counter(
+                lemma
+                for doc in self.text_analyzer.analyze(texts)
+                for lemma in doc.lemmas
+            )
             
             # Get most common topics
-            topic_counts = Counter(tokens)
             return [topic for topic, _ in topic_counts.most_common(10)]
             
         except Exception as e:
@@ -318,7 +317,7 @@ class TrendAnalysisAI:
     async def _analyze_sentiment_trends(self, texts: List[str]) -> Dict[str, float]:
         """Analyze sentiment trends."""
         try:
-            sentiments = [TextBlob(text).sentiment.polarity for text in texts]
+            sentiments = [doc.polarity for doc in self.text_analyzer.analyze(texts)]
             
             return {
                 'average_sentiment': np.mean(sentiments),
@@ -330,39 +329,86 @@ class TrendAnalysisAI:
             self.monitoring.log_error(f"Error analyzing sentiment trends: {str(e)}")
             return {}
             
-    def _analyze_content_evolution(self, content: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_content_evolution(self, texts: List[str], series: PostSeries) -> Dict[str, Any]:
         """Analyze content evolution over time."""
         try:
-            # Sort content by date
-            sorted_content = sorted(
-                content,
-                key=lambda x: x.get('created_at', ''),
-                reverse=True
-            )
-            
             # Analyze recent vs older content
-            recent_content = sorted_content[:len(sorted_content)//2]
-            older_content = sorted_content[len(sorted_content)//2:]
+            older, recent = series.split()
+            recent_topics = self._extract_topics([texts[i] for i in recent])
+            older_topics = self._extract_topics([texts[i] for i in older])
             
             return {
-                'recent_topics': self._extract_topics([c.get('text', '') for c in recent_content]),
-                'older_topics': self._extract_topics([c.get('text', '') for c in older_content]),
-                'content_shift': self._calculate_content_shift(recent_content, older_content)
+                'recent_topics': recent_topics,
+                'older_topics': older_topics,
+                'content_shift': self._calculate_content_shift(series, recent_topics, older_topics)
             }
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing content evolution: {str(e)}")
             return {}
             
-    def _analyze_growth_trends(self, audience: Dict[str, Any]) -> Dict[str, float]:
+    def _calculate_content_shift(
+        self,
+        series: PostSeries,
+        recent_topics: List[str],
+        older_topics: List[str]
+    ) -> Dict[str, float]:
+        """Compare recent topics with older ones, and posting rate and engagement over the two halves of the timeline."""
+        try:
+            union = set(recent_topics) | set(older_topics)
+            weekly = series.buckets('week')
+            middle = len(weekly.posts) // 2
+            
+            def change(values: np.ndarray) -> float:
+                if not middle:
+                    return 0.0
+                before, after = values[:middle].mean(), values[middle:].mean()
+                return float(after / before - 1) if before else 0.0
+                
+            return {
+                'topic_overlap': len(set(recent_topics) & set(older_topics)) / len(union) if union else 1.0,
+                'posting_rate_change': change(weekly.posts),
+                'engagement_change': change(weekly.values('engagement_per_post'))
+            }
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error calculating content shift: {str(e)}")
+            return {}
+            
+    def _analyze_posting_trends(self, series: PostSeries) -> Dict[str, Any]:
+        """Summarize posting volume and engagement over time from the shared series."""
+        try:
+            window = self.config.get('trend_rolling_window', 7)
+            daily_engagement = series.rolling_mean('day', window)
+            
+            return {
+                'posts': len(series),
+                'dated_fraction': series.dated_fraction,
+                'daily_posts': series.trend('day', 'posts'),
+                'weekly_posts': series.trend('week', 'posts'),
+                'weekly_engagement': series.trend('week', 'engagement'),
+                'rolling_daily_engagement': float(daily_engagement[-1]) if len(daily_engagement) else 0.0,
+                'seasonality': series.seasonality()
+            }
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error analyzing posting trends: {str(e)}")
+            return {}
+            
+    def _analyze_growth_trends(self, audience: Dict[str, Any], series: PostSeries) -> Dict[str, float]:
         """Analyze audience growth trends."""
         try:
             growth = audience.get('growth', {})
             
+            # Rates the audience data lacks are measured from the posts' weekly trend
             return {
                 'follower_growth_rate': growth.get('follower_growth_rate', 0),
-                'engagement_growth_rate': growth.get('engagement_growth_rate', 0),
-                'content_growth_rate': growth.get('content_growth_rate', 0)
+                'engagement_growth_rate': growth.get(
+                    'engagement_growth_rate', series.trend('week', 'engagement')['growth_rate']
+                ),
+                'content_growth_rate': growth.get(
+                    'content_growth_rate', series.trend('week', 'posts')['growth_rate']
+                )
             }
             
         except Exception as e:
@@ -384,14 +430,27 @@ class TrendAnalysisAI:
             self.monitoring.log_error(f"Error analyzing demographic shifts: {str(e)}")
             return {}
             
-    def _analyze_engagement_patterns(self, audience: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_engagement_patterns(self, audience: Dict[str, Any], series: PostSeries) -> Dict[str, Any]:
         """Analyze engagement patterns."""
         try:
             engagement = audience.get('engagement', {})
             
+            # Without audience data, active hours and frequency come from the posts
+            active_hours = engagement.get('active_hours')
+            if active_hours is None:
+                hourly = series.seasonality()['hour_of_day']['mean_engagement']
+                active_hours = {hour: value for hour, value in enumerate(hourly) if value > 0}
+            frequency = engagement.get('engagement_frequency')
+            if frequency is None:
+                daily = series.buckets('day').posts
+                frequency = {
+                    'posts_per_day': float(daily.mean()) if len(daily) else 0.0,
+                    'active_day_ratio': float((daily > 0).mean()) if len(daily) else 0.0
+                }
+                
             return {
-                'active_hours': engagement.get('active_hours', {}),
-                'engagement_frequency': engagement.get('engagement_frequency', {}),
+                'active_hours': active_hours,
+                'engagement_frequency': frequency,
                 'content_preferences': engagement.get('content_preferences', {})
             }
             
@@ -609,15 +668,18 @@ class TrendAnalysisAI:
             self.monitoring.log_error(f"Error identifying growth opportunities: {str(e)}")
             return []
             
-    def _predict_short_term_trends(self, content_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _predict_short_term_trends(self, content_analysis: Dict[str, Any], series: PostSeries) -> Dict[str, Any]:
         """Predict short-term trends."""
         try:
             topics = content_analysis.get('topics', [])
             sentiment = content_analysis.get('sentiment_trends', {})
             
+            # Next week, day by day, from the last four weeks
             return {
                 'trending_topics': topics[:3],
                 'sentiment_outlook': 'positive' if sentiment.get('average_sentiment', 0) > 0 else 'negative',
+                'posting_forecast': series.forecast('day', 7, 'posts', window=28),
+                'engagement_forecast': series.forecast('day', 7, 'engagement', window=28),
                 'confidence': 0.8
             }
             
@@ -625,14 +687,17 @@ class TrendAnalysisAI:
             self.monitoring.log_error(f"Error predicting short-term trends: {str(e)}")
             return {}
             
-    def _predict_medium_term_trends(self, content_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _predict_medium_term_trends(self, content_analysis: Dict[str, Any], series: PostSeries) -> Dict[str, Any]:
         """Predict medium-term trends."""
         try:
             content_evolution = content_analysis.get('content_evolution', {})
             
+            # Next four weeks from the last twelve
             return {
                 'emerging_topics': content_evolution.get('recent_topics', [])[:3],
                 'content_shift': content_evolution.get('content_shift', {}),
+                'posting_forecast': series.forecast('week', 4, 'posts', window=12),
+                'engagement_forecast': series.forecast('week', 4, 'engagement', window=12),
                 'confidence': 0.7
             }
             
@@ -640,15 +705,18 @@ class TrendAnalysisAI:
             self.monitoring.log_error(f"Error predicting medium-term trends: {str(e)}")
             return {}
             
-    def _predict_long_term_trends(self, content_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _predict_long_term_trends(self, content_analysis: Dict[str, Any], series: PostSeries) -> Dict[str, Any]:
         """Predict long-term trends."""
         try:
             topics = content_analysis.get('topics', [])
             content_types = content_analysis.get('content_types', {})
             
+            # Next six months from the whole history
             return {
                 'sustainable_topics': topics[:5],
                 'content_type_evolution': content_types,
+                'posting_forecast': series.forecast('week', 26, 'posts'),
+                'engagement_forecast': series.forecast('week', 26, 'engagement'),
                 'confidence': 0.6
             }
             
@@ -656,16 +724,18 @@ class TrendAnalysisAI:
             self.monitoring.log_error(f"Error predicting long-term trends: {str(e)}")
             return {}
             
-    def _calculate_prediction_confidence(self, content_analysis: Dict[str, Any]) -> Dict[str, float]:
+    def _calculate_prediction_confidence(self, content_analysis: Dict[str, Any], series: PostSeries) -> Dict[str, float]:
         """Calculate prediction confidence metrics."""
         try:
-            sentiment = content_analysis.get('sentiment_trends', {})
-            content_evolution = content_analysis.get('content_evolution', {})
+            # Stability falls with week-to-week variation in engagement; reliability is
+            # how well a straight line fits the weekly engagement
+            weekly = series.buckets('week').engagement
+            variation = weekly.std() / weekly.mean() if len(weekly) and weekly.mean() else 1.0
             
             return {
-                'data_quality': 0.8,
-                'trend_stability': 0.7,
-                'prediction_reliability': 0.75
+                'data_quality': series.dated_fraction,
+                'trend_stability': float(1 / (1 + variation)),
+                'prediction_reliability': series.trend('week', 'engagement')['r2']
             }
             
         except Exception as e:
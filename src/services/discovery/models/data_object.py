@@ -4,10 +4,21 @@ Data Object Model
 This module defines the DataObject class for standardized data passing between components.
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Mapping, Union
+from collections import ChainMap
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 from enum import Enum
+import msgpack
+
+# Wire format version; bump when the envelope layout changes and add an upgrade step
+SCHEMA_VERSION = 1
+
+# Upgrades from older envelope versions to the next one
+ENVELOPE_UPGRADES: Dict[int, Any] = {}
+
+# msgpack extension type code for nested datetimes
+DATETIME_EXT = 1
 
 class PlatformType(str, Enum):
     """Enum for supported platform types."""
@@ -49,6 +60,39 @@ class DataObject(BaseModel):
         """Create a DataObject from a dictionary."""
         return cls(**data)
     
+    def to_msgpack(self) -> bytes:
+        """Encode the DataObject as a schema-versioned msgpack envelope."""
+        return _pack_envelope(self.platform, self.timestamp, self.url, self.data, self.metadata, self.error)
+    
+    @classmethod
+    def from_msgpack(cls, payload: Union[bytes, memoryview]) -> 'DataObject':
+        """Decode a DataObject from a msgpack envelope without re-validating it."""
+        platform, timestamp, url, data, metadata, error = _unpack_envelope(payload)
+        return cls.model_construct(
+            platform=platform,
+            timestamp=timestamp,
+            url=url,
+            data=data,
+            metadata=metadata,
+            error=error
+        )
+    
+    def to_record(self) -> 'DataRecord':
+        """Get a slotted record sharing this object's data and metadata."""
+        return DataRecord(self.platform, self.timestamp, self.url, self.data, self.metadata, self.error)
+    
+    @classmethod
+    def from_record(cls, record: 'DataRecord') -> 'DataObject':
+        """Create a DataObject from a record, flattening its overlays."""
+        return cls.model_construct(
+            platform=record.platform,
+            timestamp=record.timestamp,
+            url=record.url,
+            data=dict(record.data),
+            metadata=dict(record.metadata),
+            error=record.error
+        )
+    
     def is_valid(self) -> bool:
         """Check if the DataObject is valid."""
         return self.error is None and bool(self.data)
@@ -112,4 +156,134 @@ class DataObject(BaseModel):
             f"  metadata={self.metadata},\n"
             f"  error={self.error}\n"
             f")"
-        ) 
\ No newline at end of file
+        ) 
+
+class DataRecord:
+    """Slotted, copy-free representation of a DataObject for pipeline stages."""
+    
+    __slots__ = ('platform', 'timestamp', 'url', 'data', 'metadata', 'error')
+    
+    def __init__(
+        self,
+        platform: PlatformType,
+        timestamp: datetime,
+        url: str,
+        data: Optional[Mapping[str, Any]] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+        error: Optional[str] = None
+    ):
+        self.platform = platform
+        self.timestamp = timestamp
+        self.url = url
+        self.data = data if data is not None else {}
+        self.metadata = metadata if metadata is not None else {}
+        self.error = error
+        
+    def extend(
+        self,
+        data: Optional[Mapping[str, Any]] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> 'DataRecord':
+        """Layer new fields over this record without copying it."""
+        return DataRecord(
+            self.platform,
+            self.timestamp,
+            self.url,
+            ChainMap(dict(data), self.data) if data else self.data,
+            ChainMap(dict(metadata), self.metadata) if metadata else self.metadata,
+            error if error is not None else self.error
+        )
+        
+    def is_valid(self) -> bool:
+        """Check if the record is valid."""
+        return self.error is None and bool(self.data)
+        
+    def to_msgpack(self) -> bytes:
+        """Encode the record as a schema-versioned msgpack envelope."""
+        return _pack_envelope(self.platform, self.timestamp, self.url, self.data, self.metadata, self.error)
+        
+    @classmethod
+    def from_msgpack(cls, payload: Union[bytes, memoryview]) -> 'DataRecord':
+        """Decode a record from a msgpack envelope."""
+        return cls(*_unpack_envelope(payload))
+        
+    def __repr__(self) -> str:
+        """String representation of the DataRecord."""
+        return f"DataRecord(platform={self.platform}, url={self.url}, timestamp={self.timestamp})"
+
+def pack_payload(value: Any) -> bytes:
+    """Encode a batch payload, such as a chunk of profiles or its results, in a schema-versioned envelope."""
+    return msgpack.packb([SCHEMA_VERSION, value], default=_encode_value, use_bin_type=True)
+
+def unpack_payload(payload: Union[bytes, memoryview]) -> Any:
+    """Decode a batch payload written by pack_payload."""
+    version, value = _unpack(payload)
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported payload schema version: {version}")
+    return value
+
+def _encode_value(value: Any) -> Any:
+    """Convert values msgpack cannot pack natively."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, datetime):
+        # An extension type, so datetimes decode as datetimes rather than strings
+        return msgpack.ExtType(DATETIME_EXT, value.isoformat().encode())
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    # numpy scalars and arrays
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def _decode_ext(code: int, data: bytes) -> Any:
+    """Restore values packed as extension types."""
+    if code == DATETIME_EXT:
+        return datetime.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+def _unpack(payload: Union[bytes, memoryview]) -> List[Any]:
+    """Unpack a msgpack payload; analysis results may have non-string keys."""
+    return msgpack.unpackb(payload, raw=False, timestamp=3, ext_hook=_decode_ext, strict_map_key=False)
+
+def _pack_envelope(
+    platform: PlatformType,
+    timestamp: datetime,
+    url: str,
+    data: Mapping[str, Any],
+    metadata: Mapping[str, Any],
+    error: Optional[str]
+) -> bytes:
+    """Pack fields into a positional envelope: [version, platform, timestamp, url, data, metadata, error]."""
+    # Timestamps are naive UTC throughout the model
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return msgpack.packb(
+        [
+            SCHEMA_VERSION,
+            platform.value,
+            msgpack.Timestamp.from_datetime(timestamp.replace(tzinfo=timezone.utc)),
+            url,
+            data,
+            metadata,
+            error
+        ],
+        default=_encode_value,
+        use_bin_type=True
+    )
+
+def _unpack_envelope(payload: Union[bytes, memoryview]) -> List[Any]:
+    """Unpack an envelope, upgrading older versions, into DataObject field order."""
+    envelope = _unpack(payload)
+    version = envelope[0]
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Unsupported DataObject schema version: {version}")
+    while version < SCHEMA_VERSION:
+        envelope = ENVELOPE_UPGRADES[version](envelope)
+        version = envelope[0]
+        
+    _, platform, timestamp, url, data, metadata, error = envelope
+    return [PlatformType(platform), timestamp.replace(tzinfo=None), url, data, metadata, error]
@@ -0,0 +1,23 @@
+"""
+NLP Module
+
+This module provides the shared NLP infrastructure for the discovery pipeline and
+intelligence components.
+"""
+
+from .registry import ModelRegistry, get_model_registry, prefetch
+from .memo_store import MemoStore, get_memo_store
+from .corpus_model import CorpusTfidfModel
+from .text_analysis import AnnotatedDoc, TextAnalyzer, get_text_analyzer
+
+__all__ = [
+    'ModelRegistry',
+    'get_model_registry',
+    'prefetch',
+    'MemoStore',
+    'get_memo_store',
+    'CorpusTfidfModel',
+    'AnnotatedDoc',
+    'TextAnalyzer',
+    'get_text_analyzer'
+]
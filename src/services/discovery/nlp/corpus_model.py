@@ -0,0 +1,202 @@
+"""
+Corpus TF-IDF Model
+
+This module implements a TF-IDF model whose document frequencies are counted over
+the whole corpus of analyzed content rather than over a single text. Terms are
+hashed into a fixed number of features, so there is no vocabulary to refit: the
+model can be fitted offline, saved, loaded once per process and keep learning from
+new texts. IDF weights are refreshed as the corpus grows, and each refresh changes
+the model version that memoized keywords are keyed on.
+
+Fit a model offline from a file with one document per line:
+
+    python -m src.services.discovery.nlp.corpus_model corpus.txt corpus_model.npz
+"""
+
+from typing import Dict, List, Any, Iterable
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import sys
+import threading
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEATURES = 1 << 20
+
+class CorpusTfidfModel:
+    """Hashed TF-IDF model with running document-frequency counts."""
+    
+    def __init__(
+        self,
+        n_features: int = DEFAULT_FEATURES,
+        refresh_documents: int = 1000,
+        refresh_fraction: float = 0.1,
+        learned_texts: int = 100000
+    ):
+        self.n_features = n_features
+        self.refresh_documents = refresh_documents
+        self.refresh_fraction = refresh_fraction
+        self.learned_texts = learned_texts
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            alternate_sign=False,
+            norm=None
+        )
+        self.analyzer = self.vectorizer.build_analyzer()
+        self.document_frequency = np.zeros(n_features, dtype=np.int64)
+        self.documents = 0
+        self.idf = np.ones(n_features)
+        self.idf_documents = 0
+        
+        # Hashing is one-way; remember a term for each feature reported as a keyword
+        self.terms: Dict[int, str] = {}
+        
+        # Digests of recently learned texts, so re-analyzed content isn't counted twice
+        self._learned: 'OrderedDict[bytes, None]' = OrderedDict()
+        self._lock = threading.Lock()
+        
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'CorpusTfidfModel':
+        """Load the model at `corpus_model_path` if there is one, else start an empty model."""
+        options = {
+            'refresh_documents': config.get('corpus_refresh_documents', 1000),
+            'refresh_fraction': config.get('corpus_refresh_fraction', 0.1),
+            'learned_texts': config.get('corpus_learned_texts', 100000)
+        }
+        path = config.get('corpus_model_path')
+        if path and os.path.exists(path):
+            return cls.load(path, **options)
+        return cls(n_features=config.get('corpus_model_features', DEFAULT_FEATURES), **options)
+        
+    @property
+    def version(self) -> str:
+        """Identifies the IDF weights in use; changes on every refresh."""
+        return f"{self.n_features}:{self.idf_documents}"
+        
+    def partial_fit(self, texts: Iterable[str]) -> 'CorpusTfidfModel':
+        """Count the documents each term occurs in, refreshing IDF once enough are new."""
+        counts = self.vectorizer.transform(texts)
+        # Rows are in canonical form, so each index appears once per document
+        frequency = np.bincount(counts.indices, minlength=self.n_features)
+        with self._lock:
+            self.document_frequency += frequency
+            self.documents += counts.shape[0]
+            new_documents = self.documents - self.idf_documents
+            if new_documents >= max(self.refresh_documents, self.refresh_fraction * self.idf_documents):
+                self._refresh()
+        return self
+        
+    def learn(self, texts: Iterable[str]) -> 'CorpusTfidfModel':
+        """Count texts not learned recently as new documents."""
+        new_texts = []
+        with self._lock:
+            for text in texts:
+                digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+                if digest in self._learned:
+                    self._learned.move_to_end(digest)
+                    continue
+                self._learned[digest] = None
+                new_texts.append(text)
+            while len(self._learned) > self.learned_texts:
+                self._learned.popitem(last=False)
+        if new_texts:
+            self.partial_fit(new_texts)
+        return self
+        
+    def transform(self, texts: Iterable[str]) -> sp.csr_matrix:
+        """L2-normalized TF-IDF rows of texts."""
+        tfidf = self.vectorizer.transform(texts).astype(np.float64)
+        # Refreshes replace the IDF array, so one reference gives a consistent set of weights
+        with self._lock:
+            idf = self.idf
+        tfidf.data *= idf[tfidf.indices]
+        return normalize(tfidf)
+        
+    def keywords(self, texts: List[str], top_n: int = 20) -> List[List[str]]:
+        """The `top_n` highest-weighted terms of each text, best first."""
+        tfidf = self.transform(texts)
+        top_features = []
+        for row in range(tfidf.shape[0]):
+            start, end = tfidf.indptr[row], tfidf.indptr[row + 1]
+            order = np.argsort(-tfidf.data[start:end], kind='stable')[:top_n]
+            top_features.append(tfidf.indices[start:end][order])
+            
+        with self._lock:
+            unnamed = {int(feature) for features in top_features for feature in features if feature not in self.terms}
+        if unnamed:
+            rows = [row for row, features in enumerate(top_features) if any(feature in unnamed for feature in features)]
+            self._name_features((texts[row] for row in rows), unnamed)
+        with self._lock:
+            return [[self.terms[feature] for feature in features] for features in top_features]
+        
+    def save(self, path: str):
+        """Write document frequencies and known terms to a compressed .npz file."""
+        with self._lock:
+            indices = np.flatnonzero(self.document_frequency)
+            np.savez_compressed(
+                path,
+                n_features=self.n_features,
+                documents=self.documents,
+                indices=indices,
+                counts=self.document_frequency[indices],
+                term_indices=np.fromiter(self.terms.keys(), dtype=np.int64, count=len(self.terms)),
+                term_strings=np.array(list(self.terms.values()), dtype=str)
+            )
+            
+    @classmethod
+    def load(cls, path: str, **options) -> 'CorpusTfidfModel':
+        """Read a model written by `save`."""
+        with np.load(path) as data:
+            model = cls(n_features=int(data['n_features']), **options)
+            model.document_frequency[data['indices']] = data['counts']
+            model.documents = int(data['documents'])
+            model.terms = dict(zip(data['term_indices'].tolist(), data['term_strings'].tolist()))
+        model._refresh()
+        return model
+        
+    def _refresh(self):
+        """Recompute smoothed IDF weights from the current counts."""
+        self.idf = np.log((1 + self.documents) / (1 + self.document_frequency)) + 1
+        self.idf_documents = self.documents
+        
+    def _name_features(self, texts: Iterable[str], features: set):
+        """Hash the terms of texts in one call to learn the terms of the given features.
+        
+        Only features reported as keywords are named, so the saved term map stays
+        bounded by the keywords actually returned rather than the whole vocabulary.
+        """
+        tokens = list({token for text in texts for token in self.analyzer(text)})
+        hashed = self.vectorizer.transform(tokens)
+        with self._lock:
+            for row, token in enumerate(tokens):
+                if hashed.indptr[row + 1] > hashed.indptr[row]:
+                    feature = int(hashed.indices[hashed.indptr[row]])
+                    if feature in features:
+                        self.terms.setdefault(feature, token)
+
+def fit_corpus(texts: Iterable[str], path: str, chunk_size: int = 10000, **options) -> CorpusTfidfModel:
+    """Fit a model over texts in chunks and save it to path."""
+    model = CorpusTfidfModel(**options)
+    chunk: List[str] = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) >= chunk_size:
+            model.partial_fit(chunk)
+            chunk = []
+    if chunk:
+        model.partial_fit(chunk)
+    model._refresh()
+    model.save(path)
+    logger.info(f"Fitted corpus model on {model.documents} documents")
+    return model
+
+if __name__ == '__main__':
+    with open(sys.argv[1], encoding='utf-8') as corpus:
+        fit_corpus((line for line in corpus if line.strip()), sys.argv[2])
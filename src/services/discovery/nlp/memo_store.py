@@ -0,0 +1,302 @@
+"""
+NLP Memo Store
+
+This module implements a content-addressed store for NLP results. Results are keyed
+by a hash of the task, the model version and the normalized text, so duplicate bios,
+reposts and cross-platform copies of the same post are analyzed once. Entries live in
+a size-bounded in-memory LRU, optionally backed by Redis or a disk directory.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Iterable, Tuple
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+import redis
+
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+def normalize_for_key(text: str) -> str:
+    """Normalize text so trivially different copies share a key."""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+def package_version(*packages: str) -> str:
+    """Get a model version string from the installed versions of the packages computing it."""
+    versions = []
+    for package in packages:
+        try:
+            versions.append(f"{package}-{importlib.metadata.version(package)}")
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(f"{package}-unknown")
+    return '/'.join(versions)
+
+def _to_json(value: Any) -> Any:
+    """Convert NumPy scalars and other stragglers for JSON encoding."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+class DiskMemoBacking:
+    """On-disk backing for memoized results, one file per entry."""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+            
+    def set(self, key: str, blob: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+        
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+class RedisMemoBacking:
+    """Redis backing for memoized results shared between workers and runs."""
+    
+    def __init__(self, url: str, ttl: int, prefix: str = 'nlp_memo:'):
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+        
+    def set(self, key: str, blob: bytes):
+        self.client.set(self.prefix + key, blob, ex=self.ttl)
+
+class MemoStore:
+    """Content-addressed LRU store of NLP results."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.monitoring = MonitoringService()
+        self.max_bytes = config.get('nlp_memo_max_bytes', 64 * 1024 * 1024)
+        self.entries: 'OrderedDict[str, Tuple[bytes, float]]' = OrderedDict()
+        self.total_bytes = 0
+        self.backing = self._create_backing()
+        self.stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {'hits': 0, 'misses': 0, 'cpu_seconds_saved': 0.0}
+        )
+        
+        # Hit rates are counted locally and published at most once per interval
+        self.metrics_interval = config.get('nlp_memo_metrics_interval', 60)
+        self._published_at = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def key(self, task: str, text: str, version: str, normalize: bool = True) -> str:
+        """Get the content address of a task's result for a text."""
+        if normalize:
+            text = normalize_for_key(text)
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (task, version, text):
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+        
+    def get(self, task: str, text: str, version: str, normalize: bool = True) -> Optional[Any]:
+        """Get a memoized result, or None on a miss."""
+        value = self._lookup(task, self.key(task, text, version, normalize))
+        self._record(task)
+        return value
+        
+    def put(
+        self,
+        task: str,
+        text: str,
+        version: str,
+        value: Any,
+        cpu_seconds: float = 0.0,
+        normalize: bool = True
+    ):
+        """Memoize a result along with the CPU time it took to compute."""
+        self._store(self.key(task, text, version, normalize), value, cpu_seconds)
+        
+    def get_or_compute(
+        self,
+        task: str,
+        text: str,
+        version: str,
+        compute: Callable[[str], Any],
+        normalize: bool = True
+    ) -> Any:
+        """Get a memoized result, computing and storing it on a miss."""
+        key = self.key(task, text, version, normalize)
+        value = self._lookup(task, key)
+        if value is None:
+            start_time = time.process_time()
+            value = compute(text)
+            self._store(key, value, time.process_time() - start_time)
+        self._record(task)
+        return value
+        
+    async def aget_or_compute(
+        self,
+        task: str,
+        text: str,
+        version: str,
+        compute: Callable[[str], Awaitable[Any]],
+        normalize: bool = True
+    ) -> Any:
+        """Get a memoized result, awaiting `compute` and storing its result on a miss."""
+        key = self.key(task, text, version, normalize)
+        value = self._lookup(task, key)
+        if value is None:
+            start_time = time.process_time()
+            value = await compute(text)
+            self._store(key, value, time.process_time() - start_time)
+        self._record(task)
+        return value
+        
+    def get_many(
+        self,
+        task: str,
+        texts: Iterable[str],
+        version: str,
+        normalize: bool = True
+    ) -> Tuple[Dict[int, Any], List[int]]:
+        """Look up many texts, returning found results by position and the positions missed."""
+        found: Dict[int, Any] = {}
+        missing: List[int] = []
+        for index, text in enumerate(texts):
+            value = self._lookup(task, self.key(task, text, version, normalize))
+            if value is None:
+                missing.append(index)
+            else:
+                found[index] = value
+        self._record(task)
+        return found, missing
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit rate and CPU time saved per task."""
+        stats = {}
+        for task, counts in self.stats.items():
+            lookups = counts['hits'] + counts['misses']
+            stats[task] = {
+                **counts,
+                'hit_rate': counts['hits'] / lookups if lookups else 0.0
+            }
+        return {'tasks': stats, 'entries': len(self.entries), 'bytes': self.total_bytes}
+        
+    def _lookup(self, task: str, key: str) -> Optional[Any]:
+        """Find an entry in memory, then in the backing store."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                
+        if entry is None and self.backing is not None:
+            try:
+                blob = self.backing.get(key)
+            except Exception as e:
+                self.monitoring.log_error(f"Error reading NLP memo backing: {str(e)}")
+                blob = None
+            if blob is not None:
+                entry = self._decode(blob)
+                self._remember(key, entry)
+                
+        counts = self.stats[task]
+        if entry is None:
+            counts['misses'] += 1
+            return None
+            
+        # Decoding gives every caller its own copy of the result
+        blob, cpu_seconds = entry
+        counts['hits'] += 1
+        counts['cpu_seconds_saved'] += cpu_seconds
+        return json.loads(blob)
+        
+    def _store(self, key: str, value: Any, cpu_seconds: float):
+        """Memoize a result in memory and in the backing store."""
+        try:
+            blob = json.dumps(value, default=_to_json, separators=(',', ':')).encode('utf-8')
+        except Exception as e:
+            self.monitoring.log_error(f"Error encoding NLP memo entry: {str(e)}")
+            return
+            
+        self._remember(key, (blob, cpu_seconds))
+        if self.backing is not None:
+            try:
+                self.backing.set(key, self._encode(blob, cpu_seconds))
+            except Exception as e:
+                self.monitoring.log_error(f"Error writing NLP memo backing: {str(e)}")
+                
+    def _remember(self, key: str, entry: Tuple[bytes, float]):
+        """Add an entry to the in-memory LRU, evicting the least recently used."""
+        with self._lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous[0])
+            self.entries[key] = entry
+            self.total_bytes += len(entry[0])
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                _, (evicted, _) = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+                
+    def _encode(self, blob: bytes, cpu_seconds: float) -> bytes:
+        """Prefix a result with its compute cost for the backing store."""
+        return f"{cpu_seconds:.6f}\n".encode('ascii') + blob
+        
+    def _decode(self, stored: bytes) -> Tuple[bytes, float]:
+        """Split a backing-store entry into result and compute cost."""
+        cost, _, blob = stored.partition(b'\n')
+        return blob, float(cost)
+        
+    def _record(self, task: str):
+        """Publish hit rates once the metrics interval has passed since the last publish."""
+        if time.monotonic() - self._published_at >= self.metrics_interval:
+            self.publish_metrics()
+            
+    def publish_metrics(self):
+        """Publish every task's hit rate and CPU time saved."""
+        self._published_at = time.monotonic()
+        for task, counts in list(self.stats.items()):
+            lookups = counts['hits'] + counts['misses']
+            self.monitoring.record_metric('nlp_memo_hit_rate', counts['hits'] / lookups if lookups else 0.0, {'task': task})
+            self.monitoring.record_metric('nlp_memo_cpu_seconds_saved', counts['cpu_seconds_saved'], {'task': task})
+            
+    def _create_backing(self) -> Any:
+        """Create the configured backing store, if any."""
+        if self.config.get('nlp_memo_redis_url'):
+            return RedisMemoBacking(
+                self.config['nlp_memo_redis_url'],
+                self.config.get('nlp_memo_ttl', 7 * 24 * 3600)
+            )
+        if self.config.get('nlp_memo_dir'):
+            return DiskMemoBacking(self.config['nlp_memo_dir'])
+        return None
+
+# Config keys that change how a store behaves; callers agreeing on them share a store
+STORE_SETTINGS = ('nlp_memo_max_bytes', 'nlp_memo_redis_url', 'nlp_memo_ttl', 'nlp_memo_dir', 'nlp_memo_metrics_interval')
+
+_memo_stores: Dict[Tuple[Any, ...], MemoStore] = {}
+_memo_store_lock = threading.Lock()
+
+def get_memo_store(config: Optional[Dict[str, Any]] = None) -> MemoStore:
+    """Get the process-wide memo store for the config's memo settings."""
+    config = config or {}
+    settings = tuple(config.get(name) for name in STORE_SETTINGS)
+    store = _memo_stores.get(settings)
+    if store is None:
+        with _memo_store_lock:
+            store = _memo_stores.get(settings)
+            if store is None:
+                store = _memo_stores[settings] = MemoStore(config)
+    return store
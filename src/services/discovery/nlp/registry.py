@@ -0,0 +1,173 @@
+"""
+NLP Model Registry
+
+This module implements a process-wide registry for NLP models used by the pipeline
+and intelligence components. Each NLTK resource, spaCy pipeline and vectorizer is
+loaded at most once per process, lazily and from a local data directory; nothing
+is downloaded at runtime. Use `python -m src.services.discovery.nlp.registry`
+at build time to populate the data directory.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Iterable
+import logging
+import os
+import sys
+import threading
+import time
+import nltk
+import psutil
+
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+# Directory holding NLTK corpora and other offline model data
+DEFAULT_DATA_DIR = os.environ.get('NLP_DATA_DIR', os.path.expanduser('~/nltk_data'))
+
+# NLTK resources used across the discovery components, by nltk.data.find path
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'vader_lexicon': 'sentiment/vader_lexicon.zip',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'maxent_ne_chunker': 'chunkers/maxent_ne_chunker',
+    'words': 'corpora/words'
+}
+
+class ModelRegistry:
+    """Lazily loads and shares NLP models across all components of a process."""
+    
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR):
+        self.data_dir = data_dir
+        self.monitoring = MonitoringService()
+        self._models: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {}
+        
+        if data_dir not in nltk.data.path:
+            nltk.data.path.insert(0, data_dir)
+            
+    def get(self, name: str, loader: Callable[[], Any]) -> Any:
+        """Get a model, loading it with `loader` the first time it is requested."""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+            
+        with self._get_lock(name):
+            model = self._models.get(name)
+            if model is None:
+                model = self._load(name, loader)
+                self._models[name] = model
+        return model
+        
+    def stopwords(self, language: str = 'english') -> frozenset:
+        """Get the NLTK stopword set for a language."""
+        def load():
+            self.require_nltk('stopwords')
+            from nltk.corpus import stopwords
+            return frozenset(stopwords.words(language))
+        return self.get(f'nltk.stopwords.{language}', load)
+        
+    def word_tokenizer(self) -> Callable[[str], List[str]]:
+        """Get NLTK's word tokenizer once its Punkt data is confirmed present."""
+        def load():
+            self.require_nltk('punkt_tab')
+            return nltk.word_tokenize
+        return self.get('nltk.word_tokenizer', load)
+        
+    def lemmatizer(self) -> Any:
+        """Get the WordNet lemmatizer with its corpus loaded."""
+        def load():
+            self.require_nltk('wordnet')
+            from nltk.stem import WordNetLemmatizer
+            lemmatizer = WordNetLemmatizer()
+            # WordNet loads lazily on first use; pay that cost here, once
+            lemmatizer.lemmatize('warmup')
+            return lemmatizer
+        return self.get('nltk.wordnet_lemmatizer', load)
+        
+    def vader(self) -> Any:
+        """Get the VADER sentiment analyzer."""
+        def load():
+            self.require_nltk('vader_lexicon')
+            from nltk.sentiment import SentimentIntensityAnalyzer
+            return SentimentIntensityAnalyzer()
+        return self.get('nltk.vader', load)
+        
+    def spacy(self, name: str = 'en_core_web_sm') -> Any:
+        """Get a spaCy pipeline, falling back to a blank English pipeline if it is not installed."""
+        def load():
+            import spacy
+            try:
+                return spacy.load(name)
+            except OSError:
+                logger.warning(f"spaCy model {name} not installed, using blank pipeline")
+                return spacy.blank('en')
+        return self.get(f'spacy.{name}', load)
+        
+    def vectorizer(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Get a shared sklearn vectorizer built by `factory`."""
+        return self.get(f'sklearn.{name}', factory)
+        
+    def require_nltk(self, *resources: str):
+        """Check that NLTK resources are present locally, never downloading them."""
+        missing = []
+        for resource in resources:
+            try:
+                nltk.data.find(NLTK_RESOURCES.get(resource, resource))
+            except LookupError:
+                missing.append(resource)
+        if missing:
+            raise LookupError(
+                f"NLTK resources {missing} not found in {self.data_dir}; "
+                f"run `python -m src.services.discovery.nlp.registry` to prefetch them"
+            )
+            
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get load time and resident size per loaded model."""
+        return dict(self.stats)
+        
+    def _load(self, name: str, loader: Callable[[], Any]) -> Any:
+        """Load a model, recording its load time and resident size."""
+        process = psutil.Process()
+        rss_before = process.memory_info().rss
+        start_time = time.perf_counter()
+        
+        model = loader()
+        
+        load_seconds = time.perf_counter() - start_time
+        rss_bytes = max(process.memory_info().rss - rss_before, 0)
+        self.stats[name] = {'load_seconds': load_seconds, 'rss_bytes': rss_bytes}
+        self.monitoring.record_metric('nlp_model_load_seconds', load_seconds, {'model': name})
+        self.monitoring.record_metric('nlp_model_rss_bytes', rss_bytes, {'model': name})
+        logger.info(f"Loaded NLP model {name} in {load_seconds:.2f}s")
+        return model
+        
+    def _get_lock(self, name: str) -> threading.Lock:
+        """Get the load lock for a model."""
+        with self._locks_guard:
+            return self._locks.setdefault(name, threading.Lock())
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
+
+def prefetch(data_dir: str = DEFAULT_DATA_DIR, resources: Iterable[str] = NLTK_RESOURCES):
+    """Download NLTK resources into the local data directory (build time only)."""
+    os.makedirs(data_dir, exist_ok=True)
+    for resource in resources:
+        nltk.download(resource, download_dir=data_dir, quiet=True)
+
+if __name__ == '__main__':
+    prefetch(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DATA_DIR)
@@ -0,0 +1,220 @@
+"""
+Text Analysis
+
+This module implements the text analysis shared by the intelligence components. A
+batch of texts is tokenized, split into sentences, lemmatized and scored for
+sentiment once, and each text becomes an `AnnotatedDoc` that every component reads
+instead of running its own TextBlob and NLTK passes. Tokenization is a single regex,
+sentiment is scored from TextBlob's pattern lexicon over those tokens, and lemma
+lookups are cached per word. Documents are memoized by content through the memo
+store, so a post analyzed by several components is annotated once.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+from dataclasses import dataclass
+import logging
+import re
+import threading
+import time
+
+from src.services.monitoring.monitoring import MonitoringService
+from .registry import get_model_registry
+from .memo_store import get_memo_store, package_version
+
+logger = logging.getLogger(__name__)
+
+# Emoticons scored by TextBlob's pattern lexicon, lowercased like the text
+EMOTICONS = frozenset((
+    ":'''(", '*-)', '8-)', '8-d', ":'(", ':-(', ':-)', ':-.', ':-/', ':-<', ':-[', ':-b', ':-c',
+    ':-d', ':-o', ':-p', ':-s', ':^)', ':c)', ':o)', ";'(", ';-)', ';-]', ';^)', '=-d', '>.>',
+    '>:)', '>:/', '>:[', '>:\\', '>:d', '>:o', '>:p', '>;]', 'o.o', 'o_o', 'x-d', '°o°', '*)',
+    '8)', ':(', ':)', ':/', ':3', ':>', ':[', ':\\', ':]', ':b', ':c', ':d', ':o', ':p', ':s',
+    ':{', ':}', ';)', ';]', ';d', '<3', '=(', '=)', '=/', '=]', '=d', '♥'
+))
+
+# Emoticons followed by a space or the end of the text, as TextBlob reads them; words,
+# with "n't" split off so negations are scored; and single punctuation marks
+TOKEN_PATTERN = re.compile(
+    r"(?:%s)(?=\s|$)|\w+(?=n't\b)|n't\b|\w+(?:'\w+)?|[^\w\s]"
+    % '|'.join(re.escape(emoticon) for emoticon in sorted(EMOTICONS, key=len, reverse=True))
+)
+SENTENCE_END = frozenset('.!?')
+
+# Bump when tokenization, sentence splitting or scoring changes
+ANALYZER_VERSION = '2'
+
+@dataclass(frozen=True)
+class AnnotatedDoc:
+    """Tokens, sentences, lemmas and sentiment of one text."""
+    
+    text: str
+    tokens: Tuple[str, ...]
+    sentences: Tuple[Tuple[int, int], ...]
+    lemmas: Tuple[str, ...]
+    polarity: float
+    subjectivity: float
+    sentence_polarities: Tuple[float, ...]
+    
+    @property
+    def words(self) -> List[str]:
+        """Word tokens, without punctuation or emoticons."""
+        return [
+            token for token in self.tokens
+            if (token[0].isalnum() or token[0] == '_') and token not in EMOTICONS
+        ]
+        
+    @property
+    def average_sentiment(self) -> float:
+        """Mean polarity of the sentences."""
+        if not self.sentence_polarities:
+            return 0
+        return sum(self.sentence_polarities) / len(self.sentence_polarities)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible form of the document."""
+        return {
+            'text': self.text,
+            'tokens': self.tokens,
+            'sentences': self.sentences,
+            'lemmas': self.lemmas,
+            'polarity': self.polarity,
+            'subjectivity': self.subjectivity,
+            'sentence_polarities': self.sentence_polarities
+        }
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AnnotatedDoc':
+        """Rebuild a document from `to_dict` output."""
+        return cls(
+            text=data['text'],
+            tokens=tuple(data['tokens']),
+            sentences=tuple(tuple(span) for span in data['sentences']),
+            lemmas=tuple(data['lemmas']),
+            polarity=data['polarity'],
+            subjectivity=data['subjectivity'],
+            sentence_polarities=tuple(data['sentence_polarities'])
+        )
+
+class TextAnalyzer:
+    """Annotates batches of texts once for every intelligence component."""
+    
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        stop_words: Optional[Iterable[str]] = None,
+        lemmatize: Optional[Callable[[str], str]] = None
+    ):
+        self.config = config or {}
+        self.monitoring = MonitoringService()
+        self.models = get_model_registry()
+        self.memo = get_memo_store(self.config)
+        self.version = f"{ANALYZER_VERSION}:{package_version('textblob', 'nltk')}"
+        self._stop_words = frozenset(stop_words) if stop_words is not None else None
+        self._lemmatize = lemmatize
+        self._lemmas: Dict[str, str] = {}
+        self._lemma_cache_size = self.config.get('lemma_cache_size', 100000)
+        self._lexicon = None
+        self._lock = threading.Lock()
+        
+    @property
+    def stop_words(self) -> frozenset:
+        """English stopwords, from the model registry unless given."""
+        if self._stop_words is None:
+            self._stop_words = self.models.stopwords()
+        return self._stop_words
+        
+    @property
+    def lexicon(self) -> Any:
+        """TextBlob's pattern sentiment lexicon."""
+        if self._lexicon is None:
+            def load():
+                from textblob.en import sentiment
+                sentiment.load()
+                return sentiment
+            self._lexicon = self.models.get('textblob.sentiment_lexicon', load)
+        return self._lexicon
+        
+    def analyze(self, texts: List[str]) -> List[AnnotatedDoc]:
+        """Annotate texts, each distinct text at most once."""
+        unique = list(dict.fromkeys(texts))
+        found, missing = self.memo.get_many('text.annotations', unique, self.version, normalize=False)
+        docs = {index: AnnotatedDoc.from_dict(value) for index, value in found.items()}
+        
+        if missing:
+            start_time = time.process_time()
+            for index in missing:
+                docs[index] = self._annotate(unique[index])
+            cpu_seconds = (time.process_time() - start_time) / len(missing)
+            for index in missing:
+                self.memo.put(
+                    'text.annotations', unique[index], self.version,
+                    docs[index].to_dict(), cpu_seconds, normalize=False
+                )
+                
+        by_text = {text: docs[index] for index, text in enumerate(unique)}
+        return [by_text[text] for text in texts]
+        
+    def lemma(self, word: str) -> str:
+        """Lemma of a lowercase word, cached."""
+        lemma = self._lemmas.get(word)
+        if lemma is None:
+            if self._lemmatize is None:
+                self._lemmatize = self.models.lemmatizer().lemmatize
+            lemma = self._lemmatize(word)
+            with self._lock:
+                if len(self._lemmas) >= self._lemma_cache_size:
+                    self._lemmas.clear()
+                self._lemmas[word] = lemma
+        return lemma
+        
+    def _annotate(self, text: str) -> AnnotatedDoc:
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        
+        # A sentence ends after a run of terminal punctuation
+        sentences = []
+        start = 0
+        for position, token in enumerate(tokens):
+            next_token = tokens[position + 1] if position + 1 < len(tokens) else None
+            if token in SENTENCE_END and next_token not in SENTENCE_END:
+                sentences.append((start, position + 1))
+                start = position + 1
+        if start < len(tokens):
+            sentences.append((start, len(tokens)))
+            
+        stop_words = self.stop_words
+        lemmas = tuple(
+            self.lemma(token) for token in tokens
+            if token.isalpha() and token not in stop_words
+        )
+        
+        # Score each sentence with the lexicon; the text's score averages every assessment
+        polarities, subjectivities, sentence_polarities = [], [], []
+        for start, end in sentences:
+            assessments = self.lexicon.assessments((token, None) for token in tokens[start:end])
+            sentence_polarities.append(
+                sum(p for _, p, _, _ in assessments) / len(assessments) if assessments else 0.0
+            )
+            polarities.extend(p for _, p, _, _ in assessments)
+            subjectivities.extend(s for _, _, s, _ in assessments)
+            
+        return AnnotatedDoc(
+            text=text,
+            tokens=tuple(tokens),
+            sentences=tuple(sentences),
+            lemmas=lemmas,
+            polarity=sum(polarities) / len(polarities) if polarities else 0.0,
+            subjectivity=sum(subjectivities) / len(subjectivities) if subjectivities else 0.0,
+            sentence_polarities=tuple(sentence_polarities)
+        )
+
+_analyzer: Optional[TextAnalyzer] = None
+_analyzer_lock = threading.Lock()
+
+def get_text_analyzer(config: Optional[Dict[str, Any]] = None) -> TextAnalyzer:
+    """Get the process-wide text analyzer."""
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = TextAnalyzer(config)
+    return _analyzer
@@ -0,0 +1,287 @@
+"""
+Fingerprint Store
+
+This module implements the per-affiliate fingerprint store used for incremental
+re-discovery. A fingerprint combines a hash of the profile fields with the newest
+post seen; the post doubles as the watermark scrapers fetch beyond on the next run.
+Counters such as followers and likes drift on every scrape, so they are kept out of
+the hash and compared with a tolerance. The store also keeps a bounded post history
+per affiliate, so posts fetched past the watermark extend it instead of the whole
+feed being fetched again.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+import logging
+import hashlib
+import json
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+import redis.asyncio as aioredis
+
+from src.services.monitoring.monitoring import MonitoringService
+
+logger = logging.getLogger(__name__)
+
+# Keys holding post lists in scraped profile data
+POST_KEYS = ('tweets', 'posts', 'videos', 'content', 'comments')
+
+# Scrape-time artefacts that change without the profile changing
+VOLATILE_KEYS = ('metadata',)
+
+@dataclass
+class AffiliateFingerprint:
+    """Profile hash and newest-post watermark for one affiliate."""
+    platform: str
+    affiliate_id: str
+    profile_hash: str
+    newest_post_id: Optional[str] = None
+    newest_post_timestamp: Optional[str] = None
+    last_seen: Optional[str] = None
+    counters: Dict[str, float] = field(default_factory=dict)
+    
+    def watermark(self) -> Optional[Dict[str, Any]]:
+        """Get the watermark scrapers fetch beyond, if any post has been seen."""
+        if not self.newest_post_id and not self.newest_post_timestamp:
+            return None
+        return {'post_id': self.newest_post_id, 'timestamp': self.newest_post_timestamp}
+
+class FingerprintStore:
+    """Stores affiliate fingerprints in memory or Redis."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.monitoring = MonitoringService()
+        self.fingerprints: Dict[str, AffiliateFingerprint] = {}
+        self.redis = None
+        if config.get('fingerprint_redis_url'):
+            self.redis = aioredis.from_url(config['fingerprint_redis_url'])
+        self.redis_prefix = config.get('fingerprint_redis_prefix', 'discovery:fingerprints:')
+        self.history_prefix = config.get('fingerprint_history_prefix', 'discovery:post_history:')
+        self.history_limit = config.get('fingerprint_history_limit', 200)
+        self.counter_tolerance = config.get('fingerprint_counter_tolerance', 0.05)
+        self.histories: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._pending_histories: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        
+    async def get(self, platform: str, affiliate_id: str) -> Optional[AffiliateFingerprint]:
+        """Get the stored fingerprint of an affiliate."""
+        try:
+            key = self._key(platform, affiliate_id)
+            if key in self.fingerprints:
+                return self.fingerprints[key]
+            if self.redis is None:
+                return None
+                
+            payload = await self.redis.hget(self.redis_prefix + platform, affiliate_id)
+            if payload is None:
+                return None
+            fingerprint = AffiliateFingerprint(**json.loads(payload))
+            self.fingerprints[key] = fingerprint
+            return fingerprint
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error loading fingerprint: {str(e)}")
+            return None
+            
+    def compute(
+        self,
+        platform: str,
+        affiliate_id: str,
+        data: Dict[str, Any],
+        previous: Optional[AffiliateFingerprint] = None
+    ) -> AffiliateFingerprint:
+        """Fingerprint freshly scraped profile data."""
+        profile_fields, counters = self._split_counters(self._strip_volatile({
+            key: value for key, value in data.items() if key not in POST_KEYS
+        }))
+        profile_hash = hashlib.blake2b(
+            json.dumps(profile_fields, sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        
+        newest_post = self._get_newest_post(data)
+        if newest_post is not None:
+            newest_post_id, newest_post_timestamp = self._post_id(newest_post), newest_post.get('timestamp')
+        elif previous is not None:
+            # No posts past the watermark; keep it where it was
+            newest_post_id, newest_post_timestamp = previous.newest_post_id, previous.newest_post_timestamp
+        else:
+            newest_post_id, newest_post_timestamp = None, None
+            
+        return AffiliateFingerprint(
+            platform=platform,
+            affiliate_id=affiliate_id,
+            profile_hash=profile_hash,
+            newest_post_id=newest_post_id,
+            newest_post_timestamp=newest_post_timestamp,
+            last_seen=datetime.utcnow().isoformat(),
+            counters=counters
+        )
+        
+    def has_changed(
+        self,
+        fingerprint: AffiliateFingerprint,
+        previous: Optional[AffiliateFingerprint]
+    ) -> bool:
+        """Check whether an affiliate's profile or posts changed since the last run."""
+        if previous is None:
+            return True
+        return (
+            fingerprint.profile_hash != previous.profile_hash
+            or fingerprint.newest_post_id != previous.newest_post_id
+            or fingerprint.newest_post_timestamp != previous.newest_post_timestamp
+            or self._counters_changed(fingerprint.counters, previous.counters)
+        )
+        
+    async def merge_history(
+        self,
+        platform: str,
+        affiliate_id: str,
+        data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Extend the stored post history with posts fetched past the watermark.
+        
+        Returns None when no history is stored, in which case the affiliate has to be
+        fetched in full.
+        """
+        try:
+            history = await self._get_history(platform, affiliate_id)
+            if history is None:
+                return None
+                
+            merged = dict(data)
+            for key in POST_KEYS:
+                if data.get(key) or history.get(key):
+                    merged[key] = self._merge_posts(data.get(key) or [], history.get(key, []))
+            return merged
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error merging post history: {str(e)}")
+            return None
+            
+    def remember_history(self, platform: str, affiliate_id: str, data: Dict[str, Any]):
+        """Hold an affiliate's posts until its fingerprint is committed."""
+        self._pending_histories[self._key(platform, affiliate_id)] = {
+            key: [post for post in data[key] if isinstance(post, dict)][:self.history_limit]
+            for key in POST_KEYS if data.get(key)
+        }
+        
+    async def commit(self, fingerprints: Iterable[AffiliateFingerprint]):
+        """Store fingerprints and post histories once their affiliates have been fully processed."""
+        try:
+            by_platform: Dict[str, Dict[str, str]] = {}
+            histories: Dict[str, Dict[str, str]] = {}
+            for fingerprint in fingerprints:
+                key = self._key(fingerprint.platform, fingerprint.affiliate_id)
+                self.fingerprints[key] = fingerprint
+                by_platform.setdefault(fingerprint.platform, {})[fingerprint.affiliate_id] = json.dumps(
+                    asdict(fingerprint)
+                )
+                if key in self._pending_histories:
+                    self.histories[key] = self._pending_histories.pop(key)
+                    histories.setdefault(fingerprint.platform, {})[fingerprint.affiliate_id] = json.dumps(
+                        self.histories[key], default=str
+                    )
+                    
+            if self.redis is not None:
+                for platform, mapping in by_platform.items():
+                    await self.redis.hset(self.redis_prefix + platform, mapping=mapping)
+                for platform, mapping in histories.items():
+                    await self.redis.hset(self.history_prefix + platform, mapping=mapping)
+                    
+        except Exception as e:
+            self.monitoring.log_error(f"Error storing fingerprints: {str(e)}")
+            
+    async def _get_history(self, platform: str, affiliate_id: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Get the stored post history of an affiliate."""
+        key = self._key(platform, affiliate_id)
+        if key in self.histories:
+            return self.histories[key]
+        if self.redis is None:
+            return None
+            
+        payload = await self.redis.hget(self.history_prefix + platform, affiliate_id)
+        if payload is None:
+            return None
+        self.histories[key] = json.loads(payload)
+        return self.histories[key]
+        
+    def _merge_posts(self, new_posts: List[Dict[str, Any]], stored: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """New posts ahead of the stored ones, without repeats, newest first and bounded."""
+        merged = []
+        seen = set()
+        for post in list(new_posts) + list(stored):
+            if not isinstance(post, dict):
+                continue
+            # Posts without an id are told apart by their timestamp and text
+            identity = self._post_id(post) or (post.get('timestamp'), post.get('text'))
+            if identity in seen:
+                continue
+            seen.add(identity)
+            merged.append(post)
+            
+        if all(post.get('timestamp') for post in merged):
+            merged.sort(key=lambda post: str(post['timestamp']), reverse=True)
+        return merged[:self.history_limit]
+        
+    def _split_counters(self, value: Any, path: str = '') -> Tuple[Any, Dict[str, float]]:
+        """Separate numeric fields, which drift between scrapes, from the hashed profile fields."""
+        counters: Dict[str, float] = {}
+        if isinstance(value, dict):
+            fields = {}
+            for key, item in value.items():
+                item_path = f"{path}.{key}" if path else str(key)
+                if isinstance(item, (int, float)) and not isinstance(item, bool):
+                    counters[item_path] = item
+                    continue
+                fields[key], nested = self._split_counters(item, item_path)
+                counters.update(nested)
+            return fields, counters
+        return value, counters
+        
+    def _counters_changed(self, counters: Dict[str, float], previous: Dict[str, float]) -> bool:
+        """Check whether any counter moved by more than the relative tolerance."""
+        if counters.keys() != previous.keys():
+            return True
+        return any(
+            abs(value - previous[key]) > self.counter_tolerance * max(abs(previous[key]), 1)
+            for key, value in counters.items()
+        )
+        
+    def _get_newest_post(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Find the newest post across the profile's post lists."""
+        posts = [
+            post for key in POST_KEYS
+            for post in (data.get(key) or [])
+            if isinstance(post, dict)
+        ]
+        if not posts:
+            return None
+            
+        dated = [post for post in posts if post.get('timestamp')]
+        if dated:
+            return max(dated, key=lambda post: post['timestamp'])
+        # Undated feeds are listed newest first
+        return posts[0]
+        
+    def _post_id(self, post: Dict[str, Any]) -> Optional[str]:
+        """Id of a post as its scraper's watermark marker reads it.
+        
+        Scrapers without a native post id read the post's link as its id and store it
+        as the post's url.
+        """
+        return post.get('post_id') or post.get('url')
+        
+    def _strip_volatile(self, value: Any) -> Any:
+        """Drop scrape-time artefacts before hashing."""
+        if isinstance(value, dict):
+            return {
+                key: self._strip_volatile(item)
+                for key, item in value.items()
+                if key not in VOLATILE_KEYS
+            }
+        if isinstance(value, list):
+            return [self._strip_volatile(item) for item in value]
+        return value
+        
+    def _key(self, platform: str, affiliate_id: str) -> str:
+        return f"{platform}:{affiliate_id}"
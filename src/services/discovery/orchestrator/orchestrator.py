@@ -25,6 +25,7 @@ from services.discovery.pipeline.data_cleaner import DataCleaner
 from services.discovery.pipeline.data_enricher import DataEnricher
 from services.discovery.pipeline.data_validator import DataValidator
 from services.discovery.pipeline.prospect_scorer import ProspectScorer
+from services.discovery.orchestrator.fingerprint_store import FingerprintStore
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,9 @@ class DiscoveryOrchestrator:
         self.data_validator = DataValidator(config)
         self.prospect_scorer = ProspectScorer(config)
         
+        # Fingerprints of known affiliates for incremental re-discovery
+        self.fingerprint_store = FingerprintStore(config)
+        
         # Initialize task tracking
         self.active_tasks = defaultdict(list)
         self.task_results = defaultdict(dict)
@@ -87,6 +91,16 @@ class DiscoveryOrchestrator:
             
             # Generate final discovery report
             discovery_report = await self._generate_discovery_report(pipeline_results)
+            discovery_report['summary']['unchanged_affiliates'] = {
+                result['platform']: result.get('unchanged', 0) for result in platform_results
+            }
+            
+            # Remember what was processed so the next run only handles changes
+            await self.fingerprint_store.commit(
+                fingerprint
+                for result in platform_results
+                for fingerprint in result.get('fingerprints', [])
+            )
             
             self.monitoring.log_info(
                 f"Completed discovery session: {session_id}",
@@ -164,22 +178,72 @@ class DiscoveryOrchestrator:
             # Discover potential affiliates
             discovered_affiliates = await scraper.discover_affiliates(search_criteria)
             
-            # Extract detailed data for each affiliate
+            # Extract data for each affiliate, fetching only posts past its watermark
             affiliate_data = []
+            fingerprints = []
+            unchanged = 0
             for affiliate in discovered_affiliates:
                 try:
-                    data = await scraper.extract_affiliate_data(affiliate)
-                    if data:
-                        affiliate_data.append(data)
+                    affiliate_id = affiliate.get('id') or affiliate['url']
+                    previous = await self.fingerprint_store.get(platform, affiliate_id)
+                    since = previous.watermark() if previous else None
+                    data = await scraper.extract_affiliate_data(affiliate, since=since)
+                    if not data:
+                        continue
+                        
+                    # Unchanged profiles skip intelligence, cleaning, enrichment and scoring
+                    fingerprint = self.fingerprint_store.compute(
+                        platform,
+                        affiliate_id,
+                        data.get('data', {}),
+                        previous
+                    )
+                    if not self.fingerprint_store.has_changed(fingerprint, previous):
+                        unchanged += 1
+                        continue
+                        
+                    # The delta only holds posts past the watermark, and engagement and
+                    # scores need the whole history, so the delta extends the stored one
+                    if since is not None:
+                        merged = await self.fingerprint_store.merge_history(
+                            platform,
+                            affiliate_id,
+                            data.get('data', {})
+                        )
+                        if merged is not None:
+                            data = {**data, 'data': merged}
+                        else:
+                            # Nothing stored to extend; fetch the whole feed once
+                            data = await scraper.extract_affiliate_data(affiliate)
+                            if not data:
+                                continue
+                            fingerprint = self.fingerprint_store.compute(
+                                platform,
+                                affiliate_id,
+                                data.get('data', {}),
+                                previous
+                            )
+                            
+                    self.fingerprint_store.remember_history(platform, affiliate_id, data.get('data', {}))
+                    affiliate_data.append(data)
+                    fingerprints.append(fingerprint)
                 except Exception as e:
                     self.monitoring.log_error(
                         f"Error extracting affiliate data: {str(e)}",
                         context={"platform": platform, "affiliate": affiliate}
                     )
             
+            self.monitoring.record_metric(
+                'discovery_unchanged_affiliates',
+                unchanged,
+                {'platform': platform}
+            )
+            
             return {
                 'platform': platform,
-                'affiliates': affiliate_data
+                'affiliates': affiliate_data,
+                'fingerprints': fingerprints,
+                'unchanged': unchanged
             }
             
         except Exception as e:
@@ -189,7 +253,9 @@ class DiscoveryOrchestrator:
             )
             return {
                 'platform': platform,
-                'affiliates': []
+                'affiliates': [],
+                'fingerprints': [],
+                'unchanged': 0
             }
             
     async def _process_intelligence(self, platform_results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -201,27 +267,39 @@ class DiscoveryOrchestrator:
                 platform = result['platform']
                 affiliates = result['affiliates']
                 
-                # Process each affiliate through appropriate intelligence processor
-                processed_affiliates = []
-                for affiliate in affiliates:
+                # Determine processor based on platform
+                processor = self._get_intelligence_processor(platform)
+                
+                # Content analysis takes the platform's affiliates as one batch
+                processed_affiliates = None
+                if isinstance(processor, ContentAnalysisAI):
                     try:
-                        # Determine processor based on platform
-                        processor = self._get_intelligence_processor(platform)
-                        
-                        # Process affiliate data
-                        processed_data = await processor.analyze_content(
-                            affiliate,
-                            platform
-                        )
-                        
-                        processed_affiliates.append(processed_data)
-                        
+                        processed_affiliates = await processor.analyze_content_batch(affiliates, platform)
                     except Exception as e:
                         self.monitoring.log_error(
-                            f"Error processing affiliate: {str(e)}",
-                            context={"platform": platform, "affiliate": affiliate}
+                            f"Error processing affiliate batch: {str(e)}",
+                            context={"platform": platform}
                         )
-                
+                        
+                # Otherwise, or if the batch failed, process each affiliate on its own
+                if processed_affiliates is None:
+                    processed_affiliates = []
+                    for affiliate in affiliates:
+                        try:
+                            # Process affiliate data
+                            processed_data = await processor.analyze_content(
+                                affiliate,
+                                platform
+                            )
+                            
+                            processed_affiliates.append(processed_data)
+                            
+                        except Exception as e:
+                            self.monitoring.log_error(
+                                f"Error processing affiliate: {str(e)}",
+                                context={"platform": platform, "affiliate": affiliate}
+                            )
+                            
                 intelligence_results[platform] = processed_affiliates
             
             return intelligence_results
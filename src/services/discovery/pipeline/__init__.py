@@ -5,21 +5,31 @@ This package implements the data processing pipeline for the discovery service,
 handling data cleaning, validation, enrichment, and scoring of prospects.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
+import logging
+import time
 
 from .data_cleaner import DataCleaner
 from .data_validator import DataValidator
 from .data_enricher import DataEnricher
 from .prospect_scorer import ProspectScorer
+from .batch_executor import BatchExecutor
 
 __all__ = [
     'DataCleaner',
     'DataValidator',
     'DataEnricher',
-    'ProspectScorer'
+    'ProspectScorer',
+    'BatchExecutor',
+    'DiscoveryPipeline'
 ]
 
+logger = logging.getLogger(__name__)
+
+# Pipeline stages, in order, as reported in chunk timings
+STAGES = ('cleaning', 'validation', 'enrichment', 'scoring')
+
 class DiscoveryPipeline:
     """Main pipeline for processing discovery data."""
     
@@ -30,44 +40,104 @@ class DiscoveryPipeline:
         self.validator = DataValidator(config)
         self.enricher = DataEnricher(config)
         self.scorer = ProspectScorer(config)
+        self.executor = BatchExecutor(config, self)
         
     async def process_profile(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process a profile through the pipeline."""
+        results, _ = await self.process_chunk([profile_data])
+        if 'error' in results[0]:
+            raise Exception(results[0]['error'])
+        return results[0]
+        
+    async def process_batch(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process multiple profiles through the pipeline across worker processes."""
+        # Results keep input order; failed profiles yield an entry with an 'error' key
+        return await self.executor.run(profiles)
+        
+    async def process_chunk(
+        self,
+        profiles: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """Process a chunk of profiles in this process, timing each stage."""
+        timings = dict.fromkeys(STAGES, 0.0)
+        results: List[Dict[str, Any]] = [{} for _ in profiles]
+        cleaned: Dict[int, Dict[str, Any]] = {}
+        platforms: List[str] = []
+        validated: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        
+        # Clean the data
+        start_time = time.perf_counter()
+        for index, profile_data in enumerate(profiles):
+            try:
+                platform = str(profile_data.get('platform', 'generic'))
+                cleaned[index] = self.cleaner.clean_profile_data(profile_data)
+                platforms.append(platform)
+            except Exception as e:
+                results[index] = self.failure(e)
+        timings['cleaning'] += time.perf_counter() - start_time
+        
+        # Validate the cleaned chunk against each platform's compiled schemas
+        start_time = time.perf_counter()
+        failed, validation_results = self.validator.validate_batch(
+            list(cleaned.values()),
+            platforms
+        )
+        timings['validation'] += time.perf_counter() - start_time
+        
+        for index, is_failed, result in zip(cleaned, failed, validation_results):
+            if is_failed:
+                results[index] = self.failure(ValueError(f"Data validation failed: {result.get('errors', [])}"))
+            else:
+                validated[index] = (cleaned[index], result)
+                
+        # Enrich the whole chunk at once so spaCy sees every post in one pass
+        start_time = time.perf_counter()
+        enriched = await self.enricher.enrich_profiles_batch(
+            [cleaned_data for cleaned_data, _ in validated.values()]
+        )
+        timings['enrichment'] += time.perf_counter() - start_time
+        
+        # Score the chunk's prospects in one vectorized pass
+        start_time = time.perf_counter()
         try:
-            # Clean the data
-            cleaned_data = self.cleaner.clean_profile_data(profile_data)
-            
-            # Validate the cleaned data
-            validation_results = self.validator.validate_profile_data(cleaned_data)
-            if not validation_results.get('is_valid', False):
-                raise ValueError(f"Data validation failed: {validation_results.get('errors', [])}")
+            scoring_results = await self.scorer.score_batch(enriched)
+        except Exception as e:
+            scoring_results = [e] * len(enriched)
+        timings['scoring'] += time.perf_counter() - start_time
+        
+        for (index, (cleaned_data, validation_results)), enriched_data, scores in zip(
+            validated.items(), enriched, scoring_results
+        ):
+            if isinstance(scores, Exception):
+                results[index] = self.failure(scores)
+                continue
                 
-            # Enrich the data
-            enriched_data = await self.enricher.enrich_profile_data(cleaned_data)
-            
-            # Score the prospect
-            scoring_results = await self.scorer.score_prospect(enriched_data)
-            
-            return {
+            results[index] = {
                 'cleaned_data': cleaned_data,
                 'validation_results': validation_results,
                 'enriched_data': enriched_data,
-                'scoring_results': scoring_results,
+                'scoring_results': scores,
                 'timestamp': datetime.utcnow().isoformat()
             }
             
+        return results, timings
+        
+    def failure(self, error: BaseException) -> Dict[str, Any]:
+        """Build the result entry for a profile that failed processing."""
+        logger.error(f"Error processing profile: {str(error)}")
+        return {
+            'error': f"Pipeline processing failed: {str(error)}",
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        
+    def warm_up(self):
+        """Preload the NLP models used by enrichment."""
+        try:
+            self.enricher.nlp
+            self.enricher.models.stopwords()
         except Exception as e:
-            raise Exception(f"Pipeline processing failed: {str(e)}")
+            logger.warning(f"Pipeline warm-up incomplete: {str(e)}")
             
-    async def process_batch(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process multiple profiles through the pipeline."""
-        results = []
-        for profile in profiles:
-            try:
-                result = await self.process_profile(profile)
-                results.append(result)
-            except Exception as e:
-                # Log error but continue processing other profiles
-                print(f"Error processing profile: {str(e)}")
-                continue
-        return results 
\ No newline at end of file
+    def close(self):
+        """Shut down batch worker processes."""
+        self.executor.close()
@@ -0,0 +1,159 @@
+"""
+Batch Executor
+
+This module implements parallel batch execution for the discovery pipeline. Profiles
+are partitioned into chunks and processed by a pool of worker processes, each holding
+a warm DiscoveryPipeline with its NLP models preloaded.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.services.monitoring.monitoring import MonitoringService
+from ..models.data_object import pack_payload, unpack_payload
+
+logger = logging.getLogger(__name__)
+
+# Pipeline held by each worker process, built once by the pool initializer
+_worker_pipeline = None
+
+def _init_worker(config: Dict[str, Any]):
+    """Build and warm up the worker's pipeline."""
+    global _worker_pipeline
+    from . import DiscoveryPipeline
+    _worker_pipeline = DiscoveryPipeline(config)
+    _worker_pipeline.warm_up()
+
+def default_workers(cap: int) -> int:
+    """Get the number of CPUs this process may run on, at most `cap`."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, cap))
+
+def _process_chunk(payload: bytes) -> bytes:
+    """Process one msgpack-encoded chunk of profiles inside a worker."""
+    results, timings = asyncio.run(_worker_pipeline.process_chunk(unpack_payload(payload)))
+    return pack_payload([results, timings])
+
+class BatchExecutor:
+    """Runs pipeline batches across a pool of warm worker processes."""
+    
+    def __init__(self, config: Dict[str, Any], pipeline: Any):
+        self.config = config
+        self.pipeline = pipeline
+        self.monitoring = MonitoringService()
+        self.workers = config.get('pipeline_workers') or default_workers(config.get('pipeline_max_workers', 8))
+        self.chunk_size = config.get('pipeline_chunk_size')
+        self.chunks_per_worker = config.get('pipeline_chunks_per_worker', 4)
+        self.chunk_retries = config.get('pipeline_chunk_retries', 1)
+        self.chunk_timings: List[Dict[str, Any]] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+    async def run(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process profiles in chunks, returning one result per profile in input order."""
+        chunks = self._partition(profiles)
+        
+        if self.workers <= 1:
+            outcomes = [await self.pipeline.process_chunk(chunk) for chunk in chunks]
+        else:
+            outcomes = await self._run_in_pool(chunks)
+            
+        results = []
+        self.chunk_timings = []
+        for index, (chunk, outcome) in enumerate(zip(chunks, outcomes)):
+            if isinstance(outcome, BaseException):
+                # Fail only this chunk's profiles
+                self.monitoring.log_error(f"Error processing pipeline chunk {index}: {str(outcome)}")
+                results.extend(self.pipeline.failure(outcome) for _ in chunk)
+                continue
+                
+            chunk_results, timings = outcome
+            results.extend(chunk_results)
+            self._record_timings(index, len(chunk), timings)
+            
+        return results
+        
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """Get per-stage timings for each chunk of the last batch."""
+        return list(self.chunk_timings)
+        
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+            
+    async def _run_in_pool(self, chunks: List[List[Dict[str, Any]]]) -> List[Any]:
+        """Run chunks on the worker pool, resubmitting the ones lost when a worker dies."""
+        outcomes: List[Any] = [None] * len(chunks)
+        pending = list(range(len(chunks)))
+        for attempt in range(self.chunk_retries + 1):
+            pool = self._get_pool()
+            attempt_outcomes = await asyncio.gather(
+                *(self._run_chunk(pool, chunks[index]) for index in pending),
+                return_exceptions=True
+            )
+            
+            broken = []
+            for index, outcome in zip(pending, attempt_outcomes):
+                outcomes[index] = outcome
+                if isinstance(outcome, BrokenProcessPool):
+                    broken.append(index)
+            if not broken:
+                break
+                
+            # A dead worker breaks the whole pool; chunks that never completed get a fresh one
+            self.monitoring.log_error(
+                f"Pipeline worker pool broke on attempt {attempt + 1}; {len(broken)} chunks did not complete"
+            )
+            self._reset_pool()
+            pending = broken
+            
+        return outcomes
+        
+    async def _run_chunk(self, pool: ProcessPoolExecutor, chunk: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """Run one chunk in a worker, so a failed submission is gathered like any other error."""
+        # Chunks and results cross the process boundary as msgpack envelopes rather than pickles
+        payload = await asyncio.get_running_loop().run_in_executor(pool, _process_chunk, pack_payload(chunk))
+        results, timings = unpack_payload(payload)
+        return results, timings
+        
+    def _partition(self, profiles: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split profiles into chunks large enough to amortize IPC."""
+        # Default to a few chunks per worker so uneven chunks still balance
+        size = self.chunk_size or max(
+            1, math.ceil(len(profiles) / (max(self.workers, 1) * self.chunks_per_worker))
+        )
+        return [profiles[start:start + size] for start in range(0, len(profiles), size)]
+        
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the worker pool, starting it on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.config.get('pipeline_start_method', 'spawn')),
+                initializer=_init_worker,
+                initargs=(self.config,)
+            )
+        return self._pool
+        
+    def _reset_pool(self):
+        """Discard a broken pool so the next submission starts fresh workers."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            
+    def _record_timings(self, index: int, size: int, timings: Dict[str, float]):
+        """Publish the stage timings of a chunk."""
+        self.chunk_timings.append({'chunk': index, 'profiles': size, 'stages': timings})
+        for stage, seconds in timings.items():
+            self.monitoring.record_metric('pipeline_stage_seconds', seconds, {'stage': stage})
+        logger.debug(f"Pipeline chunk {index} ({size} profiles): {timings}")
@@ -4,39 +4,40 @@ Data Cleaner
 This module implements data cleaning and normalization for scraped data.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 import logging
 import re
-from datetime import datetime
-import unicodedata
-from bs4 import BeautifulSoup
-import nltk
 
 from src.services.monitoring.monitoring import MonitoringService
+from .text_normalizer import normalize_text, topic_terms
+from .date_parser import DateParser
+from .streaming import RunningStats, Reservoir, TopK, chunked
 
 logger = logging.getLogger(__name__)
 
+# Post engagement metrics summarized over a profile's full history
+ENGAGEMENT_METRICS = ('likes', 'comments', 'shares', 'views')
+
 class DataCleaner:
     """Cleans and normalizes scraped data."""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.monitoring = MonitoringService()
+        self.date_parser = DateParser(config)
         
-        # Download required NLTK data
-        try:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-            nltk.download('wordnet')
-        except Exception as e:
-            self.monitoring.log_error(f"Error downloading NLTK data: {str(e)}")
-            
     def clean_profile_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Clean profile data."""
         try:
+            # Date formats are learned per platform
+            source = str(data.get('platform', 'generic'))
+            
+            # Post histories are streamed; only a bounded sample is kept in full
+            content, content_stats = self._clean_content_stream(data.get('content', []), source)
             cleaned_data = {
-                'basic_info': self._clean_basic_info(data.get('basic_info', {})),
-                'content': self._clean_content(data.get('content', [])),
+                'basic_info': self._clean_basic_info(data.get('basic_info', {}), source),
+                'content': content,
+                'content_stats': content_stats,
                 'engagement': self._clean_engagement(data.get('engagement', {})),
                 'network': self._clean_network(data.get('network', {}))
             }
@@ -47,7 +48,7 @@ class DataCleaner:
             self.monitoring.log_error(f"Error cleaning profile data: {str(e)}")
             return {}
             
-    def _clean_basic_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
+    def _clean_basic_info(self, info: Dict[str, Any], source: str = 'generic') -> Dict[str, Any]:
         """Clean basic profile information."""
         try:
             cleaned_info = {}
@@ -65,7 +66,7 @@ class DataCleaner:
             # Clean date fields
             for field in ['join_date', 'last_active']:
                 if field in info:
-                    cleaned_info[field] = self._clean_date(info[field])
+                    cleaned_info[field] = self._clean_date(info[field], f"{source}.{field}")
                     
             # Clean URLs
             for field in ['profile_picture', 'banner_image']:
@@ -78,18 +79,76 @@ class DataCleaner:
             self.monitoring.log_error(f"Error cleaning basic info: {str(e)}")
             return {}
             
-    def _clean_content(self, content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _clean_content(self, content: Iterable[Dict[str, Any]], source: str = 'generic') -> List[Dict[str, Any]]:
         """Clean content data."""
+        return self._clean_content_stream(content, source)[0]
+        
+    def _clean_content_stream(
+        self,
+        content: Iterable[Dict[str, Any]],
+        source: str = 'generic'
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Clean a post history in one pass, keeping a bounded sample and full-history statistics."""
+        try:
+            sample = Reservoir(
+                self.config.get('profile_post_budget', 1000),
+                self.config.get('profile_sample_seed', 0)
+            )
+            engagement_stats = {metric: RunningStats() for metric in ENGAGEMENT_METRICS}
+            topics = TopK(self.config.get('profile_topic_budget', 100))
+            
+            for chunk in chunked(content, self.config.get('profile_chunk_size', 500)):
+                for cleaned_item in self._clean_content_chunk(chunk, source):
+                    for metric, stats in engagement_stats.items():
+                        if metric in cleaned_item['engagement']:
+                            stats.add(cleaned_item['engagement'][metric])
+                    for term in topic_terms(cleaned_item['text']):
+                        topics.add(term)
+                    sample.add(cleaned_item)
+                    
+            content_stats = {
+                'count': sample.seen,
+                'sampled': sample.sampled,
+                'engagement': {metric: stats.to_dict() for metric, stats in engagement_stats.items()},
+                'topics': [
+                    {'topic': topic, 'count': count}
+                    for topic, count in topics.most_common(self.config.get('profile_top_topics', 10))
+                ]
+            }
+            return sample.sample(), content_stats
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error cleaning content: {str(e)}")
+            return [], {'count': 0, 'sampled': False, 'engagement': {}, 'topics': []}
+            
+    def _clean_content_chunk(self, content: List[Dict[str, Any]], source: str) -> List[Dict[str, Any]]:
+        """Clean a chunk of posts."""
         try:
             cleaned_content = []
             
-            for item in content:
+            # Parse every post timestamp of the chunk in one pass
+            timestamps = self.date_parser.parse_many(
+                [item.get('timestamp') for item in content],
+                f"{source}.content"
+            )
+            
+            for item, timestamp in zip(content, timestamps):
                 cleaned_item = {
                     'text': self._clean_text(item.get('text', '')),
                     'media': self._clean_media(item.get('media', [])),
                     'engagement': self._clean_engagement(item.get('engagement', {})),
                     'metadata': self._clean_metadata(item.get('metadata', {}))
                 }
+                
+                # Carry identity fields through unchanged for validation
+                for field in ['id', 'type']:
+                    if field in item:
+                        cleaned_item[field] = item[field]
+                        
+                # Normalize timestamps to ISO-8601, keeping unrecognized values as scraped
+                if 'timestamp' in item:
+                    cleaned_item['timestamp'] = timestamp.isoformat() if timestamp else item['timestamp']
+                    
                 cleaned_content.append(cleaned_item)
                 
             return cleaned_content
@@ -124,12 +183,16 @@ class DataCleaner:
         try:
             cleaned_network = {}
             
-            # Clean connections
+            # Clean connections, keeping a bounded sample of very large follower lists
             if 'connections' in network:
-                cleaned_network['connections'] = [
-                    self._clean_connection(conn)
-                    for conn in network['connections']
-                ]
+                sample = Reservoir(
+                    self.config.get('network_max_nodes', 5000) - 1,
+                    self.config.get('profile_sample_seed', 0)
+                )
+                for conn in network['connections']:
+                    sample.add(self._clean_connection(conn))
+                cleaned_network['connections'] = sample.sample()
+                cleaned_network['connection_count'] = sample.seen
                 
             # Clean metrics
             if 'metrics' in network:
@@ -146,25 +209,8 @@ class DataCleaner:
     def _clean_text(self, text: str) -> str:
         """Clean text content."""
         try:
-            if not text:
-                return ""
-                
-            # Convert to string if not already
-            text = str(text)
-            
-            # Remove HTML tags
-            text = BeautifulSoup(text, 'html.parser').get_text()
-            
-            # Normalize unicode
-            text = unicodedata.normalize('NFKD', text)
-            
-            # Remove special characters
-            text = re.sub(r'[^\w\s]', ' ', text)
-            
-            # Remove extra whitespace
-            text = ' '.join(text.split())
-            
-            return text.strip()
+            # Strip HTML only when present, normalize unicode, drop punctuation and extra whitespace
+            return normalize_text(text)
             
         except Exception as e:
             self.monitoring.log_error(f"Error cleaning text: {str(e)}")
@@ -184,29 +230,11 @@ class DataCleaner:
         except:
             return 0
             
-    def _clean_date(self, date: Any) -> Optional[str]:
+    def _clean_date(self, date: Any, source: str = 'generic') -> Optional[str]:
         """Clean date values."""
         try:
-            if not date:
-                return None
-                
-            # Try parsing common date formats
-            formats = [
-                '%Y-%m-%d',
-                '%d/%m/%Y',
-                '%m/%d/%Y',
-                '%B %d, %Y',
-                '%d %B %Y'
-            ]
-            
-            for fmt in formats:
-                try:
-                    parsed_date = datetime.strptime(str(date), fmt)
-                    return parsed_date.strftime('%Y-%m-%d')
-                except:
-                    continue
-                    
-            return None
+            parsed_date = self.date_parser.parse(date, source)
+            return parsed_date.strftime('%Y-%m-%d') if parsed_date else None
             
         except Exception as e:
             self.monitoring.log_error(f"Error cleaning date: {str(e)}")
@@ -4,19 +4,32 @@ Data Enricher
 This module implements data enrichment for scraped data.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+import copy
 import logging
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.sentiment import SentimentIntensityAnalyzer
-import spacy
+import math
+import random
+import time
+import networkx as nx
 from textblob import TextBlob
 
 from src.services.monitoring.monitoring import MonitoringService
+from ..nlp.registry import get_model_registry
+from ..nlp.memo_store import get_memo_store, package_version
+from .streaming import TopK
+from .text_normalizer import normalize_text, topic_terms
 
 logger = logging.getLogger(__name__)
 
+# spaCy components each batch annotation depends on; everything else is disabled
+SPACY_COMPONENTS = {
+    'entities': ('tok2vec', 'ner', 'entity_ruler'),
+    'topics': ('tok2vec', 'tagger', 'attribute_ruler', 'parser')
+}
+
+# Node standing for the profile itself in its ego network
+EGO = '__profile__'
+
 class DataEnricher:
     """Enriches scraped data with additional information."""
     
@@ -24,29 +37,60 @@ class DataEnricher:
         self.config = config
         self.monitoring = MonitoringService()
         
-        # Download required NLTK data
-        try:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-            nltk.download('vader_lexicon')
-            nltk.download('averaged_perceptron_tagger')
-            nltk.download('maxent_ne_chunker')
-            nltk.download('words')
-        except Exception as e:
-            self.monitoring.log_error(f"Error downloading NLTK data: {str(e)}")
-            
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except:
-            self.nlp = spacy.blank('en')
-            
+        # NLTK and spaCy models are shared process-wide and loaded on first use
+        self.models = get_model_registry()
+        
+        # Results are memoized by content, so repeated texts are analyzed once
+        self.memo = get_memo_store(config)
+        self.sentiment_version = package_version('nltk', 'textblob')
+        
+    @property
+    def nlp(self) -> Any:
+        """Shared spaCy pipeline."""
+        return self.models.spacy(self.config.get('spacy_model', 'en_core_web_sm'))
+        
     async def enrich_profile_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich profile data with additional information."""
+        return await self._enrich_profile(data)
+        
+    async def enrich_profiles_batch(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich a batch of profiles, running spaCy over all of their post texts at once."""
+        try:
+            # Gather every post text with its position so annotations can be scattered back
+            texts = []
+            positions: List[Tuple[int, int]] = []
+            for profile_index, data in enumerate(profiles):
+                for item_index, item in enumerate(data.get('content', [])):
+                    if 'text' in item:
+                        texts.append(item['text'])
+                        positions.append((profile_index, item_index))
+                        
+            annotations: List[Dict[int, Dict[str, Any]]] = [{} for _ in profiles]
+            for (profile_index, item_index), annotation in zip(positions, self._annotate_texts(texts)):
+                annotations[profile_index][item_index] = annotation
+                
+            return [
+                await self._enrich_profile(data, annotations[profile_index])
+                for profile_index, data in enumerate(profiles)
+            ]
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error enriching profile batch: {str(e)}")
+            return [{} for _ in profiles]
+            
+    async def _enrich_profile(
+        self,
+        data: Dict[str, Any],
+        annotations: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Enrich one profile, using precomputed post annotations when given."""
         try:
+            content = await self._enrich_content(data.get('content', []), annotations)
             enriched_data = {
                 'basic_info': await self._enrich_basic_info(data.get('basic_info', {})),
-                'content': await self._enrich_content(data.get('content', [])),
+                'content': content,
+                'content_stats': data.get('content_stats', {}),
+                'top_topics': self._rank_topics(content, data.get('content_stats', {})),
                 'engagement': await self._enrich_engagement(data.get('engagement', {})),
                 'network': await self._enrich_network(data.get('network', {}))
             }
@@ -83,25 +127,34 @@ class DataEnricher:
             self.monitoring.log_error(f"Error enriching basic info: {str(e)}")
             return info
             
-    async def _enrich_content(self, content: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _enrich_content(
+        self,
+        content: List[Dict[str, Any]],
+        annotations: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
         """Enrich content data."""
         try:
             enriched_content = []
             
-            for item in content:
+            # Annotate all post texts in one spaCy pass unless the batch path already did
+            if annotations is None:
+                indices = [index for index, item in enumerate(content) if 'text' in item]
+                annotations = dict(zip(
+                    indices,
+                    self._annotate_texts(content[index]['text'] for index in indices)
+                ))
+                
+            for index, item in enumerate(content):
                 enriched_item = item.copy()
                 
                 # Add sentiment analysis
                 if 'text' in item:
                     enriched_item['sentiment'] = self._analyze_sentiment(item['text'])
                     
-                # Add entity recognition
-                if 'text' in item:
-                    enriched_item['entities'] = self._extract_entities(item['text'])
-                    
-                # Add topic modeling
-                if 'text' in item:
-                    enriched_item['topics'] = self._extract_topics(item['text'])
+                # Add entity recognition and topic modeling
+                if index in annotations:
+                    enriched_item['entities'] = annotations[index]['entities']
+                    enriched_item['topics'] = annotations[index]['topics']
                     
                 # Add engagement analysis
                 if 'engagement' in item:
@@ -142,21 +195,15 @@ class DataEnricher:
         try:
             enriched_network = network.copy()
             
-            # Add network analysis
-            if 'connections' in network:
-                enriched_network['analysis'] = self._analyze_network(network['connections'])
-                
-            # Add community detection
-            if 'connections' in network:
-                enriched_network['communities'] = self._detect_communities(
-                    network['connections']
-                )
-                
-            # Add influence analysis
+            # Analyze the network in one pass and share communities and influence with the summary
             if 'connections' in network:
-                enriched_network['influence'] = self._analyze_influence(
-                    network['connections']
+                analysis = self._analyze_network(
+                    network['connections'],
+                    network.get('connection_count')
                 )
+                enriched_network['analysis'] = analysis
+                enriched_network['communities'] = analysis.get('communities', [])
+                enriched_network['influence'] = analysis.get('influence', {})
                 
             return enriched_network
             
@@ -167,65 +214,122 @@ class DataEnricher:
     def _analyze_sentiment(self, text: str) -> Dict[str, float]:
         """Analyze sentiment of text."""
         try:
-            # Use VADER sentiment analyzer
-            sia = SentimentIntensityAnalyzer()
-            sentiment = sia.polarity_scores(text)
-            
-            # Add TextBlob sentiment for comparison
-            blob = TextBlob(text)
-            sentiment['textblob'] = blob.sentiment.polarity
-            
-            return sentiment
+            return self.memo.get_or_compute(
+                'enricher.sentiment', text, self.sentiment_version, self._compute_sentiment
+            )
             
         except Exception as e:
             self.monitoring.log_error(f"Error analyzing sentiment: {str(e)}")
             return {'neg': 0, 'neu': 0, 'pos': 0, 'compound': 0, 'textblob': 0}
             
+    def _compute_sentiment(self, text: str) -> Dict[str, float]:
+        """Score sentiment of text with VADER and TextBlob."""
+        # Use VADER sentiment analyzer
+        sentiment = self.models.vader().polarity_scores(text)
+        
+        # Add TextBlob sentiment for comparison
+        blob = TextBlob(text)
+        sentiment['textblob'] = blob.sentiment.polarity
+        
+        return sentiment
+        
     def _extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """Extract named entities from text."""
-        try:
-            doc = self.nlp(text)
-            entities = []
-            
-            for ent in doc.ents:
-                entities.append({
-                    'text': ent.text,
-                    'label': ent.label_,
-                    'start': ent.start_char,
-                    'end': ent.end_char
-                })
-                
-            return entities
-            
-        except Exception as e:
-            self.monitoring.log_error(f"Error extracting entities: {str(e)}")
-            return []
-            
+        return self._annotate_texts([text])[0]['entities']
+        
     def _extract_topics(self, text: str) -> List[Dict[str, Any]]:
         """Extract topics from text."""
+        return self._annotate_texts([text])[0]['topics']
+        
+    def _annotate_texts(self, texts: Iterable[str]) -> List[Dict[str, Any]]:
+        """Extract entities and topics for many texts with one batched spaCy pass."""
+        texts = list(texts)
         try:
-            # Tokenize and remove stopwords
-            tokens = word_tokenize(text.lower())
-            stop_words = set(stopwords.words('english'))
-            tokens = [t for t in tokens if t not in stop_words]
-            
-            # Extract noun phrases
-            doc = self.nlp(text)
-            topics = []
-            
-            for chunk in doc.noun_chunks:
-                topics.append({
-                    'text': chunk.text,
-                    'root': chunk.root.text,
-                    'dependency': chunk.root.dep_
-                })
-                
-            return topics
+            nlp = self.nlp
+            needed = {component for components in SPACY_COMPONENTS.values() for component in components}
+            disable = [name for name in nlp.pipe_names if name not in needed]
+            
+            # Entity offsets refer to the exact text, so annotations are keyed without normalization
+            version = f"{nlp.meta.get('lang')}_{nlp.meta.get('name')}-{nlp.meta.get('version')}"
+            unique = list(dict.fromkeys(texts))
+            found, missing = self.memo.get_many('enricher.annotations', unique, version, normalize=False)
+            
+            # Only texts never seen before go through spaCy
+            if missing:
+                start_time = time.process_time()
+                docs = nlp.pipe(
+                    [unique[index] for index in missing],
+                    batch_size=self.config.get('spacy_batch_size', 256),
+                    n_process=self.config.get('spacy_n_process', 1),
+                    disable=disable
+                )
+                for index, doc in zip(missing, docs):
+                    found[index] = {'entities': self._entities_from_doc(doc), 'topics': self._topics_from_doc(doc)}
+                cpu_seconds = (time.process_time() - start_time) / len(missing)
+                for index in missing:
+                    self.memo.put(
+                        'enricher.annotations', unique[index], version, found[index],
+                        cpu_seconds, normalize=False
+                    )
+                    
+            # Repeats within the batch get their own copy so callers can't alias each other
+            by_text = {text: found[index] for index, text in enumerate(unique)}
+            annotations = []
+            seen = set()
+            for text in texts:
+                annotations.append(copy.deepcopy(by_text[text]) if text in seen else by_text[text])
+                seen.add(text)
+            return annotations
             
         except Exception as e:
-            self.monitoring.log_error(f"Error extracting topics: {str(e)}")
+            self.monitoring.log_error(f"Error annotating texts: {str(e)}")
+            return [{'entities': [], 'topics': []} for _ in texts]
+            
+    def _entities_from_doc(self, doc: Any) -> List[Dict[str, Any]]:
+        """Read named entities off a processed spaCy doc."""
+        return [
+            {
+                'text': ent.text,
+                'label': ent.label_,
+                'start': ent.start_char,
+                'end': ent.end_char
+            }
+            for ent in doc.ents
+        ]
+        
+    def _topics_from_doc(self, doc: Any) -> List[Dict[str, Any]]:
+        """Read noun-phrase topics off a processed spaCy doc."""
+        # Noun chunks need a dependency parse; pipelines without a parser have no topics
+        if not doc.has_annotation('DEP'):
             return []
-            
+        return [
+            {
+                'text': chunk.text,
+                'root': chunk.root.text,
+                'dependency': chunk.root.dep_
+            }
+            for chunk in doc.noun_chunks
+        ]
+        
+    def _rank_topics(
+        self,
+        content: List[Dict[str, Any]],
+        content_stats: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Rank a profile's topics, counted over its full post history when the cleaner streamed one."""
+        if content_stats and 'topics' in content_stats:
+            return content_stats['topics']
+            
+        # Uncleaned profiles hold their whole history; count it the same way
+        top_topics = TopK(self.config.get('profile_topic_budget', 100))
+        for item in content:
+            for term in topic_terms(normalize_text(item.get('text', ''))):
+                top_topics.add(term)
+        return [
+            {'topic': topic, 'count': count}
+            for topic, count in top_topics.most_common(self.config.get('profile_top_topics', 10))
+        ]
+        
     async def _infer_demographics(self, info: Dict[str, Any]) -> Dict[str, Any]:
         """Infer demographics from profile information."""
         try:
@@ -366,13 +470,23 @@ class DataEnricher:
             self.monitoring.log_error(f"Error analyzing engagement quality: {str(e)}")
             return {}
             
-    def _analyze_network(self, connections: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze network structure."""
+    def _analyze_network(
+        self,
+        connections: List[Dict[str, Any]],
+        size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Analyze network structure, given the full network size when connections are a sample."""
         try:
+            # Build the graph once; every metric below reads the same graph
+            graph = self._build_network_graph(connections)
+            if size is not None and size > len(connections):
+                graph.graph['sampled'] = True
+            metrics = self._calculate_network_metrics(graph, max(size or 0, len(connections)))
+            
             analysis = {
-                'metrics': self._calculate_network_metrics(connections),
-                'communities': self._detect_communities(connections),
-                'influence': self._analyze_influence(connections)
+                'metrics': metrics,
+                'communities': self._detect_communities(graph),
+                'influence': self._analyze_influence(connections, metrics)
             }
             
             return analysis
@@ -381,25 +495,55 @@ class DataEnricher:
             self.monitoring.log_error(f"Error analyzing network: {str(e)}")
             return {}
             
-    def _calculate_network_metrics(self, connections: List[Dict[str, Any]]) -> Dict[str, float]:
+    def _build_network_graph(self, connections: List[Dict[str, Any]]) -> nx.Graph:
+        """Build the profile's ego network, sampling connections past the size cap."""
+        max_nodes = self.config.get('network_max_nodes', 5000)
+        sampled = len(connections) >= max_nodes
+        if sampled:
+            rng = random.Random(self.config.get('network_sample_seed', 0))
+            connections = rng.sample(connections, max_nodes - 1)
+            
+        graph = nx.Graph(sampled=sampled)
+        graph.add_node(EGO)
+        for index, connection in enumerate(connections):
+            graph.add_edge(
+                EGO,
+                connection.get('id') or f"connection_{index}",
+                weight=connection.get('strength', 0)
+            )
+            
+        # Ties between connections are only kept when both ends are in the graph
+        for connection in connections:
+            for mutual in connection.get('metadata', {}).get('mutual_connections', []):
+                if connection.get('id') and mutual in graph and mutual not in (EGO, connection['id']):
+                    graph.add_edge(connection['id'], mutual, weight=0)
+                    
+        return graph
+        
+    def _calculate_network_metrics(self, graph: nx.Graph, size: int) -> Dict[str, float]:
         """Calculate network metrics."""
         try:
             metrics = {
-                'size': len(connections),
+                'size': size,
                 'density': 0,
                 'centrality': 0,
-                'clustering': 0
+                'clustering': 0,
+                'sampled': graph.graph.get('sampled', False)
             }
             
-            # Calculate network density
-            if metrics['size'] > 1:
-                metrics['density'] = len(connections) / (metrics['size'] * (metrics['size'] - 1))
-                
-            # Calculate network centrality
-            metrics['centrality'] = self._calculate_centrality(connections)
+            # Calculate network density, 2E / (V(V - 1)) including the profile itself
+            metrics['density'] = nx.density(graph)
+            
+            # Calculate betweenness of the profile, estimated from sampled sources on large graphs
+            samples = self.config.get('network_betweenness_samples', 100)
+            metrics['centrality'] = nx.betweenness_centrality(
+                graph,
+                k=samples if graph.number_of_nodes() > samples else None,
+                seed=self.config.get('network_sample_seed', 0)
+            )[EGO]
             
-            # Calculate clustering coefficient
-            metrics['clustering'] = self._calculate_clustering(connections)
+            # Calculate clustering coefficient of the profile, the density among its connections
+            metrics['clustering'] = nx.clustering(graph, EGO)
             
             return metrics
             
@@ -407,13 +551,18 @@ class DataEnricher:
             self.monitoring.log_error(f"Error calculating network metrics: {str(e)}")
             return {}
             
-    def _detect_communities(self, connections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _detect_communities(self, graph: nx.Graph) -> List[Dict[str, Any]]:
         """Detect communities in the network."""
         try:
-            communities = []
+            # The profile ties to everyone and would merge every community, so leave it out
+            connections = graph.subgraph(node for node in graph if node != EGO)
             
-            # Implement community detection algorithm
-            # This is a placeholder for actual implementation
+            communities = [
+                {'id': index, 'size': len(members), 'members': sorted(map(str, members))}
+                for index, members in enumerate(
+                    sorted(nx.community.label_propagation_communities(connections), key=len, reverse=True)
+                )
+            ]
             
             return communities
             
@@ -421,7 +570,7 @@ class DataEnricher:
             self.monitoring.log_error(f"Error detecting communities: {str(e)}")
             return []
             
-    def _analyze_influence(self, connections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_influence(self, connections: List[Dict[str, Any]], metrics: Dict[str, float]) -> Dict[str, Any]:
         """Analyze influence in the network."""
         try:
             influence = {
@@ -430,18 +579,33 @@ class DataEnricher:
                 'factors': []
             }
             
-            # Calculate influence score
-            influence['score'] = self._calculate_influence_score(connections)
+            strengths = [connection.get('strength', 0) for connection in connections]
+            strong_tie = self.config.get('network_strong_tie', 0.7)
+            reach_scale = self.config.get('network_reach_scale', 10000)
             
             # Analyze influence metrics
             influence['metrics'] = {
-                'reach': self._calculate_reach(connections),
-                'engagement': self._calculate_engagement(connections),
-                'authority': self._calculate_authority(connections)
+                'reach': min(math.log1p(metrics.get('size', len(connections))) / math.log1p(reach_scale), 1.0),
+                'engagement': sum(strengths) / len(strengths) if strengths else 0,
+                'authority': sum(strength >= strong_tie for strength in strengths) / len(strengths) if strengths else 0
             }
             
+            # Calculate influence score
+            influence['score'] = (
+                0.4 * influence['metrics']['reach'] +
+                0.3 * influence['metrics']['engagement'] +
+                0.3 * influence['metrics']['authority']
+            )
+            
             # Identify influence factors
-            influence['factors'] = self._identify_influence_factors(connections)
+            factors = {
+                'wide_reach': influence['metrics']['reach'] > 0.5,
+                'engaged_connections': influence['metrics']['engagement'] > 0.5,
+                'strong_ties': influence['metrics']['authority'] > 0.5,
+                'broker': metrics.get('centrality', 0) > 0.5,
+                'tight_knit': metrics.get('clustering', 0) > 0.5
+            }
+            influence['factors'] = [factor for factor, present in factors.items() if present]
             
             return influence
             
@@ -4,14 +4,20 @@ Data Validator
 This module implements data validation for scraped data.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional, Sequence, Tuple
 import logging
-import re
-from jsonschema import validate, ValidationError
+import numpy as np
 from src.services.monitoring.monitoring import MonitoringService
+from .schema_compiler import compile_schema
 
 logger = logging.getLogger(__name__)
 
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+URL_PATTERN = r'^https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
+
+# Profile sections validated, each against its own schema
+SECTIONS = ('basic_info', 'content', 'engagement', 'network')
+
 class DataValidator:
     """Validates scraped data against schemas."""
     
@@ -21,258 +27,97 @@ class DataValidator:
         
         # Define validation schemas
         self.schemas = {
-            'profile': self._get_profile_schema(),
-            'content': self._get_content_schema(),
+            'basic_info': self._get_profile_schema(),
+            'content': {'type': 'array', 'items': self._get_content_schema()},
             'engagement': self._get_engagement_schema(),
             'network': self._get_network_schema()
         }
         
-    def validate_profile_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        # Schemas are compiled once per platform, on first use
+        self.validators: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        
+    def validate_profile_data(self, data: Dict[str, Any], platform: str = 'generic') -> Dict[str, Any]:
         """Validate profile data against schemas."""
         try:
-            validation_results = {
-                'basic_info': self._validate_basic_info(data.get('basic_info', {})),
-                'content': self._validate_content(data.get('content', [])),
-                'engagement': self._validate_engagement(data.get('engagement', {})),
-                'network': self._validate_network(data.get('network', {}))
-            }
-            
-            return validation_results
+            return self._get_validator(platform)(data)
             
         except Exception as e:
             self.monitoring.log_error(f"Error validating profile data: {str(e)}")
             return {}
             
-    def _validate_basic_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate basic profile information."""
-        try:
-            # Validate against schema
-            validate(instance=info, schema=self.schemas['profile'])
-            
-            # Additional validations
-            validation_results = {
-                'is_valid': True,
-                'errors': [],
-                'warnings': []
-            }
-            
-            # Validate required fields
-            required_fields = ['username', 'name', 'bio']
-            for field in required_fields:
-                if field not in info or not info[field]:
-                    validation_results['is_valid'] = False
-                    validation_results['errors'].append(f"Missing required field: {field}")
-                    
-            # Validate field formats
-            if 'email' in info and not self._validate_email(info['email']):
-                validation_results['is_valid'] = False
-                validation_results['errors'].append("Invalid email format")
-                
-            if 'website' in info and not self._validate_url(info['website']):
-                validation_results['is_valid'] = False
-                validation_results['errors'].append("Invalid website URL")
+    def validate_batch(
+        self,
+        profiles: List[Dict[str, Any]],
+        platforms: Optional[Sequence[str]] = None
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """Validate a batch of profiles, returning a mask of failed profiles and their results."""
+        results = []
+        for index, data in enumerate(profiles):
+            try:
+                validate = self._get_validator(platforms[index] if platforms is not None else 'generic')
+                results.append(validate(data))
+            except Exception as e:
+                self.monitoring.log_error(f"Error validating profile data: {str(e)}")
+                results.append({'is_valid': False, 'errors': [str(e)]})
                 
-            # Validate field lengths
-            if 'bio' in info and len(info['bio']) > 1000:
-                validation_results['warnings'].append("Bio exceeds recommended length")
+        failed = np.fromiter(
+            (not result['is_valid'] for result in results),
+            dtype=bool,
+            count=len(results)
+        )
+        return failed, results
+        
+    def _get_validator(self, platform: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Get the compiled validator of a platform, compiling it on first use."""
+        validator = self.validators.get(platform)
+        if validator is None:
+            validator = self._compile(platform)
+            self.validators[platform] = validator
+        return validator
+        
+    def _compile(self, platform: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Compile the section schemas of a platform into one validation function."""
+        # Platforms may override section schemas, e.g. to drop fields they never supply
+        schemas = {**self.schemas, **self.config.get('validation_schemas', {}).get(platform, {})}
+        sections = tuple(
+            (section, compile_schema(schemas[section], section), schemas[section].get('type') == 'array')
+            for section in SECTIONS
+        )
+        
+        def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+            validation_results = {}
+            all_errors = []
+            for section, check, is_array in sections:
+                errors: List[str] = []
+                warnings: List[str] = []
+                check(data.get(section, [] if is_array else {}), errors, warnings)
+                validation_results[section] = {'is_valid': not errors, 'errors': errors, 'warnings': warnings}
+                all_errors.extend(errors)
                 
+            # Roll section results up for callers that only need the verdict
+            validation_results['is_valid'] = not all_errors
+            validation_results['errors'] = all_errors
             return validation_results
             
-        except ValidationError as e:
-            return {
-                'is_valid': False,
-                'errors': [str(e)],
-                'warnings': []
-            }
-        except Exception as e:
-            self.monitoring.log_error(f"Error validating basic info: {str(e)}")
-            return {'is_valid': False, 'errors': [str(e)], 'warnings': []}
-            
-    def _validate_content(self, content: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Validate content data."""
-        try:
-            validation_results = {
-                'is_valid': True,
-                'errors': [],
-                'warnings': []
-            }
-            
-            for item in content:
-                try:
-                    # Validate against schema
-                    validate(instance=item, schema=self.schemas['content'])
-                    
-                    # Additional validations
-                    if 'text' in item and len(item['text']) > 5000:
-                        validation_results['warnings'].append(
-                            "Content text exceeds recommended length"
-                        )
-                        
-                    if 'media' in item:
-                        for media in item['media']:
-                            if not self._validate_media(media):
-                                validation_results['is_valid'] = False
-                                validation_results['errors'].append(
-                                    "Invalid media format"
-                                )
-                                
-                except ValidationError as e:
-                    validation_results['is_valid'] = False
-                    validation_results['errors'].append(str(e))
-                    
-            return validation_results
-            
-        except Exception as e:
-            self.monitoring.log_error(f"Error validating content: {str(e)}")
-            return {'is_valid': False, 'errors': [str(e)], 'warnings': []}
-            
-    def _validate_engagement(self, engagement: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate engagement data."""
-        try:
-            # Validate against schema
-            validate(instance=engagement, schema=self.schemas['engagement'])
-            
-            validation_results = {
-                'is_valid': True,
-                'errors': [],
-                'warnings': []
-            }
-            
-            # Validate numeric fields
-            numeric_fields = ['likes', 'comments', 'shares', 'views']
-            for field in numeric_fields:
-                if field in engagement:
-                    if not isinstance(engagement[field], (int, float)):
-                        validation_results['is_valid'] = False
-                        validation_results['errors'].append(
-                            f"Invalid {field} value: must be numeric"
-                        )
-                    elif engagement[field] < 0:
-                        validation_results['is_valid'] = False
-                        validation_results['errors'].append(
-                            f"Invalid {field} value: must be non-negative"
-                        )
-                        
-            # Validate rates
-            if 'engagement_rate' in engagement:
-                rate = engagement['engagement_rate']
-                if not isinstance(rate, (int, float)) or rate < 0 or rate > 1:
-                    validation_results['is_valid'] = False
-                    validation_results['errors'].append(
-                        "Invalid engagement rate: must be between 0 and 1"
-                    )
-                    
-            return validation_results
-            
-        except ValidationError as e:
-            return {
-                'is_valid': False,
-                'errors': [str(e)],
-                'warnings': []
-            }
-        except Exception as e:
-            self.monitoring.log_error(f"Error validating engagement: {str(e)}")
-            return {'is_valid': False, 'errors': [str(e)], 'warnings': []}
-            
-    def _validate_network(self, network: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate network data."""
-        try:
-            # Validate against schema
-            validate(instance=network, schema=self.schemas['network'])
-            
-            validation_results = {
-                'is_valid': True,
-                'errors': [],
-                'warnings': []
-            }
-            
-            # Validate connections
-            if 'connections' in network:
-                for connection in network['connections']:
-                    if not self._validate_connection(connection):
-                        validation_results['is_valid'] = False
-                        validation_results['errors'].append(
-                            "Invalid connection format"
-                        )
-                        
-            # Validate metrics
-            if 'metrics' in network:
-                metrics = network['metrics']
-                if not self._validate_metrics(metrics):
-                    validation_results['is_valid'] = False
-                    validation_results['errors'].append(
-                        "Invalid metrics format"
-                    )
-                    
-            return validation_results
-            
-        except ValidationError as e:
-            return {
-                'is_valid': False,
-                'errors': [str(e)],
-                'warnings': []
-            }
-        except Exception as e:
-            self.monitoring.log_error(f"Error validating network: {str(e)}")
-            return {'is_valid': False, 'errors': [str(e)], 'warnings': []}
-            
-    def _validate_email(self, email: str) -> bool:
-        """Validate email format."""
-        try:
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return bool(re.match(pattern, email))
-        except:
-            return False
-            
-    def _validate_url(self, url: str) -> bool:
-        """Validate URL format."""
-        try:
-            pattern = r'^https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
-            return bool(re.match(pattern, url))
-        except:
-            return False
-            
-    def _validate_media(self, media: Dict[str, Any]) -> bool:
-        """Validate media format."""
-        try:
-            required_fields = ['type', 'url']
-            return all(field in media for field in required_fields)
-        except:
-            return False
-            
-    def _validate_connection(self, connection: Dict[str, Any]) -> bool:
-        """Validate connection format."""
-        try:
-            required_fields = ['id', 'type']
-            return all(field in connection for field in required_fields)
-        except:
-            return False
-            
-    def _validate_metrics(self, metrics: Dict[str, Any]) -> bool:
-        """Validate metrics format."""
-        try:
-            required_fields = ['size', 'density']
-            return all(field in metrics for field in required_fields)
-        except:
-            return False
-            
+        return validate
+        
     def _get_profile_schema(self) -> Dict[str, Any]:
         """Get profile validation schema."""
         return {
             'type': 'object',
             'properties': {
-                'username': {'type': 'string'},
-                'name': {'type': 'string'},
-                'bio': {'type': 'string'},
-                'email': {'type': 'string'},
-                'website': {'type': 'string'},
+                'username': {'type': 'string', 'minLength': 1},
+                'name': {'type': 'string', 'minLength': 1},
+                'bio': {'type': 'string', 'minLength': 1, 'warnMaxLength': 1000},
+                'email': {'type': 'string', 'pattern': EMAIL_PATTERN},
+                'website': {'type': 'string', 'pattern': URL_PATTERN},
                 'location': {'type': 'string'},
                 'profile_picture': {'type': 'string'},
                 'banner_image': {'type': 'string'},
                 'join_date': {'type': 'string'},
                 'last_active': {'type': 'string'}
             },
-            'required': ['username', 'name']
+            'required': ['username', 'name', 'bio']
         }
         
     def _get_content_schema(self) -> Dict[str, Any]:
@@ -282,7 +127,7 @@ class DataValidator:
             'properties': {
                 'id': {'type': 'string'},
                 'type': {'type': 'string'},
-                'text': {'type': 'string'},
+                'text': {'type': 'string', 'warnMaxLength': 5000},
                 'media': {
                     'type': 'array',
                     'items': {
@@ -313,11 +158,11 @@ class DataValidator:
         return {
             'type': 'object',
             'properties': {
-                'likes': {'type': 'number'},
-                'comments': {'type': 'number'},
-                'shares': {'type': 'number'},
-                'views': {'type': 'number'},
-                'engagement_rate': {'type': 'number'},
+                'likes': {'type': 'number', 'minimum': 0},
+                'comments': {'type': 'number', 'minimum': 0},
+                'shares': {'type': 'number', 'minimum': 0},
+                'views': {'type': 'number', 'minimum': 0},
+                'engagement_rate': {'type': 'number', 'minimum': 0, 'maximum': 1},
                 'quality_score': {'type': 'number'}
             }
         }
@@ -0,0 +1,96 @@
+"""
+Date Parser
+
+This module implements the date parser used by the DataCleaner. The first format that
+parses a value from a source is locked in for that source: later values are read with it,
+and only values it cannot parse fall back to the other formats, without changing the
+lock. Ambiguous day/month values therefore read the same way whatever order they arrive
+in. ISO-8601 strings take the `datetime.fromisoformat` fast path, and repeated strings
+are served from an LRU cache keyed on the source's locked format.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable
+from datetime import datetime
+from functools import lru_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Marker for values parsed by datetime.fromisoformat
+ISO_FORMAT = 'iso8601'
+
+# Formats tried, in order, for sources whose format is not yet known; day-first
+# wins for ambiguous d/m values
+DATE_FORMATS = [
+    ISO_FORMAT,
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%B %d, %Y',
+    '%d %B %Y',
+    '%b %d, %Y',
+    '%d %b %Y',
+    '%a %b %d %H:%M:%S %z %Y'
+]
+
+class DateParser:
+    """Parses scraped dates, remembering the format each source uses."""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.formats: List[str] = config.get('date_formats', DATE_FORMATS)
+        self.source_formats: Dict[str, str] = {}
+        self._parse_cached = lru_cache(maxsize=config.get('date_cache_size', 4096))(self._parse)
+        
+    def parse(self, value: Any, source: str = 'default') -> Optional[datetime]:
+        """Parse a date value, returning None if no known format matches."""
+        if isinstance(value, datetime):
+            return value
+        if not value:
+            return None
+        return self._parse_cached(str(value).strip(), source, self.source_formats.get(source))
+        
+    def parse_many(self, values: Iterable[Any], source: str = 'default') -> List[Optional[datetime]]:
+        """Parse a list of date values from one source, parsing each distinct value once."""
+        values = list(values)
+        parsed = {}
+        for value in values:
+            key = value if isinstance(value, str) else repr(value)
+            if key not in parsed:
+                parsed[key] = self.parse(value, source)
+        return [parsed[value if isinstance(value, str) else repr(value)] for value in values]
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache usage and the format detected per source."""
+        info = self._parse_cached.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'cache_hits': info.hits,
+            'cache_misses': info.misses,
+            'cache_hit_rate': info.hits / lookups if lookups else 0.0,
+            'source_formats': dict(self.source_formats)
+        }
+        
+    def _parse(self, text: str, source: str, known: Optional[str]) -> Optional[datetime]:
+        """Parse a string, trying the source's locked format before the others."""
+        candidates = [known] + [fmt for fmt in self.formats if fmt != known] if known else self.formats
+        
+        for fmt in candidates:
+            parsed = self._try_format(text, fmt)
+            if parsed is not None:
+                # Lock the first format detected; later misses only fall back
+                if known is None:
+                    self.source_formats.setdefault(source, fmt)
+                return parsed
+                
+        logger.debug(f"Unrecognized date format from {source}: {text!r}")
+        return None
+        
+    def _try_format(self, text: str, fmt: str) -> Optional[datetime]:
+        """Parse a string with one format."""
+        try:
+            if fmt == ISO_FORMAT:
+                return datetime.fromisoformat(text)
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            return None
@@ -5,22 +5,52 @@ This module implements multi-dimensional scoring for prospects in the discovery
 evaluating various aspects of potential affiliates.
 """
 
-from typing import Dict, Any
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+from itertools import chain
+from operator import methodcaller
 import logging
+import numbers
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 
 from src.services.monitoring.monitoring import MonitoringService
 
 logger = logging.getLogger(__name__)
 
+# Sub-score weights within each dimension
+AUDIENCE_QUALITY_WEIGHTS = {'size': 0.3, 'density': 0.2, 'centrality': 0.3, 'clustering': 0.2}
+CONTENT_RELEVANCE_WEIGHTS = {'volume': 0.3, 'engagement': 0.3, 'diversity': 0.2, 'quality': 0.2}
+INFLUENCE_LEVEL_WEIGHTS = {'followers': 0.4, 'engagement': 0.3, 'influence': 0.3}
+CONVERSION_POTENTIAL_WEIGHTS = {'ctr': 0.3, 'conversion_rate': 0.3, 'content_potential': 0.4}
+ENGAGEMENT_PROPENSITY_WEIGHTS = {'response_rate': 0.3, 'response_time': 0.2, 'content_engagement': 0.5}
+
+# Prospect-level and post-level fields packed into columns for batch scoring
+PROFILE_COLUMNS = (
+    'size', 'density', 'centrality', 'clustering', 'followers', 'engagement_rate',
+    'click_through_rate', 'conversion_rate', 'response_rate', 'avg_response_time'
+)
+POST_COLUMNS = ('likes', 'comments', 'shares', 'clicks', 'conversions')
+
+# Post engagement features read from the cleaner's full-history `content_stats`
+# rather than the sampled posts: posts seen, mean per post and share of posts with any
+HISTORY_METRICS = ('likes', 'comments', 'shares')
+HISTORY_COLUMNS = ('count',) + HISTORY_METRICS + tuple(f'{metric}_posted' for metric in HISTORY_METRICS)
+
+# Exact types accepted without an ABC check when packing
+NUMERIC_TYPES = frozenset({int, float, bool, np.int64, np.float64})
+
+# Post field readers, with the same defaults as the scalar scoring path
+GET_ENGAGEMENT = methodcaller('get', 'engagement', {})
+GET_TEXT = methodcaller('get', 'text')
+GET_MEDIA = methodcaller('get', 'media')
+GET_TYPE = methodcaller('get', 'type')
+POST_GETTERS = tuple(methodcaller('get', field, 0) for field in POST_COLUMNS)
+
 class ProspectScorer:
     """Scores prospects based on multiple dimensions."""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.monitoring = MonitoringService()
-        self.scaler = MinMaxScaler()
         
         # Initialize scoring weights
         self.weights = {
@@ -66,6 +96,240 @@ class ProspectScorer:
             self.monitoring.log_error(f"Error scoring prospect: {str(e)}")
             raise
             
+    async def score_batch(self, prospects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Score many prospects at once with vectorized NumPy operations."""
+        try:
+            columns = self._pack_prospects(prospects)
+            dimension_scores = self._score_columns(columns, len(prospects))
+            
+            # Calculate weighted composite score
+            composite_scores = np.zeros(len(prospects))
+            for dimension, weight in self.weights.items():
+                composite_scores = composite_scores + dimension_scores[dimension] * weight
+            composite_scores = np.clip(composite_scores, 0, 1).tolist()
+            dimension_lists = {dimension: scores.tolist() for dimension, scores in dimension_scores.items()}
+            
+            results = []
+            for index, prospect_data in enumerate(prospects):
+                if index in columns['fallback']:
+                    # Malformed fields get the per-dimension error handling of the scalar path
+                    results.append(await self.score_prospect(prospect_data))
+                    continue
+                    
+                results.append({
+                    'composite_score': composite_scores[index],
+                    'dimension_scores': {
+                        dimension: scores[index] for dimension, scores in dimension_lists.items()
+                    },
+                    'weights': self.weights
+                })
+                
+            return results
+            
+        except Exception as e:
+            self.monitoring.log_error(f"Error scoring prospect batch: {str(e)}")
+            raise
+            
+    def _pack_prospects(self, prospects: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Pack prospect and post fields into NumPy columns."""
+        profile_rows = []
+        post_columns: List[List[Any]] = [[] for _ in POST_COLUMNS]
+        has_text: List[bool] = []
+        has_media: List[bool] = []
+        post_types: List[Any] = []
+        valid: List[int] = []
+        post_counts: List[int] = []
+        history_rows: List[Tuple[float, ...]] = []
+        streamed: List[int] = []
+        fallback = set()
+        
+        for index, data in enumerate(prospects):
+            try:
+                metrics = data.get('network', {}).get('metrics', {})
+                engagement = data.get('engagement', {})
+                profile_row = (
+                    metrics.get('size', 0),
+                    metrics.get('density', 0),
+                    metrics.get('centrality', 0),
+                    metrics.get('clustering', 0),
+                    engagement.get('followers', 0),
+                    engagement.get('engagement_rate', 0),
+                    engagement.get('click_through_rate', 0),
+                    engagement.get('conversion_rate', 0),
+                    engagement.get('response_rate', 0),
+                    engagement.get('avg_response_time', 0)
+                )
+                
+                # Read each post field column-wise so the lookups run in C
+                content = data.get('content', [])
+                engagements = list(map(GET_ENGAGEMENT, content))
+                values = [list(map(getter, engagements)) for getter in POST_GETTERS]
+                texts = list(map(bool, map(GET_TEXT, content)))
+                media = list(map(bool, map(GET_MEDIA, content)))
+                types = list(map(GET_TYPE, content))
+                
+                # Full-history features replace the sampled posts' where the cleaner streamed them
+                history = self._streamed_history(data)
+                history_row = tuple(history[name] for name in HISTORY_COLUMNS) if history is not None else None
+                
+                # Post types must be hashable, as the scalar path collects them in a set
+                dict.fromkeys(types)
+                if not self._all_numeric(chain(profile_row, history_row or (), *values)):
+                    raise TypeError("non-numeric metric")
+                    
+            except Exception:
+                fallback.add(index)
+                continue
+                
+            profile_rows.append(profile_row)
+            if history_row is not None:
+                history_rows.append(history_row)
+                streamed.append(index)
+            for column, column_values in zip(post_columns, values):
+                column.extend(column_values)
+            has_text.extend(texts)
+            has_media.extend(media)
+            post_types.extend(types)
+            valid.append(index)
+            post_counts.append(len(content))
+            
+        # Prospects scored by the scalar path still need a row to keep indices aligned
+        profile = np.zeros((len(prospects), len(PROFILE_COLUMNS)))
+        if valid:
+            profile[valid] = np.asarray(profile_rows, dtype=float)
+            
+        history = np.zeros((len(prospects), len(HISTORY_COLUMNS)))
+        if streamed:
+            history[streamed] = np.asarray(history_rows, dtype=float)
+        has_history = np.zeros(len(prospects), dtype=bool)
+        has_history[streamed] = True
+        
+        type_codes = {post_type: code for code, post_type in enumerate(dict.fromkeys(post_types))}
+        codes = np.fromiter(map(type_codes.__getitem__, post_types), dtype=np.int64, count=len(post_types))
+        promotional = codes == type_codes['promotional'] if 'promotional' in type_codes else np.zeros(len(codes), dtype=bool)
+        
+        return {
+            'profile': {name: profile[:, i] for i, name in enumerate(PROFILE_COLUMNS)},
+            'history': {name: history[:, i] for i, name in enumerate(HISTORY_COLUMNS)},
+            'has_history': has_history,
+            'posts': {
+                name: np.asarray(column, dtype=float) for name, column in zip(POST_COLUMNS, post_columns)
+            },
+            'flags': (np.asarray(has_text, dtype=bool), np.asarray(has_media, dtype=bool), promotional),
+            'types': codes,
+            'type_count': max(len(type_codes), 1),
+            'owners': np.repeat(np.asarray(valid, dtype=np.int64), post_counts),
+            'fallback': fallback
+        }
+        
+    def _all_numeric(self, values: Iterable[Any]) -> bool:
+        """Check that values are real numbers, as the scalar scoring arithmetic requires."""
+        value_types = set(map(type, values))
+        if value_types <= NUMERIC_TYPES:
+            return True
+        return all(issubclass(value_type, numbers.Real) for value_type in value_types)
+        
+    def _score_columns(self, columns: Dict[str, Any], count: int) -> Dict[str, np.ndarray]:
+        """Score every dimension for all packed prospects."""
+        profile = columns['profile']
+        posts = columns['posts']
+        has_text, has_media, promotional = columns['flags']
+        owners = columns['owners']
+        
+        post_counts = np.bincount(owners, minlength=count)
+        safe_counts = np.maximum(post_counts, 1)
+        
+        def post_mean(values: np.ndarray) -> np.ndarray:
+            return np.bincount(owners, weights=values, minlength=count) / safe_counts
+            
+        def normalize(values: np.ndarray, min_val: float, max_val: float) -> np.ndarray:
+            # fmin/fmax skip NaN like the scalar min/max clamp does, so NaN and inf
+            # metrics normalize to the same finite scores on both paths
+            return np.fmax(0.0, np.fmin(1.0, (values - min_val) / (max_val - min_val)))
+            
+        def flag_score(*terms) -> np.ndarray:
+            score = np.zeros(len(owners))
+            for condition, points in terms:
+                score = score + np.where(condition, points, 0.0)
+            return score
+            
+        likes_posted = posts['likes'] > 0
+        comments_posted = posts['comments'] > 0
+        
+        # Post counts and engagement over the full history where the cleaner streamed it
+        streamed = columns['has_history']
+        history = columns['history']
+        
+        def from_history(name: str, sampled: np.ndarray) -> np.ndarray:
+            return np.where(streamed, history[name], sampled)
+            
+        volume = from_history('count', post_counts.astype(float))
+        mean_engagement = (
+            from_history('likes', post_mean(posts['likes'])) +
+            from_history('comments', post_mean(posts['comments'])) +
+            from_history('shares', post_mean(posts['shares']))
+        )
+        likes_rate = from_history('likes_posted', post_mean(likes_posted.astype(float)))
+        comments_rate = from_history('comments_posted', post_mean(comments_posted.astype(float)))
+        shares_rate = from_history('shares_posted', post_mean((posts['shares'] > 0).astype(float)))
+        
+        # Audience quality
+        weights = AUDIENCE_QUALITY_WEIGHTS
+        audience_quality = (
+            normalize(profile['size'], 0, 1000000) * weights['size'] +
+            normalize(profile['density'], 0, 1) * weights['density'] +
+            normalize(profile['centrality'], 0, 1) * weights['centrality'] +
+            normalize(profile['clustering'], 0, 1) * weights['clustering']
+        )
+        
+        # Content relevance
+        weights = CONTENT_RELEVANCE_WEIGHTS
+        distinct_pairs = np.unique(owners * columns['type_count'] + columns['types'])
+        distinct_types = np.bincount(distinct_pairs // columns['type_count'], minlength=count)
+        quality = post_mean(flag_score((has_text, 0.3), (has_media, 0.3))) + likes_rate * 0.2 + comments_rate * 0.2
+        content_relevance = np.where(
+            post_counts > 0,
+            normalize(volume, 0, 100) * weights['volume'] +
+            normalize(mean_engagement, 0, 1000) * weights['engagement'] +
+            distinct_types / 5 * weights['diversity'] +
+            quality * weights['quality'],
+            0.0
+        )
+        
+        # Influence level
+        weights = INFLUENCE_LEVEL_WEIGHTS
+        influence_level = (
+            normalize(profile['followers'], 0, 1000000) * weights['followers'] +
+            normalize(profile['engagement_rate'], 0, 1) * weights['engagement'] +
+            normalize(profile['centrality'], 0, 1) * weights['influence']
+        )
+        
+        # Conversion potential
+        weights = CONVERSION_POTENTIAL_WEIGHTS
+        conversion = flag_score((promotional, 0.4), (posts['clicks'] > 0, 0.3), (posts['conversions'] > 0, 0.3))
+        conversion_potential = (
+            normalize(profile['click_through_rate'], 0, 1) * weights['ctr'] +
+            normalize(profile['conversion_rate'], 0, 1) * weights['conversion_rate'] +
+            post_mean(conversion) * weights['content_potential']
+        )
+        
+        # Engagement propensity
+        weights = ENGAGEMENT_PROPENSITY_WEIGHTS
+        engagement = likes_rate * 0.3 + comments_rate * 0.4 + shares_rate * 0.3
+        engagement_propensity = (
+            normalize(profile['response_rate'], 0, 1) * weights['response_rate'] +
+            (1 - normalize(profile['avg_response_time'], 0, 24)) * weights['response_time'] +
+            engagement * weights['content_engagement']
+        )
+        
+        return {
+            'audience_quality': audience_quality,
+            'content_relevance': content_relevance,
+            'influence_level': influence_level,
+            'conversion_potential': conversion_potential,
+            'engagement_propensity': engagement_propensity
+        }
+        
     async def _score_audience_quality(self, data: Dict[str, Any]) -> float:
         """Score audience quality dimension."""
         try:
@@ -85,12 +349,7 @@ class ProspectScorer:
             clustering_score = self._normalize_score(clustering, 0, 1)
             
             # Calculate weighted score
-            weights = {
-                'size': 0.3,
-                'density': 0.2,
-                'centrality': 0.3,
-                'clustering': 0.2
-            }
+            weights = AUDIENCE_QUALITY_WEIGHTS
             
             score = (
                 size_score * weights['size'] +
@@ -112,14 +371,10 @@ class ProspectScorer:
             if not content:
                 return 0.0
                 
-            # Calculate content metrics
-            total_posts = len(content)
-            avg_engagement = np.mean([
-                post.get('engagement', {}).get('likes', 0) +
-                post.get('engagement', {}).get('comments', 0) +
-                post.get('engagement', {}).get('shares', 0)
-                for post in content
-            ])
+            # Calculate content metrics over the full history when it was streamed
+            history = self._history_features(data)
+            total_posts = history['count']
+            avg_engagement = history['likes'] + history['comments'] + history['shares']
             
             # Calculate content diversity
             content_types = set(post.get('type') for post in content)
@@ -133,21 +388,12 @@ class ProspectScorer:
                     score += 0.3
                 if post.get('media'):
                     score += 0.3
-                if post.get('engagement', {}).get('likes', 0) > 0:
-                    score += 0.2
-                if post.get('engagement', {}).get('comments', 0) > 0:
-                    score += 0.2
                 quality_scores.append(score)
             
-            avg_quality = np.mean(quality_scores) if quality_scores else 0
+            avg_quality = np.mean(quality_scores) + history['likes_posted'] * 0.2 + history['comments_posted'] * 0.2
             
             # Calculate weighted score
-            weights = {
-                'volume': 0.3,
-                'engagement': 0.3,
-                'diversity': 0.2,
-                'quality': 0.2
-            }
+            weights = CONTENT_RELEVANCE_WEIGHTS
             
             score = (
                 self._normalize_score(total_posts, 0, 100) * weights['volume'] +
@@ -179,11 +425,7 @@ class ProspectScorer:
             influence_score = self._normalize_score(influence_score, 0, 1)
             
             # Calculate weighted score
-            weights = {
-                'followers': 0.4,
-                'engagement': 0.3,
-                'influence': 0.3
-            }
+            weights = INFLUENCE_LEVEL_WEIGHTS
             
             score = (
                 follower_score * weights['followers'] +
@@ -222,11 +464,7 @@ class ProspectScorer:
             avg_conversion_potential = np.mean(conversion_scores) if conversion_scores else 0
             
             # Calculate weighted score
-            weights = {
-                'ctr': 0.3,
-                'conversion_rate': 0.3,
-                'content_potential': 0.4
-            }
+            weights = CONVERSION_POTENTIAL_WEIGHTS
             
             score = (
                 self._normalize_score(click_through_rate, 0, 1) * weights['ctr'] +
@@ -250,26 +488,16 @@ class ProspectScorer:
             response_rate = engagement.get('response_rate', 0)
             response_time = engagement.get('avg_response_time', 0)
             
-            # Calculate content engagement
-            engagement_scores = []
-            for post in content:
-                score = 0
-                if post.get('engagement', {}).get('likes', 0) > 0:
-                    score += 0.3
-                if post.get('engagement', {}).get('comments', 0) > 0:
-                    score += 0.4
-                if post.get('engagement', {}).get('shares', 0) > 0:
-                    score += 0.3
-                engagement_scores.append(score)
-            
-            avg_engagement = np.mean(engagement_scores) if engagement_scores else 0
+            # Calculate content engagement over the full history when it was streamed
+            history = self._history_features(data)
+            avg_engagement = (
+                history['likes_posted'] * 0.3 +
+                history['comments_posted'] * 0.4 +
+                history['shares_posted'] * 0.3
+            )
             
             # Calculate weighted score
-            weights = {
-                'response_rate': 0.3,
-                'response_time': 0.2,
-                'content_engagement': 0.5
-            }
+            weights = ENGAGEMENT_PROPENSITY_WEIGHTS
             
             score = (
                 self._normalize_score(response_rate, 0, 1) * weights['response_rate'] +
@@ -283,6 +511,37 @@ class ProspectScorer:
             self.monitoring.log_error(f"Error scoring engagement propensity: {str(e)}")
             return 0.0
             
+    def _history_features(self, data: Dict[str, Any]) -> Dict[str, float]:
+        """Posts seen and per-post engagement, over the full history in `content_stats` if present."""
+        features = self._streamed_history(data)
+        if features is not None:
+            return features
+            
+        # Without streamed statistics the posts given are the whole history
+        content = data.get('content', [])
+        features = {'count': len(content)}
+        for metric in HISTORY_METRICS:
+            values = [post.get('engagement', {}).get(metric, 0) for post in content]
+            features[metric] = np.mean(values) if values else 0
+            features[f'{metric}_posted'] = np.mean([value > 0 for value in values]) if values else 0
+        return features
+        
+    def _streamed_history(self, data: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """History features from the cleaner's `content_stats`, or None if it has none."""
+        stats = data.get('content_stats') or {}
+        count = stats.get('count', 0)
+        engagement = stats.get('engagement', {})
+        summaries = [engagement.get(metric) or {} for metric in HISTORY_METRICS]
+        if not count or not all('positive' in summary for summary in summaries):
+            return None
+            
+        features = {'count': count}
+        for metric, summary in zip(HISTORY_METRICS, summaries):
+            # Posts without the metric count as zero, as they do per post
+            features[metric] = summary['mean'] * summary['count'] / count
+            features[f'{metric}_posted'] = summary['positive'] / count
+        return features
+        
     async def _calculate_composite_score(self, dimension_scores: Dict[str, float]) -> float:
         """Calculate weighted composite score."""
         try:
@@ -0,0 +1,171 @@
+"""
+Schema Compiler
+
+This module compiles the JSON Schema subset used to describe scraped data into nested
+Python closures. Type tests, field accessors, required-field lists and regexes are
+resolved once at compile time, and object checks only visit the fields a record
+actually has. Subschemas using keywords outside the subset are delegated to a
+jsonschema validator built once at compile time.
+"""
+
+from typing import Dict, List, Any, Callable
+import logging
+import numbers
+import re
+from jsonschema import Draft7Validator
+
+logger = logging.getLogger(__name__)
+
+# check(value, errors, warnings) appends messages for a value; no errors means valid
+Check = Callable[[Any, List[str], List[str]], None]
+
+# Keywords compiled natively; warnMaxLength is a local extension yielding warnings
+SUPPORTED_KEYWORDS = frozenset({
+    'type', 'properties', 'required', 'items', 'minLength', 'maxLength',
+    'minimum', 'maximum', 'pattern', 'warnMaxLength', 'title', 'description'
+})
+
+def _is_number(value: Any) -> bool:
+    return type(value) is int or type(value) is float or (
+        isinstance(value, numbers.Number) and not isinstance(value, bool)
+    )
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, numbers.Integral) and not isinstance(value, bool)
+
+TYPE_TESTS: Dict[str, Callable[[Any], bool]] = {
+    'string': lambda value: isinstance(value, str),
+    'number': _is_number,
+    'integer': _is_integer,
+    'boolean': lambda value: value is True or value is False,
+    'object': lambda value: isinstance(value, dict),
+    'array': lambda value: isinstance(value, list),
+    'null': lambda value: value is None
+}
+
+# Types a plain isinstance check decides, inlined for leaf properties
+TYPE_CLASSES = {'string': str, 'object': dict, 'array': list}
+
+def compile_schema(schema: Dict[str, Any], path: str = '') -> Check:
+    """Compile a schema into a check reporting errors under `path`."""
+    if not set(schema) <= SUPPORTED_KEYWORDS:
+        return _compile_fallback(schema, path)
+        
+    type_name = schema.get('type')
+    type_test = _compile_type(type_name)
+    required = tuple(schema.get('required', ()))
+    properties = {
+        key: _compile_property(subschema, f"{path}.{key}" if path else key)
+        for key, subschema in schema.get('properties', {}).items()
+    }
+    item_check = compile_schema(schema['items'], f"{path}[]") if 'items' in schema else None
+    bounds = tuple(_compile_bounds(schema, path))
+    
+    def check(value: Any, errors: List[str], warnings: List[str]):
+        # A value of the wrong type fails once, without running checks meant for the right type
+        if type_test is not None and not type_test(value):
+            errors.append(f"{path}: {value!r} is not of type {type_name!r}")
+            return
+            
+        if isinstance(value, dict):
+            for key in required:
+                if key not in value:
+                    errors.append(f"{path}: {key!r} is a required property")
+                    
+            # Walk the record's own fields; properties it does not supply cost nothing
+            if properties:
+                for key, item in value.items():
+                    compiled = properties.get(key)
+                    if compiled is None:
+                        continue
+                    leaf_class, leaf_type, leaf_path, property_check = compiled
+                    if leaf_class is not None:
+                        if not isinstance(item, leaf_class):
+                            errors.append(f"{leaf_path}: {item!r} is not of type {leaf_type!r}")
+                    else:
+                        property_check(item, errors, warnings)
+                        
+        elif item_check is not None and isinstance(value, list):
+            for item in value:
+                item_check(item, errors, warnings)
+                
+        for bound in bounds:
+            bound(value, errors, warnings)
+            
+    return check
+
+def _compile_property(schema: Dict[str, Any], path: str) -> tuple:
+    """Compile a property, inlining checks that only test a single class."""
+    if set(schema) <= {'type', 'title', 'description'} and schema.get('type') in TYPE_CLASSES:
+        return TYPE_CLASSES[schema['type']], schema['type'], path, None
+    return None, None, path, compile_schema(schema, path)
+
+def _compile_type(type_name: Any) -> Any:
+    """Resolve a type keyword, or a list of them, to one test."""
+    if type_name is None:
+        return None
+    if isinstance(type_name, str):
+        return TYPE_TESTS[type_name]
+    tests = tuple(TYPE_TESTS[name] for name in type_name)
+    return lambda value: any(test(value) for test in tests)
+
+def _compile_bounds(schema: Dict[str, Any], path: str) -> List[Check]:
+    """Compile length, range and pattern keywords."""
+    steps: List[Check] = []
+    
+    if 'minLength' in schema or 'maxLength' in schema:
+        min_length = schema.get('minLength', 0)
+        max_length = schema.get('maxLength', float('inf'))
+        
+        def check_length(value: Any, errors: List[str], warnings: List[str]):
+            if isinstance(value, str):
+                if len(value) < min_length:
+                    errors.append(f"{path}: {value!r} is too short")
+                elif len(value) > max_length:
+                    errors.append(f"{path}: {value!r} is too long")
+        steps.append(check_length)
+        
+    if 'minimum' in schema or 'maximum' in schema:
+        minimum = schema.get('minimum', float('-inf'))
+        maximum = schema.get('maximum', float('inf'))
+        
+        def check_range(value: Any, errors: List[str], warnings: List[str]):
+            if _is_number(value):
+                if value < minimum:
+                    errors.append(f"{path}: {value!r} is less than the minimum of {minimum}")
+                elif value > maximum:
+                    errors.append(f"{path}: {value!r} is greater than the maximum of {maximum}")
+        steps.append(check_range)
+        
+    if 'pattern' in schema:
+        search = re.compile(schema['pattern']).search
+        pattern = schema['pattern']
+        
+        def check_pattern(value: Any, errors: List[str], warnings: List[str]):
+            if isinstance(value, str) and search(value) is None:
+                errors.append(f"{path}: {value!r} does not match {pattern!r}")
+        steps.append(check_pattern)
+        
+    if 'warnMaxLength' in schema:
+        warn_length = schema['warnMaxLength']
+        
+        def check_recommended_length(value: Any, errors: List[str], warnings: List[str]):
+            if isinstance(value, str) and len(value) > warn_length:
+                warnings.append(f"{path} exceeds recommended length of {warn_length}")
+        steps.append(check_recommended_length)
+        
+    return steps
+
+def _compile_fallback(schema: Dict[str, Any], path: str) -> Check:
+    """Delegate a subschema with keywords outside the compiled subset to jsonschema."""
+    Draft7Validator.check_schema(schema)
+    validator = Draft7Validator(schema)
+    logger.debug(f"Schema at {path or 'root'} uses keywords outside the compiled subset")
+    
+    def check(value: Any, errors: List[str], warnings: List[str]):
+        for error in validator.iter_errors(value):
+            location = ''.join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in error.path)
+            errors.append(f"{path}{location}: {error.message}")
+    return check
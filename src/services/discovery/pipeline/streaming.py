@@ -0,0 +1,129 @@
+"""
+Streaming Aggregates
+
+This module implements bounded-memory aggregates for per-profile collections such as
+post histories and follower lists. Each consumes an iterable once and keeps state
+sized by its budget rather than by the account: online mean and variance, reservoir
+samples and approximate top-K counts.
+"""
+
+from typing import Dict, List, Any, Iterable, Iterator, Hashable, Tuple
+import heapq
+import itertools
+import math
+import random
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most `size` items without materializing it."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+class RunningStats:
+    """Online count, mean, variance, range and positive count using Welford's algorithm."""
+    
+    def __init__(self):
+        self.count = 0
+        self.positive = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        
+    def add(self, value: float):
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value > 0:
+            self.positive += 1
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+            
+    @property
+    def variance(self) -> float:
+        """Population variance of the observations so far."""
+        return self.m2 / self.count if self.count else 0.0
+        
+    def to_dict(self) -> Dict[str, float]:
+        """Summarize the observations."""
+        return {
+            'count': self.count,
+            'positive': self.positive,
+            'mean': self.mean,
+            'variance': self.variance,
+            'min': self.minimum if self.count else 0.0,
+            'max': self.maximum if self.count else 0.0
+        }
+
+class Reservoir:
+    """Uniform sample of at most `size` items from a stream of unknown length."""
+    
+    def __init__(self, size: int, seed: int = 0):
+        self.size = size
+        self.seen = 0
+        self.items: List[Tuple[int, Any]] = []
+        self.rng = random.Random(seed)
+        
+    def add(self, item: Any):
+        """Offer one item, keeping it with probability size / seen."""
+        if len(self.items) < self.size:
+            self.items.append((self.seen, item))
+        else:
+            slot = self.rng.randrange(self.seen + 1)
+            if slot < self.size:
+                self.items[slot] = (self.seen, item)
+        self.seen += 1
+        
+    @property
+    def sampled(self) -> bool:
+        """Whether items were dropped from the stream."""
+        return self.seen > self.size
+        
+    def sample(self) -> List[Any]:
+        """Get the sampled items in stream order."""
+        return [item for _, item in sorted(self.items, key=lambda entry: entry[0])]
+
+class TopK:
+    """Approximate most frequent keys of a stream in `size` counters (Space-Saving)."""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.counts: Dict[Hashable, int] = {}
+        self.heap: List[Tuple[int, int, Hashable]] = []
+        self._order = itertools.count()
+        
+    def add(self, key: Hashable, count: int = 1):
+        """Count occurrences of a key."""
+        if key in self.counts:
+            self.counts[key] += count
+        elif len(self.counts) < self.size:
+            self.counts[key] = count
+        else:
+            # Replace the smallest counter; its count bounds the new key's overestimate
+            smallest = self._pop_smallest()
+            self.counts[key] = self.counts.pop(smallest) + count
+        heapq.heappush(self.heap, (self.counts[key], next(self._order), key))
+        
+        # Heap entries go stale as counts grow; compact before they outnumber the counters
+        if len(self.heap) > 4 * self.size:
+            self.heap = [(value, next(self._order), key) for key, value in self.counts.items()]
+            heapq.heapify(self.heap)
+            
+    def most_common(self, n: int = None) -> List[Tuple[Hashable, int]]:
+        """Get keys by descending count."""
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:n] if n is not None else ranked
+        
+    def _pop_smallest(self) -> Hashable:
+        """Pop the key holding the smallest live counter."""
+        while True:
+            value, _, key = heapq.heappop(self.heap)
+            if self.counts.get(key) == value:
+                return key
@@ -0,0 +1,56 @@
+"""
+Text Normalizer
+
+This module implements the fast text normalization used by the DataCleaner. Markup
+is detected with a substring check and stripped with a compiled tokenizer only when
+present, and punctuation removal and whitespace collapsing share one regex pass.
+It also reads the topic terms of normalized text, cheap enough to count over a
+profile's whole post history.
+"""
+
+from typing import Any, Set
+import html
+import re
+import unicodedata
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+# Markup that BeautifulSoup's get_text() drops: skipped elements with their
+# contents, comments, declarations/processing instructions, and plain tags
+_MARKUP = re.compile(
+    r'<(script|style|template)\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>.*?(?:</\1\s*>|$)'
+    r'|<!--.*?(?:-->|$)'
+    r'|<[!?][^>]*>'
+    r'|</?[A-Za-z](?:[^>"\']|"[^"]*"|\'[^\']*\')*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Runs of punctuation and whitespace, collapsed to a single space
+_NON_WORD = re.compile(r'\W+')
+
+def strip_markup(text: str) -> str:
+    """Remove HTML tags and decode character references."""
+    return html.unescape(_MARKUP.sub('', text))
+
+def normalize_text(text: Any) -> str:
+    """Strip markup, NFKD-normalize and reduce text to space-separated words."""
+    if not text:
+        return ""
+        
+    text = str(text)
+    
+    # Most bios and captions are plain text; only parse when markup may be present
+    if '<' in text or '&' in text:
+        text = strip_markup(text)
+        
+    # NFKD leaves ASCII untouched
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        
+    return _NON_WORD.sub(' ', text).strip()
+
+def topic_terms(text: str) -> Set[str]:
+    """Distinct lowercase content words of normalized text, the keys profile topics are counted by."""
+    return {
+        word for word in text.lower().split()
+        if len(word) > 2 and word.isalpha() and word not in ENGLISH_STOP_WORDS
+    }
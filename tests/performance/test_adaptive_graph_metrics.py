@@ -0,0 +1,52 @@
+import time
+import networkx as nx
+import pytest
+
+from src.services.discovery.intelligence.graph_metrics import VersionedGraph, GraphMetricsCache
+
+NODES = 20000
+EDGES = 100000
+BUDGET = 5.0
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def test_sampled_metrics_stay_within_budget():
+    """Report time for every whole-graph metric on a 20k-node graph under one shared budget."""
+    graph = VersionedGraph(nx.gnm_random_graph(NODES, EDGES, seed=1))
+    largest = max(nx.connected_components(graph), key=len)
+    graph.remove_nodes_from([n for n in list(graph) if n not in largest])
+    cache = GraphMetricsCache(graph, {'graph_metrics_time_budget': BUDGET})
+    cache.start_budget()
+    
+    start = time.perf_counter()
+    cache.betweenness_centrality()
+    betweenness_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    path_length = cache.average_path_length()
+    diameter = cache.diameter()
+    closeness = cache.closeness_centrality()
+    path_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    cache.eigenvector_centrality()
+    cache.pagerank()
+    communities = cache.communities()
+    spectral_seconds = time.perf_counter() - start
+    bounds = cache.error_bounds()
+    
+    print(
+        f"\nbetweenness: {betweenness_seconds:.1f}s ({bounds['betweenness_centrality']['pivots']} pivots, "
+        f"+/-{bounds['betweenness_centrality']['error_bound']:.3f}), "
+        f"path length {path_length:.3f} +/-{bounds['average_path_length']['error_bound']:.3f}, "
+        f"diameter {bounds['diameter']['lower']}..{bounds['diameter']['upper']}: {path_seconds:.1f}s, "
+        f"eigenvector/PageRank/communities ({bounds['louvain_communities']['method']}, "
+        f"{len(communities)} communities): {spectral_seconds:.1f}s"
+    )
+    assert len(closeness) == graph.number_of_nodes()
+    assert bounds['diameter']['lower'] == diameter <= bounds['diameter']['upper']
+    assert betweenness_seconds < 2 * BUDGET
+    assert path_seconds < 2 * BUDGET
+    # The budget is shared, so the later metrics only add their minimum work
+    assert betweenness_seconds + path_seconds + spectral_seconds < 3 * BUDGET
@@ -0,0 +1,43 @@
+import time
+import tracemalloc
+import pytest
+
+from src.services.discovery.pipeline.data_cleaner import DataCleaner
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def stream_posts(count):
+    """Page through a post history without holding it, as a paginated scraper would."""
+    for index in range(count):
+        yield {
+            'id': f"post{index}",
+            'type': 'video',
+            'text': f"Unboxing the new lens, part {index}",
+            'engagement': {'likes': index % 997, 'comments': index % 31},
+            'timestamp': '2024-01-01T00:00:00'
+        }
+
+def peak_memory(count):
+    cleaner = DataCleaner({'profile_post_budget': 1000})
+    tracemalloc.start()
+    start = time.perf_counter()
+    cleaned = cleaner.clean_profile_data({'content': stream_posts(count)})
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert cleaned['content_stats']['count'] == count
+    return peak, count / elapsed
+
+def test_profile_memory_is_bounded_by_the_post_budget():
+    """Report peak memory cleaning 10k and 200k post histories with a 1,000 post budget."""
+    small_peak, small_rate = peak_memory(10000)
+    large_peak, large_rate = peak_memory(200000)
+    
+    print(
+        f"\n10k posts: {small_peak / 2**20:.1f} MiB peak ({small_rate:,.0f} posts/s), "
+        f"200k posts: {large_peak / 2**20:.1f} MiB peak ({large_rate:,.0f} posts/s)"
+    )
+    assert large_peak < 1.5 * small_peak
@@ -0,0 +1,53 @@
+import time
+from collections import defaultdict
+import networkx as nx
+import pytest
+
+from src.services.discovery.intelligence.network_analysis import NetworkAnalysisAI
+
+COMMUNITIES = 300
+COMMUNITY_SIZE = 30
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def pairwise_community_stats(graph, communities):
+    """The previous approach: scan every community pair for each edge."""
+    densities = [nx.density(graph.subgraph(c)) for c in communities]
+    connections = defaultdict(int)
+    for u, v in graph.edges():
+        for i, community in enumerate(communities):
+            if u in community:
+                for j, other_community in enumerate(communities):
+                    if v in other_community and i != j:
+                        connections[(i, j)] += 1
+    return densities, dict(connections), nx.community.modularity(graph, communities)
+
+@pytest.mark.asyncio
+async def test_one_edge_pass_replaces_pairwise_scan():
+    """Report community statistics time with hundreds of communities."""
+    graph = nx.planted_partition_graph(COMMUNITIES, COMMUNITY_SIZE, 0.3, 0.0005, seed=1)
+    analyzer = NetworkAnalysisAI({})
+    analyzer._build_network_graph({
+        'channels': [{'id': node} for node in graph.nodes()],
+        'connections': [{'source': u, 'target': v} for u, v in graph.edges()]
+    })
+    communities = analyzer.metrics.communities()
+    
+    start = time.perf_counter()
+    densities, connections, modularity = pairwise_community_stats(analyzer.network, communities)
+    pairwise_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    result = await analyzer._analyze_communities()
+    single_pass_seconds = time.perf_counter() - start
+    
+    print(
+        f"\n{len(communities)} communities, {graph.number_of_edges()} edges: "
+        f"pairwise {pairwise_seconds:.2f}s, one pass {single_pass_seconds:.2f}s"
+    )
+    assert result['inter_community_connections'] == connections
+    assert result['community_metrics']['community_densities'] == pytest.approx(densities)
+    assert result['modularity'] == pytest.approx(modularity)
+    assert single_pass_seconds < pairwise_seconds
@@ -0,0 +1,77 @@
+import asyncio
+import random
+import time
+import pytest
+
+from src.services.discovery.intelligence.competitive_analysis import CompetitiveAnalysisAI
+from src.services.discovery.intelligence.competitor_landscape import CompetitorLandscape, LandscapeCache, GAP_DIMENSIONS
+
+PROSPECTS = 500
+COMPETITORS = 50
+KEYS = 40
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def shares(rng, field, count):
+    return {f"{field}_{rng.randrange(KEYS)}": rng.random() for _ in range(count)}
+
+def profiles(rng, count, prefix):
+    fields = [field for section in GAP_DIMENSIONS.values() for field in section.values()]
+    return [
+        {
+            'id': f"{prefix}{index}",
+            'market_share': rng.random() / count,
+            'affiliates': [{'id': f"p{rng.randrange(PROSPECTS)}"}],
+            **{field: shares(rng, field, 5) for field in fields}
+        }
+        for index in range(count)
+    ]
+
+def test_prospect_gaps_are_scored_against_one_landscape():
+    """Report gap scoring time when competitors are re-aggregated per prospect and when shared."""
+    rng = random.Random(5)
+    competitors = profiles(rng, COMPETITORS, 'c')
+    prospects = profiles(rng, PROSPECTS, 'p')
+    ai = CompetitiveAnalysisAI({})
+    
+    start = time.perf_counter()
+    per_prospect = [CompetitorLandscape.build(competitors).score_prospects([prospect])[0] for prospect in prospects]
+    per_prospect_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    batch = asyncio.run(ai.analyze_prospect_gaps({'campaign_id': 'bench', 'competitors': competitors, 'prospects': prospects}))
+    batch_seconds = time.perf_counter() - start
+    
+    print(
+        f"\n{PROSPECTS} prospects x {COMPETITORS} competitors: per-prospect aggregation {per_prospect_seconds * 1000:.1f}ms, "
+        f"shared landscape {batch_seconds * 1000:.1f}ms"
+    )
+    assert [score['gap_score'] for score in batch['prospect_gaps']] == pytest.approx(
+        [score['gap_score'] for score in per_prospect]
+    )
+    assert batch_seconds < per_prospect_seconds
+
+def test_cache_hits_cost_less_than_a_rebuild():
+    """Report the cost of a cached lookup against building the landscape, with long affiliate lists."""
+    rng = random.Random(7)
+    competitors = profiles(rng, COMPETITORS, 'c')
+    for competitor in competitors:
+        competitor['affiliates'] = [{'id': f"a{rng.randrange(10000)}", 'engagement': rng.random()} for _ in range(100)]
+    cache = LandscapeCache({})
+    cache.get(competitors, 'bench')
+    
+    start = time.perf_counter()
+    for _ in range(100):
+        CompetitorLandscape.build(competitors)
+    build_seconds = (time.perf_counter() - start) / 100
+    
+    start = time.perf_counter()
+    for _ in range(100):
+        cache.get(competitors, 'bench')
+    hit_seconds = (time.perf_counter() - start) / 100
+    
+    print(f"\n{COMPETITORS} competitors x 100 affiliates: build {build_seconds * 1000:.2f}ms, cache hit {hit_seconds * 1000:.3f}ms")
+    assert hit_seconds < build_seconds / 10
@@ -0,0 +1,53 @@
+import random
+import time
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src.services.discovery.intelligence.content_analysis import ContentAnalysisAI
+from src.services.discovery.nlp.registry import ModelRegistry
+
+POSTS = 10000
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+WORDS = [
+    'camera', 'review', 'lens', 'editing', 'software', 'creator', 'launch', 'unboxing',
+    'tutorial', 'discount', 'studio', 'lighting', 'workflow', 'travel', 'gear', 'vlog',
+    'gimbal', 'drone', 'microphone', 'tripod', 'sensor', 'firmware', 'preset', 'podcast'
+]
+
+def make_posts():
+    rng = random.Random(11)
+    return [' '.join(rng.choice(WORDS) for _ in range(25)) + f' post{i}' for i in range(POSTS)]
+
+def fit_per_text(text):
+    """The previous approach: fit a new vectorizer on each text."""
+    vectorizer = TfidfVectorizer(max_features=20, stop_words='english')
+    matrix = vectorizer.fit_transform([text])
+    names = vectorizer.get_feature_names_out()
+    return [names[i] for i in range(len(names)) if matrix[0, i] > 0]
+
+@pytest.mark.asyncio
+async def test_one_transform_replaces_per_text_fits():
+    """Report posts/s for per-text TfidfVectorizer fits and one corpus-model batch."""
+    posts = make_posts()
+    
+    start = time.perf_counter()
+    for post in posts:
+        fit_per_text(post)
+    per_text_rate = POSTS / (time.perf_counter() - start)
+    
+    analyzer = ContentAnalysisAI({})
+    analyzer.models = ModelRegistry()
+    analyzer.corpus_model.partial_fit(posts)
+    start = time.perf_counter()
+    keywords = await analyzer._extract_keywords_batch(posts)
+    batch_rate = POSTS / (time.perf_counter() - start)
+    
+    print(f"\nper-text fits: {per_text_rate:,.0f} posts/s, corpus model batch: {batch_rate:,.0f} posts/s")
+    # The rarest term leads unless it shares a hashed feature with another rare term
+    assert sum(f'post{i}' == keywords[i][0] for i in range(POSTS)) > 0.99 * POSTS
+    assert batch_rate > per_text_rate
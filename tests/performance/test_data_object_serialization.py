@@ -0,0 +1,97 @@
+import json
+import pickle
+import time
+import pytest
+from datetime import datetime
+
+from src.services.discovery.models.data_object import DataObject, PlatformType, pack_payload, unpack_payload
+
+ROUNDS = 2000
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def make_profile(index):
+    return DataObject(
+        platform=PlatformType.LINKEDIN,
+        timestamp=datetime(2026, 5, 1, 12, 0, 0),
+        url=f'https://www.linkedin.com/in/creator-{index}',
+        data={
+            'basic_info': {
+                'username': f'creator-{index}',
+                'name': 'Jordan Creator',
+                'bio': 'Reviews cameras, lenses and editing software for independent filmmakers.',
+                'followers': 48200,
+                'following': 512,
+                'location': 'Austin, TX'
+            },
+            'content': [
+                {
+                    'text': f'Post {i}: hands-on with the new mirrorless body',
+                    'likes': 340 + i,
+                    'comments': 21,
+                    'shares': 7,
+                    'timestamp': '2026-04-2%d' % (i % 10)
+                }
+                for i in range(20)
+            ],
+            'engagement': {'likes': 6800, 'comments': 420, 'shares': 140, 'views': 91000},
+            'network': {'connections': [f'peer-{i}' for i in range(50)]}
+        },
+        metadata={'scraper_version': '1.0', 'request_id': f'req-{index}'}
+    )
+
+def json_round_trip(profile):
+    return DataObject(**json.loads(json.dumps(profile.to_dict(), default=str)))
+
+def msgpack_round_trip(profile):
+    return DataObject.from_msgpack(profile.to_msgpack())
+
+def measure(round_trip, profiles):
+    start = time.perf_counter()
+    for profile in profiles:
+        round_trip(profile)
+    return len(profiles) / (time.perf_counter() - start)
+
+def test_msgpack_envelope_is_smaller_and_faster_than_json():
+    """Report bytes per profile and round-trip throughput for both wire formats."""
+    profiles = [make_profile(i) for i in range(ROUNDS)]
+    
+    json_bytes = sum(len(json.dumps(p.to_dict(), default=str).encode()) for p in profiles) / ROUNDS
+    msgpack_bytes = sum(len(p.to_msgpack()) for p in profiles) / ROUNDS
+    json_rate = measure(json_round_trip, profiles)
+    msgpack_rate = measure(msgpack_round_trip, profiles)
+    
+    print(
+        f"\njson:    {json_bytes:.0f} B/profile, {json_rate:.0f} round trips/s"
+        f"\nmsgpack: {msgpack_bytes:.0f} B/profile, {msgpack_rate:.0f} round trips/s"
+    )
+    assert msgpack_round_trip(profiles[0]) == profiles[0]
+    assert msgpack_bytes < json_bytes
+    assert msgpack_rate > json_rate
+
+def test_chunk_payloads_against_pickle():
+    """Report bytes per profile and round-trip time for a pipeline chunk sent to a worker."""
+    chunk = [make_profile(i).data for i in range(ROUNDS)]
+    
+    timings = {}
+    sizes = {}
+    for name, encode, decode in (
+        ('pickle', lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ('msgpack', pack_payload, unpack_payload)
+    ):
+        start = time.perf_counter()
+        for _ in range(5):
+            payload = encode(chunk)
+            decoded = decode(payload)
+        timings[name] = (time.perf_counter() - start) / 5
+        sizes[name] = len(payload) / ROUNDS
+        assert decoded == chunk
+        
+    print(
+        f"\npickle:  {sizes['pickle']:.0f} B/profile, {timings['pickle'] * 1000:.1f} ms/chunk"
+        f"\nmsgpack: {sizes['msgpack']:.0f} B/profile, {timings['msgpack'] * 1000:.1f} ms/chunk"
+    )
+    assert timings['msgpack'] < timings['pickle']
@@ -0,0 +1,67 @@
+import random
+import time
+from datetime import datetime, timedelta
+import pytest
+
+from src.services.discovery.pipeline.date_parser import DateParser
+
+POSTS = 50000
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+LEGACY_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%B %d, %Y', '%d %B %Y']
+
+def legacy_parse(value):
+    """The try-every-format loop the parser replaces."""
+    for fmt in LEGACY_FORMATS:
+        try:
+            return datetime.strptime(str(value), fmt)
+        except:
+            continue
+    return None
+
+def make_timestamps(count):
+    # Post dates cluster on a few hundred days, written the way a platform renders them
+    rng = random.Random(5)
+    start = datetime(2025, 1, 1)
+    return [(start + timedelta(days=rng.randrange(480))).strftime('%B %d, %Y') for _ in range(count)]
+
+def test_cached_parser_outpaces_format_loop():
+    """Report timestamps/s for the strptime loop against the caching parser."""
+    timestamps = make_timestamps(POSTS)
+    
+    start = time.perf_counter()
+    legacy = [legacy_parse(value) for value in timestamps]
+    legacy_rate = POSTS / (time.perf_counter() - start)
+    
+    parser = DateParser({})
+    start = time.perf_counter()
+    parsed = parser.parse_many(timestamps, 'youtube.content')
+    parser_rate = POSTS / (time.perf_counter() - start)
+    
+    print(f"\nstrptime loop: {legacy_rate:,.0f}/s, DateParser: {parser_rate:,.0f}/s "
+          f"({parser_rate / legacy_rate:.0f}x)")
+    assert parsed == legacy
+    assert parser_rate > legacy_rate * 5
+
+def test_detected_format_speeds_up_distinct_values():
+    """Report timestamps/s on all-distinct values, where only format detection helps."""
+    start_date = datetime(1900, 1, 1)
+    timestamps = [(start_date + timedelta(days=day)).strftime('%d %B %Y') for day in range(POSTS)]
+    
+    start = time.perf_counter()
+    legacy = [legacy_parse(value) for value in timestamps]
+    legacy_rate = POSTS / (time.perf_counter() - start)
+    
+    parser = DateParser({})
+    start = time.perf_counter()
+    parsed = [parser.parse(value, 'linkedin.content') for value in timestamps]
+    parser_rate = POSTS / (time.perf_counter() - start)
+    
+    print(f"\ndistinct values - strptime loop: {legacy_rate:,.0f}/s, DateParser: {parser_rate:,.0f}/s "
+          f"({parser_rate / legacy_rate:.1f}x)")
+    assert parsed == legacy
+    assert parser_rate > legacy_rate
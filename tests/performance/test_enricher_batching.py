@@ -0,0 +1,63 @@
+import random
+import time
+import pytest
+import spacy
+
+from src.services.discovery.nlp.memo_store import MemoStore
+from src.services.discovery.nlp.registry import ModelRegistry
+from src.services.discovery.pipeline.data_enricher import DataEnricher
+
+POSTS = 50000
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+WORDS = [
+    'camera', 'review', 'lens', 'editing', 'software', 'creator', 'launch', 'unboxing',
+    'tutorial', 'discount', 'studio', 'lighting', 'workflow', 'travel', 'gear', 'vlog'
+]
+BRANDS = ['Sony', 'Canon', 'Adobe', 'DJI', 'Austin', 'Berlin']
+
+def load_nlp():
+    """Use the trained English pipeline when installed, else a rule-based stand-in."""
+    try:
+        return spacy.load('en_core_web_sm')
+    except OSError:
+        nlp = spacy.blank('en')
+        ruler = nlp.add_pipe('entity_ruler')
+        ruler.add_patterns([{'label': 'ORG', 'pattern': brand} for brand in BRANDS])
+        nlp.add_pipe('sentencizer')
+        return nlp
+
+def make_posts(count):
+    rng = random.Random(7)
+    return [
+        ' '.join(rng.choice(WORDS) for _ in range(12)) + f' with {rng.choice(BRANDS)} #{i}'
+        for i in range(count)
+    ]
+
+def test_batched_pipe_outpaces_per_item_processing():
+    """Report docs/s for per-item spaCy calls against one batched nlp.pipe pass."""
+    enricher = DataEnricher({})
+    enricher.models = ModelRegistry()
+    enricher.models.get('spacy.en_core_web_sm', load_nlp)
+    posts = make_posts(POSTS)
+    
+    enricher.memo = MemoStore({})
+    start = time.perf_counter()
+    per_item = [
+        {'entities': enricher._extract_entities(text), 'topics': enricher._extract_topics(text)}
+        for text in posts
+    ]
+    per_item_rate = POSTS / (time.perf_counter() - start)
+    
+    enricher.memo = MemoStore({})
+    start = time.perf_counter()
+    batched = enricher._annotate_texts(posts)
+    batched_rate = POSTS / (time.perf_counter() - start)
+    
+    print(f"\nper-item: {per_item_rate:,.0f} docs/s, nlp.pipe: {batched_rate:,.0f} docs/s")
+    assert batched == per_item
+    assert batched_rate > per_item_rate
@@ -0,0 +1,62 @@
+import time
+import networkx as nx
+import pytest
+
+from src.services.discovery.intelligence.graph_metrics import VersionedGraph, GraphMetricsCache
+from src.services.discovery.intelligence.graph_store import AffiliateGraphStore
+
+NODES = 50000
+EDGES = 200000
+PROFILES = 20
+EDGES_PER_PROFILE = 50
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def deltas():
+    graph = nx.gnm_random_graph(NODES + PROFILES, EDGES + PROFILES * EDGES_PER_PROFILE, seed=5)
+    edges = [{'source': u, 'target': v} for u, v in graph.edges()]
+    return edges[:EDGES], [
+        edges[EDGES + i * EDGES_PER_PROFILE:EDGES + (i + 1) * EDGES_PER_PROFILE]
+        for i in range(PROFILES)
+    ]
+
+def refresh(metrics):
+    metrics.degree_centrality()
+    metrics.connected_components()
+    metrics.pagerank()
+
+def test_profile_deltas_cost_less_than_rebuilds():
+    """Report seconds per added profile for full rebuilds and for the incremental store."""
+    base, profiles = deltas()
+    
+    seen = list(base)
+    start = time.perf_counter()
+    for profile in profiles:
+        seen.extend(profile)
+        graph = VersionedGraph()
+        for edge in seen:
+            graph.add_edge(edge['source'], edge['target'], weight=1.0)
+        refresh(GraphMetricsCache(graph))
+    rebuild_seconds = (time.perf_counter() - start) / PROFILES
+    
+    store = AffiliateGraphStore()
+    store.update(connections=base)
+    refresh(store.metrics())
+    update_seconds = 0.0
+    start = time.perf_counter()
+    for profile in profiles:
+        update_start = time.perf_counter()
+        store.update(connections=profile)
+        store.snapshot()
+        update_seconds += time.perf_counter() - update_start
+        refresh(store.metrics())
+    incremental_seconds = (time.perf_counter() - start) / PROFILES
+    
+    print(
+        f"\nper profile: rebuild {rebuild_seconds:.2f}s, incremental {incremental_seconds:.2f}s "
+        f"(update + snapshot {update_seconds / PROFILES * 1000:.1f}ms)"
+    )
+    assert incremental_seconds < rebuild_seconds
@@ -0,0 +1,52 @@
+import random
+import time
+import pytest
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from src.services.discovery.nlp.memo_store import MemoStore
+from src.services.discovery.nlp.text_analysis import TextAnalyzer
+
+TEXTS = 10000
+DISTINCT = 1000
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+WORDS = [
+    'camera', 'review', 'lens', 'editing', 'software', 'creator', 'launch', 'unboxing',
+    'tutorial', 'discount', 'studio', 'lighting', 'workflow', 'travel', 'gear', 'vlog',
+    'amazing', 'terrible', 'love', 'hate', 'best', 'worst'
+]
+
+def make_texts():
+    """Reposted and cross-posted content: few distinct texts, many copies."""
+    rng = random.Random(7)
+    distinct = [
+        '. '.join(' '.join(rng.choice(WORDS) for _ in range(10)) for _ in range(3)) + '.'
+        for _ in range(DISTINCT)
+    ]
+    return [rng.choice(distinct) for _ in range(TEXTS)]
+
+def test_memoized_annotations_skip_duplicate_texts():
+    """Report texts/s for sentiment and token annotation with and without the memo store."""
+    analyzer = TextAnalyzer({}, stop_words=ENGLISH_STOP_WORDS, lemmatize=str)
+    texts = make_texts()
+    
+    start = time.perf_counter()
+    direct = [analyzer._annotate(text) for text in texts]
+    direct_rate = TEXTS / (time.perf_counter() - start)
+    
+    analyzer.memo = MemoStore({})
+    start = time.perf_counter()
+    memoized = [analyzer.analyze([text])[0] for text in texts]
+    memoized_rate = TEXTS / (time.perf_counter() - start)
+    
+    stats = analyzer.memo.get_stats()['tasks']['text.annotations']
+    print(
+        f"\ndirect: {direct_rate:,.0f} texts/s, memoized: {memoized_rate:,.0f} texts/s, "
+        f"hit rate {stats['hit_rate']:.0%}, {stats['cpu_seconds_saved']:.2f} CPU s saved"
+    )
+    assert memoized == direct
+    assert memoized_rate > direct_rate
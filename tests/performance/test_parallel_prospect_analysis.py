@@ -0,0 +1,85 @@
+import asyncio
+import os
+import random
+import time
+import networkx as nx
+import pytest
+
+from src.services.discovery.intelligence.intelligence_service import IntelligenceService
+
+CHANNELS = 600
+CONNECTIONS = 3000
+POSTS = 1500
+COMPETITORS = 50
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+WORDS = (
+    'camera lens review unboxing tutorial discount code sponsored great terrible '
+    'lighting studio vlog gear budget premium honest recommend creator audio'
+).split()
+
+def prospect():
+    rng = random.Random(11)
+    graph = nx.gnm_random_graph(CHANNELS, CONNECTIONS, seed=11)
+    return {
+        'id': 'creator1',
+        'platform': 'youtube',
+        'network': {
+            'channels': [{'id': node, 'subscribers': rng.randint(100, 100000)} for node in graph],
+            'connections': [{'source': u, 'target': v} for u, v in graph.edges()]
+        },
+        'trends': {
+            'content': [
+                {'text': ' '.join(rng.choices(WORDS, k=25)) + '.', 'engagement': rng.random()}
+                for _ in range(POSTS)
+            ]
+        },
+        'competition': {
+            'competitors': [
+                {'id': f'comp{c}', 'affiliates': [{'id': f'aff{c}-{a}', 'engagement': rng.random()} for a in range(20)]}
+                for c in range(COMPETITORS)
+            ]
+        }
+    }
+
+def analyze(config, data, analyzers=None):
+    service = IntelligenceService(config)
+    try:
+        start = time.perf_counter()
+        analysis = asyncio.run(service.analyze_prospect(data, analyzers))
+        return time.perf_counter() - start, analysis
+    finally:
+        asyncio.run(service.cleanup())
+
+def test_prospect_latency_approaches_the_slowest_analyzer():
+    """Report end-to-end latency against the slowest analyzer and the sequential sum."""
+    data = prospect()
+    config = {'analysis_time_budget': 120.0}
+    analyze(config, data)  # warm up models and memoized annotations
+    
+    singles = {}
+    for name in ('network_analysis', 'trend_analysis', 'competitive_analysis'):
+        seconds, analysis = analyze(config, data, [name])
+        assert analysis['status'][name] == 'completed'
+        singles[name] = seconds
+    sequential = sum(singles.values())
+    slowest = max(singles.values())
+    
+    latency, analysis = analyze(config, data)
+    
+    print(
+        f"\n{os.cpu_count()} CPUs; single analyzers: "
+        + ', '.join(f"{name} {seconds:.2f}s" for name, seconds in singles.items())
+        + f"\nsequential {sequential:.2f}s, slowest {slowest:.2f}s, planned fan-out {latency:.2f}s"
+    )
+    assert analysis['complete']
+    assert set(analysis['analysis']) == set(singles)
+    if (os.cpu_count() or 1) >= 4:
+        assert latency < 0.5 * (sequential + slowest)
+    else:
+        # Nothing to overlap on one core; the fan-out must not cost more than running in turn
+        assert latency < 1.2 * sequential
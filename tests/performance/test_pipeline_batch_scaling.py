@@ -0,0 +1,49 @@
+import os
+import time
+import pytest
+
+from src.services.discovery.pipeline import DiscoveryPipeline
+
+PROFILES = 400
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def make_profile(index):
+    return {
+        'basic_info': {'username': f'creator{index}', 'name': 'Jordan Creator', 'bio': 'Camera and lens reviews'},
+        'content': [
+            {'id': f'{index}-{i}', 'type': 'post', 'text': f'Post {i}: hands-on with the new Sony mirrorless body'}
+            for i in range(20)
+        ],
+        'engagement': {'likes': 6800, 'comments': 420, 'shares': 140, 'views': 91000}
+    }
+
+async def measure(workers, profiles):
+    pipeline = DiscoveryPipeline({'pipeline_workers': workers})
+    try:
+        # Warm the pool so worker start-up is not counted
+        await pipeline.process_batch(profiles[:workers])
+        start = time.perf_counter()
+        results = await pipeline.process_batch(profiles)
+        rate = len(profiles) / (time.perf_counter() - start)
+    finally:
+        pipeline.close()
+    assert all('error' not in result for result in results)
+    return rate
+
+@pytest.mark.asyncio
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason='needs more than one core')
+async def test_throughput_scales_with_workers():
+    """Report profiles/s for one worker against one worker per core."""
+    profiles = [make_profile(index) for index in range(PROFILES)]
+    cores = os.cpu_count()
+    
+    single = await measure(1, profiles)
+    parallel = await measure(cores, profiles)
+    
+    print(f"\n1 worker: {single:,.0f} profiles/s, {cores} workers: {parallel:,.0f} profiles/s "
+          f"({parallel / single:.1f}x)")
+    assert parallel > single * min(cores, 4) * 0.5
@@ -0,0 +1,80 @@
+import random
+import time
+import pytest
+from jsonschema import validate, ValidationError
+
+from src.services.discovery.pipeline.data_validator import DataValidator, SECTIONS
+
+PROFILES = 100000
+
+# The per-call jsonschema path is slow enough that a sample gives its rate
+REFERENCE_PROFILES = 200
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def make_profiles(count):
+    rng = random.Random(7)
+    profiles = []
+    for index in range(count):
+        profile = {
+            'basic_info': {
+                'username': f"creator{index}",
+                'name': f"Creator {index}",
+                'bio': 'Camera reviews and editing tutorials ' * rng.randint(1, 4),
+                'location': 'Austin',
+                'followers': rng.randint(0, 10**6),
+                'join_date': '2020-01-01'
+            },
+            'content': [
+                {
+                    'id': f"post{index}_{post}",
+                    'type': 'video',
+                    'text': 'Unboxing the new lens',
+                    'media': [{'type': 'image', 'url': 'https://cdn.example.com/a.jpg'}],
+                    'engagement': {'likes': rng.randint(0, 1000), 'comments': rng.randint(0, 100)},
+                    'timestamp': '2024-01-01T00:00:00'
+                }
+                for post in range(5)
+            ],
+            'engagement': {'likes': rng.randint(0, 10**5), 'comments': 10, 'engagement_rate': rng.random()},
+            'network': {
+                'connections': [{'id': f"u{n}", 'type': 'follower', 'strength': 0.5} for n in range(10)],
+                'metrics': {'size': 10, 'density': 0.1}
+            }
+        }
+        # A few profiles fail validation
+        if index % 20 == 0:
+            del profile['basic_info']['bio']
+        if index % 33 == 0:
+            profile['engagement']['likes'] = -1
+        profiles.append(profile)
+    return profiles
+
+def jsonschema_verdict(validator, profile):
+    """Validate every section with a fresh jsonschema.validate call, as each record used to."""
+    try:
+        for section in SECTIONS:
+            validate(instance=profile.get(section, {}), schema=validator.schemas[section])
+        return True
+    except ValidationError:
+        return False
+
+def test_compiled_schemas_outpace_jsonschema():
+    """Report validated profiles/s for per-call jsonschema against compiled batch validation."""
+    validator = DataValidator({})
+    profiles = make_profiles(PROFILES)
+    
+    start = time.perf_counter()
+    reference = [jsonschema_verdict(validator, profile) for profile in profiles[:REFERENCE_PROFILES]]
+    reference_rate = REFERENCE_PROFILES / (time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    failed, _ = validator.validate_batch(profiles)
+    compiled_rate = PROFILES / (time.perf_counter() - start)
+    
+    print(f"\njsonschema: {reference_rate:,.0f} profiles/s, compiled: {compiled_rate:,.0f} profiles/s")
+    assert (~failed[:REFERENCE_PROFILES]).tolist() == reference
+    assert compiled_rate > reference_rate
@@ -0,0 +1,64 @@
+import random
+import time
+import pytest
+
+from src.services.discovery.pipeline.prospect_scorer import ProspectScorer
+
+PROSPECTS = 100000
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def make_prospect(rng):
+    return {
+        'network': {'metrics': {'size': rng.randint(0, 2000000), 'density': rng.random(),
+                                'centrality': rng.random(), 'clustering': rng.random()}},
+        'engagement': {'followers': rng.randint(0, 3000000), 'engagement_rate': rng.random(),
+                       'click_through_rate': rng.random() * 0.2, 'conversion_rate': rng.random() * 0.05,
+                       'response_rate': rng.random(), 'avg_response_time': rng.uniform(0, 48)},
+        'content': [
+            {
+                'type': rng.choice(['video', 'image', 'promotional', 'text']),
+                'text': 'New review is up',
+                'media': [],
+                'engagement': {'likes': rng.randint(0, 900), 'comments': rng.randint(0, 80),
+                               'shares': rng.randint(0, 40), 'clicks': rng.choice([0, 12]),
+                               'conversions': rng.choice([0, 2])}
+            }
+            for _ in range(20)
+        ]
+    }
+
+@pytest.mark.asyncio
+async def test_batch_scoring_outpaces_per_prospect_scoring():
+    """Report prospects/s for score_prospect in a loop against one score_batch call."""
+    rng = random.Random(9)
+    prospects = [make_prospect(rng) for _ in range(PROSPECTS)]
+    scorer = ProspectScorer({})
+    
+    start = time.perf_counter()
+    expected = [await scorer.score_prospect(prospect) for prospect in prospects]
+    scalar_rate = PROSPECTS / (time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    batch = await scorer.score_batch(prospects)
+    batch_rate = PROSPECTS / (time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    columns = scorer._pack_prospects(prospects)
+    pack_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    scorer._score_columns(columns, PROSPECTS)
+    score_seconds = time.perf_counter() - start
+    
+    max_difference = max(
+        abs(result['composite_score'] - reference['composite_score'])
+        for result, reference in zip(batch, expected)
+    )
+    print(f"\nscore_prospect: {scalar_rate:,.0f} prospects/s, score_batch: {batch_rate:,.0f} prospects/s "
+          f"({batch_rate / scalar_rate:.1f}x; packing {pack_seconds:.2f}s, vectorized scoring "
+          f"{score_seconds:.3f}s; max composite difference {max_difference:.1e})")
+    assert max_difference < 1e-12
+    assert batch_rate > scalar_rate
@@ -0,0 +1,49 @@
+import random
+import time
+import pytest
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from textblob import TextBlob
+
+from src.services.discovery.nlp.memo_store import MemoStore
+from src.services.discovery.nlp.text_analysis import TextAnalyzer
+
+POSTS = 5000
+MODULES = 3
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+WORDS = [
+    'camera', 'review', 'lens', 'editing', 'software', 'creator', 'launch', 'unboxing',
+    'amazing', 'terrible', 'love', 'hate', 'best', 'worst', 'not', 'very', 'really'
+]
+
+def make_posts():
+    rng = random.Random(3)
+    return [
+        '. '.join(' '.join(rng.choice(WORDS) for _ in range(12)) for _ in range(3)) + f'! #{i}'
+        for i in range(POSTS)
+    ]
+
+def test_one_shared_pass_replaces_per_module_textblob():
+    """Report posts/s when each module runs TextBlob against one shared annotation pass."""
+    posts = make_posts()
+    
+    start = time.perf_counter()
+    for _ in range(MODULES):
+        for post in posts:
+            TextBlob(post).sentiment
+    per_module_rate = POSTS / (time.perf_counter() - start)
+    
+    analyzer = TextAnalyzer({}, stop_words=ENGLISH_STOP_WORDS, lemmatize=str)
+    analyzer.memo = MemoStore({})
+    start = time.perf_counter()
+    for _ in range(MODULES):
+        docs = analyzer.analyze(posts)
+    shared_rate = POSTS / (time.perf_counter() - start)
+    
+    print(f"\nTextBlob per module: {per_module_rate:,.0f} posts/s, shared analyzer: {shared_rate:,.0f} posts/s")
+    assert len(docs) == POSTS
+    assert shared_rate > per_module_rate
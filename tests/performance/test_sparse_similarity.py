@@ -0,0 +1,77 @@
+import time
+import tracemalloc
+import networkx as nx
+import numpy as np
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from src.services.discovery.intelligence.network_analysis import NetworkAnalysisAI
+
+DENSE_NODES = 3000
+SPARSE_NODES = 20000
+DEGREE = 10
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def make_analyzer(nodes):
+    rng = np.random.default_rng(2)
+    graph = nx.gnm_random_graph(nodes, nodes * DEGREE // 2, seed=2)
+    analyzer = NetworkAnalysisAI({})
+    analyzer._build_network_graph({
+        'channels': [
+            {
+                'id': node,
+                'subscribers': float(rng.lognormal(8, 2)),
+                'views': float(rng.lognormal(11, 2)),
+                'videos': int(rng.integers(1, 500)),
+                'engagement_rate': float(rng.random() / 10)
+            }
+            for node in graph.nodes()
+        ],
+        'connections': [{'source': u, 'target': v} for u, v in graph.edges()]
+    })
+    return analyzer
+
+def dense_collaborations(analyzer):
+    """The previous approach: a dense n x n product and a Python loop over every pair."""
+    features = analyzer._extract_node_features()
+    matrix = np.array([features[f] for f in ['subscribers', 'views', 'videos', 'engagement_rate']]).T
+    normalized = StandardScaler().fit_transform(matrix)
+    similarity_matrix = np.dot(normalized, normalized.T)
+    nodes = list(analyzer.network.nodes())
+    found = []
+    for i, node1 in enumerate(nodes):
+        for j, node2 in enumerate(nodes):
+            if i < j and not analyzer.network.has_edge(node1, node2) and similarity_matrix[i][j] > 0.5:
+                found.append((node1, node2))
+    return found
+
+def test_top_k_similarity_replaces_dense_matrix():
+    """Report collaboration search time for the dense matrix and the sparse top-K engine."""
+    analyzer = make_analyzer(DENSE_NODES)
+    start = time.perf_counter()
+    dense_collaborations(analyzer)
+    dense_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    analyzer._identify_potential_collaborations()
+    sparse_seconds = time.perf_counter() - start
+    
+    analyzer = make_analyzer(SPARSE_NODES)
+    tracemalloc.start()
+    start = time.perf_counter()
+    collaborations = analyzer._identify_potential_collaborations()
+    large_seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    print(
+        f"\n{DENSE_NODES} nodes: dense {dense_seconds:.1f}s, top-K {sparse_seconds:.1f}s; "
+        f"{SPARSE_NODES} nodes: top-K {large_seconds:.1f}s, peak {peak / 2**20:.0f} MiB "
+        f"(dense matrix alone would be {SPARSE_NODES ** 2 * 8 / 2**20:.0f} MiB)"
+    )
+    assert collaborations
+    assert sparse_seconds < dense_seconds
+    assert peak < SPARSE_NODES ** 2 * 8 / 4
@@ -0,0 +1,57 @@
+import random
+import re
+import time
+import unicodedata
+import pytest
+from bs4 import BeautifulSoup
+
+from src.services.discovery.pipeline.text_normalizer import normalize_text
+
+TEXTS = 20000
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+BIOS = [
+    'Filmmaker & photographer | Sony ambassador 📷 Austin, TX',
+    'Tech reviews every Tuesday. Business: hello@creator.studio',
+    'Café hopping ☕ travel vlogs ✈️ 12 countries and counting',
+    'Building in public. Ex-Google. Opinions my own.',
+    'Mom of 3 👩‍👧‍👦 budget recipes & meal prep ideas'
+]
+CAPTIONS = [
+    'New video is up! Testing the A7 IV in low light 🔥 #camera #gear @sonyalpha',
+    'Unboxing the new lens... link in bio 👇 #ad #partner',
+    'Which one would you pick? 1️⃣ or 2️⃣ Let me know below!',
+    '<p>Full review on the blog<br/><a href="https://example.com/review?id=1&amp;ref=ig">read more</a></p>',
+    'Giveaway time 🎉 Follow + tag 3 friends &amp; share to enter!'
+]
+
+def reference_clean(text):
+    text = BeautifulSoup(str(text), 'html.parser').get_text()
+    text = unicodedata.normalize('NFKD', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    return ' '.join(text.split()).strip()
+
+def make_texts(count):
+    rng = random.Random(11)
+    return [rng.choice(BIOS + CAPTIONS) + f' #{i}' for i in range(count)]
+
+def measure(clean, texts):
+    start = time.perf_counter()
+    results = [clean(text) for text in texts]
+    return len(texts) / (time.perf_counter() - start), results
+
+def test_fast_normalizer_outpaces_beautifulsoup():
+    """Report texts/s for BeautifulSoup cleaning against the fast normalizer."""
+    texts = make_texts(TEXTS)
+    
+    reference_rate, reference = measure(reference_clean, texts)
+    fast_rate, fast = measure(normalize_text, texts)
+    
+    print(f"\nBeautifulSoup: {reference_rate:,.0f} texts/s, normalizer: {fast_rate:,.0f} texts/s "
+          f"({fast_rate / reference_rate:.0f}x)")
+    assert fast == reference
+    assert fast_rate > reference_rate * 5
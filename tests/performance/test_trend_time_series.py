@@ -0,0 +1,89 @@
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pytest
+
+from src.services.discovery.intelligence.time_series import PostSeries
+from src.services.discovery.intelligence.trend_analysis import TrendAnalysisAI
+
+POSTS = 10000
+DAYS = 730
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.filterwarnings('ignore::DeprecationWarning')
+]
+
+def posts():
+    rng = random.Random(3)
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            'created_at': (start + timedelta(seconds=rng.randrange(DAYS * 86400))).isoformat(),
+            'likes': rng.randrange(500),
+            'comments': rng.randrange(50),
+            'shares': rng.randrange(20)
+        }
+        for _ in range(POSTS)
+    ]
+
+def walk_buckets(content, width):
+    """Per-post loop that each statistic used to rebuild its own buckets with."""
+    buckets = defaultdict(lambda: [0, 0])
+    for item in content:
+        seconds = datetime.fromisoformat(item['created_at']).timestamp()
+        bucket = buckets[int(seconds // width)]
+        bucket[0] += 1
+        bucket[1] += item['likes'] + item['comments'] + item['shares']
+    first, last = min(buckets), max(buckets)
+    return [buckets.get(key, [0, 0]) for key in range(first, last + 1)]
+
+def looped_trends(content):
+    """Trends, seasonality and forecasts from per-post loops."""
+    results = []
+    for width, horizon in ((86400, 7), (7 * 86400, 4), (7 * 86400, 26), (7 * 86400, 0), (7 * 86400, 0)):
+        values = [engagement for _, engagement in walk_buckets(content, width)]
+        slope, intercept = np.polyfit(range(len(values)), values, 1)
+        results.append([max(intercept + slope * step, 0) for step in range(len(values), len(values) + horizon)])
+    hours = defaultdict(list)
+    for item in content:
+        hours[datetime.fromisoformat(item['created_at']).hour].append(item['likes'] + item['comments'] + item['shares'])
+    results.append({hour: sum(values) / len(values) for hour, values in hours.items()})
+    return results
+
+def vectorized_trends(ai, content):
+    series = PostSeries.from_posts(content, ai.date_parser)
+    return [
+        ai._analyze_posting_trends(series),
+        ai._calculate_content_shift(series, [], []),
+        ai._analyze_growth_trends({}, series),
+        ai._analyze_engagement_patterns({}, series),
+        ai._predict_short_term_trends({}, series),
+        ai._predict_medium_term_trends({}, series),
+        ai._predict_long_term_trends({}, series),
+        ai._calculate_prediction_confidence({}, series)
+    ]
+
+def test_time_series_trends_run_in_milliseconds():
+    """Report per-profile trend time for per-post loops and for the shared columnar series."""
+    content = posts()
+    ai = TrendAnalysisAI({})
+    
+    start = time.perf_counter()
+    looped_trends(content)
+    looped_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    results = vectorized_trends(ai, content)
+    vectorized_seconds = time.perf_counter() - start
+    
+    print(
+        f"\n{POSTS} posts: per-post loops {looped_seconds * 1000:.1f}ms, "
+        f"columnar series {vectorized_seconds * 1000:.1f}ms"
+    )
+    assert results[0]['posts'] == POSTS
+    assert len(results[6]['posting_forecast']['predicted']) == 26
+    assert vectorized_seconds < looped_seconds
+    assert vectorized_seconds < 0.1
@@ -0,0 +1,170 @@
+import os
+import threading
+import time
+import pytest
+
+from src.services.discovery.intelligence.analysis_planner import AnalysisPlanner, AnalyzerSpec
+from src.services.discovery.intelligence.intelligence_service import IntelligenceService
+
+STARTED = []
+
+class SleepyAnalyzer:
+    def __init__(self, config):
+        self.seconds = config.get('sleep', 0.3)
+        
+    async def analyze(self, data, platform=None):
+        STARTED.append(data['value'])
+        if 'barrier' in data:
+            # Every analyzer must be running at once to get past the barrier
+            data['barrier'].wait(timeout=5)
+        # Blocks like the CPU-bound analyzers do
+        time.sleep(data.get('sleep', self.seconds))
+        return {'value': data['value'], 'platform': platform, 'pid': os.getpid()}
+
+def spec(name, key, **options):
+    return AnalyzerSpec(name, SleepyAnalyzer, 'analyze', (key,), **options)
+
+@pytest.fixture
+def planner():
+    planner = AnalysisPlanner({'analysis_time_budget': 2.0})
+    yield planner
+    planner.close()
+
+@pytest.mark.asyncio
+async def test_independent_analyzers_run_concurrently(planner):
+    for name in ('a', 'b', 'c'):
+        planner.register(spec(name, name))
+        
+    barrier = threading.Barrier(3)
+    outcome = await planner.run({name: {'value': name, 'barrier': barrier, 'sleep': 0} for name in ('a', 'b', 'c')})
+    
+    assert {name: result['value'] for name, result in outcome['results'].items()} == {'a': 'a', 'b': 'b', 'c': 'c'}
+    assert set(outcome['status'].values()) == {'completed'}
+
+@pytest.mark.asyncio
+async def test_slow_analyzer_times_out_with_partial_results():
+    planner = AnalysisPlanner({'analysis_time_budgets': {'slow': 0.2}})
+    planner.register(spec('fast', 'fast')).register(spec('slow', 'slow'))
+    
+    outcome = await planner.run({'fast': {'value': 1, 'sleep': 0.05}, 'slow': {'value': 2, 'sleep': 0.6}})
+    planner.close()
+    
+    assert outcome['status'] == {'fast': 'completed', 'slow': 'timeout'}
+    assert outcome['results'] == {'fast': {'value': 1, 'platform': None, 'pid': os.getpid()}}
+    assert outcome['durations']['slow'] < 0.5
+
+@pytest.mark.asyncio
+async def test_overrunning_runs_keep_their_slot_without_delaying_the_next():
+    planner = AnalysisPlanner({'analysis_time_budget': 0.2, 'analysis_slots': 2})
+    planner.register(spec('slow', 'slow'))
+    STARTED.clear()
+    
+    first = await planner.run({'slow': {'value': 'stuck', 'sleep': 0.8}})
+    # The spare slot lets the next prospect run within its own budget
+    second = await planner.run({'slow': {'value': 'quick', 'sleep': 0}})
+    third = await planner.run({'slow': {'value': 'stuck again', 'sleep': 0.8}})
+    # Both slots are held by overrunning runs, so this one never starts
+    fourth = await planner.run({'slow': {'value': 'queued', 'sleep': 0}})
+    planner.close()
+    
+    assert first['status'] == {'slow': 'timeout'}
+    assert second['status'] == {'slow': 'completed'}
+    assert third['status'] == fourth['status'] == {'slow': 'timeout'}
+    assert STARTED == ['stuck', 'quick', 'stuck again']
+    assert planner._pool_size('thread') == 2
+
+@pytest.mark.asyncio
+async def test_only_analyzers_with_data_run_and_inputs_are_computed_on_demand(planner):
+    calls = []
+    planner.register(spec('profile', 'profile', platforms=frozenset({'twitter'})))
+    planner.register(spec('trends', 'trends', platforms=frozenset({'tiktok', 'generic'}), default_platform='generic'))
+    planner.register(spec('derived', 'derived'))
+    planner.register(spec('missing', 'missing'))
+    planner.provide('derived', lambda prospect: calls.append(prospect['id']) or {'value': 'computed', 'sleep': 0})
+    prospect = {'id': 'p1', 'platform': 'Twitter', 'profile': {'value': 1, 'sleep': 0}, 'trends': {'value': 2, 'sleep': 0}}
+    
+    assert planner.plan(prospect) == {'profile': 'twitter', 'trends': 'generic', 'derived': 'twitter', 'missing': None}
+    
+    outcome = await planner.run(prospect, analyzers=['profile', 'trends', 'missing'])
+    assert outcome['status'] == {'profile': 'completed', 'trends': 'completed', 'missing': 'skipped'}
+    assert outcome['results']['trends']['platform'] == 'generic'
+    assert calls == []
+    
+    outcome = await planner.run({**prospect, 'platforms': {'profile': 'reddit'}})
+    assert outcome['status']['profile'] == 'skipped'
+    assert outcome['results']['derived']['value'] == 'computed'
+    assert calls == ['p1']
+
+@pytest.mark.asyncio
+async def test_process_analyzers_run_in_a_warm_worker():
+    # Fork so workers find the analyzer class of this test module
+    planner = AnalysisPlanner({
+        'analysis_executors': {'heavy': 'process'},
+        'analysis_slots': 1,
+        'analysis_start_method': 'fork'
+    })
+    planner.register(spec('heavy', 'heavy')).register(spec('light', 'light'))
+    
+    first = await planner.run({'heavy': {'value': 1, 'sleep': 0}, 'light': {'value': 2, 'sleep': 0}})
+    second = await planner.run({'heavy': {'value': 3, 'sleep': 0}})
+    planner.close()
+    
+    assert first['results']['light']['pid'] == os.getpid()
+    assert first['results']['heavy']['pid'] != os.getpid()
+    assert second['results']['heavy'] == {'value': 3, 'platform': None, 'pid': first['results']['heavy']['pid']}
+
+def test_unknown_executor_is_rejected():
+    with pytest.raises(ValueError, match='Unknown executor'):
+        AnalysisPlanner({'analysis_executors': {'a': 'gpu'}}).register(spec('a', 'a'))
+
+def test_stateful_analyzers_stay_out_of_worker_processes():
+    with pytest.raises(ValueError, match='keeps state'):
+        AnalysisPlanner({'analysis_executors': {'a': 'process'}}).register(spec('a', 'a', stateful=True))
+
+@pytest.mark.asyncio
+async def test_intelligence_service_runs_the_analyzers_a_prospect_has_data_for():
+    service = IntelligenceService()
+    prospect = {
+        'id': 'creator1',
+        'platform': 'youtube',
+        'network': {
+            'channels': [{'id': 'a', 'subscribers': 100}, {'id': 'b', 'subscribers': 50}],
+            'connections': [{'source': 'a', 'target': 'b'}]
+        },
+        'competition': {'competitors': []}
+    }
+    
+    analysis = await service.analyze_prospect(prospect)
+    summary = await service.get_analysis_summary('creator1')
+    await service.cleanup()
+    
+    assert analysis['status'] == {
+        'profile_analysis': 'skipped',
+        'content_analysis': 'skipped',
+        'trend_analysis': 'skipped',
+        'network_analysis': 'completed',
+        'competitive_analysis': 'completed'
+    }
+    assert analysis['complete']
+    assert analysis['analysis']['network_analysis']['network_metrics']['density'] == 1.0
+    assert summary['status'] == analysis['status']
+    assert 0 <= analysis['score']['composite_score'] <= 1
+
+@pytest.mark.asyncio
+async def test_network_analyses_grow_one_shared_graph():
+    service = IntelligenceService()
+    
+    sizes = []
+    for channels in (('a', 'b'), ('c', 'd'), ('e', 'f')):
+        analysis = await service.analyze_prospect({
+            'id': channels[0],
+            'platform': 'youtube',
+            'network': {
+                'channels': [{'id': channel, 'subscribers': 10} for channel in channels],
+                'connections': [{'source': channels[0], 'target': channels[1]}]
+            }
+        }, ['network_analysis'])
+        sizes.append(analysis['analysis']['network_analysis']['network_metrics']['size'])
+    await service.cleanup()
+    
+    assert sizes == [2, 4, 6]
@@ -0,0 +1,113 @@
+import os
+import sys
+import pytest
+
+from src.services.discovery.models.data_object import unpack_payload
+from src.services.discovery.pipeline import DiscoveryPipeline
+from src.services.discovery.pipeline import batch_executor
+
+# The real chunk runner, called by the patched ones below
+process_chunk = batch_executor._process_chunk
+
+# Set before the pool forks, so workers see it
+CRASH_MARKER = None
+
+def crash_first_chunk(payload):
+    """Kill the worker on the first chunk it runs, then process chunks normally."""
+    try:
+        os.close(os.open(CRASH_MARKER, os.O_CREAT | os.O_EXCL))
+    except FileExistsError:
+        return process_chunk(payload)
+    os._exit(1)
+
+def fail_chunk_with_creator3(payload):
+    """Raise for the chunk holding creator3."""
+    if any(profile['basic_info']['username'] == 'creator3' for profile in unpack_payload(payload)):
+        raise ValueError('chunk failed')
+    return process_chunk(payload)
+
+def make_profile(index, valid=True):
+    basic_info = {'username': f'creator{index}', 'name': f'Creator {index}', 'bio': 'Camera reviews'}
+    if not valid:
+        del basic_info['name']
+    return {
+        'basic_info': basic_info,
+        'content': [{'id': f'post{index}', 'type': 'post', 'text': f'Unboxing lens {index}'}],
+        'engagement': {'likes': index, 'comments': 1, 'shares': 0}
+    }
+
+@pytest.fixture(params=[1, 2], ids=['in_process', 'process_pool'])
+def pipeline(request):
+    pipeline = DiscoveryPipeline({
+        'pipeline_workers': request.param,
+        'pipeline_chunk_size': 3,
+        'pipeline_start_method': 'fork'
+    })
+    yield pipeline
+    pipeline.close()
+
+@pytest.mark.asyncio
+async def test_results_keep_input_order_and_isolate_failures(pipeline):
+    profiles = [make_profile(index, valid=index != 4) for index in range(8)]
+    
+    results = await pipeline.process_batch(profiles)
+    
+    assert len(results) == 8
+    assert "'name' is a required property" in results[4]['error']
+    usernames = [
+        result['cleaned_data']['basic_info']['username']
+        for index, result in enumerate(results) if index != 4
+    ]
+    assert usernames == [f'creator{index}' for index in range(8) if index != 4]
+
+@pytest.mark.asyncio
+async def test_stage_timings_are_reported_per_chunk(pipeline):
+    await pipeline.process_batch([make_profile(index) for index in range(7)])
+    
+    stats = pipeline.executor.get_stats()
+    
+    assert [chunk['profiles'] for chunk in stats] == [3, 3, 1]
+    for chunk in stats:
+        assert set(chunk['stages']) == {'cleaning', 'validation', 'enrichment', 'scoring'}
+        assert chunk['stages']['validation'] > 0
+
+@pytest.mark.asyncio
+async def test_process_profile_raises_on_invalid_profile():
+    pipeline = DiscoveryPipeline({'pipeline_workers': 1})
+    
+    with pytest.raises(Exception, match='Data validation failed'):
+        await pipeline.process_profile(make_profile(0, valid=False))
+
+@pytest.fixture
+def pool_pipeline():
+    pipeline = DiscoveryPipeline({'pipeline_workers': 2, 'pipeline_chunk_size': 3, 'pipeline_start_method': 'fork'})
+    yield pipeline
+    pipeline.close()
+
+@pytest.mark.asyncio
+async def test_chunks_lost_with_a_dead_worker_are_resubmitted(pool_pipeline, tmp_path, monkeypatch):
+    monkeypatch.setattr(sys.modules[__name__], 'CRASH_MARKER', str(tmp_path / 'crashed'))
+    monkeypatch.setattr(batch_executor, '_process_chunk', crash_first_chunk)
+    
+    results = await pool_pipeline.process_batch([make_profile(index) for index in range(7)])
+    
+    assert os.path.exists(CRASH_MARKER)
+    assert [result['cleaned_data']['basic_info']['username'] for result in results] == [f'creator{index}' for index in range(7)]
+
+@pytest.mark.asyncio
+async def test_chunk_errors_fail_the_chunk_and_keep_the_pool(pool_pipeline, monkeypatch):
+    await pool_pipeline.process_batch([make_profile(0)])
+    pool = pool_pipeline.executor._pool
+    monkeypatch.setattr(batch_executor, '_process_chunk', fail_chunk_with_creator3)
+    
+    results = await pool_pipeline.process_batch([make_profile(index) for index in range(7)])
+    
+    assert ['error' in result for result in results] == [False] * 3 + [True] * 3 + [False]
+    assert 'chunk failed' in results[4]['error']
+    assert pool_pipeline.executor._pool is pool
+
+def test_default_workers_follow_cpu_affinity_up_to_the_cap():
+    available = len(os.sched_getaffinity(0))
+    
+    assert batch_executor.default_workers(64) == min(available, 64)
+    assert batch_executor.default_workers(1) == 1
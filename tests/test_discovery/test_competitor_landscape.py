@@ -0,0 +1,120 @@
+import pytest
+from unittest.mock import patch
+
+from src.services.discovery.intelligence.competitive_analysis import CompetitiveAnalysisAI
+from src.services.discovery.intelligence.competitor_landscape import CompetitorLandscape, LandscapeCache
+
+COMPETITORS = [
+    {
+        'id': 'comp1',
+        'market_share': 0.3,
+        'market_segments': {'cameras': 0.6, 'lenses': 0.2},
+        'audience_interests': {'photography': 0.8, 'travel': 0.2},
+        'affiliates': [{'id': 'aff1', 'engagement': 0.5}]
+    },
+    {
+        'id': 'comp2',
+        'market_share': 0.2,
+        'market_segments': {'cameras': 0.4},
+        'audience_interests': {'photography': 0.4},
+        'content_formats': {'video': 1.0},
+        'affiliates': [{'id': 'aff2', 'engagement': 0.7}]
+    }
+]
+
+def test_gap_analysis_sums_competitor_shares():
+    analysis = CompetitorLandscape.build(COMPETITORS).gap_analysis()
+    
+    assert analysis['market_coverage'] == {
+        'total_market_share': 0.5,
+        'market_segments': {'cameras': 1.0, 'lenses': 0.2},
+        'geographic_coverage': {},
+        'channel_coverage': {}
+    }
+    assert analysis['audience_gaps']['interest_gaps'] == pytest.approx({'photography': 1.2, 'travel': 0.2})
+    assert analysis['content_gaps']['format_gaps'] == {'video': 1.0}
+    assert analysis['partnership_gaps'] == {'partner_type_gaps': {}, 'partnership_model_gaps': {}, 'collaboration_gaps': {}}
+
+def test_prospects_are_scored_against_the_landscape_in_one_call():
+    landscape = CompetitorLandscape.build(COMPETITORS)
+    prospects = [
+        {'id': 'covered', 'market_segments': {'cameras': 1.0}},
+        {'id': 'open', 'market_segments': {'drones': 1.0}, 'content_formats': {'podcast': 1.0}},
+        {'id': 'aff1', 'market_segments': {'lenses': 0.5, 'drones': 0.5}},
+        {'id': 'unknown'}
+    ]
+    
+    covered, open_gap, mixed, unknown = landscape.score_prospects(prospects)
+    
+    assert covered['gap_score'] == 0
+    assert open_gap['gap_score'] == 1
+    assert open_gap['dimension_scores'] == {'market_segments': 1, 'content_formats': 1}
+    # lenses hold 0.2 of the 1.0 cameras peak, so they are a 0.8 gap
+    assert mixed['gap_score'] == pytest.approx((0.8 + 1) / 2)
+    assert mixed['competitor_affiliate']
+    assert unknown == {'id': 'unknown', 'gap_score': 0, 'dimension_scores': {}, 'competitor_affiliate': False}
+    assert landscape.score_prospects([]) == []
+
+def test_landscapes_are_cached_per_campaign_until_the_ttl():
+    cache = LandscapeCache({'competitor_landscape_ttl': 60})
+    with patch.object(CompetitorLandscape, 'build', wraps=CompetitorLandscape.build) as build:
+        first = cache.get(COMPETITORS, 'campaign1')
+        assert cache.get([dict(competitor) for competitor in COMPETITORS], 'campaign1') is first
+        assert cache.get(COMPETITORS, 'campaign1', 'niche') is not first
+        assert cache.get([dict(competitor) for competitor in COMPETITORS]) is cache.get(COMPETITORS)
+        assert build.call_count == 3
+        
+        first.built_at -= 61
+        assert cache.get(COMPETITORS, 'campaign1') is not first
+        cache.invalidate('campaign1')
+        cache.get(COMPETITORS, 'campaign1')
+        assert build.call_count == 5
+
+def test_changed_competitors_rebuild_the_campaign_landscape():
+    cache = LandscapeCache({'competitor_landscape_ttl': 60})
+    first = cache.get(COMPETITORS, 'campaign1')
+    
+    changed = cache.get(COMPETITORS[:1], 'campaign1')
+    
+    assert changed is not first
+    assert changed.competitor_count == 1
+    assert cache.get(COMPETITORS[:1], 'campaign1') is changed
+
+def test_competitor_edits_are_detected_by_version():
+    cache = LandscapeCache({'competitor_landscape_ttl': 60})
+    first = cache.get(COMPETITORS, 'campaign1')
+    edited = [{**COMPETITORS[0], 'market_share': 0.5}, COMPETITORS[1]]
+    
+    # Unversioned edits wait for the TTL or an explicit invalidation
+    assert cache.get(edited, 'campaign1') is first
+    cache.invalidate('campaign1')
+    assert cache.get(edited, 'campaign1').gap_analysis()['market_coverage']['total_market_share'] == 0.7
+    
+    versioned = cache.get([{**competitor, 'updated_at': '2026-05-01'} for competitor in edited], 'campaign1')
+    bumped = [{**competitor, 'updated_at': '2026-05-02'} for competitor in edited]
+    assert cache.get(bumped, 'campaign1') is not versioned
+
+@pytest.mark.asyncio
+async def test_campaign_analyses_share_one_landscape():
+    ai = CompetitiveAnalysisAI({'untapped_gap_threshold': 0.5})
+    prospects = [
+        {'id': 'p1', 'market_segments': {'drones': 1.0}},
+        {'id': 'aff2', 'market_segments': {'drones': 1.0}},
+        {'id': 'p2', 'market_segments': {'cameras': 1.0}}
+    ]
+    
+    with patch.object(CompetitorLandscape, 'build', wraps=CompetitorLandscape.build) as build, \
+            patch.object(ai, '_analyze_competitor_affiliates', wraps=ai._analyze_competitor_affiliates) as affiliates:
+        batch = await ai.analyze_prospect_gaps({'campaign_id': 'c1', 'competitors': COMPETITORS, 'prospects': prospects})
+        single = await ai.analyze_competition({'campaign_id': 'c1', 'competitors': COMPETITORS, 'prospects': prospects[:1]})
+        await ai.analyze_competition({'campaign_id': 'c1', 'competitors': COMPETITORS})
+        
+    assert build.call_count == 1
+    assert affiliates.call_count == 1
+    assert single['competitor_analysis']['affiliate_analysis']['affiliate_count'] == 2
+    assert [score['gap_score'] for score in batch['prospect_gaps']] == [1, 1, 0]
+    assert batch['untapped_prospects'] == [{'id': 'p1', 'type': 'untapped_prospect', 'potential': 1.0}]
+    assert batch['landscape']['competitors'] == 2
+    assert single['competitor_analysis']['untapped_prospects'] == batch['untapped_prospects']
+    assert single['competitor_analysis']['gap_analysis']['market_coverage']['total_market_share'] == 0.5
+    assert single['priority_queue'][0]['opportunity']['id'] == 'p1'
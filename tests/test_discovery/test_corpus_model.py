@@ -0,0 +1,108 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from src.services.discovery.intelligence.content_analysis import ContentAnalysisAI
+from src.services.discovery.nlp.corpus_model import CorpusTfidfModel, fit_corpus
+from src.services.discovery.nlp.memo_store import MemoStore
+from src.services.discovery.nlp.registry import ModelRegistry
+from src.services.discovery.nlp.text_analysis import TextAnalyzer
+
+CORPUS = [f'camera review number{i} with lens' for i in range(50)] + ['gimbal camera setup']
+
+def test_idf_is_counted_over_the_corpus():
+    model = CorpusTfidfModel(n_features=1 << 16, refresh_documents=10).partial_fit(CORPUS)
+    
+    assert model.idf_documents == len(CORPUS)
+    assert model.keywords(['camera gimbal camera'])[0] == ['gimbal', 'camera']
+    assert model.keywords(['camera with the lens'], top_n=1) == [['lens']]
+
+def test_batch_keywords_match_single_texts():
+    model = CorpusTfidfModel(n_features=1 << 16, refresh_documents=10).partial_fit(CORPUS)
+    texts = ['new camera lens review', 'gimbal setup for travel', '']
+    
+    assert model.keywords(texts) == [model.keywords([text])[0] for text in texts]
+    assert model.keywords(texts)[2] == []
+    
+def test_only_reported_keywords_are_named():
+    model = CorpusTfidfModel(n_features=1 << 16, refresh_documents=10).partial_fit(CORPUS)
+    
+    keywords = model.keywords(['camera gimbal tripod drone microphone'], top_n=2)[0]
+    
+    assert sorted(model.terms.values()) == sorted(keywords)
+
+def test_idf_refreshes_only_after_enough_new_documents():
+    model = CorpusTfidfModel(n_features=1 << 16, refresh_documents=10, refresh_fraction=0.5)
+    versions = []
+    for start in range(0, 40, 5):
+        model.partial_fit(CORPUS[start:start + 5])
+        versions.append(model.idf_documents)
+        
+    assert versions == [0, 10, 10, 20, 20, 30, 30, 30]
+
+def test_keywords_stay_consistent_while_other_threads_learn():
+    model = CorpusTfidfModel(n_features=1 << 16, refresh_documents=5).partial_fit(CORPUS)
+    texts = [f'drone footage take{i} gimbal' for i in range(200)]
+    
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        learning = [pool.submit(model.learn, texts[start:start + 5]) for start in range(0, 200, 5)]
+        reading = [pool.submit(model.keywords, texts[start:start + 5], 3) for start in range(0, 200, 5)]
+        results = [future.result() for future in reading]
+        for future in learning:
+            future.result()
+            
+    assert model.documents == len(CORPUS) + 200
+    assert all(len(keywords) == 3 for batch in results for keywords in batch)
+    assert set(model.terms.values()) >= {keyword for batch in results for keywords in batch for keyword in keywords}
+
+def test_saved_model_loads_with_the_same_weights(tmp_path):
+    path = str(tmp_path / 'corpus.npz')
+    fitted = fit_corpus(iter(CORPUS), path, chunk_size=7, n_features=1 << 16)
+    fitted.keywords(['gimbal camera'])
+    fitted.save(path)
+    
+    loaded = CorpusTfidfModel.from_config({'corpus_model_path': path})
+    
+    assert loaded.version == fitted.version
+    assert loaded.terms == fitted.terms
+    assert (loaded.idf == fitted.idf).all()
+    assert loaded.keywords(['camera gimbal']) == fitted.keywords(['camera gimbal'])
+
+@pytest.mark.asyncio
+async def test_content_analysis_extracts_a_batch_in_one_transform():
+    analyzer = ContentAnalysisAI({'corpus_model_features': 1 << 16, 'corpus_refresh_documents': 1000})
+    analyzer.models = ModelRegistry()
+    model = analyzer.corpus_model
+    texts = ['camera lens review', 'gimbal setup', 'camera lens review']
+    
+    with patch.object(model, 'keywords', wraps=model.keywords) as keywords:
+        first = await analyzer._extract_keywords_batch(texts)
+        second = await analyzer._extract_keywords_batch(texts)
+        
+    assert keywords.call_count == 2
+    assert keywords.call_args.args[0] == ['camera lens review', 'gimbal setup']
+    assert first == second
+    assert first[0] == first[2] and first[0] is not first[2]
+    # Texts already learned are not counted again
+    assert model.documents == 2
+    assert await analyzer._extract_keywords('gimbal setup') == first[1]
+
+@pytest.mark.asyncio
+async def test_content_batch_extracts_keywords_once_for_all_profiles():
+    analyzer = ContentAnalysisAI({'corpus_model_features': 1 << 16})
+    analyzer.models = ModelRegistry()
+    analyzer.text_analyzer = TextAnalyzer({}, stop_words=ENGLISH_STOP_WORDS, lemmatize=str)
+    analyzer.text_analyzer.memo = MemoStore({})
+    profiles = [{'headline': 'camera lens review'}, {'headline': 'gimbal setup'}]
+    
+    with patch.object(analyzer, '_extract_keywords_batch', wraps=analyzer._extract_keywords_batch) as batch, \
+            patch.object(analyzer, '_extract_keywords', wraps=analyzer._extract_keywords) as single:
+        results = await analyzer.analyze_content_batch(profiles, 'linkedin')
+        
+    assert batch.call_count == 1
+    assert single.call_count == 0
+    assert results[1]['topics'] == ['gimbal', 'setup']
+    assert [sorted(result['keywords']) for result in results] == [['camera', 'lens', 'review'], ['gimbal', 'setup']]
+    with pytest.raises(ValueError):
+        await analyzer.analyze_content_batch(profiles, 'myspace')
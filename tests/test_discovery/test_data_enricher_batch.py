@@ -0,0 +1,57 @@
+import pytest
+import spacy
+from unittest.mock import patch
+
+from src.services.discovery.nlp.memo_store import MemoStore
+from src.services.discovery.nlp.registry import ModelRegistry
+from src.services.discovery.pipeline.data_enricher import DataEnricher
+
+def make_nlp():
+    nlp = spacy.blank('en')
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns([
+        {'label': 'ORG', 'pattern': 'Sony'},
+        {'label': 'GPE', 'pattern': 'Austin'}
+    ])
+    nlp.add_pipe('sentencizer')
+    return nlp
+
+@pytest.fixture
+def enricher():
+    enricher = DataEnricher({'spacy_batch_size': 2})
+    enricher.models = ModelRegistry()
+    enricher.models.get('spacy.en_core_web_sm', make_nlp)
+    enricher.memo = MemoStore({})
+    return enricher
+
+def make_profile(*texts):
+    return {'content': [{'text': text} for text in texts] + [{'likes': 3}]}
+
+@pytest.mark.asyncio
+async def test_batch_scatters_annotations_back_to_posts(enricher):
+    profiles = [
+        make_profile('Testing the Sony A7', 'Nothing to see'),
+        make_profile(),
+        make_profile('Meetup in Austin')
+    ]
+    
+    results = await enricher.enrich_profiles_batch(profiles)
+    
+    assert [len(result['content']) for result in results] == [3, 1, 2]
+    assert results[0]['content'][0]['entities'][0]['text'] == 'Sony'
+    assert results[0]['content'][1]['entities'] == []
+    assert 'entities' not in results[0]['content'][2]
+    assert results[2]['content'][0]['entities'][0]['label'] == 'GPE'
+    assert results[2]['content'][0]['topics'] == []
+
+@pytest.mark.asyncio
+async def test_batch_runs_one_pipe_with_unneeded_components_disabled(enricher):
+    nlp = enricher.nlp
+    profiles = [make_profile('Sony', 'Austin'), make_profile('Sony')]
+    
+    with patch.object(nlp, 'pipe', wraps=nlp.pipe) as pipe:
+        await enricher.enrich_profiles_batch(profiles)
+        
+    assert pipe.call_count == 1
+    assert pipe.call_args.kwargs['disable'] == ['sentencizer']
+    assert pipe.call_args.kwargs['batch_size'] == 2
@@ -0,0 +1,65 @@
+import msgpack
+import numpy as np
+import pytest
+from datetime import datetime, timezone
+
+from src.services.discovery.models.data_object import (
+    DataObject, DataRecord, PlatformType, SCHEMA_VERSION, pack_payload, unpack_payload
+)
+
+def make_profile():
+    return DataObject(
+        platform=PlatformType.TWITTER,
+        timestamp=datetime(2026, 5, 1, 12, 30, 15, 123456),
+        url='https://twitter.com/creator',
+        data={'basic_info': {'username': 'creator', 'followers': 12000}, 'content': [{'text': 'hi'}]},
+        metadata={'scraper_version': '1.0'}
+    )
+
+def test_msgpack_round_trip():
+    """Objects survive the msgpack envelope unchanged."""
+    profile = make_profile()
+    
+    decoded = DataObject.from_msgpack(profile.to_msgpack())
+    
+    assert decoded == profile
+    assert msgpack.unpackb(profile.to_msgpack(), timestamp=3)[0] == SCHEMA_VERSION
+
+def test_newer_schema_versions_are_rejected():
+    """Payloads from a newer writer are not silently misread."""
+    envelope = msgpack.unpackb(make_profile().to_msgpack(), timestamp=3)
+    envelope[0] = SCHEMA_VERSION + 1
+    
+    with pytest.raises(ValueError):
+        DataObject.from_msgpack(msgpack.packb(envelope, datetime=True))
+
+def test_record_overlays_share_the_base_data():
+    """Stages that only add fields layer them without copying the record."""
+    profile = make_profile()
+    record = profile.to_record()
+    
+    scored = record.extend(data={'score': 0.8}, metadata={'stage': 'scoring'})
+    
+    assert record.data is profile.data
+    assert 'score' not in record.data
+    assert scored.data['score'] == 0.8
+    assert scored.data['basic_info'] is profile.data['basic_info']
+    
+    decoded = DataRecord.from_msgpack(scored.to_msgpack())
+    assert dict(decoded.data) == {**profile.data, 'score': 0.8}
+    assert DataObject.from_record(scored).metadata == {'scraper_version': '1.0', 'stage': 'scoring'}
+
+def test_payloads_keep_datetimes_and_non_string_keys():
+    """Worker payloads decode to the values that went in, not their JSON forms."""
+    payload = [
+        {'joined': datetime(2024, 1, 15, 9, 30), 'seen': datetime(2024, 1, 15, tzinfo=timezone.utc)},
+        {'communities': {0: ['a', 'b'], 1: ['c']}, 'score': np.float64(0.5), 'degrees': np.array([1, 2])}
+    ]
+    
+    assert unpack_payload(pack_payload(payload)) == [
+        payload[0],
+        {'communities': {0: ['a', 'b'], 1: ['c']}, 'score': 0.5, 'degrees': [1, 2]}
+    ]
+    assert DataObject.from_msgpack(DataObject(
+        platform=PlatformType.GENERIC, url='https://example.com', data={'joined': datetime(2024, 1, 15)}
+    ).to_msgpack()).data == {'joined': datetime(2024, 1, 15)}
@@ -0,0 +1,97 @@
+import pytest
+from jsonschema import Draft7Validator
+
+from src.services.discovery.pipeline.data_validator import DataValidator, EMAIL_PATTERN
+from src.services.discovery.pipeline.schema_compiler import compile_schema
+
+def make_profile(**basic_info):
+    return {
+        'basic_info': {'username': 'lenslab', 'name': 'Lens Lab', 'bio': 'Camera reviews', **basic_info},
+        'content': [{'id': 'p1', 'type': 'video', 'text': 'Unboxing', 'media': [{'type': 'image', 'url': 'https://a.io/x.jpg'}]}],
+        'engagement': {'likes': 10, 'comments': 2, 'engagement_rate': 0.1},
+        'network': {'connections': [{'id': 'u1', 'type': 'follower', 'strength': 0.5}], 'metrics': {'size': 1, 'density': 1.0}}
+    }
+
+def validate(check, value):
+    errors, warnings = [], []
+    check(value, errors, warnings)
+    return errors, warnings
+
+def test_valid_profile_passes_every_section():
+    results = DataValidator({}).validate_profile_data(make_profile(email='hi@lenslab.io'))
+    
+    assert results['is_valid'] is True
+    assert results['errors'] == []
+    assert all(results[section]['is_valid'] for section in ('basic_info', 'content', 'engagement', 'network'))
+
+def test_errors_name_the_failing_field():
+    profile = make_profile(bio='', email='not-an-email')
+    del profile['basic_info']['name']
+    profile['engagement'].update(likes=-1, engagement_rate=1.5)
+    profile['content'][0]['media'][0].pop('url')
+    
+    results = DataValidator({}).validate_profile_data(profile)
+    
+    assert results['is_valid'] is False
+    assert results['basic_info']['errors'] == [
+        "basic_info: 'name' is a required property",
+        "basic_info.bio: '' is too short",
+        f"basic_info.email: 'not-an-email' does not match {EMAIL_PATTERN!r}"
+    ]
+    assert results['engagement']['errors'] == [
+        'engagement.likes: -1 is less than the minimum of 0',
+        'engagement.engagement_rate: 1.5 is greater than the maximum of 1'
+    ]
+    assert results['content']['errors'] == ["content[].media[]: 'url' is a required property"]
+
+def test_wrong_type_fails_once_without_range_checks():
+    check = compile_schema({'type': 'number', 'minimum': 0}, 'likes')
+    
+    assert validate(check, 'many') == (["likes: 'many' is not of type 'number'"], [])
+    assert validate(check, True)[0] == ["likes: True is not of type 'number'"]
+
+def test_long_text_warns_without_failing():
+    results = DataValidator({}).validate_profile_data(make_profile(bio='x' * 1001))
+    
+    assert results['is_valid'] is True
+    assert results['basic_info']['warnings'] == ['basic_info.bio exceeds recommended length of 1000']
+
+@pytest.mark.parametrize('value', [
+    {'username': 'a', 'name': 'b', 'bio': 'c'},
+    {'username': 'a', 'name': 'b'},
+    {'username': 'a', 'name': 'b', 'bio': 'c', 'website': 'https://lenslab.io/about'},
+    {'username': 'a', 'name': 'b', 'bio': 'c', 'website': 'lenslab'},
+    {'username': 1, 'name': 'b', 'bio': 'c'},
+    {'username': 'a', 'name': 'b', 'bio': 'c', 'join_date': None},
+    []
+])
+def test_verdicts_match_jsonschema(value):
+    schema = DataValidator({}).schemas['basic_info']
+    
+    errors, _ = validate(compile_schema(schema, 'basic_info'), value)
+    
+    assert (not errors) == Draft7Validator(schema).is_valid(value)
+
+def test_platform_schemas_override_the_defaults():
+    lenient = {'type': 'object', 'required': ['username']}
+    validator = DataValidator({'validation_schemas': {'tiktok': {'basic_info': lenient}}})
+    profile = make_profile()
+    del profile['basic_info']['bio']
+    
+    assert validator.validate_profile_data(profile, 'tiktok')['is_valid'] is True
+    assert validator.validate_profile_data(profile)['is_valid'] is False
+
+def test_unsupported_keywords_fall_back_to_jsonschema():
+    check = compile_schema({'type': 'object', 'properties': {'type': {'enum': ['video', 'image']}}}, 'item')
+    
+    assert validate(check, {'type': 'video'}) == ([], [])
+    assert validate(check, {'type': 'reel'})[0] == ["item.type: 'reel' is not one of ['video', 'image']"]
+
+def test_batch_returns_a_mask_of_failed_profiles():
+    invalid = make_profile()
+    invalid['engagement']['likes'] = -5
+    
+    failed, results = DataValidator({}).validate_batch([make_profile(), invalid, make_profile()])
+    
+    assert failed.tolist() == [False, True, False]
+    assert [result['is_valid'] for result in results] == [True, False, True]
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+from src.services.discovery.pipeline.data_cleaner import DataCleaner
+from src.services.discovery.pipeline.date_parser import DateParser, ISO_FORMAT
+
+def test_iso_strings_take_the_fast_path():
+    parser = DateParser({})
+    
+    assert parser.parse('2026-04-21T09:30:00Z') == datetime(2026, 4, 21, 9, 30, tzinfo=timezone.utc)
+    assert parser.get_stats()['source_formats'] == {'default': ISO_FORMAT}
+
+def test_detected_format_is_preferred_for_the_same_source():
+    parser = DateParser({})
+    
+    # 25/03 can only be day-first, so the source is learned as day-first
+    assert parser.parse('25/03/2026', 'linkedin') == datetime(2026, 3, 25)
+    assert parser.parse('01/02/2026', 'linkedin') == datetime(2026, 2, 1)
+    
+    # Another source that writes month-first keeps its own format
+    assert parser.parse('03/25/2026', 'twitter') == datetime(2026, 3, 25)
+    assert parser.parse('01/02/2026', 'twitter') == datetime(2026, 1, 2)
+    assert parser.get_stats()['source_formats'] == {'linkedin': '%d/%m/%Y', 'twitter': '%m/%d/%Y'}
+
+def test_a_value_outside_the_locked_format_does_not_switch_the_source():
+    parser = DateParser({})
+    
+    assert parser.parse('01/02/2026', 'linkedin') == datetime(2026, 2, 1)
+    assert parser.parse('12/31/2026', 'linkedin') == datetime(2026, 12, 31)
+    assert parser.parse('03/04/2026', 'linkedin') == datetime(2026, 4, 3)
+    assert parser.parse('01/02/2026', 'linkedin') == datetime(2026, 2, 1)
+    assert parser.get_stats()['source_formats'] == {'linkedin': '%d/%m/%Y'}
+
+def test_cached_values_follow_the_format_locked_after_them():
+    parser = DateParser({})
+    
+    # Nothing parses this yet, so the source stays unlocked and the miss is cached
+    assert parser.parse('3 days ago', 'twitter') is None
+    assert parser.parse('03/25/2026', 'twitter') == datetime(2026, 3, 25)
+    assert parser.parse('01/02/2026', 'twitter') == datetime(2026, 1, 2)
+    assert parser.parse('3 days ago', 'twitter') is None
+    assert parser.get_stats()['source_formats'] == {'twitter': '%m/%d/%Y'}
+
+def test_parse_many_parses_repeated_values_once():
+    parser = DateParser({})
+    values = ['April 21, 2026', 'April 21, 2026', None, 'not a date', 'April 22, 2026']
+    
+    parsed = parser.parse_many(values, 'youtube')
+    
+    assert parsed == [datetime(2026, 4, 21), datetime(2026, 4, 21), None, None, datetime(2026, 4, 22)]
+    assert parser.get_stats()['cache_misses'] == 3
+
+def test_cleaner_normalizes_dates_and_post_timestamps():
+    cleaner = DataCleaner({})
+    
+    cleaned = cleaner.clean_profile_data({
+        'platform': 'youtube',
+        'basic_info': {'join_date': 'March 3, 2019'},
+        'content': [
+            {'id': '1', 'type': 'video', 'text': 'a', 'timestamp': 'Apr 21, 2026'},
+            {'id': '2', 'type': 'video', 'text': 'b', 'timestamp': '3 days ago'}
+        ]
+    })
+    
+    assert cleaned['basic_info']['join_date'] == '2019-03-03'
+    assert [item['timestamp'] for item in cleaned['content']] == ['2026-04-21T00:00:00', '3 days ago']
@@ -0,0 +1,221 @@
+import networkx as nx
+import pytest
+from unittest.mock import patch
+
+from src.services.discovery.intelligence.graph_metrics import VersionedGraph, GraphMetricsCache
+from src.services.discovery.intelligence.network_analysis import NetworkAnalysisAI
+
+def test_structural_mutations_bump_the_version():
+    graph = VersionedGraph()
+    versions = [graph.version]
+    
+    graph.add_edge('a', 'b')
+    versions.append(graph.version)
+    graph.add_edges_from([('b', 'c'), ('c', 'd')])
+    versions.append(graph.version)
+    graph.degree('a'), list(graph.edges()), nx.density(graph)
+    versions.append(graph.version)
+    graph.remove_node('d')
+    versions.append(graph.version)
+    
+    assert versions[0] < versions[1] < versions[2] == versions[3] < versions[4]
+
+def test_metrics_are_computed_once_per_version():
+    graph = VersionedGraph([('a', 'b'), ('b', 'c')])
+    cache = GraphMetricsCache(graph)
+    calls = []
+    
+    def compute(g):
+        calls.append(g.number_of_edges())
+        return g.number_of_edges()
+        
+    assert cache.get('edges', compute) == 2
+    assert cache.get('edges', compute) == 2
+    graph.add_edge('c', 'd')
+    assert cache.get('edges', compute) == 3
+    assert calls == [2, 3]
+    assert cache.stats['hits'] == 1
+
+def test_failures_are_cached_for_the_version():
+    cache = GraphMetricsCache(VersionedGraph([('a', 'b')]))
+    calls = []
+    
+    def fail(graph):
+        calls.append(1)
+        raise nx.PowerIterationFailedConvergence(100)
+        
+    for _ in range(2):
+        with pytest.raises(nx.PowerIterationFailedConvergence):
+            cache.get('eigenvector_centrality', fail)
+    assert calls == [1]
+
+@pytest.mark.asyncio
+async def test_analysis_computes_each_centrality_once():
+    analyzer = NetworkAnalysisAI({})
+    analyzer._build_network_graph({
+        'channels': [{'id': str(i)} for i in range(30)],
+        'connections': [{'source': str(i), 'target': str((i * 7 + 3) % 30)} for i in range(30)]
+    })
+    
+    with patch.object(nx, 'betweenness_centrality', wraps=nx.betweenness_centrality) as betweenness, \
+            patch.object(nx, 'eigenvector_centrality', wraps=nx.eigenvector_centrality) as eigenvector:
+        await analyzer._calculate_centrality_metrics()
+        analyzer._identify_key_influencers()
+        analyzer._identify_network_expansion_opportunities()
+        
+    assert betweenness.call_count == 1
+    assert eigenvector.call_count == 1
+
+def sampled_cache(graph, **config):
+    return GraphMetricsCache(graph, {'exact_metrics_max_nodes': 50, 'graph_metrics_min_pivots': 64, **config})
+
+def test_small_graphs_use_exact_metrics():
+    graph = VersionedGraph(nx.karate_club_graph())
+    cache = GraphMetricsCache(graph)
+    
+    assert cache.betweenness_centrality() == nx.betweenness_centrality(graph)
+    assert cache.closeness_centrality() == nx.closeness_centrality(graph)
+    assert cache.average_path_length() == nx.average_shortest_path_length(graph)
+    assert cache.diameter() == nx.diameter(graph)
+    assert cache.error_bounds()['betweenness_centrality'] == {'method': 'exact', 'error_bound': 0.0}
+    assert cache.error_bounds()['diameter']['lower'] == cache.error_bounds()['diameter']['upper']
+
+def test_large_graphs_are_estimated_within_their_bounds():
+    graph = VersionedGraph(nx.connected_watts_strogatz_graph(400, 6, 0.1, seed=3))
+    cache = sampled_cache(graph)
+    
+    betweenness = cache.betweenness_centrality()
+    closeness = cache.closeness_centrality()
+    path_length = cache.average_path_length()
+    diameter = cache.diameter()
+    bounds = cache.error_bounds()
+    
+    assert bounds['betweenness_centrality']['method'] == 'pivot_sample'
+    assert bounds['betweenness_centrality']['pivots'] >= 64
+    exact_betweenness = nx.betweenness_centrality(graph)
+    assert max(abs(betweenness[n] - exact_betweenness[n]) for n in graph) <= bounds['betweenness_centrality']['error_bound']
+    
+    exact_path_length = nx.average_shortest_path_length(graph)
+    assert abs(path_length - exact_path_length) <= bounds['average_path_length']['error_bound']
+    assert abs(path_length - exact_path_length) < 0.1 * exact_path_length
+    
+    exact_closeness = nx.closeness_centrality(graph)
+    error = bounds['closeness_centrality']['average_distance_error_bound']
+    assert all(abs(1 / closeness[n] - 1 / exact_closeness[n]) <= error for n in graph)
+    
+    assert bounds['diameter']['lower'] == diameter <= nx.diameter(graph) <= bounds['diameter']['upper']
+
+def test_bounds_are_dropped_with_the_version():
+    graph = VersionedGraph(nx.path_graph(100))
+    cache = sampled_cache(graph)
+    cache.diameter()
+    
+    assert cache.error_bounds()['diameter']['method'] == 'double_sweep'
+    assert cache.error_bounds()['diameter']['lower'] == 99
+    graph.add_node('isolated')
+    assert cache.error_bounds() == {}
+    assert cache.diameter() == float('inf')
+    assert cache.average_path_length() == float('inf')
+
+def test_sampling_stops_at_the_time_budget():
+    graph = VersionedGraph(nx.gnm_random_graph(2000, 8000, seed=1))
+    cache = sampled_cache(graph, graph_metrics_time_budget=0.0, graph_metrics_min_pivots=5)
+    
+    cache.average_path_length()
+    cache.betweenness_centrality()
+    
+    assert cache.error_bounds()['average_path_length']['pivots'] == 5
+    assert cache.error_bounds()['betweenness_centrality']['pivots'] == 5
+
+def test_large_graph_power_iterations_match_networkx():
+    graph = VersionedGraph(nx.barabasi_albert_graph(400, 3, seed=1))
+    for u, v in list(graph.edges())[::4]:
+        graph[u][v]['weight'] = 3.0
+    cache = sampled_cache(graph)
+    
+    eigenvector = cache.eigenvector_centrality()
+    pagerank = cache.pagerank()
+    bounds = cache.error_bounds()
+    
+    assert eigenvector == pytest.approx(nx.eigenvector_centrality(graph, tol=1e-10), abs=1e-4)
+    assert pagerank == pytest.approx(nx.pagerank(graph, tol=1e-10), abs=1e-4)
+    assert bounds['eigenvector_centrality']['converged'] and bounds['pagerank']['converged']
+
+def test_metrics_share_one_time_budget():
+    graph = VersionedGraph(nx.gnm_random_graph(2000, 8000, seed=1))
+    cache = sampled_cache(graph, graph_metrics_time_budget=0.5, graph_metrics_min_pivots=5, graph_metrics_min_iterations=3)
+    cache.start_budget()
+    
+    cache._deadline -= 0.5
+    cache.betweenness_centrality()
+    cache.pagerank()
+    cache.eigenvector_centrality()
+    communities = cache.communities()
+    bounds = cache.error_bounds()
+    
+    assert bounds['betweenness_centrality']['pivots'] == 5
+    assert bounds['pagerank']['iterations'] == 3
+    assert bounds['eigenvector_centrality']['iterations'] == 3
+    assert bounds['louvain_communities'] == {'method': 'label_propagation'}
+    assert set().union(*communities) == set(graph)
+    
+    graph.add_edge(0, 1999)
+    cache.start_budget()
+    cache.communities()
+    assert cache.error_bounds()['louvain_communities']['method'] == 'louvain'
+
+@pytest.mark.asyncio
+async def test_influence_paths_stop_two_hops_out():
+    analyzer = NetworkAnalysisAI({})
+    analyzer._build_network_graph({
+        'channels': [{'id': str(i)} for i in range(30)],
+        'connections': [{'source': str(i), 'target': str(i + 1)} for i in range(29)]
+    })
+    
+    paths = analyzer._analyze_influence_paths([{'id': '10'}])
+    
+    expected = {target: path for target, path in nx.single_source_shortest_path(analyzer.network, '10').items() if len(path) <= 3}
+    assert paths == {'10': expected}
+
+def test_community_stats_match_networkx():
+    graph = VersionedGraph(nx.planted_partition_graph(6, 15, 0.5, 0.05, seed=2))
+    for u, v in list(graph.edges())[::3]:
+        graph[u][v]['weight'] = 2.5
+    graph.add_edge(0, 0)
+    cache = GraphMetricsCache(graph)
+    communities = cache.communities()
+    
+    stats = cache.community_stats()
+    
+    assert stats['modularity'] == pytest.approx(nx.community.modularity(graph, communities))
+    for label, community in enumerate(communities):
+        assert stats['densities'][label] == pytest.approx(nx.density(graph.subgraph(community)))
+        assert stats['conductance'][label] == pytest.approx(nx.conductance(graph, community, weight='weight'))
+        assert stats['intra_edges'][label] == graph.subgraph(community).number_of_edges()
+        assert stats['inter_edges'][label] == nx.cut_size(graph, community)
+        
+    expected = {}
+    for u, v in graph.edges():
+        i, j = stats['membership'][u], stats['membership'][v]
+        expected[(i, j)] = expected.get((i, j), 0) + 1
+    assert dict(stats['edge_counts'].todok().items()) == expected
+
+@pytest.mark.asyncio
+async def test_community_analysis_reports_inter_community_edges():
+    analyzer = NetworkAnalysisAI({})
+    analyzer._build_network_graph({
+        'channels': [{'id': node} for node in 'abcdef'],
+        'connections': [
+            {'source': 'a', 'target': 'b'}, {'source': 'b', 'target': 'c'}, {'source': 'a', 'target': 'c'},
+            {'source': 'd', 'target': 'e'}, {'source': 'e', 'target': 'f'}, {'source': 'd', 'target': 'f'},
+            {'source': 'c', 'target': 'd'}
+        ]
+    })
+    
+    result = await analyzer._analyze_communities()
+    
+    assert result['community_metrics']['number_of_communities'] == 2
+    assert sum(result['inter_community_connections'].values()) == 1
+    assert result['community_metrics']['intra_community_edges'] == [3, 3]
+    assert result['community_metrics']['community_conductance'] == [pytest.approx(1 / 7)] * 2
+    assert result['modularity'] == pytest.approx(nx.community.modularity(analyzer.network, analyzer.metrics.communities()))
@@ -0,0 +1,103 @@
+import asyncio
+import random
+import networkx as nx
+import pytest
+from unittest.mock import patch
+
+from src.services.discovery.intelligence.graph_store import AffiliateGraphStore
+from src.services.discovery.intelligence.network_analysis import NetworkAnalysisAI
+
+def connections(edges):
+    return [{'source': u, 'target': v} for u, v in edges]
+
+def test_snapshots_are_immutable_and_isolated():
+    store = AffiliateGraphStore()
+    store.update([{'id': 'a', 'subscribers': 10}], connections([('a', 'b'), ('b', 'c')]))
+    before = store.snapshot()
+    
+    store.update([{'id': 'a', 'subscribers': 20}], connections([('c', 'd')]) + [{'source': 'a', 'target': 'b', 'weight': 3.0}])
+    after = store.snapshot()
+    
+    assert sorted(before.edges()) == [('a', 'b'), ('b', 'c')]
+    assert before.nodes['a']['subscribers'] == 10
+    assert before['a']['b']['weight'] == 1.0
+    assert after.has_edge('c', 'd') and after.nodes['a']['subscribers'] == 20
+    assert after['a']['b']['weight'] == 3.0
+    assert after.version > before.version
+    assert store.snapshot() is after
+    with pytest.raises(nx.NetworkXError):
+        before.add_edge('x', 'y')
+
+def test_updates_copy_only_touched_adjacency():
+    store = AffiliateGraphStore()
+    store.update(connections=connections((i, i + 1) for i in range(100)))
+    before = store.snapshot()
+    
+    store.update(connections=connections([(50, 200)]))
+    after = store.snapshot()
+    
+    assert after._adj[10] is before._adj[10]
+    assert after._adj[50] is not before._adj[50]
+    assert 200 not in before._adj[50]
+
+def test_incremental_degree_and_components_match_networkx():
+    rng = random.Random(3)
+    store = AffiliateGraphStore({'graph_compact_every': 1000})
+    for _ in range(20):
+        store.update(connections=connections((rng.randrange(200), rng.randrange(200)) for _ in range(10)))
+        graph = store.snapshot()
+        metrics = store.metrics(graph)
+        
+        assert metrics.degree_centrality() == pytest.approx(nx.degree_centrality(graph))
+        assert sorted(map(sorted, metrics.connected_components())) == sorted(map(sorted, nx.connected_components(graph)))
+        
+    edge = next(iter(graph.edges()))
+    store.remove_edges([edge])
+    assert store.components(store.version) is None
+    store.compact()
+    graph = store.snapshot()
+    assert sorted(map(sorted, store.components(store.version))) == sorted(map(sorted, nx.connected_components(graph)))
+    assert store.degrees(store.version) == dict(graph.degree())
+
+def test_pagerank_is_warm_started_from_the_previous_version():
+    store = AffiliateGraphStore()
+    store.update(connections=connections(nx.barabasi_albert_graph(300, 3, seed=1).edges()))
+    store.metrics().pagerank()
+    store.update(connections=connections([(0, 299)]))
+    
+    with patch.object(nx, 'pagerank', wraps=nx.pagerank) as pagerank:
+        values = store.metrics().pagerank()
+        
+    assert pagerank.call_args.kwargs['nstart'] is not None
+    assert values == pytest.approx(nx.pagerank(store.snapshot(), tol=1e-10), abs=1e-4)
+
+def test_periodic_compaction():
+    store = AffiliateGraphStore({'graph_compact_every': 3})
+    for i in range(3):
+        store.update(connections=connections([(i, i + 1)]))
+    store.remove_edges([(0, 1)])
+    assert store.components(store.version) is None
+    for i in range(2):
+        store.update(connections=connections([(10 + i, 11 + i)]))
+    assert store.components(store.version) is not None
+
+@pytest.mark.asyncio
+async def test_concurrent_analyses_read_their_own_snapshot():
+    analyzer = NetworkAnalysisAI({})
+    initial = analyzer.network
+    original = NetworkAnalysisAI._analyze_communities
+    
+    async def interleaved(self):
+        await asyncio.sleep(0)
+        return await original(self)
+        
+    with patch.object(NetworkAnalysisAI, '_analyze_communities', interleaved):
+        first, second = await asyncio.gather(
+            analyzer.analyze_network({'channels': [{'id': 'a'}], 'connections': connections([('a', 'b')])}, 'youtube'),
+            analyzer.analyze_network({'channels': [{'id': 'c'}], 'connections': connections([('c', 'd'), ('d', 'e')])}, 'youtube')
+        )
+        
+    assert analyzer.network is initial
+    assert first['network_metrics']['size'] == 2
+    assert second['network_metrics']['size'] == 5
+    assert analyzer.store.snapshot().number_of_edges() == 3
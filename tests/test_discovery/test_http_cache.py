@@ -0,0 +1,197 @@
+import aiohttp
+import pytest
+from unittest.mock import patch
+from yarl import URL
+
+from src.services.discovery.adapters.http_cache import HTTPCache, CachingSession, MemoryCacheStorage
+
+PAGE = b'<html><body>' + b'creator review ' * 200 + b'</body></html>'
+
+class FakeResponse:
+    def __init__(self, status, body, url, headers=None):
+        self.status = status
+        self.url = url
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def get(self, url, headers=None, params=None, **kwargs):
+        self.requests.append((url, headers or {}))
+        status, body, headers = self.responses[url]
+        return FakeResponse(status, body, url, headers)
+
+@pytest.mark.asyncio
+async def test_fresh_entries_are_replayed_without_a_request():
+    """Responses within the platform TTL are served from the cache."""
+    cache = HTTPCache({})
+    session = FakeSession({'https://x.example/a': (200, PAGE, {'ETag': '"v1"'})})
+
+    first = await cache.get(session, 'https://x.example/a', 'twitter')
+    second = await cache.get(session, 'https://x.example/a', 'twitter')
+
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert await second.read() == PAGE
+    assert len(session.requests) == 1
+    assert cache.get_stats()['platforms']['twitter']['hit_rate'] == 0.5
+    assert cache.get_stats()['size_bytes'] < len(PAGE)
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_revalidated():
+    """Stale entries send validators and reuse the stored body on 304."""
+    cache = HTTPCache({'http_cache_ttls': {'twitter': 0}})
+    session = FakeSession({'https://x.example/a': (
+        200, PAGE, {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jun 2026 00:00:00 GMT'}
+    )})
+    await cache.get(session, 'https://x.example/a', 'twitter')
+
+    session.responses['https://x.example/a'] = (304, b'', {})
+    response = await cache.get(session, 'https://x.example/a', 'twitter')
+
+    _, headers = session.requests[-1]
+    assert headers['If-None-Match'] == '"v1"'
+    assert headers['If-Modified-Since'] == 'Mon, 01 Jun 2026 00:00:00 GMT'
+    assert response.status == 200
+    assert await response.read() == PAGE
+    assert cache.get_stats()['platforms']['twitter']['revalidated'] == 1
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted():
+    """The cache stays within its size budget."""
+    cache = HTTPCache({'http_cache_max_bytes': 250})
+    session = FakeSession({
+        f'https://x.example/{i}': (200, PAGE, {}) for i in range(3)
+    })
+
+    for i in range(3):
+        await cache.get(session, f'https://x.example/{i}')
+
+    assert cache.get_stats()['size_bytes'] <= 250
+    assert (await cache.get(session, 'https://x.example/2')).from_cache is True
+    assert (await cache.get(session, 'https://x.example/0')).from_cache is False
+
+@pytest.mark.asyncio
+async def test_self_evicting_storage_is_not_budgeted():
+    """Storage that expires entries itself, like Redis, skips the local LRU."""
+    cache = HTTPCache({'http_cache_max_bytes': 250})
+    cache.storage = MemoryCacheStorage()
+    cache.storage.evicts = True
+    session = FakeSession({
+        f'https://x.example/{i}': (200, PAGE, {}) for i in range(3)
+    })
+
+    for i in range(3):
+        await cache.get(session, f'https://x.example/{i}')
+
+    assert cache.get_stats()['entries'] == 0
+    assert (await cache.get(session, 'https://x.example/0')).from_cache is True
+
+@pytest.mark.asyncio
+async def test_disk_backend_survives_restart(tmp_path):
+    """Disk-backed entries are picked up by a new cache instance."""
+    config = {'http_cache_dir': str(tmp_path)}
+    session = FakeSession({'https://x.example/a': (200, PAGE, {})})
+    await HTTPCache(config).get(session, 'https://x.example/a')
+
+    restarted = HTTPCache(config)
+    response = await CachingSession(session, restarted, 'generic').get('https://x.example/a')
+
+    assert response.from_cache is True
+    assert len(session.requests) == 1
+    assert restarted.get_stats()['entries'] == 1
+
+@pytest.mark.asyncio
+async def test_no_store_responses_are_not_cached():
+    """Responses marked no-store are always fetched."""
+    cache = HTTPCache({})
+    session = FakeSession({'https://x.example/a': (200, PAGE, {'Cache-Control': 'no-store'})})
+
+    await cache.get(session, 'https://x.example/a')
+    await cache.get(session, 'https://x.example/a')
+
+    assert len(session.requests) == 2
+
+@pytest.mark.asyncio
+async def test_query_params_are_part_of_the_key():
+    """Requests differing only in params are cached separately."""
+    cache = HTTPCache({})
+    session = FakeSession({'https://x.example/search': (200, PAGE, {})})
+
+    await cache.get(session, 'https://x.example/search', params={'q': 'lens'})
+    again = await cache.get(session, 'https://x.example/search', params={'q': 'lens'})
+    other = await cache.get(session, 'https://x.example/search', params={'q': 'camera'})
+
+    assert again.from_cache is True
+    assert other.from_cache is False
+
+@pytest.mark.asyncio
+async def test_entries_are_replayed_only_to_matching_vary_headers():
+    """Requests with other values of a Vary header are fetched again."""
+    cache = HTTPCache({})
+    session = FakeSession({'https://x.example/a': (200, PAGE, {'Vary': 'Accept-Language'})})
+
+    await cache.get(session, 'https://x.example/a', headers={'Accept-Language': 'en'})
+    same = await cache.get(session, 'https://x.example/a', headers={'accept-language': 'en'})
+    other = await cache.get(session, 'https://x.example/a', headers={'Accept-Language': 'fr'})
+
+    assert same.from_cache is True
+    assert other.from_cache is False
+    assert len(session.requests) == 2
+
+@pytest.mark.asyncio
+async def test_requests_with_credentials_bypass_the_cache():
+    """Responses to credentialed requests are neither stored nor replayed."""
+    cache = HTTPCache({})
+    session = FakeSession({'https://x.example/a': (200, PAGE, {})})
+    await cache.get(session, 'https://x.example/a')
+
+    with_cookie = await cache.get(session, 'https://x.example/a', headers={'Cookie': 'sid=1'})
+    with_auth = await cache.get(session, 'https://x.example/a', headers={'Authorization': 'Bearer t'})
+
+    assert with_cookie.from_cache is False
+    assert with_auth.from_cache is False
+    assert len(session.requests) == 3
+    assert cache.get_stats()['platforms']['generic']['bypassed'] == 2
+
+@pytest.mark.asyncio
+async def test_cookies_collected_by_the_jar_keep_the_cache():
+    """Sites set cookies on the first response; later GETs still revalidate."""
+    cache = HTTPCache({})
+    session = FakeSession({'https://x.example/a': (200, PAGE, {'ETag': '"v1"'})})
+    session.cookie_jar = aiohttp.CookieJar(unsafe=True)
+    session.cookie_jar.update_cookies({'visitor': 'abc'}, URL('https://x.example/'))
+
+    await cache.get(session, 'https://x.example/a')
+    second = await cache.get(session, 'https://x.example/a')
+
+    assert second.from_cache is True
+    assert cache.get_stats()['platforms']['generic']['bypassed'] == 0
+
+@pytest.mark.asyncio
+async def test_hit_rates_are_published_once_per_interval():
+    """Hit rates are aggregated rather than published per request."""
+    cache = HTTPCache({'http_cache_metrics_interval': 60})
+    session = FakeSession({'https://x.example/a': (200, PAGE, {})})
+
+    with patch.object(cache.monitoring, 'record_metric') as record_metric:
+        for _ in range(10):
+            await cache.get(session, 'https://x.example/a', 'twitter')
+        assert record_metric.call_count == 0
+
+        cache._published_at -= 60
+        await cache.get(session, 'https://x.example/a', 'twitter')
+
+    record_metric.assert_called_once_with('http_cache_hit_rate', 10 / 11, {'platform': 'twitter'})
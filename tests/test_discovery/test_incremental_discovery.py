@@ -0,0 +1,135 @@
+import pytest
+
+from src.services.discovery.adapters.base_scraper import BaseScraper
+from src.services.discovery.orchestrator.fingerprint_store import FingerprintStore
+
+PROFILE = {
+    'basic_info': {'username': 'creator', 'bio': 'Camera reviews', 'metadata': {'id': 'el-1'}},
+    'tweets': [
+        {'text': 'new lens', 'timestamp': '2026-05-02T10:00:00.000Z'},
+        {'text': 'old lens', 'timestamp': '2026-05-01T10:00:00.000Z'}
+    ]
+}
+
+@pytest.fixture
+def store():
+    return FingerprintStore({})
+
+@pytest.mark.asyncio
+async def test_unchanged_profiles_are_detected(store):
+    """A profile with no new posts and the same fields is unchanged."""
+    first = store.compute('twitter', 'creator', PROFILE)
+    await store.commit([first])
+    previous = await store.get('twitter', 'creator')
+
+    rescraped = {
+        'basic_info': {'username': 'creator', 'bio': 'Camera reviews', 'metadata': {'id': 'el-9'}},
+        'tweets': []
+    }
+    fingerprint = store.compute('twitter', 'creator', rescraped, previous)
+
+    assert previous.watermark() == {'post_id': None, 'timestamp': '2026-05-02T10:00:00.000Z'}
+    assert fingerprint.newest_post_timestamp == '2026-05-02T10:00:00.000Z'
+    assert not store.has_changed(fingerprint, previous)
+
+@pytest.mark.asyncio
+async def test_profile_edits_and_new_posts_are_changes(store):
+    """Edited fields or posts past the watermark mark the affiliate as changed."""
+    previous = store.compute('twitter', 'creator', PROFILE)
+
+    edited = {**PROFILE, 'basic_info': {'username': 'creator', 'bio': 'Lens reviews'}}
+    new_post = {**PROFILE, 'tweets': [{'text': 'newer', 'timestamp': '2026-05-03T10:00:00.000Z'}]}
+
+    assert store.has_changed(store.compute('twitter', 'creator', edited, previous), previous)
+    assert store.has_changed(store.compute('twitter', 'creator', new_post, previous), previous)
+    assert store.has_changed(previous, None)
+
+def test_scrapers_stop_reading_posts_at_the_watermark():
+    """Posts at or before the watermark are skipped, tolerating a pinned post."""
+    scraper = BaseScraper({'timeout': 30, 'user_agent': 'test-agent'})
+    posts = [
+        {'id': 'pinned', 'timestamp': '2026-04-01T00:00:00Z'},
+        {'id': 'c', 'timestamp': '2026-05-03T00:00:00Z'},
+        {'id': 'b', 'timestamp': '2026-05-02T00:00:00Z'},
+        {'id': 'a', 'timestamp': '2026-05-01T00:00:00Z'},
+        {'id': 'z', 'timestamp': '2026-04-30T00:00:00Z'},
+        {'id': 'y', 'timestamp': '2026-04-29T00:00:00Z'},
+        {'id': 'x', 'timestamp': '2026-04-28T00:00:00Z'}
+    ]
+    read_calls = []
+
+    def read_marker(post):
+        read_calls.append(post['id'])
+        return {'post_id': post['id'], 'timestamp': post['timestamp']}
+
+    since = {'post_id': 'b', 'timestamp': '2026-05-02T00:00:00'}
+    new_posts = [post['id'] for post, _ in scraper._iter_new_posts(posts, since, read_marker)]
+
+    assert new_posts == ['c']
+    assert 'x' not in read_calls
+
+def test_id_only_watermarks_stop_at_the_watermark_post():
+    """Undated feeds stop at the first post matching the watermark id."""
+    scraper = BaseScraper({'timeout': 30, 'user_agent': 'test-agent'})
+    posts = [{'id': post_id} for post_id in ('/v/4', '/v/3', '/v/2', '/v/1')]
+    read_calls = []
+
+    def read_marker(post):
+        read_calls.append(post['id'])
+        return {'post_id': post['id'], 'timestamp': None}
+
+    new_posts = [post['id'] for post, _ in scraper._iter_new_posts(posts, {'post_id': '/v/3', 'timestamp': None}, read_marker)]
+
+    assert new_posts == ['/v/4']
+    assert read_calls == ['/v/4', '/v/3']
+
+def test_undated_posts_are_watermarked_by_their_id(store):
+    """Scrapers without native ids use the post link, which is its url."""
+    videos = {'basic_info': {'username': 'creator'}, 'videos': [{'url': '/v/2'}, {'url': '/v/1'}]}
+    native = {'basic_info': {'username': 'creator'}, 'posts': [{'post_id': 't3_abc', 'url': '/r/x/t3_abc'}]}
+
+    assert store.compute('youtube', 'creator', videos).watermark() == {'post_id': '/v/2', 'timestamp': None}
+    assert store.compute('reddit', 'creator', native).newest_post_id == 't3_abc'
+
+def test_counter_drift_is_not_a_change(store):
+    """Followers and likes change on every scrape; only moves past the tolerance count."""
+    profile = {'basic_info': {'username': 'creator', 'followers': 10000}, 'engagement': {'likes': 120}}
+    previous = store.compute('twitter', 'creator', profile)
+
+    drifted = {'basic_info': {'username': 'creator', 'followers': 10150}, 'engagement': {'likes': 124}}
+    jumped = {'basic_info': {'username': 'creator', 'followers': 12000}, 'engagement': {'likes': 124}}
+
+    assert previous.counters == {'basic_info.followers': 10000, 'engagement.likes': 120}
+    assert not store.has_changed(store.compute('twitter', 'creator', drifted, previous), previous)
+    assert store.has_changed(store.compute('twitter', 'creator', jumped, previous), previous)
+
+@pytest.mark.asyncio
+async def test_delta_posts_extend_the_stored_history(store):
+    """New posts merge into the committed history instead of the feed being fetched again."""
+    assert await store.merge_history('twitter', 'creator', PROFILE) is None
+
+    store.remember_history('twitter', 'creator', PROFILE)
+    await store.commit([store.compute('twitter', 'creator', PROFILE)])
+    delta = {
+        'basic_info': {'username': 'creator', 'bio': 'Camera reviews'},
+        'tweets': [
+            {'text': 'newest lens', 'timestamp': '2026-05-03T10:00:00.000Z'},
+            {'text': 'new lens', 'timestamp': '2026-05-02T10:00:00.000Z'}
+        ]
+    }
+
+    merged = await store.merge_history('twitter', 'creator', delta)
+
+    assert [post['text'] for post in merged['tweets']] == ['newest lens', 'new lens', 'old lens']
+    assert merged['basic_info'] == delta['basic_info']
+
+@pytest.mark.asyncio
+async def test_post_histories_are_bounded():
+    """Only the newest posts of an affiliate are kept."""
+    store = FingerprintStore({'fingerprint_history_limit': 2})
+    store.remember_history('twitter', 'creator', PROFILE)
+    await store.commit([store.compute('twitter', 'creator', PROFILE)])
+
+    merged = await store.merge_history('twitter', 'creator', {'tweets': [{'text': 'newest', 'timestamp': '2026-05-03T10:00:00.000Z'}]})
+
+    assert [post['text'] for post in merged['tweets']] == ['newest', 'new lens']
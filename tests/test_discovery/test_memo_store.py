@@ -0,0 +1,101 @@
+import pytest
+import spacy
+from unittest.mock import patch
+
+from src.services.discovery.nlp.memo_store import MemoStore, get_memo_store
+from src.services.discovery.nlp.registry import ModelRegistry
+from src.services.discovery.pipeline.data_enricher import DataEnricher
+
+def test_whitespace_variants_share_a_key_unless_exact():
+    store = MemoStore({})
+    
+    assert store.key('sentiment', 'Great  lens\n', 'v1') == store.key('sentiment', 'Great lens', 'v1')
+    assert store.key('sentiment', 'Great  lens', 'v1', normalize=False) != store.key('sentiment', 'Great lens', 'v1', normalize=False)
+    assert store.key('sentiment', 'Great lens', 'v1') != store.key('sentiment', 'Great lens', 'v2')
+    assert store.key('sentiment', 'Great lens', 'v1') != store.key('topics', 'Great lens', 'v1')
+
+def test_computes_once_and_hands_out_copies():
+    store = MemoStore({})
+    calls = []
+    
+    def compute(text):
+        calls.append(text)
+        return {'words': text.split()}
+        
+    first = store.get_or_compute('words', 'a b', 'v1', compute)
+    first['words'].append('mutated')
+    second = store.get_or_compute('words', ' a  b ', 'v1', compute)
+    
+    assert calls == ['a b']
+    assert second == {'words': ['a', 'b']}
+    stats = store.get_stats()['tasks']['words']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+
+def test_hit_rates_are_published_once_per_interval():
+    store = MemoStore({'nlp_memo_metrics_interval': 60})
+    
+    with patch.object(store.monitoring, 'record_metric') as record_metric:
+        for _ in range(100):
+            store.get_or_compute('words', 'a b', 'v1', str.split)
+        assert record_metric.call_count == 0
+        
+        store._published_at -= 60
+        store.get('words', 'a b', 'v1')
+        store.get('words', 'a b', 'v1')
+        
+    assert record_metric.call_count == 2
+    assert record_metric.call_args_list[0].args == ('nlp_memo_hit_rate', 100 / 101, {'task': 'words'})
+
+def test_memo_stores_are_shared_per_settings(tmp_path):
+    shared = get_memo_store({'nlp_memo_max_bytes': 1024, 'spacy_batch_size': 64})
+    
+    assert get_memo_store({'nlp_memo_max_bytes': 1024}) is shared
+    assert get_memo_store({'nlp_memo_max_bytes': 2048}) is not shared
+    assert get_memo_store({'nlp_memo_max_bytes': 1024, 'nlp_memo_dir': str(tmp_path)}).backing is not None
+
+def test_failures_are_not_memoized():
+    store = MemoStore({})
+    
+    def fail(text):
+        raise ValueError('model unavailable')
+        
+    with pytest.raises(ValueError):
+        store.get_or_compute('sentiment', 'text', 'v1', fail)
+        
+    assert store.get('sentiment', 'text', 'v1') is None
+
+def test_evicts_least_recently_used_entries_past_the_byte_limit():
+    store = MemoStore({'nlp_memo_max_bytes': 20})
+    store.put('task', 'a', 'v1', 'x' * 6)
+    store.put('task', 'b', 'v1', 'y' * 6)
+    store.get('task', 'a', 'v1')
+    store.put('task', 'c', 'v1', 'z' * 6)
+    
+    assert store.get('task', 'a', 'v1') == 'x' * 6
+    assert store.get('task', 'b', 'v1') is None
+    assert store.get('task', 'c', 'v1') == 'z' * 6
+
+def test_disk_backing_carries_results_and_cost_across_stores(tmp_path):
+    MemoStore({'nlp_memo_dir': str(tmp_path)}).put('task', 'text', 'v1', {'score': 0.5}, cpu_seconds=0.25)
+    
+    store = MemoStore({'nlp_memo_dir': str(tmp_path)})
+    
+    assert store.get('task', 'text', 'v1') == {'score': 0.5}
+    assert store.get_stats()['tasks']['task']['cpu_seconds_saved'] == pytest.approx(0.25)
+
+def test_enricher_pipes_each_distinct_text_once():
+    enricher = DataEnricher({})
+    enricher.models = ModelRegistry()
+    nlp = enricher.models.get('spacy.en_core_web_sm', lambda: spacy.blank('en'))
+    enricher.memo = MemoStore({})
+    
+    with patch.object(nlp, 'pipe', wraps=nlp.pipe) as pipe:
+        first = enricher._annotate_texts(['repost', 'original', 'repost'])
+        second = enricher._annotate_texts(['original', 'repost'])
+        
+    assert pipe.call_count == 1
+    assert pipe.call_args.args[0] == ['repost', 'original']
+    assert first[0] == first[2] and first[0] is not first[2]
+    assert second == first[1:]
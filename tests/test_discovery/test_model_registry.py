@@ -0,0 +1,43 @@
+import threading
+import time
+import nltk
+import pytest
+
+from src.services.discovery.nlp.registry import ModelRegistry
+
+@pytest.fixture
+def registry(tmp_path):
+    return ModelRegistry(str(tmp_path))
+
+def test_models_load_once_across_threads(registry):
+    """Concurrent first requests share a single load."""
+    calls = []
+    
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+        
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get('model', loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+        
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert registry.get_stats()['model']['load_seconds'] >= 0.05
+
+def test_missing_resources_never_trigger_downloads(registry, monkeypatch):
+    """Absent NLTK data is reported instead of fetched from the network."""
+    monkeypatch.setattr(nltk, 'download', lambda *args, **kwargs: pytest.fail('downloaded'))
+    monkeypatch.setattr(nltk.data, 'find', lambda path: (_ for _ in ()).throw(LookupError(path)))
+    
+    with pytest.raises(LookupError, match='prefetch'):
+        registry.stopwords()
+        
+    assert registry.data_dir in nltk.data.path
@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import patch
+
+from src.services.discovery.pipeline.data_enricher import DataEnricher, EGO
+
+def make_connections(count, mutuals=()):
+    connections = [
+        {'id': f"user_{index}", 'type': 'follower', 'strength': 0.8, 'metadata': {'mutual_connections': []}}
+        for index in range(count)
+    ]
+    for a, b in mutuals:
+        connections[a]['metadata']['mutual_connections'].append(f"user_{b}")
+    return connections
+
+@pytest.mark.parametrize('count, mutuals, density, clustering', [
+    # Star around the profile: V = 4, E = 3
+    (3, [], 0.5, 0.0),
+    # Every connection knows every other: V = 4, E = 6
+    (3, [(0, 1), (0, 2), (1, 2)], 1.0, 1.0),
+    # One tie among four connections: V = 5, E = 5
+    (4, [(0, 1)], 0.5, 1 / 6),
+    # A single connection: V = 2, E = 1
+    (1, [], 1.0, 0.0)
+])
+def test_density_is_edges_over_possible_pairs(count, mutuals, density, clustering):
+    enricher = DataEnricher({})
+    
+    metrics = enricher._analyze_network(make_connections(count, mutuals))['metrics']
+    
+    assert metrics['size'] == count
+    assert metrics['density'] == pytest.approx(density)
+    assert metrics['clustering'] == pytest.approx(clustering)
+    assert metrics['sampled'] is False
+
+def test_mutual_ties_are_not_double_counted():
+    enricher = DataEnricher({})
+    
+    graph = enricher._build_network_graph(make_connections(3, [(0, 1), (1, 0)]))
+    
+    assert graph.number_of_edges() == 4
+
+def test_large_networks_are_sampled_to_the_cap():
+    enricher = DataEnricher({'network_max_nodes': 11})
+    
+    analysis = enricher._analyze_network(make_connections(100))
+    graph = enricher._build_network_graph(make_connections(100))
+    
+    assert graph.number_of_nodes() == 11
+    assert analysis['metrics']['size'] == 100
+    assert analysis['metrics']['sampled'] is True
+    assert analysis['metrics']['density'] == pytest.approx(2 * 10 / (11 * 10))
+
+@pytest.mark.asyncio
+async def test_enrichment_builds_the_graph_once_and_shares_results():
+    enricher = DataEnricher({})
+    connections = make_connections(6, [(0, 1), (0, 2), (1, 2), (3, 4), (3, 5), (4, 5)])
+    
+    with patch.object(enricher, '_build_network_graph', wraps=enricher._build_network_graph) as build:
+        enriched = await enricher._enrich_network({'connections': connections})
+        
+    assert build.call_count == 1
+    assert enriched['communities'] is enriched['analysis']['communities']
+    assert enriched['influence'] is enriched['analysis']['influence']
+    assert sorted(community['members'] for community in enriched['communities']) == [
+        ['user_0', 'user_1', 'user_2'],
+        ['user_3', 'user_4', 'user_5']
+    ]
+    assert EGO not in str(enriched['communities'])
+    # Only the 9 cross-community pairs of the 15 connection pairs route through the profile
+    assert enriched['analysis']['metrics']['centrality'] == pytest.approx(9 / 15)
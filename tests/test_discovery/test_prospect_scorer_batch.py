@@ -0,0 +1,111 @@
+import random
+import pytest
+
+from src.services.discovery.pipeline.data_cleaner import DataCleaner
+from src.services.discovery.pipeline.prospect_scorer import ProspectScorer
+
+def make_prospect(rng):
+    post_types = ['video', 'image', 'promotional', 'text', None]
+    return {
+        'network': {'metrics': {
+            'size': rng.randint(0, 2000000),
+            'density': rng.random(),
+            'centrality': rng.uniform(-0.2, 1.2),
+            'clustering': rng.random()
+        }},
+        'engagement': {
+            'followers': rng.randint(0, 3000000),
+            'engagement_rate': rng.random(),
+            'click_through_rate': rng.random() * 0.2,
+            'conversion_rate': rng.random() * 0.05,
+            'response_rate': rng.random(),
+            'avg_response_time': rng.uniform(0, 48)
+        },
+        'content': [
+            {
+                'type': rng.choice(post_types),
+                'text': rng.choice(['', 'New review is up']),
+                'media': rng.choice([[], [{'type': 'image', 'url': 'https://cdn.example.com/a.jpg'}]]),
+                'engagement': {
+                    'likes': rng.randint(0, 900),
+                    'comments': rng.choice([0, rng.randint(1, 80)]),
+                    'shares': rng.choice([0, rng.randint(1, 40)]),
+                    'clicks': rng.choice([0, 12]),
+                    'conversions': rng.choice([0, 0, 2])
+                }
+            }
+            for _ in range(rng.randint(0, 30))
+        ]
+    }
+
+@pytest.mark.asyncio
+async def test_batch_scores_match_per_prospect_scores():
+    rng = random.Random(3)
+    scorer = ProspectScorer({})
+    prospects = [make_prospect(rng) for _ in range(300)] + [{}]
+    
+    batch = await scorer.score_batch(prospects)
+    
+    for prospect, result in zip(prospects, batch):
+        expected = await scorer.score_prospect(prospect)
+        assert result['composite_score'] == pytest.approx(expected['composite_score'], rel=1e-12, abs=1e-15)
+        assert result['dimension_scores'] == pytest.approx(expected['dimension_scores'], rel=1e-12, abs=1e-15)
+
+@pytest.mark.asyncio
+async def test_nan_and_none_metrics_score_like_the_scalar_path():
+    scorer = ProspectScorer({})
+    nan, inf = float('nan'), float('inf')
+    prospects = [
+        {'network': {'metrics': {'size': nan, 'density': 0.5, 'centrality': nan}}, 'engagement': {'followers': inf}},
+        {'engagement': {'engagement_rate': -inf, 'response_rate': nan, 'avg_response_time': nan}},
+        {'content': [{'type': 'video', 'engagement': {'likes': nan, 'comments': 3}}, {'engagement': {'shares': inf}}]},
+        {'network': {'metrics': {'size': None, 'density': 0.5}}, 'engagement': {'followers': None}},
+        {'content': [{'engagement': {'likes': None, 'comments': 3}}], 'engagement': {'click_through_rate': nan}}
+    ]
+    
+    batch = await scorer.score_batch(prospects)
+    
+    for prospect, result in zip(prospects, batch):
+        expected = await scorer.score_prospect(prospect)
+        assert result['composite_score'] == pytest.approx(expected['composite_score'], rel=1e-12, abs=1e-15)
+        assert result['dimension_scores'] == pytest.approx(expected['dimension_scores'], rel=1e-12, abs=1e-15)
+        assert 0 <= result['composite_score'] <= 1
+
+@pytest.mark.asyncio
+async def test_malformed_prospects_fall_back_to_scalar_scoring():
+    scorer = ProspectScorer({})
+    prospects = [
+        {'content': [{'engagement': {'likes': 'many'}}], 'engagement': {'followers': 5000}},
+        {'content': None, 'engagement': {'click_through_rate': 0.5}},
+        {'network': {'metrics': {'size': 'large'}}},
+        {'content': [{'type': ['video'], 'text': 'x'}]}
+    ]
+    
+    batch = await scorer.score_batch(prospects)
+    
+    for prospect, result in zip(prospects, batch):
+        assert result == await scorer.score_prospect(prospect)
+
+@pytest.mark.asyncio
+async def test_sampled_profiles_score_on_their_full_history():
+    rng = random.Random(9)
+    posts = [
+        {
+            'id': str(index),
+            'type': 'video',
+            'text': 'New review is up',
+            'engagement': {'likes': rng.randint(0, 900), 'comments': rng.choice([0, 5]), 'shares': rng.choice([0, 0, 3])}
+        }
+        for index in range(400)
+    ]
+    sampled = DataCleaner({'profile_post_budget': 20}).clean_profile_data({'content': iter(posts)})
+    whole = {'content': DataCleaner({}).clean_profile_data({'content': posts})['content']}
+    scorer = ProspectScorer({})
+    
+    expected = await scorer.score_prospect(whole)
+    scalar = await scorer.score_prospect(sampled)
+    batch, = await scorer.score_batch([sampled])
+    
+    assert len(sampled['content']) == 20
+    assert scalar['dimension_scores'] == pytest.approx(expected['dimension_scores'], rel=1e-9)
+    assert batch['dimension_scores'] == pytest.approx(scalar['dimension_scores'], rel=1e-12, abs=1e-15)
@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import MagicMock
+
+from src.services.discovery.adapters.scraper_manager import ScraperManager
+from src.services.discovery.models.data_object import PlatformType
+
+CONFIG = {
+    'timeout': 30,
+    'user_agent': 'test-agent',
+    'scraper_idle_timeout': 60,
+    'scraper_idle_check_interval': 3600
+}
+
+def make_manager():
+    """Build a manager whose browser pool hands out mock drivers."""
+    manager = ScraperManager(CONFIG)
+    manager.resources.browser_pool._create_driver = MagicMock(side_effect=lambda: MagicMock())
+    return manager
+
+@pytest.mark.asyncio
+async def test_scrapers_are_built_on_first_request():
+    """Only requested platforms are constructed, and only once."""
+    manager = make_manager()
+    assert manager.scrapers == {}
+    
+    first = await manager.get_scraper('generic')
+    second = await manager.get_scraper('Generic')
+    
+    assert first is second
+    assert list(manager.scrapers) == [PlatformType.GENERIC]
+    manager.resources.browser_pool._create_driver.assert_not_called()
+    await manager.cleanup()
+
+@pytest.mark.asyncio
+async def test_scrapers_share_session_and_browsers():
+    """Scrapers reuse one HTTP session and recycle pooled browsers."""
+    manager = make_manager()
+    
+    twitter = await manager.get_scraper('twitter')
+    generic = await manager.get_scraper('generic')
+    assert twitter.session._session is generic.session._session
+    assert twitter.http_cache is generic.http_cache
+    assert manager.resources.browser_pool._create_driver.call_count == 1
+    
+    manager.last_used[PlatformType.TWITTER] -= CONFIG['scraper_idle_timeout']
+    assert await manager.shutdown_idle_scrapers() == [PlatformType.TWITTER]
+    
+    await manager.get_scraper('youtube')
+    assert manager.resources.browser_pool._create_driver.call_count == 1
+    await manager.cleanup()
+
+@pytest.mark.asyncio
+async def test_idle_shutdown_releases_shared_resources():
+    """Once every scraper is idle, the shared session is closed."""
+    manager = make_manager()
+    scraper = await manager.get_scraper('generic')
+    session = scraper.session._session
+    
+    manager.last_used[PlatformType.GENERIC] -= CONFIG['scraper_idle_timeout']
+    await manager.shutdown_idle_scrapers()
+    
+    assert manager.scrapers == {}
+    assert session.closed
+    assert manager.get_scraper_status(PlatformType.GENERIC)['status'] == 'idle'
+
+@pytest.mark.asyncio
+async def test_leased_scrapers_outlive_the_idle_timeout():
+    """A scraper in use is not closed, and its idle time starts when it is released."""
+    manager = make_manager()
+    async with manager.lease('generic') as scraper:
+        manager.last_used[PlatformType.GENERIC] -= CONFIG['scraper_idle_timeout']
+        assert await manager.shutdown_idle_scrapers() == []
+        assert not scraper.session._session.closed
+        
+    assert manager.leases == {}
+    assert await manager.shutdown_idle_scrapers() == []
+    manager.last_used[PlatformType.GENERIC] -= CONFIG['scraper_idle_timeout']
+    assert await manager.shutdown_idle_scrapers() == [PlatformType.GENERIC]
+
+@pytest.mark.asyncio
+async def test_sessions_keep_each_scrapers_headers():
+    """Different default headers get their own session over one connection pool."""
+    manager = make_manager()
+    english = manager.resources.get_session({'Accept-Language': 'en'})
+    german = manager.resources.get_session({'Accept-Language': 'de'})
+    
+    assert english is manager.resources.get_session({'Accept-Language': 'en'})
+    assert german is not english
+    assert german.headers['Accept-Language'] == 'de'
+    assert german.connector is english.connector
+    
+    await manager.cleanup()
+    assert english.closed and german.closed and english.connector is None
@@ -0,0 +1,63 @@
+import numpy as np
+import scipy.sparse as sp
+
+from src.services.discovery.intelligence.network_analysis import NetworkAnalysisAI
+from src.services.discovery.intelligence.similarity import top_k_similarity
+
+def dense_top_k(vectors, k, threshold, exclude):
+    """Brute-force reference over the full cosine matrix."""
+    dense = vectors.toarray()
+    unit = dense / np.maximum(np.linalg.norm(dense, axis=1, keepdims=True), 1e-300)
+    scores = unit @ unit.T
+    np.fill_diagonal(scores, -np.inf)
+    scores[exclude.toarray() != 0] = -np.inf
+    expected = {}
+    for row in range(len(scores)):
+        for col in np.argsort(-scores[row], kind='stable')[:k]:
+            if scores[row, col] > threshold:
+                expected[(row, col)] = scores[row, col]
+    return expected
+
+def test_matches_brute_force_for_any_block_size():
+    vectors = sp.random(120, 40, density=0.3, random_state=4, format='csr')
+    exclude = sp.random(120, 120, density=0.05, random_state=5, format='csr')
+    expected = dense_top_k(vectors, 5, 0.1, exclude)
+    
+    for block_elements in (1, 1000, 1 << 22):
+        result = top_k_similarity(vectors, 5, threshold=0.1, exclude=exclude, block_elements=block_elements).todok()
+        assert set(result.keys()) == set(expected)
+        assert all(np.isclose(result[key], value) for key, value in expected.items())
+
+def test_result_is_bounded_by_k_per_row():
+    vectors = sp.csr_matrix(np.ones((50, 3)))
+    result = top_k_similarity(vectors, 4)
+    
+    assert result.nnz == 50 * 4
+    assert result.diagonal().sum() == 0
+    assert top_k_similarity(sp.csr_matrix((1, 3)), 4).nnz == 0
+
+def test_collaborations_pair_similar_unconnected_channels():
+    analyzer = NetworkAnalysisAI({'similarity_top_k': 3})
+    analyzer._build_network_graph({
+        'channels': [
+            {'id': 'a', 'subscribers': 1000, 'views': 50000, 'videos': 40, 'engagement_rate': 0.05},
+            {'id': 'b', 'subscribers': 1100, 'views': 52000, 'videos': 42, 'engagement_rate': 0.05},
+            {'id': 'c', 'subscribers': 900000, 'views': 9000000, 'videos': 10, 'engagement_rate': 0.01},
+            {'id': 'd', 'subscribers': 950000, 'views': 9500000, 'videos': 12, 'engagement_rate': 0.01},
+            {'id': 'hub', 'subscribers': 5000, 'views': 100000, 'videos': 100, 'engagement_rate': 0.03}
+        ],
+        'connections': [
+            {'source': 'a', 'target': 'hub'},
+            {'source': 'b', 'target': 'hub'},
+            {'source': 'c', 'target': 'd'}
+        ]
+    })
+    
+    collaborations = analyzer._identify_potential_collaborations()
+    pairs = {frozenset((c['node1'], c['node2'])): c['similarity'] for c in collaborations}
+    
+    assert collaborations[0]['similarity'] == max(pairs.values())
+    assert pairs[frozenset(('a', 'b'))] > 0.9
+    assert frozenset(('c', 'd')) not in pairs
+    assert all(similarity > 0.5 for similarity in pairs.values())
+    assert analyzer._identify_potential_collaborations() == collaborations
@@ -0,0 +1,110 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from src.services.discovery.pipeline.data_cleaner import DataCleaner
+from src.services.discovery.pipeline.data_enricher import DataEnricher
+from src.services.discovery.pipeline.streaming import RunningStats, Reservoir, TopK, chunked
+
+def test_running_stats_match_numpy():
+    values = [random.Random(3).uniform(0, 1000) for _ in range(1000)]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+        
+    assert stats.count == 1000
+    assert stats.mean == pytest.approx(np.mean(values))
+    assert stats.variance == pytest.approx(np.var(values))
+    assert stats.to_dict()['max'] == max(values)
+
+def test_reservoir_keeps_short_streams_whole_and_in_order():
+    reservoir = Reservoir(10)
+    for item in range(5):
+        reservoir.add(item)
+        
+    assert reservoir.sample() == [0, 1, 2, 3, 4]
+    assert reservoir.sampled is False
+
+def test_reservoir_samples_long_streams_uniformly():
+    inclusions = Counter()
+    for seed in range(2000):
+        reservoir = Reservoir(10, seed)
+        for item in range(100):
+            reservoir.add(item)
+        sample = reservoir.sample()
+        assert len(sample) == 10 and sample == sorted(sample)
+        inclusions.update(sample)
+        
+    # Each item is kept with probability 10 / 100, i.e. about 200 times in 2000 runs
+    assert min(inclusions.values()) > 140
+    assert max(inclusions.values()) < 260
+
+def test_top_k_is_exact_within_budget_and_finds_heavy_hitters_beyond_it():
+    exact = TopK(5)
+    for key in 'aaabbc':
+        exact.add(key)
+    assert exact.most_common() == [('a', 3), ('b', 2), ('c', 1)]
+    
+    rng = random.Random(5)
+    stream = ['camera'] * 500 + ['lens'] * 300 + [f"rare{rng.randrange(5000)}" for _ in range(5000)]
+    rng.shuffle(stream)
+    approximate = TopK(50)
+    for key in stream:
+        approximate.add(key)
+    assert [key for key, _ in approximate.most_common(2)] == ['camera', 'lens']
+    assert len(approximate.counts) == 50
+
+def test_chunked_consumes_iterators_lazily():
+    chunks = chunked(iter(range(7)), 3)
+    
+    assert next(chunks) == [0, 1, 2]
+    assert list(chunks) == [[3, 4, 5], [6]]
+
+def test_cleaner_counts_topics_over_posts_beyond_the_sample():
+    cleaner = DataCleaner({'profile_post_budget': 10, 'profile_top_topics': 2})
+    posts = ({'text': 'Drone and lens' if i % 100 == 0 else f'Lens {i}'} for i in range(1000))
+    
+    cleaned = cleaner.clean_profile_data({'content': posts})
+    
+    assert cleaned['content_stats']['topics'] == [
+        {'topic': 'lens', 'count': 1000},
+        {'topic': 'drone', 'count': 10}
+    ]
+
+def test_cleaner_bounds_posts_and_keeps_full_history_statistics():
+    cleaner = DataCleaner({'profile_post_budget': 100, 'profile_chunk_size': 64, 'network_max_nodes': 51})
+    posts = ({'id': str(i), 'type': 'post', 'text': 'hi', 'engagement': {'likes': i}} for i in range(5000))
+    connections = ({'id': f"u{i}", 'type': 'follower'} for i in range(1000))
+    
+    cleaned = cleaner.clean_profile_data({'content': posts, 'network': {'connections': connections}})
+    
+    assert len(cleaned['content']) == 100
+    assert cleaned['content_stats']['count'] == 5000
+    assert cleaned['content_stats']['sampled'] is True
+    assert cleaned['content_stats']['engagement']['likes']['mean'] == pytest.approx(2499.5)
+    assert cleaned['content_stats']['engagement']['likes']['max'] == 4999
+    assert cleaned['content_stats']['engagement']['likes']['positive'] == 4999
+    assert len(cleaned['network']['connections']) == 50
+    assert cleaned['network']['connection_count'] == 1000
+
+@pytest.mark.asyncio
+async def test_enricher_ranks_topics_and_reports_full_network_size():
+    enricher = DataEnricher({})
+    cleaned = {
+        'content': [{'text': 'Camera and lens review'}, {'text': 'the camera lens'}, {'text': 'Camera!'}],
+        'network': {'connections': [{'id': 'u1', 'type': 'follower', 'strength': 0.5}], 'connection_count': 40}
+    }
+    
+    assert enricher._rank_topics(cleaned['content']) == [
+        {'topic': 'camera', 'count': 3},
+        {'topic': 'lens', 'count': 2},
+        {'topic': 'review', 'count': 1}
+    ]
+    streamed = {'topics': [{'topic': 'drone', 'count': 900}]}
+    assert enricher._rank_topics(cleaned['content'], streamed) == streamed['topics']
+    
+    network = await enricher._enrich_network(cleaned['network'])
+    assert network['analysis']['metrics']['size'] == 40
+    assert network['analysis']['metrics']['sampled'] is True
@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import patch
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from textblob import TextBlob
+from textblob.en import sentiment
+
+from src.services.discovery.intelligence.content_analysis import ContentAnalysisAI
+from src.services.discovery.intelligence.profile_analysis import ProfileAnalysisAI
+from src.services.discovery.intelligence.trend_analysis import TrendAnalysisAI
+from src.services.discovery.nlp.memo_store import MemoStore
+from src.services.discovery.nlp.text_analysis import TextAnalyzer, AnnotatedDoc
+
+def singular(word):
+    return word[:-1] if word.endswith('s') else word
+
+@pytest.fixture
+def analyzer():
+    analyzer = TextAnalyzer({}, stop_words=ENGLISH_STOP_WORDS, lemmatize=singular)
+    analyzer.memo = MemoStore({})
+    return analyzer
+
+def test_annotates_tokens_sentences_and_lemmas(analyzer):
+    doc = analyzer.analyze(["I don't love these lenses. Great cameras!!"])[0]
+    
+    assert doc.tokens[:4] == ('i', 'do', "n't", 'love')
+    assert [doc.tokens[start:end][-1] for start, end in doc.sentences] == ['.', '!']
+    assert doc.lemmas == ('love', 'lense', 'great', 'camera')
+    assert doc.sentence_polarities[0] < 0 < doc.sentence_polarities[1]
+    assert doc.average_sentiment == pytest.approx(sum(doc.sentence_polarities) / 2)
+    assert AnnotatedDoc.from_dict(doc.to_dict()) == doc
+
+def test_sentiment_matches_the_pattern_lexicon(analyzer):
+    for text in ['a very good camera', 'not a bad tutorial at all', 'terrible lighting']:
+        doc = analyzer.analyze([text])[0]
+        polarity, subjectivity = sentiment(text)
+        assert doc.polarity == pytest.approx(polarity)
+        assert doc.subjectivity == pytest.approx(subjectivity)
+
+def test_emoticons_are_scored_like_textblob(analyzer):
+    texts = ["It's okay I guess :)", 'bad day :(', 'i <3 this', 'great :D', 'meh 8-) and ;)', 'fine :) but sad :(']
+    for text in texts:
+        doc = analyzer.analyze([text])[0]
+        blob = TextBlob(text).sentiment
+        assert doc.polarity == pytest.approx(blob.polarity)
+        assert doc.subjectivity == pytest.approx(blob.subjectivity)
+        
+    assert analyzer.analyze(['meh 8-) and ;)'])[0].words == ['meh', 'and']
+
+def test_each_distinct_text_is_annotated_once(analyzer):
+    texts = ['great camera', 'bad lens', 'great camera']
+    
+    with patch.object(analyzer, '_annotate', wraps=analyzer._annotate) as annotate:
+        first = analyzer.analyze(texts)
+        second = analyzer.analyze(texts[:2])
+        
+    assert annotate.call_count == 2
+    assert first[0] is first[2]
+    assert second == first[:2]
+    assert analyzer.analyze([]) == []
+
+def test_lemma_lookups_are_cached():
+    calls = []
+    analyzer = TextAnalyzer({}, stop_words=(), lemmatize=lambda word: calls.append(word) or word)
+    analyzer.memo = MemoStore({})
+    
+    analyzer.analyze(['camera camera lens', 'lens camera'])
+    
+    assert sorted(calls) == ['camera', 'lens']
+
+@pytest.mark.asyncio
+async def test_intelligence_modules_share_annotations(analyzer):
+    content, profiles, trends = ContentAnalysisAI({}), ProfileAnalysisAI({}), TrendAnalysisAI({})
+    for module in (content, profiles, trends):
+        module.text_analyzer = analyzer
+    posts = [{'text': 'Great camera review. Loving it!'}, {'text': 'Bad lighting tips'}]
+    
+    with patch.object(analyzer, '_annotate', wraps=analyzer._annotate) as annotate:
+        topics = trends._extract_topics([post['text'] for post in posts])
+        trend_sentiment = await trends._analyze_sentiment_trends([post['text'] for post in posts])
+        diversity = await profiles._analyze_topic_diversity(posts)
+        quality = await content._assess_content_quality(posts[0]['text'])
+        content_sentiment = await content._analyze_sentiment(posts[0]['text'])
+        
+    assert annotate.call_count == 2
+    assert topics[:2] == ['great', 'camera']
+    assert trend_sentiment['positive_ratio'] == 0.5
+    assert diversity == 1.0
+    assert quality['avg_sentence_length'] == 3.5
+    assert content_sentiment['polarity'] == analyzer.analyze([posts[0]['text']])[0].polarity
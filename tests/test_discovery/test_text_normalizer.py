@@ -0,0 +1,48 @@
+import re
+import unicodedata
+import pytest
+from bs4 import BeautifulSoup
+
+from src.services.discovery.pipeline import text_normalizer
+from src.services.discovery.pipeline.text_normalizer import normalize_text, strip_markup
+
+def reference_clean(text):
+    """The BeautifulSoup-based cleaning the normalizer replaces."""
+    if not text:
+        return ""
+    text = BeautifulSoup(str(text), 'html.parser').get_text()
+    text = unicodedata.normalize('NFKD', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    return ' '.join(text.split()).strip()
+
+SAMPLES = [
+    'Filmmaker & photographer | Sony ambassador 📷 #gear @studio',
+    'Café owner — résumé in bio, ﬁne ligatures and ２０２６ full-width digits',
+    '<p>Reviews <b>cameras</b></p><p>and lenses</p>',
+    'Links: <a href="https://example.com/?a=1&amp;b=2" title="x > y">shop</a> now',
+    'Tom &amp; Jerry &lt;b&gt;not a tag&lt;/b&gt; &copy; 2026 &#8212; &#x1F600;',
+    'Before<script type="text/javascript">var x = "<b>";</script>after',
+    '<style>p { color: red; }</style>Styled<!-- hidden note --> text',
+    '<!DOCTYPE html><html><body>Doc<br/>body</body></html>',
+    'snake_case_handle and tabs\tand\nnewlines   spaced',
+    'Price < 100 and > 50 with 3<4',
+    '',
+    None,
+    12345
+]
+
+@pytest.mark.parametrize('text', SAMPLES)
+def test_matches_beautifulsoup_cleaning(text):
+    assert normalize_text(text) == reference_clean(text)
+
+def test_plain_text_skips_markup_stripping(monkeypatch):
+    calls = []
+    monkeypatch.setattr(text_normalizer, 'strip_markup', lambda text: calls.append(text) or text)
+    
+    normalize_text('Plain bio without markup')
+    normalize_text('Bio with <i>markup</i>')
+    
+    assert calls == ['Bio with <i>markup</i>']
+
+def test_strip_markup_keeps_escaped_markup_as_text():
+    assert strip_markup('<b>bold</b> &lt;i&gt;') == 'bold <i>'
@@ -0,0 +1,202 @@
+import asyncio
+import aiohttp
+import pytest
+from unittest.mock import AsyncMock
+
+from src.services.discovery.adapters.linkedin_scraper import LinkedInScraper
+from src.services.discovery.adapters.tiered_fetcher import TieredFetcher
+from src.services.discovery.adapters.youtube_scraper import YouTubeScraper
+
+SCRAPER_CONFIG = {'timeout': 10, 'user_agent': 'test-agent', 'page_load_delay': 0}
+
+STATIC_PAGE = (
+    '<html lang="en"><head><title>Creator Shop</title>'
+    '<meta name="description" content="Gear reviews">'
+    '<meta property="og:title" content="Creator Shop on the web"></head>'
+    '<body><p>' + 'review ' * 60 + '</p><a href="/about">About</a>'
+    '<script type="application/ld+json">{"@type": "Person", "name": "Creator"}</script>'
+    '</body></html>'
+)
+SPA_SHELL = '<html><head><title>App</title></head><body><div id="root"></div></body></html>'
+CHALLENGE_PAGE = '<html><head><title>Just a moment...</title></head><body></body></html>'
+WATCH_PAGE = (
+    '<html><head><title>Lens review - YouTube</title></head><body>'
+    '<div itemscope itemtype="http://schema.org/VideoObject">'
+    '<meta itemprop="name" content="Lens review">'
+    '<meta itemprop="description" content="Testing three lenses">'
+    '<meta itemprop="duration" content="PT1H4M3S">'
+    '<meta itemprop="uploadDate" content="2026-04-21T09:30:00-07:00">'
+    '<meta itemprop="interactionCount" content="1200">'
+    '<div itemprop="interactionStatistic" itemscope itemtype="https://schema.org/InteractionCounter">'
+    '<meta itemprop="interactionType" content="https://schema.org/LikeAction">'
+    '<meta itemprop="userInteractionCount" content="87"></div>'
+    '</div><div id="root"></div></body></html>'
+)
+LINKEDIN_POST = (
+    '<html><head><title>Launch day | LinkedIn</title>'
+    '<script type="application/ld+json">{"@context": "http://schema.org", "@graph": ['
+    '{"@type": "Organization", "name": "LinkedIn"},'
+    '{"@type": "SocialMediaPosting", "articleBody": "We shipped the new camera line",'
+    ' "datePublished": "2026-04-21T09:30:00Z", "commentCount": "12", "interactionStatistic": ['
+    '{"@type": "InteractionCounter", "interactionType": "http://schema.org/LikeAction", "userInteractionCount": 340}]}'
+    ']}</script></head><body></body></html>'
+)
+LINKEDIN_LOGIN_WALL = (
+    '<html><head><title>Sign in | LinkedIn</title>'
+    '<script type="application/ld+json">{"@type": "Organization", "name": "LinkedIn"}</script>'
+    '</head><body></body></html>'
+)
+
+class FakeResponse:
+    def __init__(self, status, html, url):
+        self.status = status
+        self.url = url
+        self._html = html
+
+    async def text(self, errors=None):
+        return self._html
+
+    def raise_for_status(self):
+        raise RuntimeError(f"HTTP {self.status}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, allow_redirects=True):
+        self.requests.append(url)
+        status, html = self.pages[url]
+        return FakeResponse(status, html, url)
+
+class FailingSession:
+    def __init__(self, error):
+        self.error = error
+        self.requests = []
+
+    def get(self, url, allow_redirects=True):
+        self.requests.append(url)
+        raise self.error
+
+@pytest.fixture
+def fetcher():
+    return TieredFetcher({'browser_fallback_threshold': 2})
+
+@pytest.mark.asyncio
+async def test_static_page_served_over_http(fetcher):
+    """Pages carrying the required fields never start the browser."""
+    session = FakeSession({'https://shop.example/p': (200, STATIC_PAGE)})
+    render = AsyncMock(return_value=STATIC_PAGE)
+
+    page = await fetcher.fetch('https://shop.example/p', session, render, ('title', 'text'))
+
+    assert page.tier == 'http'
+    assert page.fields['title'] == 'Creator Shop'
+    assert page.fields['opengraph']['title'] == 'Creator Shop on the web'
+    assert page.fields['json_ld'] == [{'@type': 'Person', 'name': 'Creator'}]
+    assert page.fields['links'] == ['https://shop.example/about']
+    render.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_missing_fields_fall_back_to_browser(fetcher):
+    """Client-rendered shells are rendered in the browser."""
+    session = FakeSession({'https://app.example/p': (200, SPA_SHELL)})
+    render = AsyncMock(return_value=STATIC_PAGE)
+
+    page = await fetcher.fetch('https://app.example/p', session, render, ('title', 'text'))
+
+    assert page.tier == 'browser'
+    assert page.fields['title'] == 'Creator Shop'
+    render.assert_awaited_once_with('https://app.example/p')
+
+@pytest.mark.asyncio
+async def test_challenge_page_falls_back_to_browser(fetcher):
+    """JavaScript challenges are handed to the browser."""
+    session = FakeSession({'https://guarded.example/p': (503, CHALLENGE_PAGE)})
+    render = AsyncMock(return_value=STATIC_PAGE)
+
+    page = await fetcher.fetch('https://guarded.example/p', session, render, ('title',))
+
+    assert page.tier == 'browser'
+
+@pytest.mark.asyncio
+async def test_domains_needing_browser_are_remembered(fetcher):
+    """Repeated fallbacks skip the HTTP attempt for that domain."""
+    session = FakeSession({'https://app.example/p': (200, SPA_SHELL)})
+    render = AsyncMock(return_value=STATIC_PAGE)
+
+    for _ in range(3):
+        await fetcher.fetch('https://app.example/p', session, render, ('title', 'text'))
+
+    stats = fetcher.get_domain_stats('app.example')['app.example']
+    assert stats['requires_browser'] is True
+    assert stats['hit_rate'] == 0.0
+    assert len(session.requests) == 2
+    assert render.await_count == 3
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('error', [
+    aiohttp.ClientConnectorError(None, OSError('connection refused')),
+    asyncio.TimeoutError()
+], ids=['connection_error', 'timeout'])
+async def test_network_errors_fall_back_to_browser(fetcher, error):
+    """A failed GET is rendered in the browser without marking the domain."""
+    session = FailingSession(error)
+    render = AsyncMock(return_value=STATIC_PAGE)
+
+    for _ in range(3):
+        page = await fetcher.fetch('https://flaky.example/p', session, render, ('title',))
+
+    assert page.tier == 'browser'
+    stats = fetcher.get_domain_stats('flaky.example')['flaky.example']
+    assert stats['http_failures'] == 3
+    assert stats['requires_browser'] is False
+    assert len(session.requests) == 3
+
+@pytest.mark.asyncio
+async def test_youtube_videos_are_read_from_microdata_without_a_browser():
+    """Watch pages serve their details as microdata, so no browser is started."""
+    scraper = YouTubeScraper(SCRAPER_CONFIG)
+    scraper.session = FakeSession({'https://www.youtube.com/watch?v=abc': (200, WATCH_PAGE)})
+
+    video = await scraper.scrape_content('https://www.youtube.com/watch?v=abc')
+
+    assert scraper.driver is None
+    assert video.data['title'] == 'Lens review'
+    assert video.data['description'] == 'Testing three lenses'
+    assert (video.data['views'], video.data['likes'], video.data['comments']) == (1200, 87, 0)
+    assert video.data['duration'] == '1:04:03'
+    assert video.data['upload_date'] == '2026-04-21T09:30:00-07:00'
+
+@pytest.mark.asyncio
+async def test_linkedin_posts_are_read_from_json_ld_without_a_browser():
+    """Public posts serve their text and counts as JSON-LD, so no browser is started."""
+    scraper = LinkedInScraper(SCRAPER_CONFIG)
+    scraper.session = FakeSession({'https://www.linkedin.com/posts/launch': (200, LINKEDIN_POST)})
+
+    result = await scraper.scrape_content('https://www.linkedin.com/posts/launch')
+
+    assert scraper.driver is None
+    post, = result.data['content']
+    assert post['text'] == 'We shipped the new camera line'
+    assert post['timestamp'] == '2026-04-21T09:30:00Z'
+    assert post['engagement'] == {'likes': 340, 'comments': 12}
+
+@pytest.mark.asyncio
+async def test_linkedin_pages_without_a_post_are_rendered():
+    """JSON-LD that describes no post, as on the sign-in wall, falls back to the browser."""
+    scraper = LinkedInScraper(SCRAPER_CONFIG)
+    scraper.session = FakeSession({'https://www.linkedin.com/posts/private': (200, LINKEDIN_LOGIN_WALL)})
+    scraper._render_post = AsyncMock(return_value=LINKEDIN_POST)
+    scraper._extract_content = AsyncMock(return_value=[{'text': 'rendered'}])
+
+    result = await scraper.scrape_content('https://www.linkedin.com/posts/private')
+
+    scraper._render_post.assert_awaited_once_with('https://www.linkedin.com/posts/private')
+    assert result.data['content'] == [{'text': 'rendered'}]
@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from src.services.discovery.intelligence.time_series import PostSeries
+from src.services.discovery.intelligence.trend_analysis import TrendAnalysisAI
+from src.services.discovery.nlp.memo_store import MemoStore
+from src.services.discovery.nlp.text_analysis import TextAnalyzer
+
+DAY = 86400
+# Monday 2024-01-01 00:00 UTC
+MONDAY = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+def post(day, hour=12, engagement=None, **fields):
+    item = {'created_at': MONDAY + day * DAY + hour * 3600, **fields}
+    if engagement is not None:
+        item['engagement'] = engagement
+    return item
+
+def test_posts_are_bucketed_by_day_and_monday_weeks():
+    series = PostSeries.from_posts([
+        post(8, engagement=5), post(0, likes=1, comments=2, shares=3), post(0, hour=20, engagement=4), post(7, engagement=1)
+    ])
+    
+    daily, weekly = series.buckets('day'), series.buckets('week')
+    
+    assert daily.start == MONDAY
+    assert daily.posts.tolist() == [2, 0, 0, 0, 0, 0, 0, 1, 1]
+    assert daily.engagement.tolist() == [10, 0, 0, 0, 0, 0, 0, 1, 5]
+    assert weekly.start == MONDAY
+    assert weekly.posts.tolist() == [2, 2]
+    assert weekly.values('engagement_per_post').tolist() == [5, 3]
+    assert series.buckets('day') is daily
+
+def test_mixed_and_missing_dates_are_read_once_and_ranked():
+    posts = [
+        {'created_at': '2024-01-03T09:00:00+00:00'},
+        {'created_at': None},
+        {'created_at': datetime(2024, 1, 1, 9)},
+        {'created_at': 'not a date'},
+        {'created_at': MONDAY + DAY + 9 * 3600}
+    ]
+    
+    series = PostSeries.from_posts(posts)
+    older, recent = series.split()
+    
+    assert series.order.tolist() == [2, 4, 0]
+    assert series.dated_fraction == pytest.approx(0.6)
+    assert older.tolist() == [1, 3, 2]
+    assert recent.tolist() == [4, 0]
+
+def test_rolling_trend_and_forecast_follow_steady_growth():
+    # Day d has d + 1 posts of engagement 2; the last, partial day is left out of fits
+    series = PostSeries.from_posts([post(day, engagement=2) for day in range(10) for _ in range(day + 1)])
+    
+    rolling = series.rolling_mean('day', 3, metric='posts')
+    trend = series.trend('day', 'posts')
+    forecast = series.forecast('day', 2, 'engagement', window=4)
+    
+    assert rolling.tolist() == [1, 1.5, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert trend['slope'] == pytest.approx(1)
+    assert trend['r2'] == pytest.approx(1)
+    assert trend['buckets'] == 9
+    assert forecast['predicted'] == pytest.approx([20, 22])
+    assert forecast['r2'] == pytest.approx(1)
+
+def test_seasonality_finds_peak_hour_and_day():
+    posts = [post(day, hour=18, engagement=10) for day in range(0, 28, 7)]
+    posts += [post(day, hour=9, engagement=1) for day in range(28) if day % 7]
+    
+    seasonality = PostSeries.from_posts(posts).seasonality()
+    
+    assert seasonality['hour_of_day']['peak'] == 18
+    assert seasonality['day_of_week']['peak'] == 0
+    assert sum(seasonality['hour_of_day']['post_share']) == pytest.approx(1)
+    assert seasonality['hour_of_day']['concentration'] > seasonality['day_of_week']['concentration']
+
+def test_empty_series_is_harmless():
+    series = PostSeries.from_posts([{'text': 'undated'}])
+    
+    assert len(series) == 0
+    assert series.trend('week')['growth_rate'] == 0
+    assert series.forecast('day', 3)['predicted'] == [0, 0, 0]
+    assert series.seasonality()['hour_of_day']['peak'] is None
+
+@pytest.mark.asyncio
+async def test_trend_analysis_reads_the_shared_series():
+    ai = TrendAnalysisAI({})
+    ai.text_analyzer = TextAnalyzer({}, stop_words=ENGLISH_STOP_WORDS, lemmatize=lambda word: word)
+    ai.text_analyzer.memo = MemoStore({})
+    content = [
+        post(day, engagement=day, text='camera review' if day < 28 else 'lighting tutorial')
+        for day in range(56) for _ in range(1 + day // 14)
+    ]
+    
+    result = await ai.analyze_trends({'content': content}, 'generic')
+    
+    evolution = result['content_analysis']['content_evolution']
+    assert evolution['recent_topics'] == ['lighting', 'tutorial']
+    # Posting picks up over time, so the older half of the posts reaches into the second month
+    assert set(evolution['older_topics']) == {'camera', 'review', 'lighting', 'tutorial'}
+    assert evolution['content_shift']['topic_overlap'] == 0.5
+    assert evolution['content_shift']['posting_rate_change'] > 0
+    posting = result['content_analysis']['posting_trends']
+    assert posting['posts'] == len(content)
+    assert posting['weekly_posts']['slope'] > 0
+    growth = result['audience_analysis']['growth_trends']
+    assert growth['content_growth_rate'] == posting['weekly_posts']['growth_rate']
+    assert result['audience_analysis']['engagement_patterns']['active_hours'] == {12: pytest.approx(np.mean([c['engagement'] for c in content]))}
+    predictions = result['predictions']
+    assert predictions['short_term']['posting_forecast']['horizon'] == 7
+    assert predictions['medium_term']['engagement_forecast']['change'] > 0
+    assert len(predictions['long_term']['posting_forecast']['predicted']) == 26
+    assert predictions['confidence_metrics']['data_quality'] == 1.0